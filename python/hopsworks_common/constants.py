@@ -135,6 +135,8 @@ class ENV_VARS:
 
     KAFKA_BROKERS = "KAFKA_BROKERS"
     ELASTIC_ENDPOINT_ENV_VAR = "ELASTIC_ENDPOINT"
+    MODEL_CACHE_DIR = "HOPSWORKS_MODEL_CACHE_DIR"
+    MODEL_CACHE_MAX_SIZE = "HOPSWORKS_MODEL_CACHE_MAX_SIZE"
 
 
 class SSL_CONFIG:
@@ -172,6 +174,11 @@ class MODEL:
 class MODEL_REGISTRY:
     HOPSFS_MOUNT_PREFIX = "/hopsfs/"
     MODEL_FILES_DIR_NAME = "Files"
+    FILES_MANIFEST_FILE_NAME = "files_manifest.json"
+    # folders with many small files only are uploaded as a single bundle
+    BUNDLE_MIN_FILES = 16
+    BUNDLE_MAX_FILE_SIZE = 1024 * 1024
+    BUNDLE_MAX_SIZE = 64 * 1024 * 1024
 
 
 class MODEL_SERVING:
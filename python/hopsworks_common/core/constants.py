@@ -85,3 +85,7 @@ polars_not_installed_message = (
 # SQL packages
 HAS_SQLALCHEMY: bool = importlib.util.find_spec("sqlalchemy") is not None
 HAS_AIOMYSQL: bool = importlib.util.find_spec("aiomysql") is not None
+
+# Fast JSON decoders
+HAS_ORJSON: bool = importlib.util.find_spec("orjson") is not None
+HAS_MSGSPEC: bool = importlib.util.find_spec("msgspec") is not None
@@ -17,13 +17,15 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 import json
 import logging
 import math
 import os
 import shutil
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, wait
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Literal, Optional, Union
 
 from hopsworks_common import client, tag, usage, util
@@ -40,6 +42,36 @@ class Chunk:
         self.retries = 0
 
 
+class RangesNotSupportedError(Exception):
+    """Raised when the server answers a byte range request with the whole file."""
+
+
+class UploadBudget:
+    """Limit on the number of bytes being uploaded at the same time, shared by concurrent file uploads.
+
+    A single request larger than the budget is still admitted once nothing else is in flight.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._bytes_in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, num_bytes: int):
+        with self._condition:
+            while (
+                self._bytes_in_flight > 0
+                and self._bytes_in_flight + num_bytes > self._max_bytes
+            ):
+                self._condition.wait()
+            self._bytes_in_flight += num_bytes
+
+    def release(self, num_bytes: int):
+        with self._condition:
+            self._bytes_in_flight -= num_bytes
+            self._condition.notify_all()
+
+
 class DatasetApi:
     def __init__(self):
         self._log = logging.getLogger(__name__)
@@ -48,8 +80,11 @@ class DatasetApi:
     DEFAULT_UPLOAD_SIMULTANEOUS_UPLOADS = 3
     DEFAULT_UPLOAD_SIMULTANEOUS_CHUNKS = 3
     DEFAULT_UPLOAD_MAX_CHUNK_RETRIES = 1
+    DEFAULT_UPLOAD_MAX_BYTES_IN_FLIGHT = 16 * DEFAULT_UPLOAD_FLOW_CHUNK_SIZE
 
     DEFAULT_DOWNLOAD_FLOW_CHUNK_SIZE = 1024 * 1024
+    DEFAULT_DOWNLOAD_SIMULTANEOUS_RANGES = 4
+    DEFAULT_DOWNLOAD_RANGE_SIZE = 64 * 1024 * 1024
     FLOW_PERMANENT_ERRORS = [404, 413, 415, 500, 501]
 
     # alias for backwards-compatibility:
@@ -62,9 +97,16 @@ class DatasetApi:
         local_path: Optional[str] = None,
         overwrite: Optional[bool] = False,
         chunk_size: int = DEFAULT_DOWNLOAD_FLOW_CHUNK_SIZE,
+        simultaneous_ranges: int = DEFAULT_DOWNLOAD_SIMULTANEOUS_RANGES,
+        range_size: int = DEFAULT_DOWNLOAD_RANGE_SIZE,
+        sha256: Optional[str] = None,
     ):
         """Download file from Hopsworks Filesystem to the current working directory.
 
+        Files larger than `range_size` are downloaded as byte ranges over several connections. The ranges are written
+        to a partial file next to `local_path`, so an interrupted download resumes from the completed ranges when
+        downloading the same file again.
+
         ```python
 
         import hopsworks
@@ -80,23 +122,16 @@ class DatasetApi:
             path: path in Hopsworks filesystem to the file
             local_path: path where to download the file in the local filesystem
             overwrite: overwrite local file if exists
-            chunk_size: upload chunk size in bytes. Default 1 MB
+            chunk_size: download chunk size in bytes. Default 1 MB
+            simultaneous_ranges: number of byte ranges downloaded simultaneously. Default 4. Set to 1 to download the file as a single stream.
+            range_size: size in bytes of the byte ranges. Default 64 MB
+            sha256: expected SHA-256 hex digest of the file, verified once the download completes
         # Returns
             `str`: Path to downloaded file
         # Raises
             `hopsworks.client.exceptions.RestAPIError`: If the backend encounters an error when handling the request
+            `hopsworks.client.exceptions.DatasetException`: If the downloaded file does not match the expected size or checksum
         """
-        _client = client.get_instance()
-        path_params = [
-            "project",
-            _client._project_id,
-            "dataset",
-            "download",
-            "with_auth",
-            path,
-        ]
-        query_params = {"type": "DATASET"}
-
         # Build the path to download the file on the local fs and return to the user, it should be absolute for consistency
         # Download in CWD if local_path not specified
         if local_path is None:
@@ -121,34 +156,246 @@ class DatasetApi:
                 )
             )
 
-        file_size = int(self._get(path)["attributes"]["size"])
-        with _client._send_request(
-            "GET", path_params, query_params=query_params, stream=True
-        ) as response:
-            with open(local_path, "wb") as f:
-                pbar = None
+        attributes = self._get(path)["attributes"]
+        self._download_file(
+            path,
+            local_path,
+            int(attributes["size"]),
+            chunk_size,
+            simultaneous_ranges=simultaneous_ranges,
+            range_size=range_size,
+            modification_time=attributes.get("modificationTime"),
+            sha256=sha256,
+        )
+
+        return local_path
+
+    def _download_file(
+        self,
+        path: str,
+        local_path: str,
+        file_size: int,
+        chunk_size: int = DEFAULT_DOWNLOAD_FLOW_CHUNK_SIZE,
+        show_progress: bool = True,
+        simultaneous_ranges: int = 1,
+        range_size: int = DEFAULT_DOWNLOAD_RANGE_SIZE,
+        modification_time: Optional[int] = None,
+        sha256: Optional[str] = None,
+    ):
+        pbar = None
+        if show_progress:
+            try:
+                pbar = tqdm(
+                    total=file_size,
+                    bar_format="{desc}: {percentage:.3f}%|{bar}| {n_fmt}/{total_fmt} elapsed<{elapsed} remaining<{remaining}",
+                    desc="Downloading",
+                )
+            except Exception:
+                self._log.exception("Failed to initialize progress bar.")
+                self._log.info("Starting download")
+
+        try:
+            if simultaneous_ranges > 1 and file_size > range_size:
                 try:
-                    pbar = tqdm(
-                        total=file_size,
-                        bar_format="{desc}: {percentage:.3f}%|{bar}| {n_fmt}/{total_fmt} elapsed<{elapsed} remaining<{remaining}",
-                        desc="Downloading",
+                    self._download_ranges(
+                        path,
+                        local_path,
+                        file_size,
+                        chunk_size,
+                        simultaneous_ranges,
+                        range_size,
+                        modification_time,
+                        sha256,
+                        pbar,
                     )
-                except Exception:
-                    self._log.exception("Failed to initialize progress bar.")
-                    self._log.info("Starting download")
+                    return
+                except RangesNotSupportedError:
+                    self._log.info(
+                        "Byte ranges are not supported, downloading %s as a single stream",
+                        path,
+                    )
+                    if pbar is not None:
+                        pbar.reset()
+            self._download_stream(path, local_path, chunk_size, pbar)
+            try:
+                self._verify_download(local_path, file_size, sha256)
+            except DatasetException:
+                os.remove(local_path)
+                raise
+        finally:
+            if pbar is not None:
+                pbar.close()
+            elif show_progress:
+                self._log.info("Download finished")
+
+    def _send_download_request(self, path: str, headers: Optional[dict] = None):
+        _client = client.get_instance()
+        path_params = [
+            "project",
+            _client._project_id,
+            "dataset",
+            "download",
+            "with_auth",
+            path,
+        ]
+        query_params = {"type": "DATASET"}
+
+        return _client._send_request(
+            "GET", path_params, query_params=query_params, headers=headers, stream=True
+        )
 
+    def _download_stream(self, path, local_path, chunk_size, pbar):
+        with self._send_download_request(path) as response:
+            with open(local_path, "wb") as f:
                 for chunk in response.iter_content(chunk_size=chunk_size):
                     f.write(chunk)
 
                     if pbar is not None:
                         pbar.update(len(chunk))
 
-                if pbar is not None:
-                    pbar.close()
-                else:
-                    self._log.info("Download finished")
+    def _download_ranges(
+        self,
+        path,
+        local_path,
+        file_size,
+        chunk_size,
+        simultaneous_ranges,
+        range_size,
+        modification_time,
+        sha256,
+        pbar,
+    ):
+        part_path = local_path + ".part"
+        state_path = part_path + ".json"
+        state = {
+            "path": path,
+            "size": file_size,
+            "range_size": range_size,
+            "modification_time": modification_time,
+            "completed": [],
+        }
+        num_ranges = math.ceil(file_size / range_size)
+        completed = self._load_download_state(part_path, state_path, state)
+        if completed:
+            self._log.info(
+                "Resuming download of %s from %s/%s completed ranges",
+                path,
+                len(completed),
+                num_ranges,
+            )
+            if pbar is not None:
+                pbar.update(
+                    sum(
+                        min(range_size, file_size - number * range_size)
+                        for number in completed
+                    )
+                )
+        else:
+            # preallocate the partial file, ranges are written at their offset
+            with open(part_path, "wb") as f:
+                f.truncate(file_size)
+        state_lock = threading.Lock()
+
+        def download_range(number):
+            start = number * range_size
+            end = min(start + range_size, file_size) - 1
+            with self._send_download_request(
+                path, headers={"Range": "bytes={}-{}".format(start, end)}
+            ) as response:
+                if response.status_code != 206:
+                    raise RangesNotSupportedError()
+                with open(part_path, "r+b") as f:
+                    f.seek(start)
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        f.write(chunk)
+                        if pbar is not None:
+                            pbar.update(len(chunk))
+                    if f.tell() != end + 1:
+                        raise DatasetException(
+                            "Download of bytes {}-{} of {} was incomplete".format(
+                                start, end, path
+                            )
+                        )
+            with state_lock:
+                completed.add(number)
+                state["completed"] = sorted(completed)
+                self._save_download_state(state_path, state)
+
+        with ThreadPoolExecutor(simultaneous_ranges) as executor:
+            futures = [
+                executor.submit(download_range, number)
+                for number in range(num_ranges)
+                if number not in completed
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except RangesNotSupportedError:
+                for future in futures:
+                    future.cancel()
+                self._remove_download_state(part_path, state_path)
+                raise
+            except Exception:
+                # completed ranges are kept to resume the download
+                for future in futures:
+                    future.cancel()
+                raise
 
-        return local_path
+        try:
+            self._verify_download(part_path, file_size, sha256)
+        except DatasetException:
+            self._remove_download_state(part_path, state_path)
+            raise
+        os.replace(part_path, local_path)
+        self._remove_download_state(None, state_path)
+
+    def _load_download_state(self, part_path, state_path, state):
+        """Get the completed ranges of a partial download of the same file, an empty set if there is none."""
+        try:
+            with open(state_path, "r") as f:
+                saved_state = json.load(f)
+            part_size = os.path.getsize(part_path)
+        except (OSError, ValueError):
+            return set()
+        if part_size != state["size"] or any(
+            saved_state.get(key) != state[key]
+            for key in ["path", "size", "range_size", "modification_time"]
+        ):
+            return set()
+        return set(saved_state.get("completed", []))
+
+    def _save_download_state(self, state_path, state):
+        tmp_path = state_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, state_path)
+
+    def _remove_download_state(self, part_path, state_path):
+        for file_path in [part_path, state_path]:
+            if file_path is not None and os.path.exists(file_path):
+                os.remove(file_path)
+
+    def _verify_download(self, local_path, file_size, sha256):
+        if os.path.getsize(local_path) != file_size:
+            raise DatasetException(
+                "Downloaded file {} has {} bytes, expected {}".format(
+                    local_path, os.path.getsize(local_path), file_size
+                )
+            )
+        if sha256 is None:
+            return
+        file_hash = hashlib.sha256()
+        with open(local_path, "rb") as f:
+            for block in iter(
+                lambda: f.read(self.DEFAULT_DOWNLOAD_FLOW_CHUNK_SIZE), b""
+            ):
+                file_hash.update(block)
+        if file_hash.hexdigest() != sha256:
+            raise DatasetException(
+                "Checksum of downloaded file {} does not match, expected SHA-256 {}".format(
+                    local_path, sha256
+                )
+            )
 
     @usage.method_logger
     def upload(
@@ -223,7 +470,9 @@ class DatasetApi:
             self.mkdir(destination_path)
 
         if os.path.isdir(local_path):
+            upload_budget = UploadBudget(self.DEFAULT_UPLOAD_MAX_BYTES_IN_FLIGHT)
             with ThreadPoolExecutor(simultaneous_uploads) as executor:
+                futures = []
                 # if path is a dir, upload files and folders iteratively
                 for root, dirs, files in os.walk(local_path):
                     # os.walk(local_model_path), where local_model_path is expected to be an absolute path
@@ -237,8 +486,8 @@ class DatasetApi:
                     for d_name in dirs:
                         self.mkdir(remote_base_path + "/" + d_name)
 
-                    # uploading files in the same folder is done concurrently
-                    futures = [
+                    # files of all folders are uploaded concurrently, sub folders are created before their files are submitted
+                    futures += [
                         executor.submit(
                             self._upload_file,
                             f_name,
@@ -248,16 +497,14 @@ class DatasetApi:
                             simultaneous_chunks,
                             max_chunk_retries,
                             chunk_retry_interval,
+                            upload_budget,
                         )
                         for f_name in files
                     ]
 
-                    # wait for all upload tasks to complete
-                    _, _ = wait(futures)
-                    try:
-                        _ = [future.result() for future in futures]
-                    except Exception as e:
-                        raise e
+                # wait for all upload tasks to complete
+                for future in futures:
+                    future.result()
         else:
             self._upload_file(
                 file_name,
@@ -280,6 +527,8 @@ class DatasetApi:
         simultaneous_chunks,
         max_chunk_retries,
         chunk_retry_interval,
+        upload_budget: Optional[UploadBudget] = None,
+        show_progress: bool = True,
     ):
         file_size = os.path.getsize(local_path)
 
@@ -289,66 +538,98 @@ class DatasetApi:
             file_name, num_chunks, file_size, chunk_size
         )
 
-        chunk_number = 1
         with open(local_path, "rb") as f:
             pbar = None
-            try:
-                pbar = tqdm(
-                    total=file_size,
-                    bar_format="{desc}: {percentage:.3f}%|{bar}| {n_fmt}/{total_fmt} elapsed<{elapsed} remaining<{remaining}",
-                    desc="Uploading {}".format(local_path),
-                )
-            except Exception:
-                self._log.exception("Failed to initialize progress bar.")
-                self._log.info("Starting upload")
+            if show_progress:
+                try:
+                    pbar = tqdm(
+                        total=file_size,
+                        bar_format="{desc}: {percentage:.3f}%|{bar}| {n_fmt}/{total_fmt} elapsed<{elapsed} remaining<{remaining}",
+                        desc="Uploading {}".format(local_path),
+                    )
+                except Exception:
+                    self._log.exception("Failed to initialize progress bar.")
+                    self._log.info("Starting upload")
             with ThreadPoolExecutor(simultaneous_chunks) as executor:
-                all_chunks_processed = False
-
-                while not all_chunks_processed:
-                    chunks = []
-
-                    if os.path.getsize(local_path) == 0:
-                        chunks.append(Chunk(b'', 1, "pending"))
-                        all_chunks_processed = True
-                    else:
-                        for _ in range(simultaneous_chunks):
-                            chunk_data = f.read(chunk_size)
-                            if not chunk_data:
-                                all_chunks_processed = True
-                                break
-                            chunks.append(Chunk(chunk_data, chunk_number, "pending"))
+                # keep a sliding window of chunks in flight, a new chunk is read and submitted as soon as one completes
+                in_flight = set()
+                chunk_number = 1
+                offset = 0
+                all_chunks_read = False
+                try:
+                    while True:
+                        while (
+                            not all_chunks_read and len(in_flight) < simultaneous_chunks
+                        ):
+                            num_bytes = min(chunk_size, file_size - offset)
+                            if upload_budget is not None:
+                                upload_budget.acquire(num_bytes)
+                            chunk = Chunk(f.read(num_bytes), chunk_number, "pending")
                             chunk_number += 1
-
-                    if not chunks:
-                        break
-
-                    futures = [
-                        executor.submit(
-                            self._upload_chunk,
-                            base_params,
-                            upload_path,
-                            file_name,
-                            chunk,
-                            pbar,
-                            max_chunk_retries,
-                            chunk_retry_interval,
-                        )
-                        for chunk in chunks
-                    ]
-
-                    try:
-                        for future in futures:
+                            offset += num_bytes
+                            # an empty file is uploaded as a single empty chunk
+                            all_chunks_read = offset >= file_size
+                            in_flight.add(
+                                self._submit_chunk(
+                                    executor,
+                                    upload_budget,
+                                    num_bytes,
+                                    base_params,
+                                    upload_path,
+                                    file_name,
+                                    chunk,
+                                    pbar,
+                                    max_chunk_retries,
+                                    chunk_retry_interval,
+                                )
+                            )
+
+                        if not in_flight:
+                            break
+
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
                             future.result()
-                    except Exception:
-                        if pbar:
-                            pbar.close()
-                        raise
+                except Exception:
+                    for future in in_flight:
+                        future.cancel()
+                    if pbar:
+                        pbar.close()
+                    raise
 
             if pbar is not None:
                 pbar.close()
-            else:
+            elif show_progress:
                 self._log.info("Upload finished")
 
+    def _submit_chunk(
+        self,
+        executor,
+        upload_budget: Optional[UploadBudget],
+        reserved_bytes: int,
+        base_params,
+        upload_path,
+        file_name,
+        chunk: Chunk,
+        pbar,
+        max_chunk_retries,
+        chunk_retry_interval,
+    ):
+        future = executor.submit(
+            self._upload_chunk,
+            base_params,
+            upload_path,
+            file_name,
+            chunk,
+            pbar,
+            max_chunk_retries,
+            chunk_retry_interval,
+        )
+        if upload_budget is not None:
+            # released on completion, failure or cancellation of the chunk upload
+            future.add_done_callback(lambda _: upload_budget.release(reserved_bytes))
+        return future
+
     def _upload_chunk(
         self,
         base_params,
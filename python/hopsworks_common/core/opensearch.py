@@ -32,6 +32,7 @@ from opensearchpy.exceptions import (
     AuthenticationException,
     ConnectionError,
     ConnectionTimeout,
+    NotFoundError,
     RequestError,
 )
 from retrying import retry
@@ -182,6 +183,68 @@ class OpenSearchClientSingleton:
         )
         return result["count"]
 
+    @retry(
+        wait_exponential_multiplier=1000,
+        stop_max_attempt_number=5,
+        retry_on_exception=_is_timeout,
+    )
+    @_handle_opensearch_exception
+    def msearch(self, bodies, index=None, options=None):
+        """Run several searches on an index in a single multi-search request.
+
+        Returns the search responses in the order of `bodies`. Multi-search reports errors per search, so the first
+        failed search raises the same exception as a failed single search.
+        """
+        body = []
+        for search_body in bodies:
+            # the index is given in the url, the header of each search is empty
+            body.append({})
+            body.append(search_body)
+        responses = self._opensearch_client.msearch(
+            body=body, index=index, params=OpensearchRequestOption.get_options(options)
+        )["responses"]
+        for response in responses:
+            error = response.get("error")
+            if error is None:
+                continue
+            caused_by = isinstance(error, dict) and error.get("caused_by")
+            if caused_by and caused_by["type"] == "illegal_argument_exception":
+                raise self._create_vector_database_exception(caused_by["reason"])
+            raise VectorDatabaseException(
+                VectorDatabaseException.OTHERS,
+                f"Error in Opensearch request: {error}",
+                {"error": error},
+            )
+        return responses
+
+    @retry(
+        wait_exponential_multiplier=1000,
+        stop_max_attempt_number=5,
+        retry_on_exception=_is_timeout,
+    )
+    @_handle_opensearch_exception
+    def create_pit(self, index, keep_alive, options=None):
+        """Create a point in time of an index, to paginate over a consistent view of it.
+
+        Returns the id of the point in time, `None` if points in time are not supported by the vector database.
+        """
+        if not hasattr(self._opensearch_client, "create_pit"):
+            # the point in time api is available from opensearch-py 2.x
+            return None
+        params = dict(OpensearchRequestOption.get_options(options))
+        params["keep_alive"] = keep_alive
+        try:
+            return self._opensearch_client.create_pit(index=index, params=params)[
+                "pit_id"
+            ]
+        except (NotFoundError, RequestError):
+            # points in time are available from OpenSearch 2.4
+            return None
+
+    @_handle_opensearch_exception
+    def delete_pit(self, pit_id):
+        self._opensearch_client.delete_pit(body={"pit_id": [pit_id]})
+
     def close(self):
         if self._opensearch_client:
             self._opensearch_client.close()
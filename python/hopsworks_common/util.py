@@ -810,6 +810,9 @@ class AsyncTaskThread(threading.Thread):
     """
     Generic thread class that can be used to run async tasks in a separate thread.
     The thread will create its own event loop and run submitted tasks in that loop.
+    Tasks submitted from several threads are scheduled concurrently on the loop, at most
+    `max_concurrent_tasks` at a time. Once that many tasks are running, up to `max_pending_tasks`
+    further tasks wait in the queue and `submit` blocks callers beyond that.
 
     The thread also store and fetches a connection pool that can be used by the async tasks.
 
@@ -817,6 +820,9 @@ class AsyncTaskThread(threading.Thread):
         connection_pool_initializer (Callable): A function that initializes a connection pool.
         connection_pool_params (Tuple): The parameters to pass to the connection pool initializer.
         *thread_args: Arguments to be passed to the thread.
+        max_concurrent_tasks (Optional[int]): Maximum number of tasks running at the same time on the event loop, unbounded if `None`.
+        max_pending_tasks (Optional[int]): Maximum number of submitted tasks waiting to be scheduled, unbounded if `None`.
+        task_timeout (Optional[float]): Timeout in seconds for a task to complete once it is scheduled, no timeout if `None`.
         **thread_kwargs: Key word arguments to be passed to the thread.
 
     # Properties:
@@ -830,10 +836,20 @@ class AsyncTaskThread(threading.Thread):
         connection_pool_initializer: Callable = None,
         connection_pool_params: Tuple = (),
         *thread_args,
+        max_concurrent_tasks: Optional[int] = None,
+        max_pending_tasks: Optional[int] = None,
+        task_timeout: Optional[float] = None,
         **thread_kwargs,
     ):
         super().__init__(*thread_args, **thread_kwargs)
-        self._task_queue: queue.Queue[AsyncTask] = queue.Queue()
+        self._task_queue: queue.Queue[AsyncTask] = queue.Queue(
+            maxsize=max_pending_tasks or 0
+        )
+        self._max_concurrent_tasks: Optional[int] = max_concurrent_tasks
+        self._task_timeout: Optional[float] = task_timeout
+        # asyncio primitives are created in `run` so that they are bound to the event loop of the thread.
+        self._task_available: Optional[asyncio.Event] = None
+        self._concurrency_semaphore: Optional[asyncio.Semaphore] = None
         self._event_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
         self.stop_event = threading.Event()
         self._connection_pool_initializer: Callable = connection_pool_initializer
@@ -843,33 +859,59 @@ class AsyncTaskThread(threading.Thread):
 
     async def execute_task(self):
         """
-        Execute the async tasks for the queue.
+        Schedule the async tasks from the queue on the event loop, as long as the concurrency limit allows it.
         """
         asyncio.set_event_loop(self._event_loop)
 
         while not self.stop_event.is_set():
-            # Fetch a task from the queue.
-            task = self.task_queue.get()
-            # Run the task in the event loop and get the result
+            if self._concurrency_semaphore is not None:
+                # Wait for a running task to finish, meanwhile submitted tasks stay in the queue.
+                await self._concurrency_semaphore.acquire()
+            task = await self._next_task()
+            self._event_loop.create_task(self._run_task(task))
+
+    async def _next_task(self) -> AsyncTask:
+        """
+        Fetch the next task from the queue without blocking the event loop.
+        """
+        while True:
             try:
-                # Check if the task requires a connection pool and pass it to the function if it does.
-                if task.requires_connection_pool:
-                    task.result = await task.task_function(
-                        *task.task_args,
-                        **task.task_kwargs,
-                        connection_pool=self.connection_pool,
-                    )
-                else:
-                    task.result = await task.task_function(
-                        *task.task_args, **task.task_kwargs
-                    )
+                return self.task_queue.get_nowait()
+            except queue.Empty:
+                self._task_available.clear()
+            # `submit` sets the event after putting the task in the queue, check again in case it happened in between.
+            try:
+                return self.task_queue.get_nowait()
+            except queue.Empty:
+                await self._task_available.wait()
 
-                # Unblock the task, so the submit function can return the result.
-                task.event.set()
-            except Exception as e:
-                task.result = e
-                task.event.set()
-                raise e
+    async def _run_task(self, task: AsyncTask) -> None:
+        """
+        Run a single task, store its result or exception and unblock the submitting thread.
+        """
+        try:
+            # Check if the task requires a connection pool and pass it to the function if it does.
+            if task.requires_connection_pool:
+                coroutine = task.task_function(
+                    *task.task_args,
+                    **task.task_kwargs,
+                    connection_pool=self.connection_pool,
+                )
+            else:
+                coroutine = task.task_function(*task.task_args, **task.task_kwargs)
+            task.result = await asyncio.wait_for(coroutine, timeout=self._task_timeout)
+        except Exception as e:
+            # The exception is raised in the submitting thread, the event loop keeps serving other tasks.
+            task.result = e
+        finally:
+            if self._concurrency_semaphore is not None:
+                self._concurrency_semaphore.release()
+            # Unblock the task, so the submit function can return the result.
+            task.event.set()
+
+    def _notify_task_available(self) -> None:
+        if self._task_available is not None:
+            self._task_available.set()
 
     def stop(self):
         """
@@ -884,6 +926,9 @@ class AsyncTaskThread(threading.Thread):
         Execute the async tasks for the queue.
         """
         asyncio.set_event_loop(self._event_loop)
+        self._task_available = asyncio.Event()
+        if self._max_concurrent_tasks:
+            self._concurrency_semaphore = asyncio.Semaphore(self._max_concurrent_tasks)
         # Initialize the connection pool by using loop.run_until_complete to make sure the connection pool is initialized before the event loop starts running forever.
         if self._connection_pool_initializer:
             self._connection_pool = self._event_loop.run_until_complete(
@@ -902,9 +947,13 @@ class AsyncTaskThread(threading.Thread):
     def submit(self, task: AsyncTask):
         """
         Submit a async task to the thread and block until the execution of the function is completed.
+
+        If `max_pending_tasks` tasks are already waiting to be scheduled, this blocks until one of them is scheduled.
         """
-        # Submit a task to the queue.
+        # Submit a task to the queue, blocking while the queue is full.
         self.task_queue.put(task)
+        # Wake up the dispatcher on the event loop of the thread.
+        self._event_loop.call_soon_threadsafe(self._notify_task_available)
         # Block the execution until the task is finished.
         task.event.wait()
 
@@ -934,3 +983,17 @@ class AsyncTaskThread(threading.Thread):
         The connection pool used by the thread.
         """
         return self._connection_pool
+
+    @property
+    def max_concurrent_tasks(self) -> Optional[int]:
+        """
+        Maximum number of tasks running at the same time on the event loop.
+        """
+        return self._max_concurrent_tasks
+
+    @property
+    def task_timeout(self) -> Optional[float]:
+        """
+        Timeout in seconds for a task to complete once it is scheduled.
+        """
+        return self._task_timeout
@@ -16,6 +16,7 @@
 
 import math
 
+import numpy as np
 import pandas as pd
 from hsfs.hopsworks_udf import udf
 from hsfs.transformation_statistics import TransformationStatistics
@@ -45,26 +46,40 @@ def robust_scaler(feature: pd.Series, statistics=feature_statistics) -> pd.Serie
 
 @udf(int, drop=["feature"], mode="pandas")
 def label_encoder(feature: pd.Series, statistics=feature_statistics) -> pd.Series:
-    unique_data = sorted([value for value in statistics.feature.unique_values])
-    value_to_index = {value: index for index, value in enumerate(unique_data)}
     # Unknown categories not present in training dataset are encoded as -1.
-    return pd.Series(
-        [
-            value_to_index.get(data, -1) if not pd.isna(data) else math.nan
-            for data in feature
-        ]
-    )
+    # The source of builtin transformations is stored in the backend, so older clients without the precomputed lookup fall back to building it on every call.
+    categorical_index = getattr(statistics.feature, "categorical_index", None)
+    if categorical_index is None:
+        unique_data = sorted([value for value in statistics.feature.unique_values])
+        value_to_index = {value: index for index, value in enumerate(unique_data)}
+        return pd.Series(
+            [
+                value_to_index.get(data, -1) if not pd.isna(data) else math.nan
+                for data in feature
+            ]
+        )
+    codes = categorical_index.get_indexer(feature)
+    missing = pd.isna(feature).to_numpy()
+    if missing.any():
+        return pd.Series(np.where(missing, np.nan, codes))
+    return pd.Series(codes)
 
 
 @udf(bool, drop=["feature"], mode="pandas")
 def one_hot_encoder(feature: pd.Series, statistics=feature_statistics) -> pd.Series:
-    unique_data = [value for value in statistics.feature.unique_values]
-
-    # One hot encode features. Re-indexing to set missing categories to False and drop categories not in training data statistics.
-    # Hence one-hot encoded features would have all categories as False when a category not in training dataset is encountered.
-    one_hot = pd.get_dummies(feature, dtype="bool").reindex(
-        unique_data, axis=1, fill_value=False
+    # One hot encode features with categories sorted so as to maintain consistency in column order.
+    # Categories not in training data statistics and missing values are encoded with all categories set to False.
+    # The source of builtin transformations is stored in the backend, so older clients without the precomputed lookup fall back to building it on every call.
+    categorical_index = getattr(statistics.feature, "categorical_index", None)
+    if categorical_index is None:
+        unique_data = [value for value in statistics.feature.unique_values]
+        one_hot = pd.get_dummies(feature, dtype="bool").reindex(
+            unique_data, axis=1, fill_value=False
+        )
+        return one_hot.reindex(sorted(one_hot.columns), axis=1)
+    codes = categorical_index.get_indexer(feature)
+    return pd.DataFrame(
+        statistics.feature.one_hot_encoding_table[codes],
+        index=feature.index,
+        columns=categorical_index,
     )
-
-    # Sorting by columns so as to maintain consistency in column order.
-    return one_hot.reindex(sorted(one_hot.columns), axis=1)
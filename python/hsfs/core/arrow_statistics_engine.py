@@ -0,0 +1,578 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Descriptive statistics of feature data computed with pyarrow and numpy, in the Deequ JSON format.
+
+Statistics are computed in a single pass over Arrow record batches and kept as mergeable sketches, so that data
+larger than memory can be profiled batch by batch, and partial results computed on different parts of the data
+can be merged. The sketches can be included in the statistics of each feature, to be persisted and merged later
+on without reading the data again.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from hopsworks_common.core.constants import HAS_NUMPY, HAS_PANDAS, HAS_POLARS
+from hsfs.core.statistics_sketches import (
+    CoMomentsSketch,
+    HyperLogLog,
+    MomentsSketch,
+    QuantileSketch,
+    ValueCounts,
+)
+from hsfs.core.type_systems import PYARROW_HOPSWORKS_DTYPE_MAPPING
+
+
+if HAS_NUMPY:
+    import numpy as np
+
+if HAS_PANDAS:
+    import pandas as pd
+
+if HAS_POLARS:
+    import polars as pl
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+INTEGRAL = "Integral"
+FRACTIONAL = "Fractional"
+BOOLEAN = "Boolean"
+STRING = "String"
+
+DEFAULT_NUM_HISTOGRAM_BINS = 20
+# Deequ only computes histograms of non numerical features with at most this many distinct values
+MAXIMUM_HISTOGRAM_DISTINCT_VALUES = 1000
+DEFAULT_BATCH_SIZE = 65536
+NULL_VALUE = "NullValue"
+PERCENTILES = [(i + 1) / 100 for i in range(100)]
+SKETCH = "sketch"
+# persisted sketches are smaller than the in memory ones, all of them use the same sizes so that they can be merged
+PERSISTED_QUANTILE_SKETCH_K = 512
+PERSISTED_DISTINCT_VALUES_PRECISION = 12
+
+
+def infer_data_type(arrow_type: pa.DataType) -> Optional[str]:
+    """Deequ data type of an Arrow type, `None` if it cannot be inferred.
+
+    # Arguments
+        arrow_type: Arrow type of the feature.
+
+    # Returns
+        `str`. One of `"Integral"`, `"Fractional"`, `"Boolean"` or `"String"`.
+    """
+    if _is_nested(arrow_type):
+        return STRING
+    hopsworks_type = PYARROW_HOPSWORKS_DTYPE_MAPPING.get(arrow_type, None)
+    if hopsworks_type in ["timestamp", "date", "binary", "string"]:
+        return STRING
+    if hopsworks_type in ["float", "double"]:
+        return FRACTIONAL
+    if hopsworks_type in ["int", "bigint"]:
+        return INTEGRAL
+    if hopsworks_type == "boolean":
+        return BOOLEAN
+    return None
+
+
+def _is_nested(arrow_type: pa.DataType) -> bool:
+    return (
+        pa.types.is_null(arrow_type)
+        or pa.types.is_list(arrow_type)
+        or pa.types.is_large_list(arrow_type)
+        or pa.types.is_struct(arrow_type)
+    )
+
+
+def _hashable_values(array: pa.Array) -> np.ndarray:
+    # temporal values are hashed by their integer representation instead of being cast to strings
+    if pa.types.is_temporal(array.type):
+        return array.view(
+            pa.int32() if array.type.bit_width == 32 else pa.int64()
+        ).to_numpy(zero_copy_only=False)
+    return array.to_numpy(zero_copy_only=False)
+
+
+def _histogram_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+class _ColumnStatistics:
+    def __init__(
+        self,
+        name: str,
+        data_type: str,
+        is_nested: bool,
+        histograms: bool,
+        exact_uniqueness: bool,
+        num_histogram_bins: int,
+        quantile_sketch_k: int,
+        distinct_values_precision: int,
+    ):
+        self.name = name
+        self.data_type = data_type
+        self.is_numerical = self.data_type in [INTEGRAL, FRACTIONAL]
+        self.is_nested = is_nested
+        self.histograms = histograms
+        self.exact_uniqueness = exact_uniqueness
+        self.num_histogram_bins = num_histogram_bins
+
+        self.count = 0
+        self.num_nulls = 0
+        self.distinct_values = (
+            None if self.is_nested else HyperLogLog(distinct_values_precision)
+        )
+        self.moments = MomentsSketch() if self.is_numerical else None
+        self.quantiles = (
+            QuantileSketch(quantile_sketch_k) if self.is_numerical else None
+        )
+        self.value_counts = (
+            ValueCounts()
+            if not self.is_nested
+            and (exact_uniqueness or (histograms and not self.is_numerical))
+            else None
+        )
+
+    @classmethod
+    def from_arrow_type(
+        cls, name: str, arrow_type: pa.DataType, **kwargs
+    ) -> _ColumnStatistics:
+        data_type = infer_data_type(arrow_type)
+        if data_type is None:
+            print(
+                "Data type could not be inferred for column '"
+                + name.split(".")[-1]
+                + "'. Defaulting to 'String'",
+                file=sys.stderr,
+            )
+            data_type = STRING
+        return cls(name, data_type, _is_nested(arrow_type), **kwargs)
+
+    @classmethod
+    def from_sketch(
+        cls, name: str, data_type: str, sketch: Dict[str, Any], **kwargs
+    ) -> _ColumnStatistics:
+        column = cls(name, data_type, sketch["nested"], **kwargs)
+        column.count = sketch["count"]
+        column.num_nulls = sketch["numNulls"]
+        if sketch.get("distinctValues") is not None:
+            column.distinct_values = HyperLogLog.from_dict(sketch["distinctValues"])
+        if sketch.get("moments") is not None:
+            column.moments = MomentsSketch.from_dict(sketch["moments"])
+        if sketch.get("quantiles") is not None:
+            column.quantiles = QuantileSketch.from_dict(sketch["quantiles"])
+        if column.value_counts is not None:
+            column.value_counts = (
+                ValueCounts.from_dict(sketch["valueCounts"])
+                if sketch.get("valueCounts") is not None
+                else None
+            )
+        return column
+
+    def to_sketch_dict(self) -> Dict[str, Any]:
+        return {
+            "nested": self.is_nested,
+            "count": self.count,
+            "numNulls": self.num_nulls,
+            "distinctValues": self.distinct_values.to_dict()
+            if self.distinct_values is not None
+            else None,
+            "moments": self.moments.to_dict() if self.moments is not None else None,
+            "quantiles": self.quantiles.to_dict()
+            if self.quantiles is not None
+            else None,
+            # exact distinct values are not persisted, their size is not bounded
+            "valueCounts": self.value_counts.to_dict()
+            if self.value_counts is not None and not self.exact_uniqueness
+            else None,
+        }
+
+    def update(self, array: pa.Array, numerical_values: Optional[np.ndarray]) -> None:
+        self.count += len(array)
+        if self.is_nested:
+            self.num_nulls += array.null_count
+            return
+
+        if self.is_numerical:
+            if self.data_type == INTEGRAL:
+                # integers are not cast to floats, large distinct integers would be hashed to the same value
+                values = array.drop_null().to_numpy(zero_copy_only=False)
+                self.num_nulls += array.null_count
+            else:
+                # NaN values count as missing values, like in pandas
+                values = numerical_values[~np.isnan(numerical_values)]
+                self.num_nulls += len(array) - len(values)
+            self.moments.update(values)
+            self.quantiles.update(values)
+            self.distinct_values.update_hashes(pd.util.hash_array(values))
+            if self.value_counts is not None:
+                distinct, counts = np.unique(values, return_counts=True)
+                self.value_counts.update(distinct.tolist(), counts.tolist())
+            return
+
+        if pa.types.is_dictionary(array.type):
+            array = array.dictionary_decode()
+        self.num_nulls += array.null_count
+        array = array.drop_null()
+        self.distinct_values.update_hashes(pd.util.hash_array(_hashable_values(array)))
+        if self.value_counts is not None:
+            counts = pc.value_counts(array)
+            self.value_counts.update(
+                [
+                    _histogram_value(value)
+                    for value in counts.field("values").to_pylist()
+                ],
+                counts.field("counts").to_pylist(),
+            )
+            if (
+                not self.exact_uniqueness
+                and len(self.value_counts.counts) > MAXIMUM_HISTOGRAM_DISTINCT_VALUES
+            ):
+                # too many distinct values for a histogram, stop counting them
+                self.value_counts = None
+
+    def merge(self, other: _ColumnStatistics) -> None:
+        self.count += other.count
+        self.num_nulls += other.num_nulls
+        if self.distinct_values is not None:
+            self.distinct_values.merge(other.distinct_values)
+        if self.is_numerical:
+            self.moments.merge(other.moments)
+            self.quantiles.merge(other.quantiles)
+        if self.value_counts is not None:
+            if other.value_counts is None:
+                self.value_counts = None
+            else:
+                self.value_counts.merge(other.value_counts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        num_non_null = self.count - self.num_nulls
+        stats = {
+            "column": self.name.split(".")[-1],
+            "dataType": self.data_type,
+            "isDataTypeInferred": "false",
+            "count": self.count,
+            "numRecordsNull": self.num_nulls,
+            "numRecordsNonNull": num_non_null,
+            "completeness": num_non_null / self.count if self.count else 0.0,
+        }
+        if self.distinct_values is not None:
+            stats["approximateNumDistinctValues"] = min(
+                self.distinct_values.estimate(), num_non_null
+            )
+        if self.exact_uniqueness and self.value_counts is not None:
+            stats.update(self.value_counts.uniqueness_statistics())
+        if self.is_numerical and num_non_null > 0:
+            stats["minimum"] = self.moments.minimum
+            stats["maximum"] = self.moments.maximum
+            stats["sum"] = self.moments.sum
+            stats["mean"] = self.moments.mean
+            stats["stdDev"] = self.moments.stddev
+            stats["approxPercentiles"] = self.quantiles.quantiles(PERCENTILES)
+        if self.histograms and num_non_null > 0:
+            histogram = self._histogram()
+            if histogram is not None:
+                stats["histogram"] = histogram
+        return stats
+
+    def _histogram(self) -> Optional[List[Dict[str, Any]]]:
+        if self.is_numerical:
+            histogram = self.quantiles.histogram(self.num_histogram_bins)
+            if histogram is None:
+                return None
+            counts, edges = histogram
+            bins = [
+                ("%.2f to %.2f" % (low, high), count)
+                for low, high, count in zip(edges[:-1], edges[1:], counts.tolist())
+            ]
+        elif self.value_counts is not None:
+            bins = self.value_counts.counts.most_common()
+        else:
+            return None
+        if self.num_nulls > 0:
+            bins.append((NULL_VALUE, self.num_nulls))
+        return [
+            {"value": value, "count": count, "ratio": count / self.count}
+            for value, count in bins
+        ]
+
+
+class ArrowStatisticsEngine:
+    """Compute descriptive statistics of Arrow record batches.
+
+    # Arguments
+        schema: Arrow schema of the data.
+        columns: Names of the features to compute statistics for, defaults to all features.
+        correlations: Whether to compute the Pearson correlation between numerical features.
+        histograms: Whether to compute histograms of the features.
+        exact_uniqueness: Whether to compute exact distinct values statistics, this keeps every distinct value in memory.
+        num_histogram_bins: Number of equal width bins of numerical features histograms.
+        include_sketches: Whether to include the sketches of each feature in its statistics, under the `"sketch"` key.
+            Exact distinct values statistics cannot be restored from the sketches.
+    """
+
+    def __init__(
+        self,
+        schema: pa.Schema,
+        columns: Optional[List[str]] = None,
+        correlations: bool = False,
+        histograms: bool = False,
+        exact_uniqueness: bool = False,
+        num_histogram_bins: int = DEFAULT_NUM_HISTOGRAM_BINS,
+        include_sketches: bool = False,
+    ):
+        if not columns:
+            columns = schema.names
+        self._column_options = {
+            "histograms": histograms,
+            "exact_uniqueness": exact_uniqueness,
+            "num_histogram_bins": num_histogram_bins,
+            "quantile_sketch_k": PERSISTED_QUANTILE_SKETCH_K
+            if include_sketches
+            else QuantileSketch.DEFAULT_K,
+            "distinct_values_precision": PERSISTED_DISTINCT_VALUES_PRECISION
+            if include_sketches
+            else HyperLogLog.DEFAULT_PRECISION,
+        }
+        self._columns = {
+            name: _ColumnStatistics.from_arrow_type(
+                name, schema.field(name).type, **self._column_options
+            )
+            for name in columns
+            if name in schema.names
+        }
+        self._correlations = correlations
+        self._include_sketches = include_sketches
+        self._co_moments = self._init_co_moments()
+
+    def _init_co_moments(self) -> Dict[Tuple[str, str], CoMomentsSketch]:
+        if not self._correlations:
+            return {}
+        numerical_columns = [
+            name for name, column in self._columns.items() if column.is_numerical
+        ]
+        return {
+            pair: CoMomentsSketch()
+            for pair in itertools.combinations(numerical_columns, 2)
+        }
+
+    @classmethod
+    def from_sketches(
+        cls,
+        column_statistics: List[Dict[str, Any]],
+        correlations: bool = False,
+        histograms: bool = False,
+        num_histogram_bins: int = DEFAULT_NUM_HISTOGRAM_BINS,
+    ) -> ArrowStatisticsEngine:
+        """Restore an engine from statistics of features that include their sketches.
+
+        # Arguments
+            column_statistics: Statistics of the features in the Deequ format, including the `"sketch"` key.
+            correlations: Whether to compute the Pearson correlation between numerical features.
+            histograms: Whether to compute histograms of the features.
+            num_histogram_bins: Number of equal width bins of numerical features histograms.
+
+        # Returns
+            `ArrowStatisticsEngine`. Engine that can be merged with other engines restored from sketches.
+        """
+        engine = cls(
+            pa.schema([]),
+            correlations=correlations,
+            histograms=histograms,
+            num_histogram_bins=num_histogram_bins,
+            include_sketches=True,
+        )
+        engine._columns = {
+            stats["column"]: _ColumnStatistics.from_sketch(
+                stats["column"],
+                stats["dataType"],
+                stats[SKETCH],
+                **engine._column_options,
+            )
+            for stats in column_statistics
+        }
+        engine._co_moments = engine._init_co_moments()
+        for stats in column_statistics:
+            for other_name, co_moments in stats[SKETCH].get("coMoments", {}).items():
+                if (stats["column"], other_name) in engine._co_moments:
+                    engine._co_moments[(stats["column"], other_name)] = (
+                        CoMomentsSketch.from_dict(co_moments)
+                    )
+        return engine
+
+    def update(self, data: Union[pa.RecordBatch, pa.Table]) -> ArrowStatisticsEngine:
+        """Add the rows of a record batch or table to the statistics.
+
+        # Arguments
+            data: Arrow record batch or table, with the schema the engine was created with.
+
+        # Returns
+            `ArrowStatisticsEngine`. The engine itself.
+        """
+        batches = (
+            data.to_batches(max_chunksize=DEFAULT_BATCH_SIZE)
+            if isinstance(data, pa.Table)
+            else [data]
+        )
+        for batch in batches:
+            numerical_values = {}
+            for name, column in self._columns.items():
+                array = batch.column(name)
+                if column.is_numerical:
+                    numerical_values[name] = array.cast(
+                        pa.float64(), safe=False
+                    ).to_numpy(zero_copy_only=False)
+                column.update(array, numerical_values.get(name))
+            for (x, y), co_moments in self._co_moments.items():
+                co_moments.update(numerical_values[x], numerical_values[y])
+        return self
+
+    def merge(self, other: ArrowStatisticsEngine) -> ArrowStatisticsEngine:
+        """Merge the statistics of another part of the data into this engine.
+
+        # Arguments
+            other: Engine computing the same statistics of the same features on another part of the data.
+
+        # Returns
+            `ArrowStatisticsEngine`. The engine itself.
+
+        # Raises
+            `ValueError`: If the engines compute statistics of different features.
+        """
+        if list(self._columns) != list(other._columns):
+            raise ValueError(
+                "Only statistics of the same features can be merged, got {} and {}.".format(
+                    list(self._columns), list(other._columns)
+                )
+            )
+        for name, column in self._columns.items():
+            column.merge(other._columns[name])
+        for pair, co_moments in self._co_moments.items():
+            co_moments.merge(other._co_moments[pair])
+        return self
+
+    def to_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Statistics of the features in the Deequ format."""
+        columns = []
+        for name, column in self._columns.items():
+            stats = column.to_dict()
+            if self._correlations and column.is_numerical:
+                stats["correlations"] = self._column_correlations(name)
+            if self._include_sketches:
+                stats[SKETCH] = column.to_sketch_dict()
+                stats[SKETCH]["coMoments"] = {
+                    other_name.split(".")[-1]: co_moments.to_dict()
+                    for (
+                        column_name,
+                        other_name,
+                    ), co_moments in self._co_moments.items()
+                    if column_name == name
+                }
+            columns.append(stats)
+        return {"columns": columns}
+
+    def to_json(self) -> str:
+        """Statistics of the features serialized in the Deequ JSON format."""
+        return json.dumps(self.to_dict())
+
+    def _column_correlations(self, name: str) -> List[Dict[str, Any]]:
+        correlations = []
+        for other_name, other_column in self._columns.items():
+            if not other_column.is_numerical:
+                continue
+            if other_name == name:
+                correlation = 1.0
+            else:
+                co_moments = self._co_moments.get(
+                    (name, other_name), self._co_moments.get((other_name, name))
+                )
+                correlation = co_moments.correlation
+            if correlation is not None:
+                correlations.append(
+                    {
+                        "column": other_name.split(".")[-1],
+                        "correlation": correlation,
+                    }
+                )
+        return correlations
+
+    @classmethod
+    def profile(
+        cls,
+        data: Union[
+            pd.DataFrame,
+            pl.DataFrame,
+            pa.Table,
+            pa.RecordBatchReader,
+            Iterable[pa.RecordBatch],
+        ],
+        columns: Optional[List[str]] = None,
+        correlations: bool = False,
+        histograms: bool = False,
+        exact_uniqueness: bool = False,
+        num_histogram_bins: int = DEFAULT_NUM_HISTOGRAM_BINS,
+        include_sketches: bool = False,
+    ) -> str:
+        """Compute descriptive statistics of a dataframe or a stream of record batches.
+
+        # Arguments
+            data: Pandas or Polars dataframe, Arrow table, or iterable of Arrow record batches.
+            columns: Names of the features to compute statistics for, defaults to all features.
+            correlations: Whether to compute the Pearson correlation between numerical features.
+            histograms: Whether to compute histograms of the features.
+            exact_uniqueness: Whether to compute exact distinct values statistics.
+            num_histogram_bins: Number of equal width bins of numerical features histograms.
+            include_sketches: Whether to include the sketches of each feature in its statistics.
+
+        # Returns
+            `str`. Statistics of the features serialized in the Deequ JSON format.
+        """
+        if HAS_PANDAS and isinstance(data, pd.DataFrame):
+            data = pa.Table.from_pandas(data, preserve_index=False)
+        elif HAS_POLARS and isinstance(data, pl.DataFrame):
+            data = data.to_arrow()
+
+        if isinstance(data, (pa.Table, pa.RecordBatchReader)):
+            schema = data.schema
+            batches = data.to_batches() if isinstance(data, pa.Table) else data
+        else:
+            batches = iter(data)
+            first_batch = next(batches, None)
+            if first_batch is None:
+                # the types of the features are unknown without any record batch, null features are profiled as strings
+                schema = pa.schema([(name, pa.null()) for name in columns or []])
+            else:
+                schema = first_batch.schema
+                batches = itertools.chain([first_batch], batches)
+
+        engine = cls(
+            schema,
+            columns=columns,
+            correlations=correlations,
+            histograms=histograms,
+            exact_uniqueness=exact_uniqueness,
+            num_histogram_bins=num_histogram_bins,
+            include_sketches=include_sketches,
+        )
+        for batch in batches:
+            engine.update(batch)
+        return engine.to_json()
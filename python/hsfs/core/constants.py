@@ -20,7 +20,9 @@ from hopsworks_common.core.constants import (
     HAS_CONFLUENT_KAFKA,
     HAS_FAST_AVRO,
     HAS_GREAT_EXPECTATIONS,
+    HAS_MSGSPEC,
     HAS_NUMPY,
+    HAS_ORJSON,
     HAS_PANDAS,
     HAS_POLARS,
     HAS_PYARROW,
@@ -37,7 +39,9 @@ __all__ = [
     "HAS_CONFLUENT_KAFKA",
     "HAS_FAST_AVRO",
     "HAS_GREAT_EXPECTATIONS",
+    "HAS_MSGSPEC",
     "HAS_NUMPY",
+    "HAS_ORJSON",
     "HAS_PANDAS",
     "HAS_POLARS",
     "HAS_SQLALCHEMY",
@@ -169,6 +169,8 @@ class FeatureDescriptiveStatistics:
             extended_statistics["histogram"] = json_dict["histogram"]
         if "kll" in json_dict:
             extended_statistics["kll"] = json_dict["kll"]
+        if "sketch" in json_dict:
+            extended_statistics["sketch"] = json_dict["sketch"]
         stats_dict["extended_statistics"] = (
             extended_statistics if extended_statistics else None
         )
@@ -0,0 +1,146 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+_logger = logging.getLogger(__name__)
+
+
+class FeatureVectorCache:
+    """Thread safe LRU cache with time to live for raw feature vectors read from the online feature store.
+
+    Entries are keyed by the serving key values of the lookup. The cached values are the raw results
+    returned by the online store client, before passed features, on-demand and model-dependent
+    transformations are applied.
+
+    # Arguments
+        max_size: Maximum number of feature vectors kept in the cache, least recently used ones are evicted first.
+        ttl: Time to live of a cached feature vector in seconds.
+        clock: Monotonic clock returning seconds, used for testing.
+    """
+
+    MAX_SIZE_KEY = "max_size"
+    TTL_KEY = "ttl"
+    DEFAULT_MAX_SIZE = 10000
+    DEFAULT_TTL = 60.0
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_size <= 0:
+            raise ValueError(
+                "Feature vector cache `max_size` must be a positive integer."
+            )
+        if ttl <= 0:
+            raise ValueError("Feature vector cache `ttl` must be a positive number.")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, Tuple[float, Dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> FeatureVectorCache:
+        """Create the cache from the `cache_config` passed to `init_serving`."""
+        max_size = config.get(cls.MAX_SIZE_KEY, cls.DEFAULT_MAX_SIZE)
+        ttl = config.get(cls.TTL_KEY, cls.DEFAULT_TTL)
+        _logger.debug(
+            "Initialising feature vector cache with max size %s and ttl %s seconds.",
+            max_size,
+            ttl,
+        )
+        return cls(max_size=max_size, ttl=ttl)
+
+    @staticmethod
+    def make_key(entry: Dict[str, Any], *namespace: Hashable) -> Optional[Hashable]:
+        """Build the cache key of a serving key entry, returns `None` if the entry values are not hashable."""
+        try:
+            key = (namespace, tuple(sorted(entry.items())))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Optional[Hashable]) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached feature vector, or `None` if it is missing or expired."""
+        if key is None:
+            return None
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                self._misses += 1
+                return None
+            expires_at, value = cached
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        # Callers update the returned dictionary with passed features, never hand out the cached one.
+        return dict(value)
+
+    def put(self, key: Optional[Hashable], value: Dict[str, Any]) -> None:
+        """Cache a feature vector, evicting the least recently used ones if the cache is full."""
+        if key is None or not value:
+            # Do not cache entries missing in the online store, they may be written any time.
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl, dict(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all feature vectors from the cache, the hit and miss counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Number of hits, misses and evictions since the cache was created and its current size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+            }
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of feature vectors kept in the cache."""
+        return self._max_size
+
+    @property
+    def ttl(self) -> float:
+        """Time to live of a cached feature vector in seconds."""
+        return self._ttl
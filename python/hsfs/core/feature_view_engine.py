@@ -887,6 +887,9 @@ class FeatureViewEngine:
         return td
 
     def delete_training_data(self, feature_view_obj, training_data_version=None):
+        self._transformation_function_engine.clear_feature_statistics_cache(
+            feature_view_obj, training_data_version
+        )
         if training_data_version:
             self._feature_view_api.delete_training_data_version(
                 feature_view_obj.name, feature_view_obj.version, training_data_version
@@ -26,7 +26,9 @@ if TYPE_CHECKING:
 from hsfs import engine, util, validation_report
 from hsfs import expectation_suite as es
 from hsfs import feature_group as fg_mod
+from hsfs.core import native_expectation_engine
 from hsfs.core.constants import HAS_GREAT_EXPECTATIONS
+from hsfs.validation_report import ValidationReport
 
 
 class GreatExpectationEngine:
@@ -39,6 +41,9 @@ class GreatExpectationEngine:
         :rtype: `GreatExpectationEngine`
         """
         self._feature_store_id = feature_store_id
+        self._native_expectation_engine = (
+            native_expectation_engine.NativeExpectationEngine()
+        )
 
     def validate(
         self,
@@ -65,9 +70,21 @@ class GreatExpectationEngine:
             feature_group, expectation_suite, validation_options
         )
 
-        if self.should_run_validation(
+        if not self.should_run_validation(
             expectation_suite=suite, validation_options=validation_options
         ):
+            # if run_validation is False we skip validation and saving_report
+            return
+
+        if validation_options.get(
+            "native_validation", False
+        ) and self._native_expectation_engine.is_supported_dataframe(dataframe):
+            report = self._native_expectation_engine.validate(
+                dataframe=dataframe,
+                expectation_suite=suite,
+                ge_validate_kwargs=validation_options.get("ge_validate_kwargs", {}),
+            )
+        else:
             if not HAS_GREAT_EXPECTATIONS:
                 raise ModuleNotFoundError(
                     f"Feature Group {feature_group.name}, v{feature_group.version} is configured to run validation with Great Expectations, "
@@ -82,9 +99,6 @@ class GreatExpectationEngine:
                 expectation_suite=suite.to_ge_type(),
                 ge_validate_kwargs=validation_options.get("ge_validate_kwargs", {}),
             )
-        else:
-            # if run_validation is False we skip validation and saving_report
-            return
 
         if report.success:
             print("Validation succeeded.")
@@ -142,7 +156,10 @@ class GreatExpectationEngine:
     def save_or_convert_report(
         self,
         feature_group,
-        report: great_expectations.core.ExpectationSuiteValidationResult,
+        report: Union[
+            great_expectations.core.ExpectationSuiteValidationResult,
+            validation_report.ValidationReport,
+        ],
         save_report: bool,
         ge_type: bool,
         validation_options: Dict[str, Any],
@@ -159,6 +176,13 @@ class GreatExpectationEngine:
                 report, ingestion_result=ingestion_result, ge_type=ge_type
             )
 
+        if isinstance(report, ValidationReport):
+            # report of the native expectation engine
+            if ge_type and HAS_GREAT_EXPECTATIONS:
+                return report.to_ge_type()
+            report.ingestion_result = ingestion_result
+            return report
+
         if ge_type:
             return report
         else:
@@ -16,9 +16,22 @@
 from __future__ import annotations
 
 import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from io import BytesIO
-from typing import TYPE_CHECKING, Any, Callable, Dict, Literal, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from hopsworks_common import client
 from hopsworks_common.core.constants import (
@@ -27,6 +40,7 @@ from hopsworks_common.core.constants import (
     HAS_FAST_AVRO,
     HAS_NUMPY,
     HAS_PANDAS,
+    HAS_POLARS,
     avro_not_installed_message,
 )
 from hopsworks_common.decorators import uses_confluent_kafka
@@ -40,6 +54,9 @@ if HAS_NUMPY:
 if HAS_PANDAS:
     import pandas as pd
 
+if HAS_POLARS:
+    import polars as pl
+
 if HAS_CONFLUENT_KAFKA:
     from confluent_kafka import Consumer, KafkaError, Producer, TopicPartition
 
@@ -55,6 +72,9 @@ if TYPE_CHECKING:
     from hsfs.feature_group import ExternalFeatureGroup, FeatureGroup
 
 
+DEFAULT_ENCODING_CHUNK_SIZE = 10000
+
+
 @uses_confluent_kafka
 def init_kafka_consumer(
     feature_store_id: int,
@@ -239,22 +259,24 @@ def get_encoder_func(writer_schema: str) -> callable:
     return lambda record, outf: writer.write(record, avro.io.BinaryEncoder(outf))
 
 
+def _normalize_value(value: Any) -> Any:
+    # for avro to be able to serialize them, they need to be python data types
+    if HAS_NUMPY and isinstance(value, np.ndarray):
+        return value.tolist()
+    if HAS_PANDAS and isinstance(value, pd.Timestamp):
+        value = value.to_pydatetime()
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    if HAS_PANDAS and isinstance(value, pd._libs.missing.NAType):
+        return None
+    return value
+
+
 def encode_row(complex_feature_writers, writer, row):
     # transform special data types
-    # here we might need to handle also timestamps and other complex types
-    # possible optimizaiton: make it based on type so we don't need to loop over
-    # all keys in the row
     if isinstance(row, dict):
         for k in row.keys():
-            # for avro to be able to serialize them, they need to be python data types
-            if HAS_NUMPY and isinstance(row[k], np.ndarray):
-                row[k] = row[k].tolist()
-            if HAS_PANDAS and isinstance(row[k], pd.Timestamp):
-                row[k] = row[k].to_pydatetime()
-            if isinstance(row[k], datetime) and row[k].tzinfo is None:
-                row[k] = row[k].replace(tzinfo=timezone.utc)
-            if HAS_PANDAS and isinstance(row[k], pd._libs.missing.NAType):
-                row[k] = None
+            row[k] = _normalize_value(row[k])
     # encode complex features
     row = encode_complex_features(complex_feature_writers, row)
     # encode feature row
@@ -264,6 +286,173 @@ def encode_row(complex_feature_writers, writer, row):
     return encoded_row
 
 
+def _normalize_pandas_column(series: pd.Series) -> List[Any]:
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        if series.dt.tz is None:
+            series = series.dt.tz_localize(timezone.utc)
+        return [
+            None if value is pd.NaT else value for value in series.array.to_pydatetime()
+        ]
+    values = series.tolist()
+    if series.dtype == object:
+        # object columns can hold arrays, timestamps or missing values of any kind
+        return [_normalize_value(value) for value in values]
+    if isinstance(series.dtype, pd.api.extensions.ExtensionDtype) and series.hasnans:
+        return [None if value is pd.NA else value for value in values]
+    return values
+
+
+def _normalize_polars_column(series: pl.Series) -> List[Any]:
+    values = series.to_list()
+    if series.dtype == pl.Datetime and getattr(series.dtype, "time_zone", None) is None:
+        return [
+            value if value is None else value.replace(tzinfo=timezone.utc)
+            for value in values
+        ]
+    return values
+
+
+def normalize_dataframe_columns(
+    dataframe: Union[pd.DataFrame, pl.DataFrame],
+) -> Dict[str, List[Any]]:
+    """Convert the columns of a dataframe to lists of python values which avro can serialize.
+
+    Conversions are chosen once per column from its dtype: naive timestamps are localized to UTC,
+    numpy arrays are converted to lists and pandas missing values to `None`.
+    """
+    if HAS_PANDAS and isinstance(dataframe, pd.DataFrame):
+        return {
+            name: _normalize_pandas_column(series) for name, series in dataframe.items()
+        }
+    return {
+        series.name: _normalize_polars_column(series)
+        for series in dataframe.get_columns()
+    }
+
+
+def build_kafka_keys(
+    columns: Dict[str, List[Any]], primary_key: List[str], num_rows: int
+) -> List[str]:
+    """Build the Kafka message key of each row from its primary key values."""
+    if not primary_key:
+        return [""] * num_rows
+    return [
+        "".join(values)
+        for values in zip(*[map(str, columns[pk]) for pk in sorted(primary_key)])
+    ]
+
+
+def _write_to_buffer(writer: Callable, record: Any, outf: BytesIO) -> bytes:
+    outf.seek(0)
+    outf.truncate()
+    writer(record, outf)
+    return outf.getvalue()
+
+
+def encode_columns(
+    complex_feature_writers: Dict[str, Callable],
+    writer: Callable,
+    columns: Dict[str, List[Any]],
+) -> List[bytes]:
+    """Avro encode the rows of normalized columns, reusing a single buffer for all records."""
+    with BytesIO() as outf:
+        for feature_name, feature_writer in complex_feature_writers.items():
+            columns[feature_name] = [
+                _write_to_buffer(feature_writer, value, outf)
+                for value in columns[feature_name]
+            ]
+        names = list(columns.keys())
+        return [
+            _write_to_buffer(writer, dict(zip(names, values)), outf)
+            for values in zip(*columns.values())
+        ]
+
+
+_process_encoders: Dict[str, Callable] = {}
+
+
+def _encode_columns_with_schemas(
+    complex_feature_schemas: Dict[str, str],
+    writer_schema: str,
+    columns: Dict[str, List[Any]],
+) -> List[bytes]:
+    # runs in a worker process, encoder functions can not be pickled so they are built from the schemas
+    for schema in [writer_schema, *complex_feature_schemas.values()]:
+        if schema not in _process_encoders:
+            _process_encoders[schema] = get_encoder_func(schema)
+    return encode_columns(
+        {
+            feature_name: _process_encoders[schema]
+            for feature_name, schema in complex_feature_schemas.items()
+        },
+        _process_encoders[writer_schema],
+        columns,
+    )
+
+
+def encode_dataframe(
+    feature_group: Union[FeatureGroup, ExternalFeatureGroup],
+    dataframe: Union[pd.DataFrame, pl.DataFrame],
+    complex_feature_writers: Dict[str, Callable],
+    writer: Callable,
+    chunk_size: Optional[int] = None,
+    num_processes: Optional[int] = None,
+) -> Iterator[Tuple[str, bytes]]:
+    """Encode a dataframe to Kafka messages, yielding the key and avro encoded value of each row in order.
+
+    The dataframe is encoded in chunks, types are normalized column-wise and keys are precomputed for
+    each chunk. If `num_processes` is larger than 1, chunks are encoded concurrently in a process pool.
+    """
+    chunk_size = chunk_size or DEFAULT_ENCODING_CHUNK_SIZE
+    num_rows = len(dataframe)
+
+    def normalized_chunks() -> Iterator[Tuple[List[str], Dict[str, List[Any]]]]:
+        for start in range(0, num_rows, chunk_size):
+            if HAS_PANDAS and isinstance(dataframe, pd.DataFrame):
+                chunk = dataframe.iloc[start : start + chunk_size]
+            else:
+                chunk = dataframe.slice(start, chunk_size)
+            columns = normalize_dataframe_columns(chunk)
+            yield (
+                build_kafka_keys(columns, feature_group.primary_key, len(chunk)),
+                columns,
+            )
+
+    if not num_processes or num_processes <= 1:
+        for keys, columns in normalized_chunks():
+            yield from zip(
+                keys, encode_columns(complex_feature_writers, writer, columns)
+            )
+        return
+
+    complex_feature_schemas = {
+        feature_name: feature_group._get_feature_avro_schema(feature_name)
+        for feature_name in complex_feature_writers
+    }
+    writer_schema = feature_group._get_encoded_avro_schema()
+    with ProcessPoolExecutor(max_workers=num_processes) as executor:
+        # bound the number of chunks in flight to limit memory usage
+        pending = deque()
+        for keys, columns in normalized_chunks():
+            pending.append(
+                (
+                    keys,
+                    executor.submit(
+                        _encode_columns_with_schemas,
+                        complex_feature_schemas,
+                        writer_schema,
+                        columns,
+                    ),
+                )
+            )
+            if len(pending) > num_processes:
+                keys, future = pending.popleft()
+                yield from zip(keys, future.result())
+        while pending:
+            keys, future = pending.popleft()
+            yield from zip(keys, future.result())
+
+
 def get_kafka_config(
     feature_store_id: int,
     write_options: Optional[Dict[str, Any]] = None,
@@ -20,6 +20,7 @@ from datetime import datetime, timedelta
 from typing import List, Optional, Tuple, TypeVar, Union
 
 from hopsworks_common.client.exceptions import RestAPIError
+from hopsworks_common.core.constants import HAS_PANDAS
 from hsfs import feature_group, feature_view, util
 from hsfs.core import monitoring_window_config as mwc
 from hsfs.core import statistics_engine
@@ -27,6 +28,10 @@ from hsfs.core.feature_descriptive_statistics import FeatureDescriptiveStatistic
 from hsfs.training_dataset_split import TrainingDatasetSplit
 
 
+if HAS_PANDAS:
+    import pandas as pd
+
+
 class MonitoringWindowConfigEngine:
     _MAX_TIME_RANGE_LENGTH = 12
 
@@ -354,7 +359,10 @@ class MonitoringWindowConfigEngine:
                 )
 
             if row_percentage < 1.0:
-                entity_df = entity_df.sample(fraction=row_percentage)
+                if HAS_PANDAS and isinstance(entity_df, pd.DataFrame):
+                    entity_df = entity_df.sample(frac=row_percentage)
+                else:
+                    entity_df = entity_df.sample(fraction=row_percentage)
 
         except RestAPIError as e:
             if (
@@ -364,8 +372,6 @@ class MonitoringWindowConfigEngine:
                 # creating an empty Spark DataFrame requires a valid schema [SchemaType(name, type)]
                 # and takes unnecessary time and resources. We can return an empty pandas dataframe instead
                 # because the computation of statistics will be discarded in statistics_engine (len(df.head()) == 0)
-                import pandas as pd
-
                 return pd.DataFrame(columns=[feat.name for feat in entity.schema])
             else:
                 raise e
@@ -397,7 +403,10 @@ class MonitoringWindowConfigEngine:
         ).read()
 
         if feature_name:
-            entity_df = entity_df.select(feature_name)
+            if HAS_PANDAS and isinstance(entity_df, pd.DataFrame):
+                entity_df = entity_df[[feature_name]]
+            else:
+                entity_df = entity_df.select(feature_name)
 
         return entity_df
 
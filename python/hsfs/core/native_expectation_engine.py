@@ -0,0 +1,399 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from __future__ import annotations
+
+import datetime
+import decimal
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+from hopsworks_common.core.constants import HAS_POLARS, HAS_PYARROW
+from hsfs import engine
+from hsfs import expectation_suite as es
+from hsfs import ge_expectation as ge_exp
+from hsfs.core.constants import HAS_GREAT_EXPECTATIONS
+from hsfs.ge_validation_result import ValidationResult
+from hsfs.validation_report import ValidationReport
+
+
+if HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+if HAS_POLARS:
+    import polars as pl
+
+if HAS_GREAT_EXPECTATIONS:
+    import great_expectations
+
+
+class NativeExpectationEngine:
+    """Engine evaluating the most common expectations of a suite on the Arrow arrays of a DataFrame.
+
+    Results have the structure of the results of Great Expectations with the default `BASIC` result format.
+    Expectations that are not supported, or that cannot be evaluated on the Arrow type of their column,
+    are evaluated with Great Expectations.
+    """
+
+    # max number of unexpected values listed in a result, as in Great Expectations
+    PARTIAL_UNEXPECTED_LIST_SIZE = 20
+
+    COLUMN_MAP_KWARGS = {"column", "mostly"}
+    COLUMN_AGGREGATE_KWARGS = {
+        "column",
+        "min_value",
+        "max_value",
+        "strict_min",
+        "strict_max",
+    }
+
+    SUPPORTED_EXPECTATIONS = {
+        "expect_column_values_to_not_be_null": COLUMN_MAP_KWARGS,
+        "expect_column_values_to_be_between": COLUMN_MAP_KWARGS
+        | {"min_value", "max_value", "strict_min", "strict_max"},
+        "expect_column_values_to_be_in_set": COLUMN_MAP_KWARGS | {"value_set"},
+        "expect_column_values_to_be_unique": COLUMN_MAP_KWARGS,
+        "expect_column_values_to_match_regex": COLUMN_MAP_KWARGS | {"regex"},
+        "expect_column_mean_to_be_between": COLUMN_AGGREGATE_KWARGS,
+        "expect_column_stdev_to_be_between": COLUMN_AGGREGATE_KWARGS,
+    }
+
+    @staticmethod
+    def is_supported_dataframe(dataframe: Any) -> bool:
+        return HAS_PYARROW and (
+            isinstance(dataframe, pd.DataFrame)
+            or (HAS_POLARS and isinstance(dataframe, pl.DataFrame))
+        )
+
+    def is_supported(self, expectation: ge_exp.GeExpectation) -> bool:
+        supported_kwargs = self.SUPPORTED_EXPECTATIONS.get(expectation.expectation_type)
+        return (
+            supported_kwargs is not None
+            and "column" in expectation.kwargs
+            and set(expectation.kwargs.keys()) <= supported_kwargs
+            # evaluation parameters are resolved by Great Expectations
+            and not any(
+                isinstance(value, dict) for value in expectation.kwargs.values()
+            )
+        )
+
+    def validate(
+        self,
+        dataframe: Union[pd.DataFrame, pl.DataFrame],
+        expectation_suite: es.ExpectationSuite,
+        ge_validate_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> ValidationReport:
+        """Validate a DataFrame against an expectation suite.
+
+        # Arguments
+            dataframe: The pandas or polars DataFrame to validate.
+            expectation_suite: The expectation suite to validate the DataFrame against.
+            ge_validate_kwargs: kwargs of the validate method of Great Expectations, used to evaluate
+                the expectations that are not supported.
+
+        # Returns
+            `ValidationReport`. The report of the validation.
+
+        # Raises
+            `ModuleNotFoundError`: If Great Expectations is needed to evaluate some expectations
+                but it is not installed.
+        """
+        validation_time = datetime.datetime.now(datetime.timezone.utc)
+        columns = {}
+        results: List[Optional[ValidationResult]] = []
+        for expectation in expectation_suite.expectations:
+            result = None
+            if self.is_supported(expectation):
+                result = self._evaluate(dataframe, expectation, columns)
+            results.append(result)
+
+        fallback_expectations = [
+            expectation
+            for expectation, result in zip(expectation_suite.expectations, results)
+            if result is None
+        ]
+        if fallback_expectations:
+            fallback_results = iter(
+                self._validate_with_great_expectations(
+                    dataframe,
+                    expectation_suite,
+                    fallback_expectations,
+                    ge_validate_kwargs,
+                ).results
+            )
+            results = [
+                result if result is not None else next(fallback_results)
+                for result in results
+            ]
+
+        successful_expectations = sum(result.success for result in results)
+        return ValidationReport(
+            success=successful_expectations == len(results),
+            results=results,
+            evaluation_parameters={},
+            statistics={
+                "evaluated_expectations": len(results),
+                "successful_expectations": successful_expectations,
+                "unsuccessful_expectations": len(results) - successful_expectations,
+                "success_percent": successful_expectations / len(results) * 100
+                if results
+                else None,
+            },
+            meta={
+                "expectation_suite_name": expectation_suite.expectation_suite_name,
+                "run_id": {
+                    "run_name": None,
+                    "run_time": validation_time.isoformat(),
+                },
+                "batch_kwargs": {},
+                "batch_markers": {},
+                "batch_parameters": {},
+                "validation_time": validation_time.strftime("%Y%m%dT%H%M%S.%fZ"),
+                "expectation_suite_meta": expectation_suite.meta,
+            },
+        )
+
+    def _validate_with_great_expectations(
+        self,
+        dataframe: Union[pd.DataFrame, pl.DataFrame],
+        expectation_suite: es.ExpectationSuite,
+        expectations: List[ge_exp.GeExpectation],
+        ge_validate_kwargs: Optional[Dict[str, Any]],
+    ) -> ValidationReport:
+        if not HAS_GREAT_EXPECTATIONS:
+            raise ModuleNotFoundError(
+                "Expectations "
+                f"{', '.join(expectation.expectation_type for expectation in expectations)} "
+                "cannot be evaluated natively and Great Expectations is not installed. "
+                "Please install it using `pip install great_expectations`."
+            )
+        report = engine.get_instance().validate_with_great_expectations(
+            dataframe=dataframe,
+            expectation_suite=great_expectations.core.ExpectationSuite(
+                expectation_suite_name=expectation_suite.expectation_suite_name,
+                expectations=[expectation.to_ge_type() for expectation in expectations],
+                meta=expectation_suite.meta,
+            ),
+            ge_validate_kwargs=ge_validate_kwargs,
+        )
+        return ValidationReport(**report.to_json_dict())
+
+    def _get_column(
+        self,
+        dataframe: Union[pd.DataFrame, pl.DataFrame],
+        column: str,
+        columns: Dict[str, Optional[Union[pa.Array, pa.ChunkedArray]]],
+    ) -> Optional[Union[pa.Array, pa.ChunkedArray]]:
+        # columns are converted once and shared by the expectations of the suite
+        if column not in columns:
+            if column not in dataframe.columns:
+                columns[column] = None
+            elif isinstance(dataframe, pd.DataFrame):
+                try:
+                    columns[column] = pa.Array.from_pandas(dataframe[column])
+                except (
+                    pa.ArrowInvalid,
+                    pa.ArrowTypeError,
+                    pa.ArrowNotImplementedError,
+                ):
+                    # values of mixed types
+                    columns[column] = None
+            else:
+                columns[column] = dataframe[column].to_arrow()
+        return columns[column]
+
+    def _evaluate(
+        self,
+        dataframe: Union[pd.DataFrame, pl.DataFrame],
+        expectation: ge_exp.GeExpectation,
+        columns: Dict[str, Optional[Union[pa.Array, pa.ChunkedArray]]],
+    ) -> Optional[ValidationResult]:
+        array = self._get_column(dataframe, expectation.kwargs["column"], columns)
+        if array is None:
+            return None
+
+        kwargs = expectation.kwargs
+        try:
+            if expectation.expectation_type == "expect_column_values_to_not_be_null":
+                success, result = self._not_null_result(array, kwargs.get("mostly", 1))
+            elif expectation.expectation_type in [
+                "expect_column_mean_to_be_between",
+                "expect_column_stdev_to_be_between",
+            ]:
+                success, result = self._aggregate_result(
+                    array,
+                    pc.mean(array).as_py()
+                    if expectation.expectation_type
+                    == "expect_column_mean_to_be_between"
+                    # sample standard deviation, as pandas
+                    else pc.stddev(array, ddof=1).as_py(),
+                    kwargs,
+                )
+            else:
+                values = pc.drop_null(array)
+                is_expected = self._get_column_map_function(
+                    expectation.expectation_type
+                )(values, kwargs)
+                if is_expected is None:
+                    return None
+                success, result = self._column_map_result(
+                    array, values, is_expected, kwargs.get("mostly", 1)
+                )
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # e.g. comparison of a column with values of another type
+            return None
+
+        return ValidationResult(
+            success=success,
+            result=result,
+            expectation_config={
+                "expectation_type": expectation.expectation_type,
+                "kwargs": expectation.kwargs,
+                "meta": expectation.meta,
+            },
+            exception_info={
+                "raised_exception": False,
+                "exception_message": None,
+                "exception_traceback": None,
+            },
+            meta={},
+        )
+
+    def _get_column_map_function(self, expectation_type: str):
+        return {
+            "expect_column_values_to_be_between": self._is_between,
+            "expect_column_values_to_be_in_set": self._is_in_set,
+            "expect_column_values_to_be_unique": self._is_unique,
+            "expect_column_values_to_match_regex": self._matches_regex,
+        }[expectation_type]
+
+    @staticmethod
+    def _is_between(values, kwargs: Dict[str, Any]):
+        # values are not null, all of them are expected if there are no bounds
+        is_expected = pc.is_valid(values)
+        if kwargs.get("min_value") is not None:
+            compare = (
+                pc.greater if kwargs.get("strict_min", False) else pc.greater_equal
+            )
+            is_expected = pc.and_(is_expected, compare(values, kwargs["min_value"]))
+        if kwargs.get("max_value") is not None:
+            compare = pc.less if kwargs.get("strict_max", False) else pc.less_equal
+            is_expected = pc.and_(is_expected, compare(values, kwargs["max_value"]))
+        return is_expected
+
+    @staticmethod
+    def _is_in_set(values, kwargs: Dict[str, Any]):
+        return pc.is_in(values, value_set=pa.array(kwargs["value_set"]))
+
+    @staticmethod
+    def _is_unique(values, kwargs: Dict[str, Any]):
+        # all occurrences of duplicated values are unexpected
+        value_counts = pc.value_counts(values)
+        duplicated_values = pc.filter(
+            value_counts.field("values"), pc.greater(value_counts.field("counts"), 1)
+        )
+        return pc.invert(pc.is_in(values, value_set=duplicated_values))
+
+    @staticmethod
+    def _matches_regex(values, kwargs: Dict[str, Any]):
+        if not pa.types.is_string(values.type) and not pa.types.is_large_string(
+            values.type
+        ):
+            # Great Expectations matches the string representation of other values
+            return None
+        # pattern syntax errors of RE2 raise ArrowInvalid, e.g. for lookarounds
+        return pc.match_substring_regex(values, pattern=kwargs["regex"])
+
+    def _not_null_result(self, array, mostly: float):
+        element_count = len(array)
+        unexpected_count = array.null_count
+        return self._is_mostly(
+            element_count - unexpected_count, element_count, mostly
+        ), {
+            "element_count": element_count,
+            "unexpected_count": unexpected_count,
+            "unexpected_percent": self._percent(unexpected_count, element_count),
+            "unexpected_percent_total": self._percent(unexpected_count, element_count),
+            "partial_unexpected_list": [],
+        }
+
+    def _column_map_result(self, array, values, is_expected, mostly: float):
+        element_count = len(array)
+        missing_count = array.null_count
+        nonmissing_count = element_count - missing_count
+        unexpected_count = nonmissing_count - (pc.sum(is_expected).as_py() or 0)
+        unexpected_percent = self._percent(unexpected_count, nonmissing_count)
+        return self._is_mostly(
+            nonmissing_count - unexpected_count, nonmissing_count, mostly
+        ), {
+            "element_count": element_count,
+            "missing_count": missing_count,
+            "missing_percent": self._percent(missing_count, element_count),
+            "unexpected_count": unexpected_count,
+            "unexpected_percent": unexpected_percent,
+            "unexpected_percent_total": self._percent(unexpected_count, element_count),
+            "unexpected_percent_nonmissing": unexpected_percent,
+            "partial_unexpected_list": [
+                self._to_json_value(value)
+                for value in pc.filter(values, pc.invert(is_expected))
+                .slice(0, self.PARTIAL_UNEXPECTED_LIST_SIZE)
+                .to_pylist()
+            ],
+        }
+
+    def _aggregate_result(self, array, observed_value, kwargs: Dict[str, Any]):
+        element_count = len(array)
+        missing_count = array.null_count
+        success = observed_value is not None
+        if success and kwargs.get("min_value") is not None:
+            success = (
+                observed_value > kwargs["min_value"]
+                if kwargs.get("strict_min", False)
+                else observed_value >= kwargs["min_value"]
+            )
+        if success and kwargs.get("max_value") is not None:
+            success = (
+                observed_value < kwargs["max_value"]
+                if kwargs.get("strict_max", False)
+                else observed_value <= kwargs["max_value"]
+            )
+        return success, {
+            "observed_value": self._to_json_value(observed_value),
+            "element_count": element_count,
+            "missing_count": missing_count,
+            "missing_percent": 100 * missing_count / element_count
+            if element_count
+            else None,
+        }
+
+    @staticmethod
+    def _to_json_value(value: Any) -> Any:
+        # results are saved as JSON, values are converted like Great Expectations does
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, datetime.timedelta):
+            return str(value)
+        if isinstance(value, decimal.Decimal):
+            return float(value)
+        return value
+
+    @staticmethod
+    def _is_mostly(expected_count: int, count: int, mostly: float) -> bool:
+        return count == 0 or expected_count / count >= mostly
+
+    @staticmethod
+    def _percent(count: int, total: int) -> Optional[float]:
+        return count / total * 100 if total else None
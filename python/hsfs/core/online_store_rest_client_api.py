@@ -16,17 +16,23 @@
 import json
 import logging
 from datetime import date, datetime
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 from hsfs import util
 from hsfs.client import exceptions, online_store_rest_client
-from hsfs.core.constants import HAS_NUMPY
+from hsfs.core.constants import HAS_MSGSPEC, HAS_NUMPY, HAS_ORJSON
 from requests import Response
 
 
 if HAS_NUMPY:
     import numpy as np
 
+if HAS_ORJSON:
+    import orjson
+
+if HAS_MSGSPEC:
+    import msgspec
+
 _logger = logging.getLogger(__name__)
 
 if HAS_NUMPY:
@@ -52,12 +58,65 @@ if HAS_NUMPY:
 else:
     NpDatetimeEncoder = json.JSONEncoder
 
+JSON_DECODER_ORJSON = "orjson"
+JSON_DECODER_MSGSPEC = "msgspec"
+JSON_DECODER_JSON = "json"
+
+
+def get_json_decoder(name: Optional[str] = None) -> Callable[[bytes], Any]:
+    """Get the function used to decode the body of RonDB Rest Server responses.
+
+    # Arguments:
+        name: Name of the decoder, one of "orjson", "msgspec" or "json". Defaults to the fastest installed one.
+
+    # Returns:
+        A function decoding a JSON document from bytes.
+
+    # Raises:
+        `ValueError`: If the decoder name is unknown.
+        `ModuleNotFoundError`: If the package of the requested decoder is not installed.
+    """
+    if name is None:
+        if HAS_ORJSON:
+            name = JSON_DECODER_ORJSON
+        elif HAS_MSGSPEC:
+            name = JSON_DECODER_MSGSPEC
+        else:
+            name = JSON_DECODER_JSON
+    if name == JSON_DECODER_ORJSON:
+        if not HAS_ORJSON:
+            raise ModuleNotFoundError(
+                "orjson package not found, install it with `pip install orjson`."
+            )
+        return orjson.loads
+    elif name == JSON_DECODER_MSGSPEC:
+        if not HAS_MSGSPEC:
+            raise ModuleNotFoundError(
+                "msgspec package not found, install it with `pip install msgspec`."
+            )
+        return msgspec.json.decode
+    elif name == JSON_DECODER_JSON:
+        return json.loads
+    raise ValueError(
+        f"Unknown JSON decoder {name}, expected one of "
+        f"{[JSON_DECODER_ORJSON, JSON_DECODER_MSGSPEC, JSON_DECODER_JSON]}."
+    )
+
 
 class OnlineStoreRestClientApi:
     SINGLE_VECTOR_ENDPOINT = "feature_store"
     BATCH_VECTOR_ENDPOINT = "batch_feature_store"
     PING_ENDPOINT = "ping"
 
+    def __init__(self, json_decoder: Optional[str] = None):
+        """Client for the RonDB Rest Server Feature Store API.
+
+        # Arguments:
+            json_decoder: Name of the package used to decode responses, one of "orjson", "msgspec" or "json".
+                Defaults to the fastest installed one.
+        """
+        self._decode_json = get_json_decoder(json_decoder)
+
     def get_single_raw_feature_vector(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Get a single feature vector from the feature store.
 
@@ -94,9 +153,10 @@ class OnlineStoreRestClientApi:
                     or authorization header (x-api-key) is not properly set.
                 - 500: Internal server error.
         """
-        _logger.debug(
-            f"Sending request to RonDB Rest Server with payload: {json.dumps(payload, indent=2, cls=NpDatetimeEncoder)}"
-        )
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                f"Sending request to RonDB Rest Server with payload: {json.dumps(payload, indent=2, cls=NpDatetimeEncoder)}"
+            )
         return self.handle_rdrs_feature_store_response(
             online_store_rest_client.get_instance().send_request(
                 method="POST",
@@ -138,9 +198,10 @@ class OnlineStoreRestClientApi:
                     or authorization header (x-api-key) is not properly set.
                 - 500: Internal server error.
         """
-        _logger.debug(
-            f"Sending request to RonDB Rest Server with payload: {json.dumps(payload, indent=2, cls=NpDatetimeEncoder)}"
-        )
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                f"Sending request to RonDB Rest Server with payload: {json.dumps(payload, indent=2, cls=NpDatetimeEncoder)}"
+            )
         return self.handle_rdrs_feature_store_response(
             online_store_rest_client.get_instance().send_request(
                 method="POST",
@@ -179,8 +240,11 @@ class OnlineStoreRestClientApi:
             _logger.debug(
                 "Received response from RonDB Rest Server with status code 200"
             )
-            _logger.debug(f"Response: {json.dumps(response.json(), indent=2)}")
-            return response.json()
+            # Decode the body once, large batch responses are expensive to parse.
+            response_json = self._decode_json(response.content)
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(f"Response: {json.dumps(response_json, indent=2)}")
+            return response_json
         else:
             _logger.error(
                 f"Received response from RonDB Rest Server with status code {response.status_code}"
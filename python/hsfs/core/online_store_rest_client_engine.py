@@ -18,11 +18,16 @@ from __future__ import annotations
 import base64
 import itertools
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import requests
 from hsfs import training_dataset_feature as td_feature_mod
 from hsfs import util
+from hsfs.client import exceptions
 from hsfs.core import online_store_rest_client_api
 
 
@@ -36,7 +41,15 @@ class OnlineStoreRestClientEngine:
     MISSING_STATUS = "MISSING"
     BINARY_TYPE = "binary"
     DATE_TYPE = "date"
-    FEATURE_TYPE_TO_DECODE = [BINARY_TYPE, DATE_TYPE]
+    TIMESTAMP_TYPE = "timestamp"
+    JSON_DECODER = "json_decoder"
+    BATCH_CHUNK_SIZE = "batch_chunk_size"
+    BATCH_MAX_PARALLEL_REQUESTS = "batch_max_parallel_requests"
+    BATCH_CHUNK_RETRIES = "batch_chunk_retries"
+    _DEFAULT_BATCH_CHUNK_SIZE = 256
+    _DEFAULT_BATCH_MAX_PARALLEL_REQUESTS = 4
+    _DEFAULT_BATCH_CHUNK_RETRIES = 2
+    _BATCH_CHUNK_RETRY_BACKOFF_SECOND = 0.1
 
     def __init__(
         self,
@@ -44,6 +57,11 @@ class OnlineStoreRestClientEngine:
         feature_view_name: str,
         feature_view_version: int,
         features: List[td_feature_mod.TrainingDatasetFeature],
+        batch_chunk_size: Optional[int] = None,
+        batch_max_parallel_requests: Optional[int] = None,
+        batch_chunk_retries: Optional[int] = None,
+        json_decoder: Optional[str] = None,
+        decode_timestamps: bool = False,
     ):
         """Initialize the Online Store Rest Client Engine. This class contains the logic to mediate
         the interaction between the python client and the RonDB Rest Server Feature Store API.
@@ -54,12 +72,21 @@ class OnlineStoreRestClientEngine:
             feature_view_version: The version of the feature view from which to retrieve the feature vector.
             features: A list of features to be used for the feature vector conversion. Note that the features
                 must be ordered according to the feature vector schema.
+            batch_chunk_size: Maximum number of entries sent in a single batch request. Larger batches are split
+                into chunks which are sent concurrently. Defaults to 256.
+            batch_max_parallel_requests: Maximum number of chunks of a batch sent concurrently. Defaults to 4.
+            batch_chunk_retries: Number of times a chunk is retried on connection errors, timeouts or server errors. Defaults to 2.
+            json_decoder: Name of the package used to decode responses, one of "orjson", "msgspec" or "json".
+                Defaults to the fastest installed one.
+            decode_timestamps: Whether to convert timestamp feature values to python datetime objects.
         """
         _logger.debug(
             f"Initializing Online Store Rest Client Engine for Feature View {feature_view_name}, version: {feature_view_version} in Feature Store {feature_store_name}."
         )
         self._online_store_rest_client_api = (
-            online_store_rest_client_api.OnlineStoreRestClientApi()
+            online_store_rest_client_api.OnlineStoreRestClientApi(
+                json_decoder=json_decoder
+            )
         )
         self._feature_store_name = feature_store_name
         self._feature_view_name = feature_view_name
@@ -83,33 +110,80 @@ class OnlineStoreRestClientEngine:
                     self._is_inference_helpers_list.append(True)
                 elif not feat.training_helper_column:
                     self._is_inference_helpers_list.append(False)
-        self._feature_to_decode = self.get_feature_to_decode(features)
+        self._feature_value_decoders = self.get_feature_value_decoders(
+            features, decode_timestamps=decode_timestamps
+        )
+        # (index, name, decoder) of the features returned for inference_helpers_only False and True.
+        self._row_layouts: Dict[
+            bool, List[Tuple[int, str, Optional[Callable[[Any], Any]]]]
+        ] = {
+            helpers_only: [
+                (index, name, self._feature_value_decoders.get(index))
+                for index, (name, is_helper) in enumerate(
+                    zip(self._ordered_feature_names, self._is_inference_helpers_list)
+                )
+                if is_helper is helpers_only
+            ]
+            for helpers_only in (False, True)
+        }
+
+        self._batch_chunk_size = batch_chunk_size or self._DEFAULT_BATCH_CHUNK_SIZE
+        self._batch_max_parallel_requests = (
+            batch_max_parallel_requests or self._DEFAULT_BATCH_MAX_PARALLEL_REQUESTS
+        )
+        self._batch_chunk_retries = (
+            batch_chunk_retries
+            if batch_chunk_retries is not None
+            else self._DEFAULT_BATCH_CHUNK_RETRIES
+        )
+        # Created on first chunked batch request, shared by all subsequent ones.
+        self._batch_executor: Optional[ThreadPoolExecutor] = None
+        self._batch_executor_lock = threading.Lock()
         _logger.debug(
             f"Mapping fg_id to feature names: {self._feature_names_per_fg_id}."
         )
 
-    def get_feature_to_decode(
-        self, features: List[td_feature_mod.TrainingDatasetFeature]
-    ) -> Dict[int, str]:
-        """Get a mapping of feature indices to their types for features that need decoding.
-
-        This method identifies features that have types requiring special decoding from the RonDB Rest Server
-        response and maps their position in the ordered feature list to their type.
+    def get_feature_value_decoders(
+        self,
+        features: List[td_feature_mod.TrainingDatasetFeature],
+        decode_timestamps: bool = False,
+    ) -> Dict[int, Callable[[Any], Any]]:
+        """Get a mapping of feature indices to the functions decoding their values in the RonDB Rest Server response.
 
         # Arguments
             features: List of TrainingDatasetFeature objects containing feature metadata
+            decode_timestamps: Whether to convert timestamp values to python datetime objects.
 
         # Returns
-            Dict[int, str]: A dictionary mapping feature indices to their type strings for features
-                that require decoding. The indices correspond to the position in _ordered_feature_names.
+            Dict[int, Callable]: A dictionary mapping feature indices to the decoding function of their values.
+                Decoders are only called on non null values.
         """
-        feature_to_decode = {}
-        for feat in features:
-            if feat.type in self.FEATURE_TYPE_TO_DECODE:
-                feature_to_decode[self._ordered_feature_names.index(feat.name)] = (
-                    feat.type
-                )
-        return feature_to_decode
+        decoders = {
+            self.BINARY_TYPE: base64.b64decode,
+            self.DATE_TYPE: date.fromisoformat,
+        }
+        if decode_timestamps:
+            decoders[self.TIMESTAMP_TYPE] = self._decode_timestamp
+        return {
+            self._ordered_feature_names.index(feat.name): decoders[feat.type]
+            for feat in features
+            if feat.type in decoders and feat.name in self._ordered_feature_names
+        }
+
+    @staticmethod
+    def _decode_timestamp(value: Union[str, int, datetime]) -> datetime:
+        """Convert a timestamp returned by the RonDB Rest Server to a naive utc datetime.
+
+        Timestamps read from the online store are returned as string, whereas passed features
+        given as datetime were serialized to integer milliseconds.
+        """
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+        elif isinstance(value, int):
+            return datetime.fromtimestamp(value / 1000, tz=timezone.utc).replace(
+                tzinfo=None
+            )
+        return value
 
     def build_base_payload(
         self,
@@ -164,24 +238,12 @@ class OnlineStoreRestClientEngine:
             feature_values: List of feature values from the RonDB Rest Server
 
         # Returns:
-            List of decoded feature values with binary values base64 decoded and date strings
-            converted to datetime.date objects
+            List of decoded feature values with binary values base64 decoded, date strings
+            converted to datetime.date objects and, if enabled, timestamps converted to datetime objects
         """
-        for feature_index, data_type in self._feature_to_decode.items():
-            if (
-                data_type == self.BINARY_TYPE
-                and feature_values[feature_index] is not None
-            ):
-                feature_values[feature_index] = base64.b64decode(
-                    feature_values[feature_index]
-                )
-            elif (
-                data_type == self.DATE_TYPE
-                and feature_values[feature_index] is not None
-            ):
-                feature_values[feature_index] = datetime.strptime(
-                    feature_values[feature_index], "%Y-%m-%d"
-                ).date()
+        for feature_index, decode in self._feature_value_decoders.items():
+            if feature_values[feature_index] is not None:
+                feature_values[feature_index] = decode(feature_values[feature_index])
         return feature_values
 
     def get_single_feature_vector(
@@ -318,9 +380,7 @@ class OnlineStoreRestClientEngine:
                 "If some entries do not have passed features, pass an empty dict for those entries."
             )
 
-        response = self._online_store_rest_client_api.get_batch_raw_feature_vectors(
-            payload=payload
-        )
+        response = self._get_batch_raw_feature_vectors_in_chunks(payload=payload)
 
         if return_type != self.RETURN_TYPE_RESPONSE_JSON:
             _logger.debug("Converting batch response to feature value rows for each.")
@@ -339,6 +399,96 @@ class OnlineStoreRestClientEngine:
         else:
             return response
 
+    def _get_batch_raw_feature_vectors_in_chunks(
+        self, payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send the batch payload in chunks of at most `batch_chunk_size` entries and merge the responses in order.
+
+        Chunks are sent concurrently, at most `batch_max_parallel_requests` at a time, sharing the connection pool
+        of the REST client session.
+        """
+        entries = payload["entries"]
+        if len(entries) <= self._batch_chunk_size:
+            return self._send_batch_chunk(payload)
+
+        passed_features = payload.get("passedFeatures") or []
+        chunk_payloads = []
+        for start in range(0, len(entries), self._batch_chunk_size):
+            end = start + self._batch_chunk_size
+            chunk_payload = dict(payload)
+            chunk_payload["entries"] = entries[start:end]
+            chunk_payload["passedFeatures"] = passed_features[start:end]
+            chunk_payloads.append(chunk_payload)
+        _logger.debug(
+            "Sending batch of %d entries in %d chunks.",
+            len(entries),
+            len(chunk_payloads),
+        )
+        # map returns the responses in the order of the chunks.
+        responses = list(
+            self._get_batch_executor().map(self._send_batch_chunk, chunk_payloads)
+        )
+
+        merged_response = {"features": [], "status": []}
+        for response in responses:
+            merged_response["features"].extend(response.get("features") or [])
+            merged_response["status"].extend(response.get("status") or [])
+            if response.get("detailedStatus") is not None:
+                merged_response.setdefault("detailedStatus", []).extend(
+                    response["detailedStatus"]
+                )
+        # The metadata describes the features and is the same for all chunks.
+        merged_response["metadata"] = responses[0].get("metadata")
+        return merged_response
+
+    def _send_batch_chunk(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a single batch request, retrying on connection errors, timeouts and server errors."""
+        for attempt in range(self._batch_chunk_retries + 1):
+            try:
+                return self._online_store_rest_client_api.get_batch_raw_feature_vectors(
+                    payload=payload
+                )
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+                exceptions.RestAPIError,
+            ) as e:
+                if attempt == self._batch_chunk_retries or (
+                    isinstance(e, exceptions.RestAPIError)
+                    and e.response.status_code < 500
+                ):
+                    raise e
+                _logger.debug(
+                    "Batch request failed with %s, retrying (attempt %d of %d).",
+                    e,
+                    attempt + 1,
+                    self._batch_chunk_retries,
+                )
+                time.sleep(self._BATCH_CHUNK_RETRY_BACKOFF_SECOND * 2**attempt)
+
+    def _get_batch_executor(self) -> ThreadPoolExecutor:
+        if self._batch_executor is None:
+            with self._batch_executor_lock:
+                if self._batch_executor is None:
+                    self._batch_executor = ThreadPoolExecutor(
+                        max_workers=self._batch_max_parallel_requests,
+                        thread_name_prefix="rdrs_batch",
+                    )
+        return self._batch_executor
+
+    def close(self) -> None:
+        """Shut down the threads sending chunks of batch requests."""
+        with self._batch_executor_lock:
+            if self._batch_executor is not None:
+                _logger.debug("Shutting down batch request executor.")
+                self._batch_executor.shutdown(wait=False)
+                self._batch_executor = None
+
+    def __del__(self):
+        # The engine may not be fully initialised if its constructor failed.
+        if hasattr(self, "_batch_executor_lock"):
+            self.close()
+
     def convert_rdrs_response_to_feature_value_row(
         self,
         row_feature_values: Union[List[Any], None],
@@ -364,23 +514,33 @@ class OnlineStoreRestClientEngine:
             A dictionary with the feature names as keys and the feature values as values. Values types are not guaranteed to
             match the feature type in the metadata. Timestamp SQL types are converted to python datetime.
         """
-        row_feature_values = self.decode_rdrs_feature_values(row_feature_values)
         if drop_missing and (
             detailed_status is None and row_feature_values is not None
         ):
             raise ValueError(
                 "Detailed status is required to drop missing features from the feature vector."
             )
-        failed_read_feature_names = []
+        layout = self._row_layouts[inference_helpers_only]
         if detailed_status is not None and drop_missing:
-            for operation_status in detailed_status:
-                if operation_status["httpStatus"] != 200:
-                    failed_read_feature_names.extend(
-                        self.feature_names_per_fg_id[operation_status["featureGroupId"]]
-                    )
-            _logger.debug(
-                f"Feature names which failed on read: {failed_read_feature_names}."
-            )
+            failed_read_fg_ids = {
+                operation_status["featureGroupId"]
+                for operation_status in detailed_status
+                if operation_status["httpStatus"] != 200
+            }
+            if failed_read_fg_ids:
+                failed_read_feature_names = {
+                    name
+                    for fg_id in failed_read_fg_ids
+                    for name in self.feature_names_per_fg_id[fg_id]
+                }
+                _logger.debug(
+                    f"Feature names which failed on read: {failed_read_feature_names}."
+                )
+                layout = [
+                    feature
+                    for feature in layout
+                    if feature[1] not in failed_read_feature_names
+                ]
 
         if return_type == self.RETURN_TYPE_FEATURE_VALUE_LIST:
             if row_feature_values is None and drop_missing:
@@ -390,29 +550,19 @@ class OnlineStoreRestClientEngine:
                 _logger.debug(
                     "Feature vector is null, returning None for all features."
                 )
-                return [
-                    None
-                    for is_helper in self.is_inference_helpers_list
-                    if is_helper is inference_helpers_only
-                ]
+                return [None] * len(layout)
             elif drop_missing:
                 _logger.debug(
                     "Dropping missing features from the feature vector and return as list."
                 )
                 return [
-                    value
-                    for (name, value, is_helper) in zip(
-                        self.ordered_feature_names,
-                        row_feature_values,
-                        self.is_inference_helpers_list,
-                    )
-                    if (
-                        name not in failed_read_feature_names
-                        and is_helper is inference_helpers_only
-                    )
+                    row_feature_values[index]
+                    if decode is None or row_feature_values[index] is None
+                    else decode(row_feature_values[index])
+                    for index, _, decode in layout
                 ]
             _logger.debug("Returning feature vector as list.")
-            return row_feature_values
+            return self.decode_rdrs_feature_values(row_feature_values)
 
         elif return_type == self.RETURN_TYPE_FEATURE_VALUE_DICT:
             if row_feature_values is None and drop_missing:
@@ -422,42 +572,15 @@ class OnlineStoreRestClientEngine:
                 _logger.debug(
                     "Feature vector is null, returning None for all features."
                 )
-                return {
-                    name: None
-                    for (name, is_helper) in zip(
-                        self.ordered_feature_names, self.is_inference_helpers_list
-                    )
-                    if is_helper is inference_helpers_only
-                }
-            elif drop_missing:
-                _logger.debug(
-                    "Dropping missing features from the feature vector and return as dict."
-                )
-                return {
-                    name: value
-                    for (name, value, is_helper) in zip(
-                        self.ordered_feature_names,
-                        row_feature_values,
-                        self.is_inference_helpers_list,
-                    )
-                    if (
-                        name not in failed_read_feature_names
-                        and is_helper is inference_helpers_only
-                    )
-                }
-            else:
-                _logger.debug("Returning feature vector as dict.")
-                return dict(
-                    {
-                        name: value
-                        for (name, value, is_helper) in zip(
-                            self.ordered_feature_names,
-                            row_feature_values,
-                            self.is_inference_helpers_list,
-                        )
-                        if is_helper is inference_helpers_only
-                    }
-                )
+                return {name: None for _, name, _ in layout}
+            _logger.debug("Returning feature vector as dict.")
+            # Decode and project the values in a single pass over the row.
+            return {
+                name: row_feature_values[index]
+                if decode is None or row_feature_values[index] is None
+                else decode(row_feature_values[index])
+                for index, name, decode in layout
+            }
 
     @property
     def feature_store_name(self) -> str:
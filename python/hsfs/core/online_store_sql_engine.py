@@ -19,7 +19,19 @@ import asyncio
 import json
 import logging
 import re
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from hopsworks_common.core import variable_api
 from hopsworks_common.util import AsyncTask, AsyncTaskThread
@@ -74,6 +86,13 @@ class OnlineStoreSqlClient:
         self._prefix_by_serving_index = None
         self._pkname_by_serving_index = None
         self._serving_key_by_serving_index: Dict[str, ServingKey] = {}
+        # Functions building the serving key values of an entry or a result row, by prepared statement index.
+        self._serving_key_extractor_by_serving_index: Dict[
+            int, Callable[[Dict[str, Any]], Tuple[Any, ...]]
+        ] = {}
+        self._result_key_extractor_by_serving_index: Dict[
+            int, Callable[[Dict[str, Any]], Tuple[Any, ...]]
+        ] = {}
         self._serving_keys: Set[ServingKey] = set(serving_keys or [])
 
         self._prepared_statements: Dict[str, List[ServingPreparedStatement]] = {}
@@ -90,6 +109,15 @@ class OnlineStoreSqlClient:
         self._connection_options = None
 
         self._async_task_thread = None
+        # Connection pools used by the asyncio API, aiomysql pools are bound to the event loop they are created in.
+        # Each pool is stored with the asynchronous generator closing it when its event loop shuts down.
+        self._connection_pools_by_loop: Dict[
+            asyncio.AbstractEventLoop, Tuple[Any, AsyncGenerator[None, None]]
+        ] = {}
+        # Pools being created, so that concurrent lookups on the same event loop share a single pool.
+        self._pending_connection_pools: Dict[
+            asyncio.AbstractEventLoop, asyncio.Task
+        ] = {}
 
     def __del__(self):
         # Safely stop the async task thread.
@@ -97,63 +125,86 @@ class OnlineStoreSqlClient:
         if self._async_task_thread.is_alive():
             self._async_task_thread.stop()
 
-    def fetch_prepared_statements(
+    def fetch_prepared_statement(
         self,
         entity: Union[feature_view.FeatureView, training_dataset.TrainingDataset],
-        inference_helper_columns: bool,
-    ) -> None:
+        key: str,
+    ) -> List[ServingPreparedStatement]:
+        """Fetch the prepared statements of a label from Hopsworks."""
+        _logger.debug(f"Fetching prepared statement for key {key}")
         if hasattr(entity, "_feature_view_engine"):
-            _logger.debug(
-                f"Initialising prepared statements for feature view {entity.name} version {entity.version}."
+            return self.feature_view_api.get_serving_prepared_statement(
+                entity.name,
+                entity.version,
+                batch=key.startswith("batch"),
+                inference_helper_columns=key.endswith("helper_column"),
             )
-            for key in self.get_prepared_statement_labels(inference_helper_columns):
-                _logger.debug(f"Fetching prepared statement for key {key}")
-                self.prepared_statements[key] = (
-                    self.feature_view_api.get_serving_prepared_statement(
-                        entity.name,
-                        entity.version,
-                        batch=key.startswith("batch"),
-                        inference_helper_columns=key.endswith("helper_column"),
-                    )
-                )
-                _logger.debug(f"{self.prepared_statements[key]}")
         elif hasattr(entity, "_training_dataset_type"):
-            _logger.debug(
-                f"Initialising prepared statements for training dataset {entity.name} version {entity.version}."
+            return self.training_dataset_api.get_serving_prepared_statement(
+                entity, batch=key.startswith("batch")
             )
-            for key in self.get_prepared_statement_labels(
-                with_inference_helper_column=False
-            ):
-                _logger.debug(f"Fetching prepared statement for key {key}")
-                self.prepared_statements[key] = (
-                    self.training_dataset_api.get_serving_prepared_statement(
-                        entity, batch=key.startswith("batch")
-                    )
-                )
         else:
             raise ValueError(
                 "Object type needs to be `feature_view.FeatureView` or `training_dataset.TrainingDataset`."
             )
 
+    def fetch_prepared_statements(
+        self,
+        entity: Union[feature_view.FeatureView, training_dataset.TrainingDataset],
+        inference_helper_columns: bool,
+    ) -> None:
+        _logger.debug(
+            f"Initialising prepared statements for {entity.name} version {entity.version}."
+        )
+        if not hasattr(entity, "_feature_view_engine"):
+            # training datasets do not have inference helper columns
+            inference_helper_columns = False
+        labels = self.get_prepared_statement_labels(inference_helper_columns)
+        # the prepared statements of each label are independent, fetch them concurrently
+        with ThreadPoolExecutor(len(labels)) as executor:
+            futures = {
+                key: executor.submit(self.fetch_prepared_statement, entity, key)
+                for key in labels
+            }
+        for key, future in futures.items():
+            self.prepared_statements[key] = future.result()
+            _logger.debug(f"{self.prepared_statements[key]}")
+
         if len(self.skip_fg_ids) > 0:
             _logger.debug(
                 f"Skip feature groups {self.skip_fg_ids} when initialising prepared statements."
             )
-            self.prepared_statements[key] = {
-                ps
-                for ps in self.prepared_statements[key]
-                if ps.feature_group_id not in self.skip_fg_ids
-            }
+            for key in labels:
+                self.prepared_statements[key] = [
+                    ps
+                    for ps in self.prepared_statements[key]
+                    if ps.feature_group_id not in self.skip_fg_ids
+                ]
 
     def init_prepared_statements(
         self,
         entity: Union[feature_view.FeatureView, training_dataset.TrainingDataset],
         inference_helper_columns: bool,
+        prepared_statements: Optional[
+            Dict[str, List[ServingPreparedStatement]]
+        ] = None,
     ) -> None:
-        _logger.debug(
-            "Fetch and reset prepared statements and external as user may be re-initialising with different parameters"
-        )
-        self.fetch_prepared_statements(entity, inference_helper_columns)
+        labels = self.get_prepared_statement_labels(inference_helper_columns)
+        if prepared_statements is not None and all(
+            key in prepared_statements for key in labels
+        ):
+            _logger.debug("Reset prepared statements from a serving snapshot")
+            for key in labels:
+                self.prepared_statements[key] = [
+                    ps
+                    for ps in prepared_statements[key]
+                    if ps.feature_group_id not in self.skip_fg_ids
+                ]
+        else:
+            _logger.debug(
+                "Fetch and reset prepared statements and external as user may be re-initialising with different parameters"
+            )
+            self.fetch_prepared_statements(entity, inference_helper_columns)
 
         self.init_parametrize_and_serving_utils(
             self.prepared_statements[self.BATCH_VECTOR_KEY]
@@ -206,6 +257,8 @@ class OnlineStoreSqlClient:
                         join_index
                     ].get(_sk.feature_name, 0),
                 )
+        self._serving_key_extractor_by_serving_index = {}
+        self._result_key_extractor_by_serving_index = {}
 
     def _parametrize_prepared_statements(
         self,
@@ -235,34 +288,65 @@ class OnlineStoreSqlClient:
 
         return prepared_statements_dict
 
-    def init_async_mysql_connection(self, options=None):
+    def init_async_mysql_connection(
+        self,
+        options=None,
+        online_connector: Optional[storage_connector.JdbcConnector] = None,
+        hostname: Optional[str] = None,
+    ):
+        """Initialise the connection pool to the Online Feature Store.
+
+        # Arguments
+            options: Options of the connection pool.
+            online_connector: Connector to the Online Feature Store, fetched from Hopsworks if not provided.
+            hostname: External hostname of the Online Feature Store, fetched from Hopsworks if not provided
+                and connecting from outside of Hopsworks.
+        """
         assert self._prepared_statements.get(self.SINGLE_VECTOR_KEY) is not None, (
             "Prepared statements are not initialized. "
             "Please call `init_prepared_statement` method first."
         )
-        _logger.debug(
-            "Fetching storage connector for sql connection to Online Feature Store."
-        )
-        self._online_connector = self._storage_connector_api.get_online_connector(
-            self._feature_store_id
-        )
+        if not self._external:
+            hostname = None
+        elif hostname is None and online_connector is None:
+            # the connector and the hostname are independent, fetch them concurrently
+            with ThreadPoolExecutor(2) as executor:
+                hostname_future = executor.submit(self.fetch_hostname)
+                online_connector = self.fetch_online_connector()
+                hostname = hostname_future.result()
+        elif hostname is None:
+            hostname = self.fetch_hostname()
+        self._online_connector = online_connector or self.fetch_online_connector()
+        self._hostname = hostname
         self._connection_options = options
-        self._hostname = (
-            variable_api.VariableApi().get_loadbalancer_external_domain("mysqld")
-            if self._external
-            else None
-        )
 
         if not self._async_task_thread:
+            default_min_size = len(self._prepared_statements[self.SINGLE_VECTOR_KEY])
+            options = options or {}
             # Create the async event thread if it is not already running and start it.
+            # Lookups submitted from several threads run concurrently, bounded by the size of the connection pool.
             self._async_task_thread = AsyncTaskThread(
                 connection_pool_initializer=self._get_connection_pool,
-                connection_pool_params=(
-                    len(self._prepared_statements[self.SINGLE_VECTOR_KEY]),
+                connection_pool_params=(default_min_size,),
+                max_concurrent_tasks=options.get(
+                    "max_concurrent_lookups", options.get("maxsize", default_min_size)
                 ),
+                max_pending_tasks=options.get("max_pending_lookups"),
+                # the query timeout is applied to the prepared statements in `_execute_prep_statements`
             )
             self._async_task_thread.start()
 
+    def fetch_online_connector(self) -> storage_connector.JdbcConnector:
+        """Fetch the connector to the Online Feature Store from Hopsworks."""
+        _logger.debug(
+            "Fetching storage connector for sql connection to Online Feature Store."
+        )
+        return self._storage_connector_api.get_online_connector(self._feature_store_id)
+
+    def fetch_hostname(self) -> str:
+        """Fetch the external hostname of the Online Feature Store from Hopsworks."""
+        return variable_api.VariableApi().get_loadbalancer_external_domain("mysqld")
+
     def get_single_feature_vector(self, entry: Dict[str, Any]) -> Dict[str, Any]:
         """Retrieve single vector with parallel queries using aiomysql engine."""
         return self._single_vector_result(
@@ -277,6 +361,36 @@ class OnlineStoreSqlClient:
             entries, self.parametrised_prepared_statements[self.BATCH_VECTOR_KEY]
         )
 
+    async def get_single_feature_vector_async(
+        self, entry: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Retrieve single vector with parallel queries awaited on the running event loop."""
+        prepared_statement_execution, bind_entries = self._single_vector_bind_entries(
+            entry, self.parametrised_prepared_statements[self.SINGLE_VECTOR_KEY]
+        )
+        results_dict = await self._execute_prep_statements(
+            prepared_statement_execution,
+            bind_entries,
+            connection_pool=await self._get_running_loop_connection_pool(),
+        )
+        return self._build_single_vector(results_dict)
+
+    async def get_batch_feature_vectors_async(
+        self, entries: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Retrieve batch vector with parallel queries awaited on the running event loop."""
+        prepared_stmts_to_execute, entry_values = self._batch_vector_bind_entries(
+            entries, self.parametrised_prepared_statements[self.BATCH_VECTOR_KEY]
+        )
+        parallel_results = await self._execute_prep_statements(
+            prepared_stmts_to_execute,
+            entry_values,
+            connection_pool=await self._get_running_loop_connection_pool(),
+        )
+        return self._stitch_batch_vector_results(
+            entries, prepared_stmts_to_execute, parallel_results
+        )
+
     def get_inference_helper_vector(self, entry: Dict[str, Any]) -> Dict[str, Any]:
         """Retrieve single vector with parallel queries using aiomysql engine."""
         return self._single_vector_result(
@@ -295,7 +409,27 @@ class OnlineStoreSqlClient:
         self, entry: Dict[str, Any], prepared_statement_objects: Dict[int, sql.text]
     ) -> Dict[str, Any]:
         """Retrieve single vector with parallel queries using aiomysql engine."""
+        prepared_statement_execution, bind_entries = self._single_vector_bind_entries(
+            entry, prepared_statement_objects
+        )
+
+        # run all the prepared statements in parallel using aiomysql engine
+        results_dict = self._async_task_thread.submit(
+            AsyncTask(
+                task_function=self._execute_prep_statements,
+                task_args=(
+                    prepared_statement_execution,
+                    bind_entries,
+                ),
+                requires_connection_pool=True,
+            )
+        )
+        return self._build_single_vector(results_dict)
 
+    def _single_vector_bind_entries(
+        self, entry: Dict[str, Any], prepared_statement_objects: Dict[int, sql.text]
+    ) -> Tuple[Dict[int, sql.text], Dict[int, Dict[str, Any]]]:
+        """Select the prepared statements to execute for a single entry and their bind parameters."""
         if all([isinstance(val, list) for val in entry.values()]):
             raise ValueError(
                 "Entry is expected to be single value per primary key. "
@@ -304,8 +438,6 @@ class OnlineStoreSqlClient:
                 "`training_dataset.init_prepared_statement()` "
                 "or `feature_view.init_serving()`"
             )
-        # Initialize the set of values
-        serving_vector = {}
         bind_entries = {}
         prepared_statement_execution = {}
         for prepared_statement_index in prepared_statement_objects:
@@ -331,21 +463,17 @@ class OnlineStoreSqlClient:
                 prepared_statement_objects[prepared_statement_index]
             )
 
-        # run all the prepared statements in parallel using aiomysql engine
         _logger.debug(
             f"Executing prepared statements for serving vector with entries: {bind_entries}"
         )
-        results_dict = self._async_task_thread.submit(
-            AsyncTask(
-                task_function=self._execute_prep_statements,
-                task_args=(
-                    prepared_statement_execution,
-                    bind_entries,
-                ),
-                requires_connection_pool=True,
-            )
-        )
+        return prepared_statement_execution, bind_entries
+
+    def _build_single_vector(
+        self, results_dict: Dict[int, List[Any]]
+    ) -> Dict[str, Any]:
+        """Merge the rows returned by the prepared statements into a single serving vector."""
         _logger.debug(f"Retrieved feature vectors: {results_dict}")
+        serving_vector = {}
         _logger.debug("Constructing serving vector from results")
         for key in results_dict:
             for row in results_dict[key]:
@@ -364,15 +492,33 @@ class OnlineStoreSqlClient:
         _logger.debug(
             f"Starting batch vector retrieval for {len(entries)} entries via aiomysql engine."
         )
-        # create dict object that will have of order of the vector as key and values as
-        # vector itself to stitch them correctly if there are multiple feature groups involved. At this point we
-        # expect that backend will return correctly ordered vectors.
-        batch_results = [{} for _ in range(len(entries))]
+        prepared_stmts_to_execute, entry_values = self._batch_vector_bind_entries(
+            entries, prepared_statement_objects
+        )
+        # run all the prepared statements in parallel using aiomysql engine
+        parallel_results = self._async_task_thread.submit(
+            AsyncTask(
+                task_function=self._execute_prep_statements,
+                task_args=(prepared_stmts_to_execute, entry_values),
+                requires_connection_pool=True,
+            )
+        )
+        return self._stitch_batch_vector_results(
+            entries, prepared_stmts_to_execute, parallel_results
+        )
+
+    def _batch_vector_bind_entries(
+        self,
+        entries: List[Dict[str, Any]],
+        prepared_statement_objects: Dict[int, sql.text],
+    ) -> Tuple[Dict[int, sql.text], Dict[int, Dict[str, List[Tuple[Any, ...]]]]]:
+        """Select the prepared statements to execute for a batch of entries and their bind parameters."""
         entry_values = {}
-        serving_keys_all_fg = []
         prepared_stmts_to_execute = {}
         # construct the list of entry values for binding to query
-        _logger.debug(f"Parametrize prepared statements with entry values: {entries}")
+        _logger.debug(
+            "Parametrize prepared statements with %d entry values.", len(entries)
+        )
         for prepared_statement_index in prepared_statement_objects:
             # prepared_statement_index include fg with label only
             # But _serving_key_by_serving_index include the index when the join_index is 0 (left side)
@@ -383,83 +529,111 @@ class OnlineStoreSqlClient:
                 prepared_statement_objects[prepared_statement_index]
             )
             entry_values_tuples = list(
-                map(
-                    lambda e, prepared_statement_index=prepared_statement_index: tuple(
-                        [
-                            (
-                                e.get(sk.required_serving_key)
-                                # Check if there is any entry matched with feature name,
-                                # if the required serving key is not provided.
-                                or e.get(sk.feature_name)
-                            )
-                            for sk in self.serving_key_by_serving_index[
-                                prepared_statement_index
-                            ]
-                        ]
-                    ),
-                    entries,
-                )
-            )
-            _logger.debug(
-                f"Prepared statement {prepared_statement_index} with entries: {entry_values_tuples}"
+                map(self._get_serving_key_extractor(prepared_statement_index), entries)
             )
             entry_values[prepared_statement_index] = {"batch_ids": entry_values_tuples}
 
-        _logger.debug(
-            f"Executing prepared statements for batch vector with entries: {entry_values}"
-        )
-        # run all the prepared statements in parallel using aiomysql engine
-        parallel_results = self._async_task_thread.submit(
-            AsyncTask(
-                task_function=self._execute_prep_statements,
-                task_args=(prepared_stmts_to_execute, entry_values),
-                requires_connection_pool=True,
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                f"Executing prepared statements for batch vector with entries: {entry_values}"
             )
-        )
+        return prepared_stmts_to_execute, entry_values
 
-        _logger.debug(f"Retrieved feature vectors: {parallel_results}, stitching them.")
+    def _stitch_batch_vector_results(
+        self,
+        entries: List[Dict[str, Any]],
+        prepared_stmts_to_execute: Dict[int, sql.text],
+        parallel_results: Dict[int, List[Any]],
+    ) -> Tuple[List[Dict[str, Any]], List[ServingKey]]:
+        """Stitch the rows returned by each prepared statement into one vector per entry."""
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                f"Retrieved feature vectors: {parallel_results}, stitching them."
+            )
+        # The vectors are stitched by position of the entry, joining the rows of each prepared statement on
+        # the serving key values, so that multiple feature groups can be involved.
+        batch_results = [{} for _ in range(len(entries))]
+        serving_keys_all_fg = []
         # construct the results
         for prepared_statement_index in prepared_stmts_to_execute:
-            statement_results = {}
-            serving_keys = self.serving_key_by_serving_index[prepared_statement_index]
-            serving_keys_all_fg += serving_keys
-            prefix_features = [
-                (self.prefix_by_serving_index[prepared_statement_index] or "")
-                + sk.feature_name
-                for sk in self.serving_key_by_serving_index[prepared_statement_index]
+            serving_keys_all_fg += self.serving_key_by_serving_index[
+                prepared_statement_index
             ]
-            _logger.debug(
-                f"Use prefix from prepare statement because prefix from serving key is collision adjusted {prefix_features}."
-            )
-            _logger.debug("iterate over results by index of the prepared statement")
+            # Use prefix from prepare statement because prefix from serving key is collision adjusted.
+            result_key = self._get_result_key_extractor(prepared_statement_index)
+            # can primary key be complex feature? No, not supported.
+            statement_results = {}
             for row in parallel_results[prepared_statement_index]:
-                _logger.debug(f"Processing row: {row}")
                 row_dict = dict(row)
-                # can primary key be complex feature? No, not supported.
-                result_dict = row_dict
-                _logger.debug(
-                    f"Add result to statement results: {self._get_result_key(prefix_features, row_dict)} : {result_dict}"
-                )
-                statement_results[self._get_result_key(prefix_features, row_dict)] = (
-                    result_dict
-                )
+                statement_results[result_key(row_dict)] = row_dict
 
-            _logger.debug(f"Add partial results to batch results: {statement_results}")
-            for i, entry in enumerate(entries):
-                _logger.debug(
-                    "Processing entry %s : %s",
-                    entry,
-                    statement_results.get(
-                        self._get_result_key_serving_key(serving_keys, entry), {}
-                    ),
-                )
-                batch_results[i].update(
-                    statement_results.get(
-                        self._get_result_key_serving_key(serving_keys, entry), {}
-                    )
-                )
+            serving_key = self._get_serving_key_extractor(prepared_statement_index)
+            for batch_result, entry in zip(batch_results, entries):
+                statement_result = statement_results.get(serving_key(entry))
+                if statement_result:
+                    batch_result.update(statement_result)
         return batch_results, serving_keys_all_fg
 
+    def _get_serving_key_extractor(
+        self, prepared_statement_index: int
+    ) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+        """Function returning the serving key values of an entry, in the order of the prepared statement parameters."""
+        extractor = self._serving_key_extractor_by_serving_index.get(
+            prepared_statement_index
+        )
+        if extractor is None:
+            extractor = self._build_key_extractor(
+                [
+                    # Check if there is any entry matched with feature name,
+                    # if the required serving key is not provided.
+                    (sk.required_serving_key, sk.feature_name)
+                    for sk in self.serving_key_by_serving_index[
+                        prepared_statement_index
+                    ]
+                ]
+            )
+            self._serving_key_extractor_by_serving_index[prepared_statement_index] = (
+                extractor
+            )
+        return extractor
+
+    def _get_result_key_extractor(
+        self, prepared_statement_index: int
+    ) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+        """Function returning the serving key values of a result row of the prepared statement."""
+        extractor = self._result_key_extractor_by_serving_index.get(
+            prepared_statement_index
+        )
+        if extractor is None:
+            prefix = self.prefix_by_serving_index[prepared_statement_index] or ""
+            extractor = self._build_key_extractor(
+                [
+                    (prefix + sk.feature_name, None)
+                    for sk in self.serving_key_by_serving_index[
+                        prepared_statement_index
+                    ]
+                ]
+            )
+            self._result_key_extractor_by_serving_index[prepared_statement_index] = (
+                extractor
+            )
+        return extractor
+
+    @staticmethod
+    def _build_key_extractor(
+        key_names: List[Tuple[str, Optional[str]]],
+    ) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+        """Build a function returning the tuple of values of the given keys of a dictionary.
+
+        Each key is given as a pair of the key name and an optional fallback key name used if the value is missing.
+        """
+        if all(fallback is None for _, fallback in key_names):
+            names = [name for name, _ in key_names]
+            return lambda d: tuple([d.get(name) for name in names])
+        return lambda d: tuple(
+            [d.get(name) or d.get(fallback) for name, fallback in key_names]
+        )
+
     def refresh_mysql_connection(self):
         _logger.debug("Refreshing MySQL connection.")
         try:
@@ -506,35 +680,6 @@ class OnlineStoreSqlClient:
             query_online,
         )
 
-    @staticmethod
-    def _get_result_key(
-        primary_keys: List[str], result_dict: Dict[str, str]
-    ) -> Tuple[str]:
-        _logger.debug(f"Get result key {primary_keys} from result dict {result_dict}")
-        result_key = []
-        for pk in primary_keys:
-            result_key.append(result_dict.get(pk))
-        return tuple(result_key)
-
-    @staticmethod
-    def _get_result_key_serving_key(
-        serving_keys: List[ServingKey], result_dict: Dict[str, Dict[str, Any]]
-    ) -> Tuple[str]:
-        _logger.debug(
-            f"Get result key serving key {serving_keys} from result dict {result_dict}"
-        )
-        result_key = []
-        for sk in serving_keys:
-            _logger.debug(
-                f"Get result key for serving key {sk.required_serving_key} or {sk.feature_name}"
-            )
-            result_key.append(
-                result_dict.get(sk.required_serving_key)
-                or result_dict.get(sk.feature_name)
-            )
-        _logger.debug(f"Result key: {result_key}")
-        return tuple(result_key)
-
     @staticmethod
     def get_prepared_statement_labels(
         with_inference_helper_column: bool = False,
@@ -561,6 +706,69 @@ class OnlineStoreSqlClient:
         )
         return connection_pool
 
+    async def _get_running_loop_connection_pool(
+        self,
+    ) -> aiomysql.utils._ConnectionContextManager:
+        """Get the connection pool bound to the running event loop, creating it on first use.
+
+        Concurrent callers on the same loop share a single pool creation task. The pool is closed when the loop
+        shuts down its asynchronous generators, as `asyncio.run` does before closing the loop.
+        """
+        assert self._online_connector is not None, (
+            "Async MySQL connection is not initialized. "
+            "Please call `init_async_mysql_connection` method first."
+        )
+        loop = asyncio.get_running_loop()
+        if loop in self._connection_pools_by_loop:
+            return self._connection_pools_by_loop[loop][0]
+        pool_task = self._pending_connection_pools.get(loop)
+        if pool_task is None:
+            self._release_closed_loops_connection_pools()
+            _logger.debug("Creating connection pool for the running event loop.")
+            pool_task = loop.create_task(self._create_running_loop_connection_pool())
+            self._pending_connection_pools[loop] = pool_task
+        return await asyncio.shield(pool_task)
+
+    async def _create_running_loop_connection_pool(
+        self,
+    ) -> aiomysql.utils._ConnectionContextManager:
+        loop = asyncio.get_running_loop()
+        try:
+            connection_pool = await self._get_connection_pool(
+                len(self._prepared_statements[self.SINGLE_VECTOR_KEY])
+            )
+        finally:
+            # A failed pool creation is not cached, so that the next call retries.
+            del self._pending_connection_pools[loop]
+        shutdown_hook = self._close_connection_pool_on_loop_shutdown(
+            loop, connection_pool
+        )
+        # Starting the generator registers it with the loop, which closes it in `loop.shutdown_asyncgens`.
+        await shutdown_hook.__anext__()
+        self._connection_pools_by_loop[loop] = (connection_pool, shutdown_hook)
+        return connection_pool
+
+    async def _close_connection_pool_on_loop_shutdown(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        connection_pool: aiomysql.utils._ConnectionContextManager,
+    ) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            _logger.debug("Closing connection pool of the event loop shutting down.")
+            self._connection_pools_by_loop.pop(loop, None)
+            connection_pool.close()
+            await connection_pool.wait_closed()
+
+    def _release_closed_loops_connection_pools(self) -> None:
+        # Pools of loops closed without shutting down their asynchronous generators cannot be closed anymore,
+        # they are only released so that the loops and their connections can be garbage collected.
+        for loop in [
+            loop for loop in self._connection_pools_by_loop if loop.is_closed()
+        ]:
+            del self._connection_pools_by_loop[loop]
+
     async def _query_async_sql(
         self,
         stmt,
@@ -706,6 +914,11 @@ class OnlineStoreSqlClient:
         """
         return self._feature_name_order_by_psp
 
+    @property
+    def external(self) -> bool:
+        """Whether the Online Feature Store is accessed from outside of Hopsworks."""
+        return self._external
+
     @property
     def skip_fg_ids(self) -> Set[int]:
         """The list of feature group ids to skip when retrieving feature vectors.
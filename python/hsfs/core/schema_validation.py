@@ -2,7 +2,12 @@ import logging
 import re
 
 import pandas as pd
-from hopsworks_common.core.constants import HAS_POLARS
+from hopsworks_common.core.constants import HAS_POLARS, HAS_PYARROW
+
+
+if HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.compute as pc
 
 
 logger = logging.getLogger(__name__)
@@ -14,6 +19,11 @@ class DataFrameValidator:
     @staticmethod
     def get_validator(df):
         """method to get the appropriate implementation of validator for the DataFrame type"""
+        if not HAS_PYARROW:
+            # pandas and polars DataFrames are validated through Arrow arrays
+            logger.warning("pyarrow is not installed. Skipping validation")
+            return None
+
         if isinstance(df, pd.DataFrame):
             return PandasValidator()
 
@@ -145,45 +155,47 @@ class DataFrameValidator:
         return dataframe_features
 
 
-class PandasValidator(DataFrameValidator):
+class ArrowValidator(DataFrameValidator):
+    # Validator of the Arrow arrays of a DataFrame. Null counts are stored in the arrays
+    # and string lengths are computed with vectorized kernels, without copying columns.
+
     @staticmethod
-    def get_string_columns(df):
-        if pd.__version__.startswith("2."):
-            # For pandas 2+, use is_string_dtype api
-            return [
-                col
-                for col in df.columns
-                if pd.api.types.is_string_dtype(df[col].dropna())
-            ]
-        else:
-            # For pandas 1.x,  is_string_dtype api is not compatible, so check each row if its a string
-            string_cols = []
-            for col in df.select_dtypes(include=["object", "string"]).columns:
-                # Skip empty columns
-                if df[col].count() == 0:
-                    continue
-                # Check if ALL non-null values are strings
-                if df[col].dropna().map(lambda x: isinstance(x, str)).all():
-                    string_cols.append(col)
-            return string_cols
+    def is_string_type(arrow_type):
+        return (
+            pa.types.is_string(arrow_type)
+            or pa.types.is_large_string(arrow_type)
+            or (
+                hasattr(pa.types, "is_string_view")
+                and pa.types.is_string_view(arrow_type)
+            )
+        )
+
+    def get_arrow_columns(self, feature_group, df):
+        """To be implemented by subclasses, returns the Arrow arrays of the primary key and string columns"""
+        raise NotImplementedError("Subclasses must implement this method")
 
-    # Pandas df specific validator
     def _validate_df_specifics(self, feature_group, df):
         errors = {}
         column_lengths = {}
         is_pk_null = False
         is_string_length_exceeded = False
 
+        columns = self.get_arrow_columns(feature_group, df)
+
         # Check for null values in primary key columns
         for pk in feature_group.primary_key:
-            if df[pk].isnull().any():
+            if columns[pk].null_count > 0:
                 errors[pk] = f"Primary key column {pk} contains null values."
                 is_pk_null = True
 
         # Check string lengths
-        string_columns = self.get_string_columns(df)
-        for col in string_columns:
-            currentmax = df[col].str.len().max()
+        for col, array in columns.items():
+            if not self.is_string_type(array.type):
+                continue
+            currentmax = pc.max(pc.utf8_length(array)).as_py()
+            if currentmax is None:
+                # only null values
+                continue
             col_max_len = (
                 self.get_online_varchar_length(
                     self.get_feature_from_list(col, feature_group.features)
@@ -202,41 +214,55 @@ class PandasValidator(DataFrameValidator):
         return errors, column_lengths, is_pk_null, is_string_length_exceeded
 
 
-class PolarsValidator(DataFrameValidator):
-    # Polars df specific validator
-    def _validate_df_specifics(self, feature_group, df):
-        import polars as pl
-
-        errors = {}
-        column_lengths = {}
-        is_pk_null = False
-        is_string_length_exceeded = False
+class PandasValidator(ArrowValidator):
+    @staticmethod
+    def _to_arrow(series):
+        try:
+            return pa.Array.from_pandas(series)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # values of mixed types
+            return None
 
-        # Check for null values in primary key columns
-        for pk in feature_group.primary_key:
-            if df[pk].is_null().any():
-                errors[pk] = f"Primary key column {pk} contains null values."
-                is_pk_null = True
+    @staticmethod
+    def get_string_columns(df):
+        string_cols = []
+        for col, dtype in df.dtypes.items():
+            # object columns are strings if Arrow infers a string type from all non-null values
+            if pd.api.types.is_string_dtype(dtype):
+                array = PandasValidator._to_arrow(df[col])
+                if array is not None and ArrowValidator.is_string_type(array.type):
+                    string_cols.append(col)
+        return string_cols
 
-        # Check string lengths
-        for col in df.select(pl.col(pl.String)).columns:
-            currentmax = df[col].str.len_chars().max()
-            col_max_len = (
-                self.get_online_varchar_length(
-                    self.get_feature_from_list(col, feature_group.features)
+    # Pandas df specific validator
+    def get_arrow_columns(self, feature_group, df):
+        columns = {}
+        for col, dtype in df.dtypes.items():
+            is_pk = col in feature_group.primary_key
+            if not (is_pk or pd.api.types.is_string_dtype(dtype)):
+                continue
+            array = self._to_arrow(df[col])
+            if array is None and is_pk:
+                # only the null values of primary keys of mixed types are validated
+                array = pa.array(
+                    df[col].notnull().to_numpy(), mask=df[col].isnull().to_numpy()
                 )
-                if feature_group.features
-                else 100
-            )
+            if array is not None:
+                columns[col] = array
+        return columns
 
-            if col_max_len is not None and currentmax > col_max_len:
-                errors[col] = (
-                    f"String length exceeded. Column {col} has string values longer than maximum column limit of {col_max_len} characters."
-                )
-                column_lengths[col] = currentmax
-                is_string_length_exceeded = True
 
-        return errors, column_lengths, is_pk_null, is_string_length_exceeded
+class PolarsValidator(ArrowValidator):
+    # Polars df specific validator
+    def get_arrow_columns(self, feature_group, df):
+        import polars as pl
+
+        # converting polars columns to Arrow does not copy them
+        return {
+            col: df[col].to_arrow()
+            for col in df.columns
+            if col in feature_group.primary_key or df[col].dtype == pl.String
+        }
 
 
 class PySparkValidator(DataFrameValidator):
@@ -0,0 +1,213 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import humps
+from hopsworks_common.client.exceptions import FeatureStoreException
+from hsfs import storage_connector
+from hsfs.constructor.serving_prepared_statement import ServingPreparedStatement
+from hsfs.core.feature_descriptive_statistics import FeatureDescriptiveStatistics
+
+
+@dataclass
+class SnapshotFeatureGroup:
+    """Parent feature group of a feature view, as needed to serve feature vectors."""
+
+    name: str
+    version: int
+    online_enabled: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "version": self.version,
+            "onlineEnabled": self.online_enabled,
+        }
+
+
+class ServingSnapshot:
+    """Metadata fetched from Hopsworks when initialising serving of a feature view.
+
+    A snapshot is exported once after `init_serving` and restored by later `init_serving` calls, e.g. at the start of
+    each inference pod, to initialise serving without requests to the Hopsworks REST API.
+
+    The snapshot contains the credentials of the online feature store, it must be stored as securely as them.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        feature_view_name: str,
+        feature_view_version: int,
+        training_dataset_version: Optional[int],
+        parent_feature_groups: List[SnapshotFeatureGroup],
+        transformation_statistics: Optional[List[FeatureDescriptiveStatistics]] = None,
+        prepared_statements: Optional[Dict[str, List[ServingPreparedStatement]]] = None,
+        online_connector: Optional[storage_connector.JdbcConnector] = None,
+        hostname: Optional[str] = None,
+    ):
+        self._feature_view_name = feature_view_name
+        self._feature_view_version = feature_view_version
+        self._training_dataset_version = training_dataset_version
+        self._parent_feature_groups = parent_feature_groups
+        self._transformation_statistics = transformation_statistics
+        self._prepared_statements = prepared_statements
+        self._online_connector = online_connector
+        self._hostname = hostname
+
+    def save(self, path: str) -> None:
+        """Write the snapshot to a local file, readable only by its owner."""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> ServingSnapshot:
+        """Read a snapshot written by `save`."""
+        with open(path, "r") as f:
+            return cls.from_response_json(json.load(f))
+
+    def check_feature_view(self, feature_view_name: str, feature_view_version: int):
+        if (
+            self._feature_view_name != feature_view_name
+            or self._feature_view_version != feature_view_version
+        ):
+            raise FeatureStoreException(
+                f"Serving snapshot of feature view '{self._feature_view_name}' version {self._feature_view_version} "
+                f"cannot be used to initialise serving of feature view '{feature_view_name}' version {feature_view_version}."
+            )
+
+    @classmethod
+    def from_response_json(cls, json_dict: Dict[str, Any]) -> ServingSnapshot:
+        if json_dict.get("formatVersion") != cls.FORMAT_VERSION:
+            raise FeatureStoreException(
+                f"Unsupported serving snapshot format version {json_dict.get('formatVersion')}, "
+                "export the snapshot again with this version of the library."
+            )
+        json_decamelized = humps.decamelize(json_dict)
+        transformation_statistics = json_dict.get("transformationStatistics")
+        prepared_statements = json_dict.get("preparedStatements")
+        online_connector = json_dict.get("onlineConnector")
+        return cls(
+            feature_view_name=json_decamelized["feature_view_name"],
+            feature_view_version=json_decamelized["feature_view_version"],
+            training_dataset_version=json_decamelized.get("training_dataset_version"),
+            parent_feature_groups=[
+                SnapshotFeatureGroup(**fg)
+                for fg in json_decamelized["parent_feature_groups"]
+            ],
+            transformation_statistics=[
+                FeatureDescriptiveStatistics.from_response_json(stats)
+                for stats in transformation_statistics
+            ]
+            if transformation_statistics is not None
+            else None,
+            # keys of prepared statements are labels, they are not decamelized
+            prepared_statements={
+                key: [ServingPreparedStatement(**humps.decamelize(ps)) for ps in pss]
+                for key, pss in prepared_statements.items()
+            }
+            if prepared_statements is not None
+            else None,
+            online_connector=storage_connector.StorageConnector.from_response_json(
+                online_connector
+            )
+            if online_connector is not None
+            else None,
+            hostname=json_decamelized.get("hostname"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "formatVersion": self.FORMAT_VERSION,
+            "featureViewName": self._feature_view_name,
+            "featureViewVersion": self._feature_view_version,
+            "trainingDatasetVersion": self._training_dataset_version,
+            "parentFeatureGroups": [fg.to_dict() for fg in self._parent_feature_groups],
+            "transformationStatistics": [
+                stats.to_dict() for stats in self._transformation_statistics
+            ]
+            if self._transformation_statistics is not None
+            else None,
+            "preparedStatements": {
+                key: [
+                    {
+                        "featureGroupId": ps.feature_group_id,
+                        "preparedStatementIndex": ps.prepared_statement_index,
+                        "preparedStatementParameters": [
+                            param.to_dict()
+                            for param in ps.prepared_statement_parameters
+                        ],
+                        "queryOnline": ps.query_online,
+                        "prefix": ps.prefix,
+                    }
+                    for ps in pss
+                ]
+                for key, pss in self._prepared_statements.items()
+            }
+            if self._prepared_statements is not None
+            else None,
+            "onlineConnector": {
+                **self._online_connector.to_dict(),
+                "connectionString": self._online_connector.connection_string,
+                "arguments": self._online_connector.arguments,
+            }
+            if self._online_connector is not None
+            else None,
+            "hostname": self._hostname,
+        }
+
+    @property
+    def feature_view_name(self) -> str:
+        return self._feature_view_name
+
+    @property
+    def feature_view_version(self) -> int:
+        return self._feature_view_version
+
+    @property
+    def training_dataset_version(self) -> Optional[int]:
+        return self._training_dataset_version
+
+    @property
+    def parent_feature_groups(self) -> List[SnapshotFeatureGroup]:
+        return self._parent_feature_groups
+
+    @property
+    def transformation_statistics(
+        self,
+    ) -> Optional[List[FeatureDescriptiveStatistics]]:
+        return self._transformation_statistics
+
+    @property
+    def prepared_statements(
+        self,
+    ) -> Optional[Dict[str, List[ServingPreparedStatement]]]:
+        return self._prepared_statements
+
+    @property
+    def online_connector(self) -> Optional[storage_connector.JdbcConnector]:
+        return self._online_connector
+
+    @property
+    def hostname(self) -> Optional[str]:
+        return self._hostname
@@ -132,6 +132,8 @@ class StatisticsApi:
         row_percentage: Optional[float] = None,
         before_transformation: Optional[bool] = None,
         training_dataset_version: Optional[int] = None,
+        filter_eq_times: bool = False,
+        with_content: bool = False,
     ) -> Optional[List[statistics.Statistics]]:
         """Get all statistics of an entity.
 
@@ -151,8 +153,12 @@ class StatisticsApi:
         :type before_transformation: bool
         :param training_dataset_version: Version of the training dataset on which statistics were computed
         :type training_dataset_version: int
+        :param filter_eq_times: Whether the window commit times must be equal to the given ones, instead of within the window
+        :type filter_eq_times: bool
+        :param with_content: Whether include feature descriptive statistics in the response or not
+        :type with_content: bool
         """
-        # get all statistics by entity + filters + sorts, without the feature descriptive statistics
+        # get all statistics by entity + filters + sorts, by default without the feature descriptive statistics
         _client = client.get_instance()
         path_params = self.get_path(metadata_instance, training_dataset_version)
 
@@ -164,15 +170,15 @@ class StatisticsApi:
             computation_time=computation_time,
             start_commit_time=start_commit_time,
             end_commit_time=end_commit_time,
-            filter_eq_times=False,
+            filter_eq_times=filter_eq_times,
             feature_names=feature_names,
             row_percentage=row_percentage,
             before_transformation=before_transformation,
             training_dataset_version=training_dataset_version,
-            # retrieve all entity statistics, excluding feature descriptive statistics
+            # retrieve all entity statistics
             offset=offset,
             limit=limit,
-            with_content=False,
+            with_content=with_content,
         )
 
         return statistics.Statistics.from_response_json(
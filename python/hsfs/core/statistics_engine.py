@@ -22,7 +22,7 @@ from typing import List, Optional, Union
 
 from hsfs import decorators, engine, split_statistics, statistics, util
 from hsfs.client import exceptions
-from hsfs.core import job, statistics_api
+from hsfs.core import arrow_statistics_engine, job, statistics_api
 from hsfs.core.feature_descriptive_statistics import FeatureDescriptiveStatistics
 
 
@@ -83,6 +83,137 @@ class StatisticsEngine:
             # Python engine
             return engine.get_instance().profile_by_spark(metadata_instance)
 
+    def compute_and_save_commit_statistics(
+        self,
+        metadata_instance,
+        feature_dataframe,
+        feature_group_commit_id,
+    ) -> Optional[statistics.Statistics]:
+        """Compute statistics with mergeable sketches on the data written by a single commit and send the result to Hopsworks.
+        Args:
+            metadata_instance: FeatureGroup. Metadata of the feature group the data was written to.
+            feature_dataframe: Spark or Pandas DataFrame written by the commit.
+            feature_group_commit_id: int. Feature group commit id.
+        Returns:
+            Statistics. Statistics metadata containing a list of single feature descriptive statistics,
+                        each of them including the sketches of the feature in its extended statistics.
+        """
+        computation_time = int(float(datetime.now().timestamp()) * 1000)
+        statistics_config = metadata_instance.statistics_config
+        stats_str = engine.get_instance().profile_sketches(
+            feature_dataframe,
+            statistics_config.columns,
+            statistics_config.correlations,
+            statistics_config.histograms,
+        )
+        desc_stats = self._parse_deequ_statistics(stats_str)
+        if desc_stats:
+            stats = statistics.Statistics(
+                computation_time=computation_time,
+                feature_descriptive_statistics=desc_stats,
+                window_start_commit_time=feature_group_commit_id,
+                window_end_commit_time=feature_group_commit_id,
+            )
+            return self._save_statistics(stats, metadata_instance, None)
+
+    @decorators.catch_not_found("hsfs.statistics.Statistics", fallback_return=None)
+    def merge_commit_statistics(
+        self,
+        metadata_instance,
+        start_commit_time: Optional[int] = None,
+        end_commit_time: Optional[int] = None,
+        feature_names: Optional[List[str]] = None,
+        commit_ids: Optional[List[int]] = None,
+    ) -> Optional[statistics.Statistics]:
+        """Merge the sketches of the statistics computed on each commit of a commit window.
+
+        Args:
+            metadata_instance: FeatureGroup. Metadata of the feature group containing the data.
+            start_commit_time: int. Window start commit time. If not set, the window starts from the first commit.
+            end_commit_time: int. Window end commit time. If not set, the window ends at the last commit.
+            feature_names: List[str]. List of feature names of which statistics are merged.
+            commit_ids: List[int]. Commits that must all be covered by statistics with sketches.
+        Returns:
+            Statistics. Statistics metadata of the commit window, or `None` if there are no statistics
+                        with sketches for (any of the) commits in the window.
+        """
+        commit_stats = self._statistics_api.get_all(
+            metadata_instance,
+            start_commit_time=start_commit_time,
+            end_commit_time=end_commit_time,
+            feature_names=feature_names,
+            with_content=True,
+        )
+        if not isinstance(commit_stats, list):
+            commit_stats = [commit_stats] if commit_stats is not None else []
+
+        # most recent statistics with sketches of each commit
+        stats_by_commit = {}
+        for stats in sorted(commit_stats, key=lambda stats: stats.computation_time):
+            if self._is_commit_statistics(stats):
+                stats_by_commit[stats.window_end_commit_time] = stats
+        if not stats_by_commit or (
+            commit_ids is not None and not set(commit_ids).issubset(stats_by_commit)
+        ):
+            return None
+
+        statistics_config = metadata_instance.statistics_config
+        merged_stats = None
+        for stats in stats_by_commit.values():
+            commit_sketches = (
+                arrow_statistics_engine.ArrowStatisticsEngine.from_sketches(
+                    [
+                        {
+                            "column": fds.feature_name,
+                            "dataType": fds.feature_type,
+                            "sketch": fds.extended_statistics["sketch"],
+                        }
+                        for fds in stats.feature_descriptive_statistics
+                    ],
+                    correlations=statistics_config.correlations,
+                    histograms=statistics_config.histograms,
+                )
+            )
+            try:
+                merged_stats = (
+                    commit_sketches
+                    if merged_stats is None
+                    else merged_stats.merge(commit_sketches)
+                )
+            except ValueError:
+                # the features of the feature group changed within the window
+                return None
+
+        return statistics.Statistics(
+            computation_time=int(float(datetime.now().timestamp()) * 1000),
+            feature_descriptive_statistics=self._parse_deequ_statistics(
+                merged_stats.to_dict()
+            ),
+            window_start_commit_time=start_commit_time,
+            window_end_commit_time=end_commit_time or max(stats_by_commit),
+        )
+
+    def merge_and_save_commit_statistics(
+        self, metadata_instance, feature_group_commit_id, commit_ids
+    ) -> Optional[statistics.Statistics]:
+        """Compute the statistics of the feature group as of a commit by merging the sketches of all its commits.
+        Args:
+            metadata_instance: FeatureGroup. Metadata of the feature group containing the data.
+            feature_group_commit_id: int. Feature group commit id.
+            commit_ids: List[int]. Ids of all the commits of the feature group up to `feature_group_commit_id`.
+        Returns:
+            Statistics. Statistics metadata containing a list of single feature descriptive statistics,
+                        or `None` if not all the commits have statistics with sketches.
+        """
+        stats = self.merge_commit_statistics(
+            metadata_instance,
+            end_commit_time=feature_group_commit_id,
+            commit_ids=commit_ids,
+        )
+        if stats is None:
+            return None
+        return self._save_statistics(stats, metadata_instance, None)
+
     def compute_and_save_monitoring_statistics(
         self,
         metadata_instance,
@@ -111,29 +242,20 @@ class StatisticsEngine:
         elif isinstance(feature_name, list):
             feature_names = feature_name
 
-        if engine.get_type() == "spark":
-            commit_time = int(float(datetime.now().timestamp()) * 1000)
-            stats_str = self.profile_statistics(
-                feature_dataframe, feature_names, False, False, False
-            )
-            desc_stats = self._parse_deequ_statistics(stats_str)
+        commit_time = int(float(datetime.now().timestamp()) * 1000)
+        stats_str = self.profile_statistics(
+            feature_dataframe, feature_names, False, False, False
+        )
+        desc_stats = self._parse_deequ_statistics(stats_str)
 
-            stats = statistics.Statistics(
-                computation_time=commit_time,
-                row_percentage=row_percentage,
-                feature_descriptive_statistics=desc_stats,
-                window_end_commit_time=window_end_commit_time,
-                window_start_commit_time=window_start_commit_time,
-            )
-            return self._save_statistics(stats, metadata_instance, None)
-        else:
-            # TODO: Only compute statistics with Spark at the moment. This method is expected to be called
-            # only through run_feature_monitoring(), which is the entrypoint of the feature monitoring job.
-            # Pending work for next sprint is to compute statistics on the Python client as well, as part of
-            # the deequ replacement work.
-            raise exceptions.FeatureStoreException(
-                "Descriptive statistics for feature monitoring cannot be computed with the Python engine."
-            )
+        stats = statistics.Statistics(
+            computation_time=commit_time,
+            row_percentage=row_percentage,
+            feature_descriptive_statistics=desc_stats,
+            window_end_commit_time=window_end_commit_time,
+            window_start_commit_time=window_start_commit_time,
+        )
+        return self._save_statistics(stats, metadata_instance, None)
 
     @staticmethod
     def profile_statistics_with_config(feature_dataframe, statistics_config) -> str:
@@ -328,13 +450,57 @@ class StatisticsEngine:
         """
         start_commit_time = util.convert_event_time_to_timestamp(start_commit_time)
         end_commit_time = util.convert_event_time_to_timestamp(end_commit_time)
-        return self._statistics_api.get(
+        stats = self._statistics_api.get(
             metadata_instance,
             start_commit_time=start_commit_time,
             end_commit_time=end_commit_time,
             feature_names=feature_names,
             row_percentage=row_percentage,
         )
+        if (
+            start_commit_time is None
+            and stats is not None
+            and self._is_commit_statistics(stats)
+        ):
+            # The statistics of a single commit only cover the data written by that commit,
+            # look for the statistics of all the commits up to the end of the window instead.
+            window_stats = self._statistics_api.get_all(
+                metadata_instance,
+                end_commit_time=end_commit_time,
+                feature_names=feature_names,
+                row_percentage=row_percentage,
+                filter_eq_times=True,
+                with_content=True,
+            )
+            if not isinstance(window_stats, list):
+                window_stats = [window_stats] if window_stats is not None else []
+            stats = next(
+                (
+                    candidate
+                    for candidate in sorted(
+                        window_stats,
+                        key=lambda candidate: candidate.computation_time,
+                        reverse=True,
+                    )
+                    if not self._is_commit_statistics(candidate)
+                ),
+                None,
+            )
+        return stats
+
+    @staticmethod
+    def _is_commit_statistics(stats: statistics.Statistics) -> bool:
+        # statistics computed on the data written by a single commit, including the sketches of each feature
+        return (
+            stats.window_end_commit_time is not None
+            and stats.window_start_commit_time == stats.window_end_commit_time
+            and bool(stats.feature_descriptive_statistics)
+            and all(
+                fds.extended_statistics is not None
+                and arrow_statistics_engine.SKETCH in fds.extended_statistics
+                for fds in stats.feature_descriptive_statistics
+            )
+        )
 
     def _profile_transformation_fn_statistics(
         self, feature_dataframe, columns, label_encoder_features
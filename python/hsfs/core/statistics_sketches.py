@@ -0,0 +1,424 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Mergeable summaries of feature values used to compute descriptive statistics in a single pass.
+
+Every sketch can be updated with batches of values and merged with a sketch of the same type built
+on another part of the data, the merged sketch summarizes the union of both parts. Sketches can be
+serialized to JSON compatible dictionaries, so that they can be persisted and merged later on.
+"""
+
+from __future__ import annotations
+
+import base64
+import math
+import zlib
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from hopsworks_common.core.constants import HAS_NUMPY
+
+
+if HAS_NUMPY:
+    import numpy as np
+
+
+def _encode_array(array: np.ndarray) -> str:
+    return base64.b64encode(zlib.compress(array.tobytes())).decode("ascii")
+
+
+def _decode_array(encoded: str, dtype: np.dtype) -> np.ndarray:
+    return np.frombuffer(zlib.decompress(base64.b64decode(encoded)), dtype=dtype).copy()
+
+
+class MomentsSketch:
+    """Count, minimum, maximum, sum, mean and sum of squared deviations of numerical values."""
+
+    def __init__(self):
+        self.count = 0
+        self.minimum: Optional[Union[int, float]] = None
+        self.maximum: Optional[Union[int, float]] = None
+        self.sum = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a batch of non null values."""
+        if len(values) == 0:
+            return
+        other = MomentsSketch()
+        other.count = len(values)
+        # the minimum and maximum of integers are kept as integers
+        other.minimum = values.min().item()
+        other.maximum = values.max().item()
+        # the sum is accumulated in floating point as large integers overflow int64
+        other.sum = float(values.sum(dtype=np.float64))
+        other.mean = other.sum / other.count
+        other.m2 = float(((values.astype(np.float64) - other.mean) ** 2).sum())
+        self.merge(other)
+
+    def merge(self, other: MomentsSketch) -> MomentsSketch:
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.__dict__.update(other.__dict__)
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        # Chan et al. parallel variance update
+        self.m2 = self.m2 + other.m2 + delta**2 * self.count * other.count / count
+        self.mean = self.mean + delta * other.count / count
+        self.sum += other.sum
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "sum": self.sum,
+            "mean": self.mean,
+            "m2": self.m2,
+        }
+
+    @classmethod
+    def from_dict(cls, json_dict: Dict[str, Any]) -> MomentsSketch:
+        sketch = cls()
+        sketch.__dict__.update(json_dict)
+        return sketch
+
+    @property
+    def stddev(self) -> Optional[float]:
+        """Population standard deviation, as computed by Deequ."""
+        if self.count == 0:
+            return None
+        return math.sqrt(self.m2 / self.count)
+
+
+class CoMomentsSketch:
+    """Co-moments of a pair of numerical features, used to compute their Pearson correlation."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+
+    def update(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Add a batch of value pairs, pairs where any of the values is NaN are ignored."""
+        valid = ~(np.isnan(x) | np.isnan(y))
+        x, y = x[valid], y[valid]
+        if len(x) == 0:
+            return
+        other = CoMomentsSketch()
+        other.count = len(x)
+        other.mean_x = float(x.mean())
+        other.mean_y = float(y.mean())
+        dx = x - other.mean_x
+        dy = y - other.mean_y
+        other.m2_x = float((dx * dx).sum())
+        other.m2_y = float((dy * dy).sum())
+        other.c_xy = float((dx * dy).sum())
+        self.merge(other)
+
+    def merge(self, other: CoMomentsSketch) -> CoMomentsSketch:
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.__dict__.update(other.__dict__)
+            return self
+        count = self.count + other.count
+        weight = self.count * other.count / count
+        delta_x = other.mean_x - self.mean_x
+        delta_y = other.mean_y - self.mean_y
+        self.m2_x += other.m2_x + delta_x**2 * weight
+        self.m2_y += other.m2_y + delta_y**2 * weight
+        self.c_xy += other.c_xy + delta_x * delta_y * weight
+        self.mean_x += delta_x * other.count / count
+        self.mean_y += delta_y * other.count / count
+        self.count = count
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_x": self.mean_x,
+            "mean_y": self.mean_y,
+            "m2_x": self.m2_x,
+            "m2_y": self.m2_y,
+            "c_xy": self.c_xy,
+        }
+
+    @classmethod
+    def from_dict(cls, json_dict: Dict[str, Any]) -> CoMomentsSketch:
+        sketch = cls()
+        sketch.__dict__.update(json_dict)
+        return sketch
+
+    @property
+    def correlation(self) -> Optional[float]:
+        if self.count == 0 or self.m2_x == 0 or self.m2_y == 0:
+            return None
+        return self.c_xy / math.sqrt(self.m2_x * self.m2_y)
+
+
+class HyperLogLog:
+    """HyperLogLog sketch estimating the number of distinct values from their 64 bit hashes.
+
+    # Arguments
+        precision: Number of bits of the hash used to select a register, the relative error is about `1.04 / sqrt(2 ** precision)`.
+    """
+
+    DEFAULT_PRECISION = 14
+
+    def __init__(self, precision: int = DEFAULT_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @staticmethod
+    def _bit_length(values: np.ndarray) -> np.ndarray:
+        # exact bit length of unsigned 64 bit integers, floating point logarithms round the lowest bits
+        length = np.zeros(len(values), dtype=np.uint8)
+        for shift in (32, 16, 8, 4, 2, 1):
+            has_high_bits = values >= np.uint64(1 << shift)
+            length[has_high_bits] += shift
+            values = np.where(has_high_bits, values >> np.uint64(shift), values)
+        return length + (values > 0)
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        """Add a batch of 64 bit hashes of values."""
+        if len(hashes) == 0:
+            return
+        hashes = hashes.astype(np.uint64, copy=False)
+        index = hashes >> np.uint64(64 - self.precision)
+        remaining_bits = 64 - self.precision
+        remaining = hashes & np.uint64((1 << remaining_bits) - 1)
+        # position of the leftmost set bit in the remaining bits
+        rank = (remaining_bits + 1 - self._bit_length(remaining)).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: HyperLogLog) -> HyperLogLog:
+        if other.precision != self.precision:
+            raise ValueError(
+                "Only HyperLogLog sketches of the same precision can be merged."
+            )
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "precision": self.precision,
+            "registers": _encode_array(self.registers),
+        }
+
+    @classmethod
+    def from_dict(cls, json_dict: Dict[str, Any]) -> HyperLogLog:
+        sketch = cls(precision=json_dict["precision"])
+        sketch.registers = _decode_array(json_dict["registers"], np.uint8)
+        return sketch
+
+    def estimate(self) -> int:
+        num_registers = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / num_registers)
+        estimate = (
+            alpha
+            * num_registers**2
+            / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        )
+        num_zero_registers = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * num_registers and num_zero_registers > 0:
+            # linear counting is more accurate for small cardinalities
+            estimate = num_registers * math.log(num_registers / num_zero_registers)
+        return int(round(estimate))
+
+
+class QuantileSketch:
+    """KLL style sketch of numerical values answering approximate rank queries.
+
+    Values are kept in levels of sorted compactors, the items of level `i` stand for `2 ** i` values. When a
+    level holds more items than its capacity, every other item is promoted to the next level. The top level
+    holds up to `k` items and capacities decrease geometrically towards the lower levels, so that the sketch
+    keeps about `3 * k` items in total. As long as no compaction happened, the sketch keeps all values and
+    quantiles are exact.
+
+    # Arguments
+        k: Capacity of the top level, the rank error is in the order of `1 / k`.
+    """
+
+    DEFAULT_K = 4096
+    MINIMUM_CAPACITY = 8
+    CAPACITY_DECAY = 2 / 3
+
+    def __init__(self, k: int = DEFAULT_K):
+        self.k = k
+        self.count = 0
+        self.levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        # alternate the items promoted on compaction to avoid a systematic bias
+        self._offset = 0
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a batch of non null values."""
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        self.levels[0] = np.concatenate(
+            [self.levels[0], np.asarray(values, dtype=np.float64)]
+        )
+        self._compact()
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        self.count += other.count
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0, dtype=np.float64))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compact()
+        return self
+
+    def _capacity(self, level: int) -> int:
+        return max(
+            self.MINIMUM_CAPACITY,
+            int(self.k * self.CAPACITY_DECAY ** (len(self.levels) - 1 - level)),
+        )
+
+    def _compact(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                items = np.sort(items)
+                # an odd item out stays on its level
+                keep = items[: len(items) % 2]
+                promoted = items[len(keep) + self._offset :: 2]
+                self._offset = 1 - self._offset
+                self.levels[level] = keep
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                self.levels[level + 1] = np.concatenate(
+                    [self.levels[level + 1], promoted]
+                )
+            level += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "k": self.k,
+            "count": self.count,
+            "levels": [_encode_array(items) for items in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, json_dict: Dict[str, Any]) -> QuantileSketch:
+        sketch = cls(k=json_dict["k"])
+        sketch.count = json_dict["count"]
+        sketch.levels = [
+            _decode_array(items, np.float64) for items in json_dict["levels"]
+        ]
+        return sketch
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether the sketch still holds all the values it was updated with."""
+        return len(self.levels) == 1 or all(
+            len(items) == 0 for items in self.levels[1:]
+        )
+
+    def weighted_items(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Sorted items of the sketch and the number of values each of them stands for."""
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [
+                np.full(len(level_items), 2**level, dtype=np.int64)
+                for level, level_items in enumerate(self.levels)
+            ]
+        )
+        order = np.argsort(items, kind="stable")
+        return items[order], weights[order]
+
+    def quantiles(self, fractions: Iterable[float]) -> Optional[List[float]]:
+        """Approximate quantiles of the values, linearly interpolated like pandas when the sketch is exact."""
+        if self.count == 0:
+            return None
+        fractions = list(fractions)
+        if self.is_exact:
+            return np.quantile(self.levels[0], fractions).tolist()
+        items, weights = self.weighted_items()
+        cumulative_weights = np.cumsum(weights)
+        ranks = np.asarray(fractions) * cumulative_weights[-1]
+        indices = np.minimum(
+            np.searchsorted(cumulative_weights, ranks, side="left"), len(items) - 1
+        )
+        return items[indices].tolist()
+
+    def histogram(self, num_bins: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Approximate number of values in `num_bins` equal width bins between the minimum and maximum finite item.
+
+        Infinite values are counted in the first or last bin, `None` is returned if there is no finite item.
+        """
+        if self.count == 0:
+            return None
+        items, weights = self.weighted_items()
+        finite_items = items[np.isfinite(items)]
+        if len(finite_items) == 0:
+            return None
+        low, high = finite_items[0], finite_items[-1]
+        counts, edges = np.histogram(
+            np.clip(items, low, high), bins=num_bins, range=(low, high), weights=weights
+        )
+        return counts.astype(np.int64), edges
+
+
+class ValueCounts:
+    """Exact number of occurrences of each distinct value."""
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+
+    def update(self, values: Iterable[Any], counts: Iterable[int]) -> None:
+        """Add the occurrences of a batch of distinct values."""
+        for value, count in zip(values, counts):
+            self.counts[value] += count
+
+    def merge(self, other: ValueCounts) -> ValueCounts:
+        self.counts.update(other.counts)
+        return self
+
+    def to_dict(self) -> List[List[Any]]:
+        return [[value, count] for value, count in self.counts.items()]
+
+    @classmethod
+    def from_dict(cls, json_list: List[List[Any]]) -> ValueCounts:
+        sketch = cls()
+        sketch.counts.update({value: count for value, count in json_list})
+        return sketch
+
+    def uniqueness_statistics(self) -> Dict[str, float]:
+        """Exact distinct values statistics, following the Deequ definitions."""
+        num_values = sum(self.counts.values())
+        if num_values == 0:
+            return {}
+        frequencies = np.fromiter(self.counts.values(), dtype=np.float64)
+        probabilities = frequencies / num_values
+        return {
+            "exactNumDistinctValues": len(self.counts),
+            "distinctness": len(self.counts) / num_values,
+            "uniqueness": float(np.count_nonzero(frequencies == 1)) / num_values,
+            # adding zero turns the entropy of a constant feature from -0.0 into 0.0
+            "entropy": float(-(probabilities * np.log(probabilities)).sum()) + 0.0,
+        }
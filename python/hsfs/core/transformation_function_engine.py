@@ -15,15 +15,25 @@
 #
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, TypeVar, Union
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, TypeVar, Union
 
 import pandas as pd
-from hsfs import feature_view, statistics, training_dataset, transformation_function
+from hsfs import (
+    feature_view,
+    statistics,
+    training_dataset,
+    training_dataset_split,
+    transformation_function,
+)
 from hsfs.core import transformation_function_api
 
 
 if TYPE_CHECKING:
     import polars as pl
+    from hsfs.core.feature_descriptive_statistics import (
+        FeatureDescriptiveStatistics,
+    )
 
 
 class TransformationFunctionEngine:
@@ -39,6 +49,11 @@ class TransformationFunctionEngine:
     )
     FEATURE_NOT_EXIST_ERROR = "Provided feature '{}' in transformation functions do not exist in any of the feature groups."
 
+    # Transformation statistics shared by all feature view objects of the process, keyed by
+    # feature view, training dataset version and split definition.
+    _feature_statistics_cache: Dict[Tuple, List[FeatureDescriptiveStatistics]] = {}
+    _feature_statistics_cache_lock = threading.Lock()
+
     def __init__(self, feature_store_id: int):
         self._feature_store_id = feature_store_id
         self._transformation_function_api: transformation_function_api.TransformationFunctionApi = transformation_function_api.TransformationFunctionApi(
@@ -146,18 +161,18 @@ class TransformationFunctionEngine:
         )
 
     @staticmethod
-    def get_ready_to_use_transformation_fns(
+    def get_transformation_statistics(
         feature_view: feature_view.FeatureView,
         training_dataset_version: Optional[int] = None,
-    ) -> List[transformation_function.TransformationFunction]:
+    ) -> Optional[List[FeatureDescriptiveStatistics]]:
         """
-        Function that updates statistics required for all transformation functions in the feature view based on training dataset version.
+        Function that fetches the statistics required by the transformation functions in the feature view.
 
         # Arguments
             feature_view `FeatureView`: The feature view in which the training data is being created.
-            training_dataset_version `TrainingDataset`: The training version used to update the statistics used in the transformation functions.
+            training_dataset_version `TrainingDataset`: The training version used to compute the statistics used in the transformation functions.
         # Returns
-            `List[transformation_function.TransformationFunction]` : List of transformation functions.
+            `Optional[List[FeatureDescriptiveStatistics]]` : Statistics of the training dataset features, `None` if no transformation function requires statistics.
         """
         # check if transformation functions require statistics
         is_stat_required = any(
@@ -167,33 +182,59 @@ class TransformationFunctionEngine:
             ]
         )
         if not is_stat_required:
-            td_tffn_stats = None
-        else:
-            # if there are any transformation functions that require statistics get related statistics and
-            # populate with relevant arguments
-            # there should be only one statistics object with before_transformation=true
-            if training_dataset_version is None:
-                raise ValueError(
-                    "Training data version is required for transformation. Call `feature_view.init_serving(version)` "
-                    "or `feature_view.init_batch_scoring(version)` to pass the training dataset version."
-                    "Training data can be created by `feature_view.create_training_data` or `feature_view.training_data`."
-                )
-            td_tffn_stats = feature_view._statistics_engine.get(
-                feature_view,
-                before_transformation=True,
-                training_dataset_version=training_dataset_version,
+            return None
+
+        # if there are any transformation functions that require statistics get related statistics and
+        # populate with relevant arguments
+        # there should be only one statistics object with before_transformation=true
+        if training_dataset_version is None:
+            raise ValueError(
+                "Training data version is required for transformation. Call `feature_view.init_serving(version)` "
+                "or `feature_view.init_batch_scoring(version)` to pass the training dataset version."
+                "Training data can be created by `feature_view.create_training_data` or `feature_view.training_data`."
             )
+        td_tffn_stats = feature_view._statistics_engine.get(
+            feature_view,
+            before_transformation=True,
+            training_dataset_version=training_dataset_version,
+        )
 
-        if is_stat_required and td_tffn_stats is None:
+        if td_tffn_stats is None:
             raise ValueError(
                 "No statistics available for initializing transformation functions."
                 + "Training data can be created by `feature_view.create_training_data` or `feature_view.training_data`."
             )
+        return td_tffn_stats.feature_descriptive_statistics
 
-        if is_stat_required:
+    @staticmethod
+    def get_ready_to_use_transformation_fns(
+        feature_view: feature_view.FeatureView,
+        training_dataset_version: Optional[int] = None,
+        feature_descriptive_statistics: Optional[
+            List[FeatureDescriptiveStatistics]
+        ] = None,
+    ) -> List[transformation_function.TransformationFunction]:
+        """
+        Function that updates statistics required for all transformation functions in the feature view based on training dataset version.
+
+        # Arguments
+            feature_view `FeatureView`: The feature view in which the training data is being created.
+            training_dataset_version `TrainingDataset`: The training version used to update the statistics used in the transformation functions.
+            feature_descriptive_statistics `List[FeatureDescriptiveStatistics]`: Statistics used in the transformation functions, fetched for the training dataset version if not provided.
+        # Returns
+            `List[transformation_function.TransformationFunction]` : List of transformation functions.
+        """
+        if feature_descriptive_statistics is None:
+            feature_descriptive_statistics = (
+                TransformationFunctionEngine.get_transformation_statistics(
+                    feature_view, training_dataset_version
+                )
+            )
+
+        if feature_descriptive_statistics is not None:
             for transformation_function in feature_view.transformation_functions:
                 transformation_function.transformation_statistics = (
-                    td_tffn_stats.feature_descriptive_statistics
+                    feature_descriptive_statistics
                 )
         return feature_view.transformation_functions
 
@@ -207,7 +248,7 @@ class TransformationFunctionEngine:
             ],
             Union[pd.DataFrame, pl.DataFrame, TypeVar("pyspark.sql.DataFrame")],
         ],
-    ) -> None:
+    ) -> Optional[List[FeatureDescriptiveStatistics]]:
         """
         Function that computes and sets the statistics required for the UDF used for transformation.
 
@@ -217,6 +258,8 @@ class TransformationFunctionEngine:
             training_dataset_obj `TrainingDataset`: The training dataset for which the statistics is to be computed.
             feature_view `FeatureView`: The feature view in which the training data is being created.
             dataset `Union[Dict[str,  Union[pd.DataFrame, pl.DataFrame, ps.DataFrame]],  Union[pd.DataFrame, pl.DataFrame, ps.DataFrame]]`: A dataframe that conqtains the training data or a dictionary that contains both the training and test data.
+        # Returns
+            `Optional[List[FeatureDescriptiveStatistics]]` : The statistics computed, `None` if no transformation function requires statistics.
         """
         statistics_features: Set[str] = set()
         label_encoder_features: Set[str] = set()
@@ -254,15 +297,18 @@ class TransformationFunctionEngine:
                 )
 
             # Set statistics computed in the hopsworks UDF
-            for tf in feature_view_obj.transformation_functions:
-                tf.transformation_statistics = stats.feature_descriptive_statistics
+            TransformationFunctionEngine._set_transformation_statistics(
+                feature_view_obj, stats.feature_descriptive_statistics
+            )
+            return stats.feature_descriptive_statistics
+        return None
 
     @staticmethod
     def get_and_set_feature_statistics(
         training_dataset: training_dataset.TrainingDataset,
         feature_view_obj: feature_view.FeatureView,
         training_dataset_version: int = None,
-    ) -> None:
+    ) -> Optional[List[FeatureDescriptiveStatistics]]:
         """
         Function that gets the transformation statistics computed while creating the training dataset from the backend and assigns it to the hopsworks UDF object.
 
@@ -272,6 +318,8 @@ class TransformationFunctionEngine:
             training_dataset_obj `TrainingDataset`: The training dataset for which the statistics is to be computed.
             feature_view `FeatureView`: The feature view in which the training data is being created.
             training_dataset_version `int`: The version of the training dataset for which the statistics is to be retrieved.
+        # Returns
+            `Optional[List[FeatureDescriptiveStatistics]]` : The statistics retrieved, `None` if no transformation function requires statistics.
 
         # Raises
             `ValueError` : If the statistics are not present in the backend.
@@ -296,7 +344,187 @@ class TransformationFunctionEngine:
                     "No statistics available for initializing transformation functions."
                 )
 
-            for tf in feature_view_obj.transformation_functions:
-                tf.transformation_statistics = (
-                    td_tffn_stats.feature_descriptive_statistics
+            TransformationFunctionEngine._set_transformation_statistics(
+                feature_view_obj, td_tffn_stats.feature_descriptive_statistics
+            )
+            return td_tffn_stats.feature_descriptive_statistics
+        return None
+
+    @staticmethod
+    def set_feature_statistics(
+        training_dataset: training_dataset.TrainingDataset,
+        feature_view_obj: feature_view.FeatureView,
+        dataset: Union[
+            Dict[
+                str, Union[pd.DataFrame, pl.DataFrame, TypeVar("pyspark.sql.DataFrame")]
+            ],
+            Union[pd.DataFrame, pl.DataFrame, TypeVar("pyspark.sql.DataFrame")],
+        ],
+        training_dataset_version: Optional[int] = None,
+    ) -> None:
+        """
+        Function that sets the statistics required for the UDF used for transformation, reusing previously computed statistics where possible.
+
+        Statistics are taken from the statistics cache if the same training dataset version and split definition were already read in this process.
+        Otherwise, if `training_dataset_version` refers to an existing training dataset that is materialized or covers a closed event time range,
+        the statistics computed while creating it are retrieved from the backend.
+        Statistics are only computed on `dataset` if neither is available.
+
+        # Argument
+            training_dataset_obj `TrainingDataset`: The training dataset for which the statistics is to be set.
+            feature_view `FeatureView`: The feature view in which the training data is being created.
+            dataset `Union[Dict[str,  Union[pd.DataFrame, pl.DataFrame, ps.DataFrame]],  Union[pd.DataFrame, pl.DataFrame, ps.DataFrame]]`: A dataframe that contains the training data or a dictionary that contains both the training and test data.
+            training_dataset_version `Optional[int]`: The version of the existing training dataset being read, `None` if the training dataset was just created.
+        """
+        if not any(
+            tf.hopsworks_udf.statistics_required
+            for tf in feature_view_obj.transformation_functions
+        ):
+            return
+
+        cache_key = TransformationFunctionEngine._feature_statistics_cache_key(
+            training_dataset, feature_view_obj
+        )
+        if cache_key is not None:
+            with TransformationFunctionEngine._feature_statistics_cache_lock:
+                feature_statistics = (
+                    TransformationFunctionEngine._feature_statistics_cache.get(
+                        cache_key
+                    )
+                )
+            if feature_statistics is not None:
+                TransformationFunctionEngine._set_transformation_statistics(
+                    feature_view_obj, feature_statistics
+                )
+                return
+
+        feature_statistics = None
+        if (
+            training_dataset_version is not None
+            and cache_key is not None
+            and TransformationFunctionEngine._has_fixed_training_data(training_dataset)
+        ):
+            try:
+                feature_statistics = (
+                    TransformationFunctionEngine.get_and_set_feature_statistics(
+                        training_dataset, feature_view_obj, training_dataset_version
+                    )
+                )
+            except ValueError:
+                # statistics were not saved for this version, compute them below
+                feature_statistics = None
+        if feature_statistics is None:
+            feature_statistics = (
+                TransformationFunctionEngine.compute_and_set_feature_statistics(
+                    training_dataset, feature_view_obj, dataset
+                )
+            )
+
+        if cache_key is not None and feature_statistics is not None:
+            with TransformationFunctionEngine._feature_statistics_cache_lock:
+                TransformationFunctionEngine._feature_statistics_cache[cache_key] = (
+                    feature_statistics
                 )
+
+    @staticmethod
+    def clear_feature_statistics_cache(
+        feature_view_obj: feature_view.FeatureView,
+        training_dataset_version: Optional[int] = None,
+    ) -> None:
+        """
+        Remove the cached transformation statistics of a feature view.
+
+        # Arguments
+            feature_view_obj `FeatureView`: The feature view for which the statistics are removed.
+            training_dataset_version `Optional[int]`: The training dataset version for which the statistics are removed. Statistics of all versions are removed if `None`.
+        """
+        prefix = (
+            feature_view_obj.featurestore_id,
+            feature_view_obj.name,
+            feature_view_obj.version,
+            feature_view_obj.id,
+        )
+        with TransformationFunctionEngine._feature_statistics_cache_lock:
+            for cache_key in list(
+                TransformationFunctionEngine._feature_statistics_cache
+            ):
+                if cache_key[:4] == prefix and (
+                    training_dataset_version is None
+                    or cache_key[4] == training_dataset_version
+                ):
+                    del TransformationFunctionEngine._feature_statistics_cache[
+                        cache_key
+                    ]
+
+    @staticmethod
+    def _has_fixed_training_data(
+        training_dataset: training_dataset.TrainingDataset,
+    ) -> bool:
+        """
+        Check whether reading the training dataset again returns the data its saved statistics were computed on.
+
+        # Returns
+            `bool` : `True` if the training dataset is materialized or its event time range is closed, `False` if
+                in-memory training data may include feature data written after the training dataset was created.
+        """
+        if training_dataset.training_dataset_type != training_dataset.IN_MEMORY:
+            return True
+        if training_dataset.event_end_time is not None:
+            return True
+        return len(training_dataset.splits) > 0 and all(
+            split.split_type
+            == training_dataset_split.TrainingDatasetSplit.TIME_SERIES_SPLIT
+            and split.end_time is not None
+            for split in training_dataset.splits
+        )
+
+    @staticmethod
+    def _feature_statistics_cache_key(
+        training_dataset: training_dataset.TrainingDataset,
+        feature_view_obj: feature_view.FeatureView,
+    ) -> Optional[Tuple]:
+        """
+        Build the key identifying the data the transformation statistics are computed on.
+
+        # Returns
+            `Optional[Tuple]` : The cache key, `None` if reading the training dataset again may produce different training data,
+                i.e. random splits without a seed.
+        """
+        if training_dataset.version is None:
+            return None
+        splits = tuple(
+            (
+                split.name,
+                split.split_type,
+                split.percentage,
+                split.start_time,
+                split.end_time,
+            )
+            for split in training_dataset.splits
+        )
+        if training_dataset.seed is None and any(
+            split.split_type == training_dataset_split.TrainingDatasetSplit.RANDOM_SPLIT
+            for split in training_dataset.splits
+        ):
+            return None
+        # the feature view id changes if the feature view is deleted and created again
+        return (
+            feature_view_obj.featurestore_id,
+            feature_view_obj.name,
+            feature_view_obj.version,
+            feature_view_obj.id,
+            training_dataset.version,
+            training_dataset.event_start_time,
+            training_dataset.event_end_time,
+            training_dataset.seed,
+            training_dataset.train_split,
+            splits,
+        )
+
+    @staticmethod
+    def _set_transformation_statistics(
+        feature_view_obj: feature_view.FeatureView,
+        feature_statistics: List[FeatureDescriptiveStatistics],
+    ) -> None:
+        for tf in feature_view_obj.transformation_functions:
+            tf.transformation_statistics = feature_statistics
@@ -16,21 +16,42 @@
 from __future__ import annotations
 
 import base64
+import copy
+import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import hsfs
+import pandas as pd
 from hopsworks_common.client.exceptions import (
     FeatureStoreException,
     VectorDatabaseException,
 )
+from hopsworks_common.core.constants import (
+    HAS_POLARS,
+    HAS_PYARROW,
+    polars_not_installed_message,
+    pyarrow_not_installed_message,
+)
 from hsfs.constructor.filter import Filter, Logic
 from hsfs.constructor.join import Join
 from hsfs.core.opensearch import OpenSearchClientSingleton
 from hsfs.feature import Feature
 
 
+if HAS_POLARS:
+    import polars as pl
+
+if HAS_PYARROW:
+    import pyarrow as pa
+
+_logger = logging.getLogger(__name__)
+
+
 class VectorDbClient:
+    DEFAULT_READ_BATCH_SIZE = 10000
+    DEFAULT_PIT_KEEP_ALIVE = "1m"
+
     _filter_map = {
         Filter.GT: "gt",
         Filter.GE: "gte",
@@ -118,21 +139,127 @@ class VectorDbClient:
         filter: Union[Filter, Logic] = None,
         options=None,
     ):
+        embedding_feature = self._get_embedding_feature(feature)
+        self._check_filter(filter, embedding_feature.feature_group)
+        col_name = embedding_feature.embedding_index.col_prefix + embedding_feature.name
+        query = self._get_knn_query(embedding_feature, col_name, embedding, k, filter)
+        if not index_name:
+            index_name = embedding_feature.embedding_index.index_name
+
+        results = self._opensearch_client.search(
+            body=query, index=index_name, options=options
+        )
+
+        # When using project index (`embedding_feature.embedding_index.col_prefix` is not empty), sometimes the total number of result returned is less than k. Possible reason is that when using project index, some embedding columns have null value if the row is from a different feature group. And opensearch filter out the result where embedding is null after retrieving the top k results. So search 3 times more data if it is using project index and size of result is not k.
+        if (
+            embedding_feature.embedding_index.col_prefix
+            and len(results["hits"]["hits"]) != k
+        ):
+            query["query"]["bool"]["must"][0]["knn"][col_name]["k"] = (
+                self._get_project_index_k(index_name, query, col_name, k, options)
+            )
+            results = self._opensearch_client.search(
+                body=query, index=index_name, options=options
+            )
+
+        return self._convert_hits(
+            embedding_feature,
+            self._get_type_converters(embedding_feature.feature_group.features),
+            results["hits"]["hits"],
+        )
+
+    def find_neighbors_batch(
+        self,
+        embeddings,
+        feature: Feature = None,
+        index_name=None,
+        k=10,
+        filter: Union[Filter, Logic] = None,
+        options=None,
+    ):
+        """Find the nearest neighbors of many embeddings with multi-search requests.
+
+        All embeddings are searched in a single request. With a project index, the embeddings with less than k
+        results are searched again with a larger k in one more request, instead of one more request per embedding.
+
+        # Arguments
+            embeddings: list of embeddings or 2D array with one embedding per row.
+            feature: the embedding feature, required only if there are multiple embeddings in the query.
+            index_name: the index to search, defaults to the index of the embedding feature.
+            k: the number of neighbors of each embedding.
+            filter: filter restricting the search space.
+            options: options of the requests to the vector database.
+        # Returns
+            `List[List[Tuple[float, Dict[str, Any]]]]`: The score and row of the neighbors of each embedding, in the
+            order of the embeddings.
+        """
+        embedding_feature = self._get_embedding_feature(feature)
+        self._check_filter(filter, embedding_feature.feature_group)
+        col_name = embedding_feature.embedding_index.col_prefix + embedding_feature.name
+        queries = [
+            self._get_knn_query(
+                embedding_feature,
+                col_name,
+                embedding.tolist() if hasattr(embedding, "tolist") else embedding,
+                k,
+                filter,
+            )
+            for embedding in embeddings
+        ]
+        if not queries:
+            return []
+        if not index_name:
+            index_name = embedding_feature.embedding_index.index_name
+
+        results = self._opensearch_client.msearch(
+            queries, index=index_name, options=options
+        )
+
+        # see `find_neighbors` for why project indexes can return less than k results
+        if embedding_feature.embedding_index.col_prefix:
+            incomplete = [
+                i
+                for i, result in enumerate(results)
+                if len(result["hits"]["hits"]) != k
+            ]
+            if incomplete:
+                project_index_k = self._get_project_index_k(
+                    index_name, queries[incomplete[0]], col_name, k, options
+                )
+                for i in incomplete:
+                    queries[i]["query"]["bool"]["must"][0]["knn"][col_name]["k"] = (
+                        project_index_k
+                    )
+                for i, result in zip(
+                    incomplete,
+                    self._opensearch_client.msearch(
+                        [queries[i] for i in incomplete],
+                        index=index_name,
+                        options=options,
+                    ),
+                ):
+                    results[i] = result
+
+        converters = self._get_type_converters(embedding_feature.feature_group.features)
+        return [
+            self._convert_hits(embedding_feature, converters, result["hits"]["hits"])
+            for result in results
+        ]
+
+    def _get_embedding_feature(self, feature):
         if not feature:
             if not self._embedding_features:
                 raise ValueError("embedding col is not defined.")
             if len(self._embedding_features) > 1:
                 raise ValueError("More than 1 embedding columns but col is not defined")
-            embedding_feature = list(self._embedding_features.values())[0]
-        else:
-            embedding_feature = self._embedding_features.get(feature, None)
-            if embedding_feature is None:
-                raise ValueError(
-                    f"feature: {feature.name} is not an embedding feature."
-                )
-        self._check_filter(filter, embedding_feature.feature_group)
-        col_name = embedding_feature.embedding_index.col_prefix + embedding_feature.name
-        query = {
+            return list(self._embedding_features.values())[0]
+        embedding_feature = self._embedding_features.get(feature, None)
+        if embedding_feature is None:
+            raise ValueError(f"feature: {feature.name} is not an embedding feature.")
+        return embedding_feature
+
+    def _get_knn_query(self, embedding_feature, col_name, embedding, k, filter):
+        return {
             "size": k,
             "query": {
                 "bool": {
@@ -151,80 +278,79 @@ class VectorDbClient:
                 ).keys()
             ),
         }
-        if not index_name:
-            index_name = embedding_feature.embedding_index.index_name
 
-        results = self._opensearch_client.search(
-            body=query, index=index_name, options=options
-        )
-
-        # When using project index (`embedding_feature.embedding_index.col_prefix` is not empty), sometimes the total number of result returned is less than k. Possible reason is that when using project index, some embedding columns have null value if the row is from a different feature group. And opensearch filter out the result where embedding is null after retrieving the top k results. So search 3 times more data if it is using project index and size of result is not k.
-        if (
-            embedding_feature.embedding_index.col_prefix
-            and len(results["hits"]["hits"]) != k
-        ):
-            # Get the max number of results allowed to request if it is not available.
-            # This is expected to be executed once only.
-            if not VectorDbClient._index_result_limit_k.get(index_name):
-                query["query"]["bool"]["must"][0]["knn"][col_name]["k"] = 2**31 - 1
-                try:
-                    # It is expected that this request ALWAYS fails because requested k is too large.
-                    # The purpose here is to get the max k allowed from the vector database, and cache it.
-                    self._opensearch_client.search(
-                        body=query, index=index_name, options=options
+    def _get_project_index_k(self, index_name, query, col_name, k, options):
+        # Get the max number of results allowed to request if it is not available.
+        # This is expected to be executed once only.
+        if not VectorDbClient._index_result_limit_k.get(index_name):
+            query = copy.deepcopy(query)
+            query["query"]["bool"]["must"][0]["knn"][col_name]["k"] = 2**31 - 1
+            try:
+                # It is expected that this request ALWAYS fails because requested k is too large.
+                # The purpose here is to get the max k allowed from the vector database, and cache it.
+                self._opensearch_client.search(
+                    body=query, index=index_name, options=options
+                )
+            except VectorDatabaseException as e:
+                if (
+                    e.reason == VectorDatabaseException.REQUESTED_K_TOO_LARGE
+                    and e.info.get(VectorDatabaseException.REQUESTED_K_TOO_LARGE_INFO_K)
+                ):
+                    VectorDbClient._index_result_limit_k[index_name] = e.info.get(
+                        VectorDatabaseException.REQUESTED_K_TOO_LARGE_INFO_K
                     )
-                except VectorDatabaseException as e:
-                    if (
-                        e.reason == VectorDatabaseException.REQUESTED_K_TOO_LARGE
-                        and e.info.get(
-                            VectorDatabaseException.REQUESTED_K_TOO_LARGE_INFO_K
-                        )
-                    ):
-                        VectorDbClient._index_result_limit_k[index_name] = e.info.get(
-                            VectorDatabaseException.REQUESTED_K_TOO_LARGE_INFO_K
-                        )
-                    else:
-                        raise e
-            query["query"]["bool"]["must"][0]["knn"][col_name]["k"] = min(
-                VectorDbClient._index_result_limit_k.get(index_name, k), 3 * k
-            )
-            results = self._opensearch_client.search(
-                body=query, index=index_name, options=options
-            )
+                else:
+                    raise e
+        return min(VectorDbClient._index_result_limit_k.get(index_name, k), 3 * k)
 
+    def _convert_hits(self, embedding_feature, converters, hits):
+        key_map = self._fg_vdb_col_td_col_map[embedding_feature.feature_group.id]
         # https://opensearch.org/docs/latest/search-plugins/knn/approximate-knn/#spaces
         return [
             (
                 1 / item["_score"] - 1,
-                self._convert_to_pandas_type(
-                    embedding_feature.feature_group.features,
-                    self._rewrite_result_key(
-                        item["_source"],
-                        self._fg_vdb_col_td_col_map[embedding_feature.feature_group.id],
-                    ),
+                self._apply_type_converters(
+                    converters, self._rewrite_result_key(item["_source"], key_map)
                 ),
             )
-            for item in results["hits"]["hits"]
+            for item in hits
         ]
 
     def _convert_to_pandas_type(self, schema, result):
+        return self._apply_type_converters(self._get_type_converters(schema), result)
+
+    def _get_type_converters(self, schema):
+        """Get the conversions of the features of a schema to pandas types, to apply them to many results."""
+        converters = []
         for feature in schema:
-            feature_name = feature.name
             feature_type = feature.type.lower()
-            feature_value = result.get(feature_name)
-            if not feature_value:  # Feature value can be null
-                continue
-            elif feature_type == "date":
-                result[feature_name] = datetime.utcfromtimestamp(
-                    feature_value // 10**3
-                ).date()
+            if feature_type == "date":
+                converters.append(
+                    (
+                        feature.name,
+                        lambda value: datetime.utcfromtimestamp(value // 10**3).date(),
+                    )
+                )
             elif feature_type == "timestamp":
                 # convert timestamp in ms to datetime in s
-                result[feature_name] = datetime.utcfromtimestamp(feature_value // 10**3)
+                converters.append(
+                    (
+                        feature.name,
+                        lambda value: datetime.utcfromtimestamp(value // 10**3),
+                    )
+                )
             elif feature_type == "binary" or (
                 feature.is_complex() and feature not in self._embedding_features
             ):
-                result[feature_name] = base64.b64decode(feature_value)
+                converters.append((feature.name, base64.b64decode))
+        return converters
+
+    def _apply_type_converters(self, converters, result):
+        for feature_name, converter in converters:
+            feature_value = result.get(feature_name)
+            if not feature_value:  # Feature value can be null
+                continue
+            result[feature_name] = converter(feature_value)
         return result
 
     def _check_filter(self, filter, fg):
@@ -399,6 +525,137 @@ class VectorDbClient:
         else:
             raise FeatureStoreException("Feature group does not have embedding.")
 
+    def read_batches(
+        self,
+        fg_id,
+        schema,
+        pk,
+        index_name=None,
+        batch_size=DEFAULT_READ_BATCH_SIZE,
+        keep_alive=DEFAULT_PIT_KEEP_ALIVE,
+        options=None,
+    ):
+        """Read all rows of a feature group from the vector database, one batch at a time.
+
+        Pages are fetched with `search_after` over a point in time of the index, so the rows are read from a
+        consistent view of the index and only one batch is held in memory. If the vector database does not support
+        points in time, pages are fetched from the live index.
+
+        # Arguments
+            fg_id: id of the feature group.
+            schema: features of the feature group.
+            pk: column of the vector database present in all rows of the feature group.
+            index_name: the index to read, defaults to the index of the feature group.
+            batch_size: number of rows per batch.
+            keep_alive: how long the point in time is kept between two pages.
+            options: options of the requests to the vector database.
+        # Returns
+            `Iterator[List[Dict[str, Any]]]`: The batches of rows.
+        """
+        if fg_id not in self._fg_vdb_col_fg_col_map:
+            raise FeatureStoreException("Provided fg does not have embedding.")
+        if not index_name:
+            index_name = self._get_vector_db_index_name(fg_id)
+        query = {
+            "size": batch_size,
+            "query": {"bool": {"must": {"exists": {"field": pk}}}},
+            "_source": list(self._fg_vdb_col_fg_col_map.get(fg_id).keys()),
+        }
+        pit_id = self._opensearch_client.create_pit(
+            index_name, keep_alive, options=options
+        )
+        if pit_id is None:
+            _logger.info(
+                "Point in time is not supported by the vector database, reading the live index."
+            )
+            # document ids are unique, so pages never skip or repeat rows with equal sort values
+            query["sort"] = [{"_id": "asc"}]
+        else:
+            # the shard and position of a document within a point in time are unique and sorting on them
+            # does not load the ids of all documents in memory
+            query["sort"] = [{"_shard_doc": "asc"}]
+        converters = self._get_type_converters(schema)
+        key_map = self._fg_vdb_col_td_col_map[fg_id]
+
+        try:
+            while True:
+                if pit_id:
+                    query["pit"] = {"id": pit_id, "keep_alive": keep_alive}
+                results = self._opensearch_client.search(
+                    body=query, index=None if pit_id else index_name, options=options
+                )
+                hits = results["hits"]["hits"]
+                if hits:
+                    yield [
+                        self._apply_type_converters(
+                            converters,
+                            self._rewrite_result_key(item["_source"], key_map),
+                        )
+                        for item in hits
+                    ]
+                if len(hits) < batch_size:
+                    return
+                query["search_after"] = hits[-1]["sort"]
+                if pit_id:
+                    # the id of the point in time can change between pages
+                    pit_id = results.get("pit_id", pit_id)
+        finally:
+            if pit_id:
+                try:
+                    self._opensearch_client.delete_pit(pit_id)
+                except Exception:
+                    # the point in time expires after keep_alive anyway
+                    _logger.debug("Failed to delete point in time.", exc_info=True)
+
+    @staticmethod
+    def read_feature_group_batches(
+        feature_group: "hsfs.feature_group.FeatureGroup",
+        batch_size: int = DEFAULT_READ_BATCH_SIZE,
+        dataframe_type: str = "pandas",
+        options: Optional[dict] = None,
+    ):
+        """Read all rows of an embedding feature group as dataframes of at most `batch_size` rows.
+
+        # Arguments
+            feature_group: the embedding feature group.
+            batch_size: number of rows per dataframe.
+            dataframe_type: `"pandas"`, `"polars"` or `"arrow"`.
+            options: options of the requests to the vector database.
+        # Returns
+            `Iterator[Union[pd.DataFrame, pl.DataFrame, pa.Table]]`: The batches of rows.
+        """
+        if not feature_group.embedding_index:
+            raise FeatureStoreException("Feature group does not have embedding.")
+        dataframe_type = dataframe_type.lower()
+        if dataframe_type not in ["pandas", "polars", "arrow"]:
+            raise FeatureStoreException(
+                f'dataframe_type : {dataframe_type} not supported. Possible values are "pandas", "polars" or "arrow"'
+            )
+        if dataframe_type == "polars" and not HAS_POLARS:
+            raise ModuleNotFoundError(polars_not_installed_message)
+        if dataframe_type == "arrow" and not HAS_PYARROW:
+            raise ModuleNotFoundError(pyarrow_not_installed_message)
+
+        vector_db_client = VectorDbClient(feature_group.select_all())
+        feature_names = [f.name for f in feature_group.features]
+        for results in vector_db_client.read_batches(
+            feature_group.id,
+            feature_group.features,
+            pk=feature_group.embedding_index.col_prefix + feature_group.primary_key[0],
+            index_name=feature_group.embedding_index.index_name,
+            batch_size=batch_size,
+            options=options,
+        ):
+            columns = {
+                name: [result.get(name) for result in results] for name in feature_names
+            }
+            if dataframe_type == "polars":
+                yield pl.DataFrame(columns)
+            elif dataframe_type == "arrow":
+                yield pa.table(columns)
+            else:
+                yield pd.DataFrame(columns)
+
     def count(self, fg, options=None):
         query = {
             "query": {
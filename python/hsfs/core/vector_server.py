@@ -15,10 +15,14 @@
 #
 from __future__ import annotations
 
+import asyncio
+import functools
 import itertools
 import logging
+import time
 import warnings
 from base64 import b64decode
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from io import BytesIO
 from typing import (
@@ -26,6 +30,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     List,
     Literal,
     Optional,
@@ -41,9 +46,11 @@ from hopsworks_common.core.constants import (
     HAS_FAST_AVRO,
     HAS_NUMPY,
     HAS_POLARS,
+    HAS_PYARROW,
     avro_not_installed_message,
     numpy_not_installed_message,
     polars_not_installed_message,
+    pyarrow_not_installed_message,
 )
 from hsfs import (
     feature_view,
@@ -56,8 +63,10 @@ from hsfs import (
 from hsfs import training_dataset_feature as tdf_mod
 from hsfs.client import exceptions, online_store_rest_client
 from hsfs.core import (
+    feature_vector_cache,
     online_store_rest_client_engine,
     online_store_sql_engine,
+    serving_snapshot,
 )
 from hsfs.core import (
     transformation_function_engine as tf_engine_mod,
@@ -78,7 +87,13 @@ if HAS_AVRO:
 if HAS_POLARS:
     import polars as pl
 
+if HAS_PYARROW:
+    import pyarrow as pa
+
 if TYPE_CHECKING:
+    from hsfs.core.feature_descriptive_statistics import (
+        FeatureDescriptiveStatistics,
+    )
     from hsfs.feature_group import FeatureGroup
 
 _logger = logging.getLogger(__name__)
@@ -89,9 +104,13 @@ class VectorServer:
     DEFAULT_SQL_CLIENT = "sql"
     # Compatibility with 3.7
     DEFAULT_CLIENT_KEY = "default_online_store_client"
+    # Return types for which batch feature vectors are assembled directly into columns.
+    COLUMNAR_RETURN_TYPES = {"numpy", "pandas", "polars", "arrow"}
     REST_CLIENT_CONFIG_OPTIONS_KEY = "config_online_store_rest_client"
     RESET_REST_CLIENT_OPTIONS_KEY = "reset_online_store_rest_client"
     SQL_TIMESTAMP_STRING_FORMAT = "%Y-%m-%d %H:%M:%S"
+    # Maximum number of metadata requests sent concurrently while initialising serving.
+    INIT_SERVING_MAX_PARALLEL_REQUESTS = 8
 
     def __init__(
         self,
@@ -155,6 +174,9 @@ class VectorServer:
         self._sql_client = None
 
         self._rest_client_engine = None
+        self._feature_vector_cache: Optional[feature_vector_cache.FeatureVectorCache] = (
+            None
+        )
         self._init_rest_client: Optional[bool] = None
         self._init_sql_client: Optional[bool] = None
         self._default_client: Optional[Literal["rest", "sql"]] = None
@@ -163,9 +185,15 @@ class VectorServer:
         self._feature_to_handle_if_sql: Optional[Set[str]] = None
         self._valid_serving_keys: Set[str] = set()
         self._serving_initialized: bool = False
-        self._parent_feature_groups: List[FeatureGroup] = []
+        self._parent_feature_groups: List[
+            Union[FeatureGroup, serving_snapshot.SnapshotFeatureGroup]
+        ] = []
+        self._transformation_statistics: Optional[
+            List[FeatureDescriptiveStatistics]
+        ] = None
         self.__all_features_on_demand: Optional[bool] = None
         self.__all_feature_groups_online: Optional[bool] = None
+        self._init_serving_timings: Dict[str, float] = {}
 
     def init_serving(
         self,
@@ -179,21 +207,12 @@ class VectorServer:
         reset_rest_client: bool = False,
         config_rest_client: Optional[Dict[str, Any]] = None,
         default_client: Optional[Literal["rest", "sql"]] = None,
+        cache_config: Optional[Dict[str, Any]] = None,
+        snapshot: Optional[serving_snapshot.ServingSnapshot] = None,
     ):
         self._training_dataset_version = training_dataset_version
-
-        self._parent_feature_groups = entity.get_parent_feature_groups().accessible
-
-        if not (self._all_feature_groups_online or self._all_features_on_demand):
-            raise exceptions.FeatureStoreException(
-                "Feature vector retrieval is only available for feature view generated by online enabled feature groups or for feature views that contain only on-demand features. "
-                f"Feature group(s) {[f'{fg.name} version : {fg.version}'  for fg in self._parent_feature_groups if not fg.online_enabled]} are not online enabled."
-            )
-        elif not self._all_feature_groups_online and self._all_features_on_demand:
-            warnings.warn(
-                "Features will be computed on-demand during vector retrieval because the feature view includes only offline feature groups.",
-                stacklevel=1,
-            )
+        self._init_serving_timings = {}
+        start_time = time.perf_counter()
 
         if options is not None:
             reset_rest_client = reset_rest_client or options.get(
@@ -219,44 +238,188 @@ class VectorServer:
 
         if external is None:
             external = client._is_external()
+
+        sql_client = None
+        if snapshot is None:
+            if self._init_sql_client:
+                sql_client = self._create_sql_client(external)
+            snapshot = self._fetch_serving_metadata(
+                entity, inference_helper_columns, sql_client
+            )
+        self._parent_feature_groups = snapshot.parent_feature_groups
+
+        if not (self._all_feature_groups_online or self._all_features_on_demand):
+            raise exceptions.FeatureStoreException(
+                "Feature vector retrieval is only available for feature view generated by online enabled feature groups or for feature views that contain only on-demand features. "
+                f"Feature group(s) {[f'{fg.name} version : {fg.version}'  for fg in self._parent_feature_groups if not fg.online_enabled]} are not online enabled."
+            )
+        elif not self._all_feature_groups_online and self._all_features_on_demand:
+            warnings.warn(
+                "Features will be computed on-demand during vector retrieval because the feature view includes only offline feature groups.",
+                stacklevel=1,
+            )
+
         # `init_prepared_statement` should be the last because other initialisations
         # has to be done successfully before it is able to fetch feature vectors.
-        self.init_transformation(entity)
+        self._timed(
+            "transformation", self.init_transformation, entity, snapshot=snapshot
+        )
         self.set_return_feature_value_handlers(features=entity.features)
 
+        # Reinitialising serving drops previously cached feature vectors.
+        self._feature_vector_cache = (
+            feature_vector_cache.FeatureVectorCache.from_config(cache_config)
+            if cache_config is not None
+            else None
+        )
+
         if self._init_rest_client and self.__all_feature_groups_online:
-            self.setup_rest_client_and_engine(
+            self._timed(
+                "rest_client",
+                self.setup_rest_client_and_engine,
                 entity=entity,
                 config_rest_client=config_rest_client,
                 reset_rest_client=reset_rest_client,
             )
 
         if self._init_sql_client and self.__all_feature_groups_online:
-            self.setup_sql_client(
+            self._timed(
+                "sql_client",
+                self.setup_sql_client,
                 entity=entity,
                 external=external,
                 inference_helper_columns=inference_helper_columns,
                 options=options,
+                snapshot=snapshot,
+                sql_client=sql_client,
             )
         self._serving_initialized = True
+        self._init_serving_timings["total"] = time.perf_counter() - start_time
+        _logger.debug(
+            "Serving initialised, duration of each stage in seconds: %s",
+            self._init_serving_timings,
+        )
+
+    def _fetch_serving_metadata(
+        self,
+        entity: feature_view.FeatureView,
+        inference_helper_columns: bool,
+        sql_client: Optional[online_store_sql_engine.OnlineStoreSqlClient] = None,
+    ) -> serving_snapshot.ServingSnapshot:
+        """Fetch the metadata required for serving from Hopsworks.
+
+        The requests are independent of each other, they are sent concurrently so that initialising serving takes
+        about one round trip instead of one per request. The metadata of the sql client is only used if all parent
+        feature groups are online enabled, in which case errors fetching it are raised.
+
+        # Arguments
+            entity: The feature view to serve.
+            inference_helper_columns: Whether to fetch the prepared statements of inference helper columns.
+            sql_client: The sql client to fetch the prepared statements, connector and hostname with, if initialised.
+        # Returns
+            `ServingSnapshot`: The fetched metadata.
+        """
+        with ThreadPoolExecutor(self.INIT_SERVING_MAX_PARALLEL_REQUESTS) as executor:
+            parent_feature_groups = executor.submit(
+                self._timed,
+                "parent_feature_groups",
+                lambda: entity.get_parent_feature_groups().accessible,
+            )
+            transformation_statistics = executor.submit(
+                self._timed,
+                "transformation_statistics",
+                tf_engine_mod.TransformationFunctionEngine.get_transformation_statistics,
+                entity,
+                self._training_dataset_version,
+            )
+            prepared_statements = {}
+            online_connector = hostname = None
+            if sql_client is not None:
+                prepared_statements = {
+                    key: executor.submit(
+                        self._timed,
+                        f"prepared_statements.{key}",
+                        sql_client.fetch_prepared_statement,
+                        entity,
+                        key,
+                    )
+                    for key in sql_client.get_prepared_statement_labels(
+                        inference_helper_columns
+                    )
+                }
+                online_connector = executor.submit(
+                    self._timed, "online_connector", sql_client.fetch_online_connector
+                )
+                if sql_client.external:
+                    hostname = executor.submit(
+                        self._timed, "hostname", sql_client.fetch_hostname
+                    )
+
+        parent_feature_groups = [
+            serving_snapshot.SnapshotFeatureGroup(
+                name=fg.name, version=fg.version, online_enabled=fg.online_enabled
+            )
+            for fg in parent_feature_groups.result()
+        ]
+        all_feature_groups_online = all(
+            fg.online_enabled for fg in parent_feature_groups
+        )
+        return serving_snapshot.ServingSnapshot(
+            feature_view_name=entity.name,
+            feature_view_version=entity.version,
+            training_dataset_version=self._training_dataset_version,
+            parent_feature_groups=parent_feature_groups,
+            transformation_statistics=transformation_statistics.result(),
+            prepared_statements={
+                key: future.result() for key, future in prepared_statements.items()
+            }
+            if sql_client is not None and all_feature_groups_online
+            else None,
+            online_connector=online_connector.result()
+            if sql_client is not None and all_feature_groups_online
+            else None,
+            hostname=hostname.result()
+            if hostname is not None and all_feature_groups_online
+            else None,
+        )
+
+    def _timed(self, stage: str, fn: Callable, *args, **kwargs) -> Any:
+        """Call a function and record its duration as a stage of initialising serving."""
+        start_time = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._init_serving_timings[stage] = time.perf_counter() - start_time
 
     def init_batch_scoring(
         self,
         entity: Union[feature_view.FeatureView, training_dataset.TrainingDataset],
         training_dataset_version: int,
+        snapshot: Optional[serving_snapshot.ServingSnapshot] = None,
     ):
         self._training_dataset_version = training_dataset_version
-        self.init_transformation(entity)
+        self.init_transformation(entity, snapshot=snapshot)
         self._serving_initialized = True
 
     def init_transformation(
         self,
         entity: Union[feature_view.FeatureView],
+        snapshot: Optional[serving_snapshot.ServingSnapshot] = None,
     ):
+        # statistics are kept to export them in serving snapshots
+        self._transformation_statistics = (
+            snapshot.transformation_statistics
+            if snapshot is not None
+            else tf_engine_mod.TransformationFunctionEngine.get_transformation_statistics(
+                entity,
+                self._training_dataset_version,
+            )
+        )
         # attach transformation functions
         model_dependent_transformations = tf_engine_mod.TransformationFunctionEngine.get_ready_to_use_transformation_fns(
             entity,
             self._training_dataset_version,
+            feature_descriptive_statistics=self._transformation_statistics,
         )
 
         # Filter out model-dependent transformation functions that use label features. Only the first label feature is checked since a transformation function using label feature can only contain label features.
@@ -290,19 +453,66 @@ class VectorServer:
         external: bool,
         inference_helper_columns: bool,
         options: Optional[Dict[str, Any]] = None,
+        snapshot: Optional[serving_snapshot.ServingSnapshot] = None,
+        sql_client: Optional[online_store_sql_engine.OnlineStoreSqlClient] = None,
     ) -> None:
         _logger.debug("Initialising Online Store SQL client")
-        self._sql_client = online_store_sql_engine.OnlineStoreSqlClient(
+        self._sql_client = sql_client or self._create_sql_client(external)
+        self.sql_client.init_prepared_statements(
+            entity,
+            inference_helper_columns,
+            prepared_statements=snapshot.prepared_statements
+            if snapshot is not None
+            else None,
+        )
+        self.sql_client.init_async_mysql_connection(
+            options=options,
+            online_connector=snapshot.online_connector
+            if snapshot is not None
+            else None,
+            hostname=snapshot.hostname if snapshot is not None else None,
+        )
+
+    def _create_sql_client(
+        self, external: bool
+    ) -> online_store_sql_engine.OnlineStoreSqlClient:
+        return online_store_sql_engine.OnlineStoreSqlClient(
             feature_store_id=self._feature_store_id,
             skip_fg_ids=self._skip_fg_ids,
             serving_keys=self.serving_keys,
             external=external,
         )
-        self.sql_client.init_prepared_statements(
-            entity,
-            inference_helper_columns,
+
+    def get_serving_snapshot(
+        self, entity: feature_view.FeatureView
+    ) -> serving_snapshot.ServingSnapshot:
+        """Get the metadata fetched from Hopsworks while initialising serving, to restore it with `init_serving`."""
+        if not self._serving_initialized:
+            raise exceptions.FeatureStoreException(
+                "Serving is not initialized. Call `feature_view.init_serving()` before exporting a serving snapshot."
+            )
+        return serving_snapshot.ServingSnapshot(
+            feature_view_name=entity.name,
+            feature_view_version=entity.version,
+            training_dataset_version=self._training_dataset_version,
+            parent_feature_groups=[
+                serving_snapshot.SnapshotFeatureGroup(
+                    name=fg.name, version=fg.version, online_enabled=fg.online_enabled
+                )
+                for fg in self._parent_feature_groups
+            ],
+            transformation_statistics=self._transformation_statistics,
+            prepared_statements={
+                key: list(prepared_statements)
+                for key, prepared_statements in self._sql_client.prepared_statements.items()
+            }
+            if self._sql_client is not None
+            else None,
+            online_connector=self._sql_client.online_connector
+            if self._sql_client is not None
+            else None,
+            hostname=self._sql_client.hostname if self._sql_client is not None else None,
         )
-        self.sql_client.init_async_mysql_connection(options=options)
 
     def setup_rest_client_and_engine(
         self,
@@ -312,12 +522,30 @@ class VectorServer:
     ):
         # naming is off here, but it avoids confusion with the argument init_rest_client
         _logger.debug("Initialising Online Store REST client")
+        rest_engine_config = config_rest_client or {}
+        if self._rest_client_engine is not None:
+            # release the threads of the engine being replaced
+            self._rest_client_engine.close()
         self._rest_client_engine = (
             online_store_rest_client_engine.OnlineStoreRestClientEngine(
                 feature_store_name=self._feature_store_name,
                 feature_view_name=entity.name,
                 feature_view_version=entity.version,
                 features=entity.features,
+                batch_chunk_size=rest_engine_config.get(
+                    online_store_rest_client_engine.OnlineStoreRestClientEngine.BATCH_CHUNK_SIZE
+                ),
+                batch_max_parallel_requests=rest_engine_config.get(
+                    online_store_rest_client_engine.OnlineStoreRestClientEngine.BATCH_MAX_PARALLEL_REQUESTS
+                ),
+                batch_chunk_retries=rest_engine_config.get(
+                    online_store_rest_client_engine.OnlineStoreRestClientEngine.BATCH_CHUNK_RETRIES
+                ),
+                json_decoder=rest_engine_config.get(
+                    online_store_rest_client_engine.OnlineStoreRestClientEngine.JSON_DECODER
+                ),
+                # timestamps are converted while decoding the response rows
+                decode_timestamps=True,
             )
         )
         # This logic needs to move to the above engine init
@@ -395,7 +623,7 @@ class VectorServer:
     def get_feature_vector(
         self,
         entry: Dict[str, Any],
-        return_type: Union[Literal["list", "numpy", "pandas", "polars"]],
+        return_type: Union[Literal["list", "numpy", "pandas", "polars", "arrow"]],
         passed_features: Optional[Dict[str, Any]] = None,
         vector_db_features: Optional[Dict[str, Any]] = None,
         allow_missing: bool = False,
@@ -405,8 +633,92 @@ class VectorServer:
         on_demand_features: Optional[bool] = True,
         request_parameters: Optional[Dict[str, Any]] = None,
         transformation_context: Dict[str, Any] = None,
-    ) -> Union[pd.DataFrame, pl.DataFrame, np.ndarray, List[Any], Dict[str, Any]]:
+    ) -> Union[
+        pd.DataFrame, pl.DataFrame, pa.Table, np.ndarray, List[Any], Dict[str, Any]
+    ]:
         """Assembles serving vector from online feature store."""
+        online_client_choice, rondb_entry = self._prepare_entry(
+            entry=entry,
+            passed_features=passed_features,
+            vector_db_features=vector_db_features,
+            request_parameters=request_parameters,
+            allow_missing=allow_missing,
+            force_rest_client=force_rest_client,
+            force_sql_client=force_sql_client,
+        )
+
+        serving_vector = self._fetch_feature_vector(
+            rondb_entry, online_client_choice, allow_missing=allow_missing
+        )
+
+        return self._assemble_feature_vector_and_convert(
+            serving_vector,
+            return_type=return_type,
+            passed_features=passed_features,
+            vector_db_features=vector_db_features,
+            allow_missing=allow_missing,
+            client=online_client_choice,
+            transform=transform,
+            on_demand_features=on_demand_features,
+            request_parameters=request_parameters,
+            transformation_context=transformation_context,
+        )
+
+    async def get_feature_vector_async(
+        self,
+        entry: Dict[str, Any],
+        return_type: Union[Literal["list", "numpy", "pandas", "polars", "arrow"]],
+        passed_features: Optional[Dict[str, Any]] = None,
+        vector_db_features: Optional[Dict[str, Any]] = None,
+        allow_missing: bool = False,
+        force_rest_client: bool = False,
+        force_sql_client: bool = False,
+        transform: bool = True,
+        on_demand_features: Optional[bool] = True,
+        request_parameters: Optional[Dict[str, Any]] = None,
+        transformation_context: Dict[str, Any] = None,
+    ) -> Union[
+        pd.DataFrame, pl.DataFrame, pa.Table, np.ndarray, List[Any], Dict[str, Any]
+    ]:
+        """Assembles serving vector from online feature store, awaiting the lookup on the running event loop."""
+        online_client_choice, rondb_entry = self._prepare_entry(
+            entry=entry,
+            passed_features=passed_features,
+            vector_db_features=vector_db_features,
+            request_parameters=request_parameters,
+            allow_missing=allow_missing,
+            force_rest_client=force_rest_client,
+            force_sql_client=force_sql_client,
+        )
+
+        serving_vector = await self._fetch_feature_vector_async(
+            rondb_entry, online_client_choice, allow_missing=allow_missing
+        )
+
+        return self._assemble_feature_vector_and_convert(
+            serving_vector,
+            return_type=return_type,
+            passed_features=passed_features,
+            vector_db_features=vector_db_features,
+            allow_missing=allow_missing,
+            client=online_client_choice,
+            transform=transform,
+            on_demand_features=on_demand_features,
+            request_parameters=request_parameters,
+            transformation_context=transformation_context,
+        )
+
+    def _prepare_entry(
+        self,
+        entry: Dict[str, Any],
+        passed_features: Optional[Dict[str, Any]],
+        vector_db_features: Optional[Dict[str, Any]],
+        request_parameters: Optional[Dict[str, Any]],
+        allow_missing: bool,
+        force_rest_client: bool,
+        force_sql_client: bool,
+    ) -> Tuple[Literal["rest", "sql"], Dict[str, Any]]:
+        """Selects the online store client and validates the entry before the feature vector is fetched."""
         online_client_choice = self.which_client_and_ensure_initialised(
             force_rest_client=force_rest_client, force_sql_client=force_sql_client
         )
@@ -422,20 +734,102 @@ class VectorServer:
             passed_features=passed_features,
             vector_db_features=vector_db_features,
         )
+        return online_client_choice, rondb_entry
+
+    def _fetch_feature_vector(
+        self,
+        rondb_entry: Dict[str, Any],
+        online_client_choice: Literal["rest", "sql"],
+        allow_missing: bool,
+    ) -> Dict[str, Any]:
         if len(rondb_entry) == 0:
             _logger.debug("Empty entry for rondb, skipping fetching.")
-            serving_vector = {}  # updated below with vector_db_features and passed_features
-        elif online_client_choice == self.DEFAULT_REST_CLIENT:
+            return {}  # updated later with vector_db_features and passed_features
+        cache_key = self._feature_vector_cache_key(
+            rondb_entry, online_client_choice, allow_missing
+        )
+        serving_vector = self._get_cached_feature_vector(cache_key)
+        if serving_vector is None:
+            serving_vector = self._read_feature_vector(
+                rondb_entry, online_client_choice, allow_missing=allow_missing
+            )
+            self._cache_feature_vector(cache_key, serving_vector)
+        return serving_vector
+
+    async def _fetch_feature_vector_async(
+        self,
+        rondb_entry: Dict[str, Any],
+        online_client_choice: Literal["rest", "sql"],
+        allow_missing: bool,
+    ) -> Dict[str, Any]:
+        if len(rondb_entry) == 0:
+            _logger.debug("Empty entry for rondb, skipping fetching.")
+            return {}  # updated later with vector_db_features and passed_features
+        cache_key = self._feature_vector_cache_key(
+            rondb_entry, online_client_choice, allow_missing
+        )
+        serving_vector = self._get_cached_feature_vector(cache_key)
+        if serving_vector is None:
+            serving_vector = await self._read_feature_vector_async(
+                rondb_entry, online_client_choice, allow_missing=allow_missing
+            )
+            self._cache_feature_vector(cache_key, serving_vector)
+        return serving_vector
+
+    def _read_feature_vector(
+        self,
+        rondb_entry: Dict[str, Any],
+        online_client_choice: Literal["rest", "sql"],
+        allow_missing: bool,
+    ) -> Dict[str, Any]:
+        if online_client_choice == self.DEFAULT_REST_CLIENT:
             _logger.debug("get_feature_vector Online REST client")
-            serving_vector = self.rest_client_engine.get_single_feature_vector(
+            return self.rest_client_engine.get_single_feature_vector(
                 rondb_entry,
                 drop_missing=not allow_missing,
                 return_type=self.rest_client_engine.RETURN_TYPE_FEATURE_VALUE_DICT,
             )
         else:
             _logger.debug("get_feature_vector Online SQL client")
-            serving_vector = self.sql_client.get_single_feature_vector(rondb_entry)
+            return self.sql_client.get_single_feature_vector(rondb_entry)
 
+    async def _read_feature_vector_async(
+        self,
+        rondb_entry: Dict[str, Any],
+        online_client_choice: Literal["rest", "sql"],
+        allow_missing: bool,
+    ) -> Dict[str, Any]:
+        if online_client_choice == self.DEFAULT_REST_CLIENT:
+            # The RonDB REST client is synchronous, run it in the default executor of the loop so that it does not block it.
+            _logger.debug("get_feature_vector_async Online REST client")
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(
+                    self._read_feature_vector,
+                    rondb_entry,
+                    online_client_choice,
+                    allow_missing=allow_missing,
+                ),
+            )
+        else:
+            _logger.debug("get_feature_vector_async Online SQL client")
+            return await self.sql_client.get_single_feature_vector_async(rondb_entry)
+
+    def _assemble_feature_vector_and_convert(
+        self,
+        serving_vector: Dict[str, Any],
+        return_type: Union[Literal["list", "numpy", "pandas", "polars", "arrow"]],
+        passed_features: Optional[Dict[str, Any]],
+        vector_db_features: Optional[Dict[str, Any]],
+        allow_missing: bool,
+        client: Literal["rest", "sql"],
+        transform: bool,
+        on_demand_features: bool,
+        request_parameters: Optional[Dict[str, Any]],
+        transformation_context: Dict[str, Any],
+    ) -> Union[
+        pd.DataFrame, pl.DataFrame, pa.Table, np.ndarray, List[Any], Dict[str, Any]
+    ]:
         self._raise_transformation_warnings(
             transform=transform, on_demand_features=on_demand_features
         )
@@ -445,7 +839,7 @@ class VectorServer:
             passed_values=passed_features or {},
             vector_db_result=vector_db_features or {},
             allow_missing=allow_missing,
-            client=online_client_choice,
+            client=client,
             transform=transform,
             on_demand_features=on_demand_features,
             request_parameters=request_parameters,
@@ -465,7 +859,7 @@ class VectorServer:
         self,
         entries: List[Dict[str, Any]],
         return_type: Optional[
-            Union[Literal["list", "numpy", "pandas", "polars"]]
+            Union[Literal["list", "numpy", "pandas", "polars", "arrow"]]
         ] = None,
         passed_features: Optional[List[Dict[str, Any]]] = None,
         vector_db_features: Optional[List[Dict[str, Any]]] = None,
@@ -476,10 +870,119 @@ class VectorServer:
         transform: bool = True,
         on_demand_features: Optional[bool] = True,
         transformation_context: Dict[str, Any] = None,
-    ) -> Union[pd.DataFrame, pl.DataFrame, np.ndarray, List[Any], List[Dict[str, Any]]]:
+        vectorized_transformations: bool = False,
+    ) -> Union[
+        pd.DataFrame, pl.DataFrame, pa.Table, np.ndarray, List[Any], List[Dict[str, Any]]
+    ]:
         """Assembles serving vector from online feature store."""
         if passed_features is None:
             passed_features = []
+        entries, online_client_choice, rondb_entries, skipped_empty_entries = (
+            self._prepare_entries(
+                entries=entries,
+                passed_features=passed_features,
+                vector_db_features=vector_db_features,
+                request_parameters=request_parameters,
+                allow_missing=allow_missing,
+                force_rest_client=force_rest_client,
+                force_sql_client=force_sql_client,
+                transform=transform,
+                on_demand_features=on_demand_features,
+            )
+        )
+
+        batch_results = self._fetch_feature_vectors(
+            rondb_entries, online_client_choice, allow_missing=allow_missing
+        )
+
+        return self._assemble_feature_vectors_and_convert(
+            entries=entries,
+            batch_results=batch_results,
+            skipped_empty_entries=skipped_empty_entries,
+            return_type=return_type,
+            passed_features=passed_features,
+            vector_db_features=vector_db_features,
+            request_parameters=request_parameters,
+            allow_missing=allow_missing,
+            client=online_client_choice,
+            transform=transform,
+            on_demand_features=on_demand_features,
+            transformation_context=transformation_context,
+            vectorized_transformations=vectorized_transformations,
+        )
+
+    async def get_feature_vectors_async(
+        self,
+        entries: List[Dict[str, Any]],
+        return_type: Optional[
+            Union[Literal["list", "numpy", "pandas", "polars", "arrow"]]
+        ] = None,
+        passed_features: Optional[List[Dict[str, Any]]] = None,
+        vector_db_features: Optional[List[Dict[str, Any]]] = None,
+        request_parameters: Optional[List[Dict[str, Any]]] = None,
+        allow_missing: bool = False,
+        force_rest_client: bool = False,
+        force_sql_client: bool = False,
+        transform: bool = True,
+        on_demand_features: Optional[bool] = True,
+        transformation_context: Dict[str, Any] = None,
+        vectorized_transformations: bool = False,
+    ) -> Union[
+        pd.DataFrame, pl.DataFrame, pa.Table, np.ndarray, List[Any], List[Dict[str, Any]]
+    ]:
+        """Assembles serving vectors from online feature store, awaiting the lookup on the running event loop."""
+        if passed_features is None:
+            passed_features = []
+        entries, online_client_choice, rondb_entries, skipped_empty_entries = (
+            self._prepare_entries(
+                entries=entries,
+                passed_features=passed_features,
+                vector_db_features=vector_db_features,
+                request_parameters=request_parameters,
+                allow_missing=allow_missing,
+                force_rest_client=force_rest_client,
+                force_sql_client=force_sql_client,
+                transform=transform,
+                on_demand_features=on_demand_features,
+            )
+        )
+
+        batch_results = await self._fetch_feature_vectors_async(
+            rondb_entries, online_client_choice, allow_missing=allow_missing
+        )
+
+        return self._assemble_feature_vectors_and_convert(
+            entries=entries,
+            batch_results=batch_results,
+            skipped_empty_entries=skipped_empty_entries,
+            return_type=return_type,
+            passed_features=passed_features,
+            vector_db_features=vector_db_features,
+            request_parameters=request_parameters,
+            allow_missing=allow_missing,
+            client=online_client_choice,
+            transform=transform,
+            on_demand_features=on_demand_features,
+            transformation_context=transformation_context,
+            vectorized_transformations=vectorized_transformations,
+        )
+
+    def _prepare_entries(
+        self,
+        entries: List[Dict[str, Any]],
+        passed_features: List[Dict[str, Any]],
+        vector_db_features: Optional[List[Dict[str, Any]]],
+        request_parameters: Optional[List[Dict[str, Any]]],
+        allow_missing: bool,
+        force_rest_client: bool,
+        force_sql_client: bool,
+        transform: bool,
+        on_demand_features: bool,
+    ) -> Tuple[List[Dict[str, Any]], Literal["rest", "sql"], List[Dict[str, Any]], List[int]]:
+        """Selects the online store client and validates the entries before the feature vectors are fetched.
+
+        Returns the entries, the client to use, the entries to fetch from RonDB and the indices of the entries which are skipped.
+        """
         # Assertions on passed_features and vector_db_features
         assert (
             passed_features is None
@@ -544,26 +1047,204 @@ class VectorServer:
             else:
                 skipped_empty_entries.append(idx)
 
-        if online_client_choice == self.DEFAULT_REST_CLIENT and len(rondb_entries) > 0:
+        return entries, online_client_choice, rondb_entries, skipped_empty_entries
+
+    def _fetch_feature_vectors(
+        self,
+        rondb_entries: List[Dict[str, Any]],
+        online_client_choice: Literal["rest", "sql"],
+        allow_missing: bool,
+    ) -> List[Dict[str, Any]]:
+        if len(rondb_entries) == 0:
+            _logger.debug("Empty entries for rondb, skipping fetching.")
+            return []
+        if self._feature_vector_cache is None:
+            return self._read_feature_vectors(
+                rondb_entries, online_client_choice, allow_missing=allow_missing
+            )
+        batch_results, cache_keys, missed_indices = self._get_cached_feature_vectors(
+            rondb_entries, online_client_choice, allow_missing
+        )
+        if missed_indices:
+            fetched_results = self._read_feature_vectors(
+                [rondb_entries[i] for i in missed_indices],
+                online_client_choice,
+                allow_missing=allow_missing,
+            )
+            self._merge_fetched_feature_vectors(
+                batch_results, cache_keys, missed_indices, fetched_results
+            )
+        return batch_results
+
+    async def _fetch_feature_vectors_async(
+        self,
+        rondb_entries: List[Dict[str, Any]],
+        online_client_choice: Literal["rest", "sql"],
+        allow_missing: bool,
+    ) -> List[Dict[str, Any]]:
+        if len(rondb_entries) == 0:
+            _logger.debug("Empty entries for rondb, skipping fetching.")
+            return []
+        if self._feature_vector_cache is None:
+            return await self._read_feature_vectors_async(
+                rondb_entries, online_client_choice, allow_missing=allow_missing
+            )
+        batch_results, cache_keys, missed_indices = self._get_cached_feature_vectors(
+            rondb_entries, online_client_choice, allow_missing
+        )
+        if missed_indices:
+            fetched_results = await self._read_feature_vectors_async(
+                [rondb_entries[i] for i in missed_indices],
+                online_client_choice,
+                allow_missing=allow_missing,
+            )
+            self._merge_fetched_feature_vectors(
+                batch_results, cache_keys, missed_indices, fetched_results
+            )
+        return batch_results
+
+    def _read_feature_vectors(
+        self,
+        rondb_entries: List[Dict[str, Any]],
+        online_client_choice: Literal["rest", "sql"],
+        allow_missing: bool,
+    ) -> List[Dict[str, Any]]:
+        if online_client_choice == self.DEFAULT_REST_CLIENT:
             _logger.debug("get_batch_feature_vector Online REST client")
-            batch_results = self.rest_client_engine.get_batch_feature_vectors(
+            return self.rest_client_engine.get_batch_feature_vectors(
                 entries=rondb_entries,
                 drop_missing=not allow_missing,
                 return_type=self.rest_client_engine.RETURN_TYPE_FEATURE_VALUE_DICT,
             )
-        elif len(rondb_entries) > 0:
-            # get result row
+        else:
             _logger.debug("get_batch_feature_vectors through SQL client")
             batch_results, _ = self.sql_client.get_batch_feature_vectors(rondb_entries)
+            return batch_results
+
+    async def _read_feature_vectors_async(
+        self,
+        rondb_entries: List[Dict[str, Any]],
+        online_client_choice: Literal["rest", "sql"],
+        allow_missing: bool,
+    ) -> List[Dict[str, Any]]:
+        if online_client_choice == self.DEFAULT_REST_CLIENT:
+            # The RonDB REST client is synchronous, run it in the default executor of the loop so that it does not block it.
+            _logger.debug("get_batch_feature_vectors_async Online REST client")
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(
+                    self._read_feature_vectors,
+                    rondb_entries,
+                    online_client_choice,
+                    allow_missing=allow_missing,
+                ),
+            )
         else:
-            _logger.debug("Empty entries for rondb, skipping fetching.")
-            batch_results = []
+            _logger.debug("get_batch_feature_vectors_async through SQL client")
+            batch_results, _ = await self.sql_client.get_batch_feature_vectors_async(
+                rondb_entries
+            )
+            return batch_results
 
-        _logger.debug("Assembling feature vectors from batch results")
-        next_skipped = (
-            skipped_empty_entries.pop(0) if len(skipped_empty_entries) > 0 else None
+    def _feature_vector_cache_key(
+        self,
+        rondb_entry: Dict[str, Any],
+        online_client_choice: Literal["rest", "sql"],
+        allow_missing: bool,
+    ) -> Optional[Hashable]:
+        if self._feature_vector_cache is None:
+            return None
+        # The REST client drops missing features unless allow_missing is set, so the raw results differ.
+        return self._feature_vector_cache.make_key(
+            rondb_entry, online_client_choice, allow_missing
         )
+
+    def _get_cached_feature_vector(
+        self, cache_key: Optional[Hashable]
+    ) -> Optional[Dict[str, Any]]:
+        if self._feature_vector_cache is None:
+            return None
+        return self._feature_vector_cache.get(cache_key)
+
+    def _cache_feature_vector(
+        self, cache_key: Optional[Hashable], serving_vector: Dict[str, Any]
+    ) -> None:
+        if self._feature_vector_cache is not None:
+            self._feature_vector_cache.put(cache_key, serving_vector)
+
+    def _get_cached_feature_vectors(
+        self,
+        rondb_entries: List[Dict[str, Any]],
+        online_client_choice: Literal["rest", "sql"],
+        allow_missing: bool,
+    ) -> Tuple[List[Optional[Dict[str, Any]]], List[Optional[Hashable]], List[int]]:
+        """Look up a batch of entries in the feature vector cache.
+
+        Returns the cached results with `None` for cache misses, the cache keys and the indices of the cache misses.
+        """
+        cache_keys = [
+            self._feature_vector_cache_key(entry, online_client_choice, allow_missing)
+            for entry in rondb_entries
+        ]
+        batch_results = [self._get_cached_feature_vector(key) for key in cache_keys]
+        missed_indices = [
+            idx for idx, result in enumerate(batch_results) if result is None
+        ]
+        _logger.debug(
+            "Feature vector cache hits %d, misses %d.",
+            len(rondb_entries) - len(missed_indices),
+            len(missed_indices),
+        )
+        return batch_results, cache_keys, missed_indices
+
+    def _merge_fetched_feature_vectors(
+        self,
+        batch_results: List[Optional[Dict[str, Any]]],
+        cache_keys: List[Optional[Hashable]],
+        missed_indices: List[int],
+        fetched_results: List[Dict[str, Any]],
+    ) -> None:
+        for idx, serving_vector in zip(missed_indices, fetched_results):
+            batch_results[idx] = serving_vector
+            self._cache_feature_vector(cache_keys[idx], serving_vector)
+
+    def _assemble_feature_vectors_and_convert(
+        self,
+        entries: List[Dict[str, Any]],
+        batch_results: List[Dict[str, Any]],
+        skipped_empty_entries: List[int],
+        return_type: Optional[Union[Literal["list", "numpy", "pandas", "polars", "arrow"]]],
+        passed_features: List[Dict[str, Any]],
+        vector_db_features: Optional[List[Dict[str, Any]]],
+        request_parameters: Optional[List[Dict[str, Any]]],
+        allow_missing: bool,
+        client: Literal["rest", "sql"],
+        transform: bool,
+        on_demand_features: bool,
+        transformation_context: Dict[str, Any],
+        vectorized_transformations: bool,
+    ) -> Union[
+        pd.DataFrame, pl.DataFrame, pa.Table, np.ndarray, List[Any], List[Dict[str, Any]]
+    ]:
+        online_client_choice = client
+        _logger.debug("Assembling feature vectors from batch results")
+        # batch_results only contain the entries which were not skipped, in the order of the entries.
+        skipped_entries = set(skipped_empty_entries)
+        batch_results_iter = iter(batch_results)
         vectors = []
+        batch_request_parameters = []
+        columnar = (
+            not vectorized_transformations
+            and return_type is not None
+            and return_type.lower() in self.COLUMNAR_RETURN_TYPES
+        )
+        if columnar:
+            column_names = self._get_feature_vector_col_names(
+                transform=transform, on_demand_features=on_demand_features
+            )
+            # Preallocated column buffers, filled from the assembled feature vectors without building row lists.
+            column_buffers = [[None] * len(entries) for _ in column_names]
+            num_vectors = 0
 
         # If request parameter is a dictionary then copy it to list with the same length as that of entires
         request_parameters = (
@@ -583,16 +1264,43 @@ class VectorServer:
             request_parameters or [],
             fillvalue=None,
         ):
-            if next_skipped == idx:
+            if idx in skipped_entries:
                 _logger.debug("Entry %d was skipped, setting to empty dict.", idx)
-                next_skipped = (
-                    skipped_empty_entries.pop(0)
-                    if len(skipped_empty_entries) > 0
-                    else None
-                )
                 result_dict = {}
             else:
-                result_dict = batch_results.pop(0)
+                result_dict = next(batch_results_iter)
+
+            if vectorized_transformations:
+                # Transformations are applied once over all feature vectors after they have been collected.
+                result_dict = self.prepare_feature_vector_dict(
+                    result_dict=result_dict,
+                    passed_values=passed_values,
+                    vector_db_result=vector_db_result,
+                    allow_missing=allow_missing,
+                    client=online_client_choice,
+                )
+                if result_dict is not None:
+                    vectors.append(result_dict)
+                    batch_request_parameters.append(request_parameter or {})
+                continue
+
+            if columnar:
+                vector_dict = self.assemble_feature_vector_dict(
+                    result_dict=result_dict,
+                    passed_values=passed_values,
+                    vector_db_result=vector_db_result,
+                    allow_missing=allow_missing,
+                    client=online_client_choice,
+                    transform=transform,
+                    on_demand_features=on_demand_features,
+                    request_parameters=request_parameter,
+                    transformation_context=transformation_context,
+                )
+                if vector_dict is not None:
+                    for column_buffer, fname in zip(column_buffers, column_names):
+                        column_buffer[num_vectors] = vector_dict.get(fname)
+                    num_vectors += 1
+                continue
 
             vector = self.assemble_feature_vector(
                 result_dict=result_dict,
@@ -609,6 +1317,34 @@ class VectorServer:
             if vector is not None:
                 vectors.append(vector)
 
+        if columnar:
+            if num_vectors < len(entries):
+                # Skipped feature vectors leave unused slots at the end of the buffers.
+                column_buffers = [buffer[:num_vectors] for buffer in column_buffers]
+            return self.handle_feature_columns_return_type(
+                dict(zip(column_names, column_buffers)),
+                num_vectors=num_vectors,
+                column_names=column_names,
+                return_type=return_type,
+            )
+
+        if vectorized_transformations:
+            feature_columns = self.apply_batch_transformation(
+                vectors,
+                batch_request_parameters,
+                transformation_context=transformation_context,
+                transform=transform,
+                on_demand_features=on_demand_features,
+            )
+            return self.handle_feature_columns_return_type(
+                feature_columns,
+                num_vectors=len(vectors),
+                column_names=self._get_feature_vector_col_names(
+                    transform=transform, on_demand_features=on_demand_features
+                ),
+                return_type=return_type,
+            )
+
         return self.handle_feature_vector_return_type(
             vectors,
             batch=True,
@@ -631,6 +1367,80 @@ class VectorServer:
         transformation_context: Dict[str, Any] = None,
     ) -> Optional[List[Any]]:
         """Assembles serving vector from online feature store."""
+        result_dict = self.assemble_feature_vector_dict(
+            result_dict=result_dict,
+            passed_values=passed_values,
+            vector_db_result=vector_db_result,
+            allow_missing=allow_missing,
+            client=client,
+            transform=transform,
+            on_demand_features=on_demand_features,
+            request_parameters=request_parameters,
+            transformation_context=transformation_context,
+        )
+        if result_dict is None:
+            return None
+
+        return [
+            result_dict.get(fname, None)
+            for fname in self._get_feature_vector_col_names(
+                transform=transform, on_demand_features=on_demand_features
+            )
+        ]
+
+    def assemble_feature_vector_dict(
+        self,
+        result_dict: Dict[str, Any],
+        passed_values: Optional[Dict[str, Any]],
+        vector_db_result: Optional[Dict[str, Any]],
+        allow_missing: bool,
+        client: Literal["rest", "sql"],
+        transform: bool,
+        on_demand_features: bool,
+        request_parameters: Optional[Dict[str, Any]] = None,
+        transformation_context: Dict[str, Any] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Assembles serving vector from online feature store as a dictionary mapping feature names to values.
+
+        Returns `None` if the feature vector should be skipped.
+        """
+        result_dict = self.prepare_feature_vector_dict(
+            result_dict=result_dict,
+            passed_values=passed_values,
+            vector_db_result=vector_db_result,
+            allow_missing=allow_missing,
+            client=client,
+        )
+        if result_dict is None:
+            return None
+
+        if (
+            len(self.model_dependent_transformation_functions) > 0
+            or len(self.on_demand_transformation_functions) > 0
+        ):
+            self.apply_transformation(
+                result_dict,
+                request_parameters or {},
+                transformation_context,
+                transform=transform,
+                on_demand_features=on_demand_features,
+            )
+
+        _logger.debug("Assembled and transformed dict feature vector: %s", result_dict)
+        return result_dict
+
+    def prepare_feature_vector_dict(
+        self,
+        result_dict: Optional[Dict[str, Any]],
+        passed_values: Optional[Dict[str, Any]],
+        vector_db_result: Optional[Dict[str, Any]],
+        allow_missing: bool,
+        client: Literal["rest", "sql"],
+    ) -> Optional[Dict[str, Any]]:
+        """Merges the retrieved feature values with the vector db results and passed features, and applies the return value handlers.
+
+        Returns `None` if the feature vector should be skipped.
+        """
         # Errors in batch requests are returned as None values
         _logger.debug("Assembling serving vector: %s", result_dict)
         if result_dict is None:
@@ -671,34 +1481,17 @@ class VectorServer:
 
         if len(self.return_feature_value_handlers) > 0:
             self.apply_return_value_handlers(result_dict, client=client)
-        if (
-            len(self.model_dependent_transformation_functions) > 0
-            or len(self.on_demand_transformation_functions) > 0
-        ):
-            self.apply_transformation(
-                result_dict,
-                request_parameters or {},
-                transformation_context,
-                transform=transform,
-                on_demand_features=on_demand_features,
-            )
+        return result_dict
 
-        _logger.debug("Assembled and transformed dict feature vector: %s", result_dict)
+    def _get_feature_vector_col_names(
+        self, transform: bool, on_demand_features: bool
+    ) -> List[str]:
         if transform:
-            return [
-                result_dict.get(fname, None)
-                for fname in self.transformed_feature_vector_col_name
-            ]
+            return self.transformed_feature_vector_col_name
         elif on_demand_features:
-            return [
-                result_dict.get(fname, None)
-                for fname in self._on_demand_feature_vector_col_name
-            ]
+            return self._on_demand_feature_vector_col_name
         else:
-            return [
-                result_dict.get(fname, None)
-                for fname in self._untransformed_feature_vector_col_name
-            ]
+            return self._untransformed_feature_vector_col_name
 
     def _validate_input_features(
         self,
@@ -802,7 +1595,7 @@ class VectorServer:
         self,
         feature_vectors: Union[List[Any], List[List[Any]], pd.DataFrame, pl.DataFrame],
         transformation_context: Dict[str, Any] = None,
-        return_type: Union[Literal["list", "numpy", "pandas", "polars"]] = None,
+        return_type: Union[Literal["list", "numpy", "pandas", "polars", "arrow"]] = None,
     ) -> Union[List[Any], List[List[Any]], pd.DataFrame, pl.DataFrame]:
         """
         Applies model dependent transformation on the provided feature vector.
@@ -863,7 +1656,7 @@ class VectorServer:
         ] = None,
         request_parameters: Union[List[Dict[str, Any]], Dict[str, Any]] = None,
         transformation_context: Dict[str, Any] = None,
-        return_type: Union[Literal["list", "numpy", "pandas", "polars"]] = None,
+        return_type: Union[Literal["list", "numpy", "pandas", "polars", "arrow"]] = None,
     ):
         """
         Function computes on-demand features present in the feature view.
@@ -975,7 +1768,7 @@ class VectorServer:
         ],
         batch: bool,
         inference_helper: bool,
-        return_type: Union[Literal["list", "dict", "numpy", "pandas", "polars"]],
+        return_type: Union[Literal["list", "dict", "numpy", "pandas", "polars", "arrow"]],
         transform: bool = False,
         on_demand_feature: bool = False,
     ) -> Union[
@@ -1030,15 +1823,82 @@ class VectorServer:
                 schema=column_names if not inference_helper else None,
                 orient="row",
             )
+        elif return_type.lower() == "arrow":
+            _logger.debug("Returning feature vector as arrow table")
+            if not HAS_PYARROW:
+                raise ModuleNotFoundError(pyarrow_not_installed_message)
+            if inference_helper:
+                return pa.Table.from_pylist(
+                    feature_vectorz if batch else [feature_vectorz]
+                )
+            rows = feature_vectorz if batch else [feature_vectorz]
+            return pa.table(
+                {
+                    fname: [row[idx] for row in rows]
+                    for idx, fname in enumerate(column_names)
+                }
+            )
         else:
             raise ValueError(
-                f"""Unknown return type. Supported return types are {"'list', 'numpy'" if not inference_helper else "'dict'"}, 'polars' and 'pandas''"""
+                f"""Unknown return type. Supported return types are {"'list', 'numpy'" if not inference_helper else "'dict'"}, 'polars', 'pandas' and 'arrow'"""
+            )
+
+    def handle_feature_columns_return_type(
+        self,
+        feature_columns: Dict[str, List[Any]],
+        num_vectors: int,
+        column_names: List[str],
+        return_type: Union[Literal["list", "numpy", "pandas", "polars", "arrow"]],
+    ) -> Union[pd.DataFrame, pl.DataFrame, pa.Table, np.ndarray, List[List[Any]]]:
+        """
+        Function that converts a batch of feature vectors stored as columns into the requested return type.
+
+        # Arguments
+            feature_columns: `Dict[str, List[Any]]`. Dictionary mapping feature names to the values of the feature for all feature vectors in the batch.
+            num_vectors: `int`. The number of feature vectors in the batch.
+            column_names: `List[str]`. The names of the features to be returned, in order.
+            return_type: `"list"`, `"pandas"`, `"polars"`, `"numpy"` or `"arrow"`.
+        # Returns
+            `Union[pd.DataFrame, pl.DataFrame, pa.Table, np.ndarray, List[List[Any]]]`: The feature vectors in the requested return type.
+        """
+        columns = {
+            fname: feature_columns.get(fname, [None] * num_vectors)
+            for fname in column_names
+        }
+
+        if return_type.lower() == "list":
+            _logger.debug("Returning feature vectors as value list")
+            return [list(vector) for vector in zip(*columns.values())]
+        elif return_type.lower() == "numpy":
+            _logger.debug("Returning feature vectors as numpy array")
+            if not HAS_NUMPY:
+                raise ModuleNotFoundError(numpy_not_installed_message)
+            if num_vectors == 0 or len(columns) == 0:
+                return np.array([])
+            # The dtype is inferred over all values as for a list of rows, the transpose is a view.
+            return np.array(list(columns.values())).T
+        elif return_type.lower() == "pandas":
+            _logger.debug("Returning feature vectors as pandas dataframe")
+            return pd.DataFrame(columns, columns=column_names)
+        elif return_type.lower() == "polars":
+            _logger.debug("Returning feature vectors as polars dataframe")
+            if not HAS_POLARS:
+                raise ModuleNotFoundError(polars_not_installed_message)
+            return pl.DataFrame(columns)
+        elif return_type.lower() == "arrow":
+            _logger.debug("Returning feature vectors as arrow table")
+            if not HAS_PYARROW:
+                raise ModuleNotFoundError(pyarrow_not_installed_message)
+            return pa.table(columns)
+        else:
+            raise ValueError(
+                "Unknown return type. Supported return types are 'list', 'numpy', 'polars', 'pandas' and 'arrow'"
             )
 
     def get_inference_helper(
         self,
         entry: Dict[str, Any],
-        return_type: Union[Literal["dict", "pandas", "polars"]],
+        return_type: Union[Literal["dict", "pandas", "polars", "arrow"]],
         force_rest_client: bool,
         force_sql_client: bool,
     ) -> Union[pd.DataFrame, pl.DataFrame, Dict[str, Any]]:
@@ -1076,7 +1936,7 @@ class VectorServer:
         self,
         feature_view_object: feature_view.FeatureView,
         entries: List[Dict[str, Any]],
-        return_type: Union[Literal["dict", "pandas", "polars"]],
+        return_type: Union[Literal["dict", "pandas", "polars", "arrow"]],
         force_rest_client: bool,
         force_sql_client: bool,
     ) -> Union[pd.DataFrame, pl.DataFrame, List[Dict[str, Any]]]:
@@ -1360,6 +2220,172 @@ class VectorServer:
 
         return encoded_feature_dict
 
+    def apply_batch_transformation(
+        self,
+        row_dicts: List[Dict[str, Any]],
+        request_parameters: List[Dict[str, Any]],
+        transformation_context: Dict[str, Any] = None,
+        transform: bool = True,
+        on_demand_features: bool = True,
+    ) -> Dict[str, List[Any]]:
+        """
+        Function that collects a batch of feature vectors into columns and applies both on-demand and model dependent transformations to them.
+
+        Pandas UDFs are invoked once over the whole batch, python UDFs are applied by iterating over the columns of the batch.
+
+        # Arguments
+            row_dicts: `List[Dict[str, Any]]`. The feature vectors as dictionaries mapping feature names to values.
+            request_parameters: `List[Dict[str, Any]]`. Request parameters for each of the feature vectors.
+            transformation_context: `Dict[str, Any]` A dictionary mapping variable names to objects that will be provided as contextual information to the transformation function at runtime.
+            transform : `bool`. Specify if model-dependent transformations should be applied.
+            on_demand_features : `bool`. Specify if on-demand features should be computed.
+        # Returns
+            `Dict[str, List[Any]]`: Dictionary mapping feature names to the values of the feature for all feature vectors in the batch.
+        """
+        num_vectors = len(row_dicts)
+        feature_names = dict.fromkeys(
+            fname for row_dict in row_dicts for fname in row_dict.keys()
+        )
+        feature_columns = {
+            fname: [row_dict.get(fname, None) for row_dict in row_dicts]
+            for fname in feature_names
+        }
+
+        if num_vectors == 0:
+            return feature_columns
+
+        if (
+            transform or on_demand_features
+        ) and self._on_demand_transformation_functions:
+            # Check for any missing request parameters
+            for row_dict, request_parameter in zip(row_dicts, request_parameters):
+                self.check_missing_request_parameters(
+                    features=row_dict, request_parameters=request_parameter
+                )
+
+            # Apply on-demand transformations
+            self.apply_on_demand_transformations_batch(
+                feature_columns,
+                request_parameters,
+                num_vectors,
+                transformation_context,
+            )
+
+        if transform:
+            # Apply model dependent transformations
+            self.apply_model_dependent_transformations_batch(
+                feature_columns, num_vectors, transformation_context
+            )
+
+        return feature_columns
+
+    def apply_on_demand_transformations_batch(
+        self,
+        feature_columns: Dict[str, List[Any]],
+        request_parameters: List[Dict[str, Any]],
+        num_vectors: int,
+        transformation_context: Dict[str, Any] = None,
+    ) -> Dict[str, List[Any]]:
+        _logger.debug("Applying On-Demand transformation functions on batch.")
+        for tf in self._on_demand_transformation_functions:
+            # Setting transformation function context variables.
+            tf.hopsworks_udf.transformation_context = transformation_context
+
+            features = []
+            for (
+                unprefixed_feature
+            ) in tf.hopsworks_udf.unprefixed_transformation_features:
+                if tf.hopsworks_udf.feature_name_prefix:
+                    prefixed_feature = (
+                        tf.hopsworks_udf.feature_name_prefix + unprefixed_feature
+                    )
+                else:
+                    prefixed_feature = unprefixed_feature
+
+                # Request parameters take precedence over the retrieved feature values, in the same order as for single feature vectors.
+                retrieved_values = feature_columns.get(
+                    prefixed_feature, [None] * num_vectors
+                )
+                features.append(
+                    [
+                        request_parameter.get(
+                            prefixed_feature,
+                            request_parameter.get(unprefixed_feature, value),
+                        )
+                        for request_parameter, value in zip(
+                            request_parameters, retrieved_values
+                        )
+                    ]
+                )
+
+            feature_columns.update(
+                self._apply_transformation_function_on_batch(tf, features, num_vectors)
+            )
+        return feature_columns
+
+    def apply_model_dependent_transformations_batch(
+        self,
+        feature_columns: Dict[str, List[Any]],
+        num_vectors: int,
+        transformation_context: Dict[str, Any] = None,
+    ) -> Dict[str, List[Any]]:
+        _logger.debug("Applying Model-Dependent transformation functions on batch.")
+        for tf in self.model_dependent_transformation_functions:
+            # Setting transformation function context variables.
+            tf.hopsworks_udf.transformation_context = transformation_context
+            features = [
+                feature_columns.get(feature, [None] * num_vectors)
+                for feature in tf.hopsworks_udf.transformation_features
+            ]
+            feature_columns.update(
+                self._apply_transformation_function_on_batch(tf, features, num_vectors)
+            )
+        return feature_columns
+
+    def _apply_transformation_function_on_batch(
+        self,
+        transformation_function: transformation_function.TransformationFunction,
+        features: List[List[Any]],
+        num_vectors: int,
+    ) -> Dict[str, List[Any]]:
+        """
+        Function that executes a transformation function over columns of feature values.
+
+        # Arguments
+            transformation_function: `TransformationFunction`. The transformation function to be executed.
+            features: `List[List[Any]]`. The values of each argument of the transformation function for all feature vectors in the batch.
+            num_vectors: `int`. The number of feature vectors in the batch.
+        # Returns
+            `Dict[str, List[Any]]`: Dictionary mapping the output column names of the transformation function to their values.
+        """
+        hopsworks_udf = transformation_function.hopsworks_udf
+        udf = hopsworks_udf.get_udf(
+            online=True
+        )  # Get only python compatible UDF irrespective of engine
+
+        if (
+            hopsworks_udf.execution_mode.get_current_execution_mode(online=True)
+            == UDFExecutionMode.PANDAS
+        ):
+            transformed_results = udf(*[pd.Series(feature) for feature in features])
+            if isinstance(transformed_results, pd.Series):
+                return {transformed_results.name: transformed_results.tolist()}
+            return {
+                col: transformed_results[col].tolist() for col in transformed_results
+            }
+
+        output_column_names = transformation_function.output_column_names
+        arguments = zip(*features) if features else [()] * num_vectors
+        transformed_results = [udf(*argument) for argument in arguments]
+        if len(output_column_names) > 1:
+            return {
+                output_column_name: list(transformed_column)
+                for output_column_name, transformed_column in zip(
+                    output_column_names, zip(*transformed_results)
+                )
+            }
+        return {output_column_names[0]: transformed_results}
+
     def apply_return_value_handlers(
         self, row_dict: Dict[str, Any], client: Literal["rest", "sql"]
     ):
@@ -1671,6 +2697,17 @@ class VectorServer:
     ) -> Optional[online_store_sql_engine.OnlineStoreSqlClient]:
         return self._sql_client
 
+    @property
+    def feature_vector_cache(
+        self,
+    ) -> Optional[feature_vector_cache.FeatureVectorCache]:
+        return self._feature_vector_cache
+
+    @property
+    def init_serving_timings(self) -> Dict[str, float]:
+        """Duration in seconds of each stage of the last serving initialisation."""
+        return self._init_serving_timings
+
     @property
     def rest_client_engine(
         self,
@@ -1773,7 +2810,9 @@ class VectorServer:
     def feature_to_handle_if_rest(self) -> Set[str]:
         # RonDB REST client already deserialize complex features
         # Only timestamp need converting to datetime obj and
-        # complex features retrieved via opensearch need to be deserialized
+        # complex features retrieved via opensearch need to be deserialized.
+        # Timestamps read from RonDB are already converted by the REST client engine and are returned as is,
+        # passed features are merged afterwards and still need converting.
         if self._feature_to_handle_if_rest is None:
             self._feature_to_handle_if_rest = {
                 f.name
@@ -15,14 +15,11 @@
 #
 from __future__ import annotations
 
-import json
 import logging
 import math
-import numbers
 import os
 import random
 import re
-import sys
 import uuid
 import warnings
 from datetime import datetime, timedelta, timezone
@@ -66,6 +63,7 @@ from hsfs import (
 from hsfs import storage_connector as sc
 from hsfs.constructor import query
 from hsfs.core import (
+    arrow_statistics_engine,
     dataset_api,
     feature_group_api,
     feature_view_api,
@@ -87,7 +85,6 @@ from hsfs.core.constants import (
     HAS_PYARROW,
     HAS_SQLALCHEMY,
 )
-from hsfs.core.type_systems import PYARROW_HOPSWORKS_DTYPE_MAPPING
 from hsfs.core.vector_db_client import VectorDbClient
 from hsfs.feature_group import ExternalFeatureGroup, FeatureGroup
 from hsfs.hopsworks_udf import HopsworksUdf, UDFExecutionMode
@@ -538,122 +535,28 @@ class Engine:
         histograms: Any,
         exact_uniqueness: bool = True,
     ) -> str:
-        # TODO: add statistics for correlations, histograms and exact_uniqueness
-        if HAS_POLARS and (
-            isinstance(df, pl.DataFrame) or isinstance(df, pl.dataframe.frame.DataFrame)
-        ):
-            arrow_schema = df.to_arrow().schema
-        else:
-            arrow_schema = pa.Schema.from_pandas(df, preserve_index=False)
-
-        # parse timestamp columns to string columns
-        for field in arrow_schema:
-            if not (
-                pa.types.is_null(field.type)
-                or pa.types.is_list(field.type)
-                or pa.types.is_large_list(field.type)
-                or pa.types.is_struct(field.type)
-            ) and PYARROW_HOPSWORKS_DTYPE_MAPPING.get(field.type, None) in [
-                "timestamp",
-                "date",
-            ]:
-                if HAS_POLARS and (
-                    isinstance(df, pl.DataFrame)
-                    or isinstance(df, pl.dataframe.frame.DataFrame)
-                ):
-                    df = df.with_columns(pl.col(field.name).cast(pl.String))
-                else:
-                    df[field.name] = df[field.name].astype(str)
-
-        if relevant_columns is None or len(relevant_columns) == 0:
-            stats = df.describe().to_dict()
-            relevant_columns = df.columns
-        else:
-            target_cols = [col for col in df.columns if col in relevant_columns]
-            stats = df[target_cols].describe().to_dict()
-        # df.describe() does not compute stats for all col types (e.g., string)
-        # we need to compute stats for the rest of the cols iteratively
-        missing_cols = list(set(relevant_columns) - set(stats.keys()))
-        for col in missing_cols:
-            stats[col] = df[col].describe().to_dict()
-        final_stats = []
-        for col in relevant_columns:
-            if HAS_POLARS and (
-                isinstance(df, pl.DataFrame)
-                or isinstance(df, pl.dataframe.frame.DataFrame)
-            ):
-                stats[col] = dict(zip(stats["statistic"], stats[col]))
-            # set data type
-            arrow_type = arrow_schema.field(col).type
-            if (
-                pa.types.is_null(arrow_type)
-                or pa.types.is_list(arrow_type)
-                or pa.types.is_large_list(arrow_type)
-                or pa.types.is_struct(arrow_type)
-                or PYARROW_HOPSWORKS_DTYPE_MAPPING.get(arrow_type, None)
-                in ["timestamp", "date", "binary", "string"]
-            ):
-                dataType = "String"
-            elif PYARROW_HOPSWORKS_DTYPE_MAPPING.get(arrow_type, None) in [
-                "float",
-                "double",
-            ]:
-                dataType = "Fractional"
-            elif PYARROW_HOPSWORKS_DTYPE_MAPPING.get(arrow_type, None) in [
-                "int",
-                "bigint",
-            ]:
-                dataType = "Integral"
-            elif PYARROW_HOPSWORKS_DTYPE_MAPPING.get(arrow_type, None) == "boolean":
-                dataType = "Boolean"
-            else:
-                print(
-                    "Data type could not be inferred for column '"
-                    + col.split(".")[-1]
-                    + "'. Defaulting to 'String'",
-                    file=sys.stderr,
-                )
-                dataType = "String"
-
-            stat = self._convert_pandas_statistics(stats[col], dataType)
-            stat["isDataTypeInferred"] = "false"
-            stat["column"] = col.split(".")[-1]
-            stat["completeness"] = 1
-
-            final_stats.append(stat)
-
-        return json.dumps(
-            {"columns": final_stats},
+        return arrow_statistics_engine.ArrowStatisticsEngine.profile(
+            df,
+            columns=relevant_columns,
+            correlations=correlations,
+            histograms=histograms,
+            exact_uniqueness=exact_uniqueness,
         )
 
-    def _convert_pandas_statistics(
-        self, stat: Dict[str, Any], dataType: str
-    ) -> Dict[str, Any]:
-        # For now transformation only need 25th, 50th, 75th percentiles
-        # TODO: calculate properly all percentiles
-        content_dict = {"dataType": dataType}
-        if "count" in stat:
-            content_dict["count"] = stat["count"]
-        if not dataType == "String":
-            if "25%" in stat:
-                percentiles = [0] * 100
-                percentiles[24] = stat["25%"]
-                percentiles[49] = stat["50%"]
-                percentiles[74] = stat["75%"]
-                content_dict["approxPercentiles"] = percentiles
-            if "mean" in stat:
-                content_dict["mean"] = stat["mean"]
-            if "mean" in stat and "count" in stat:
-                if isinstance(stat["mean"], numbers.Number):
-                    content_dict["sum"] = stat["mean"] * stat["count"]
-            if "max" in stat:
-                content_dict["maximum"] = stat["max"]
-            if "std" in stat and not pd.isna(stat["std"]):
-                content_dict["stdDev"] = stat["std"]
-            if "min" in stat:
-                content_dict["minimum"] = stat["min"]
-
-        return content_dict
+    def profile_sketches(
+        self,
+        df: Union[pd.DataFrame, pl.DataFrame],
+        relevant_columns: List[str],
+        correlations: Any,
+        histograms: Any,
+    ) -> str:
+        return arrow_statistics_engine.ArrowStatisticsEngine.profile(
+            df,
+            columns=relevant_columns,
+            correlations=correlations,
+            histograms=histograms,
+            include_sketches=True,
+        )
 
     def validate(
         self, dataframe: pd.DataFrame, expectations: Any, log_activity: bool = True
@@ -906,14 +809,9 @@ class Engine:
             df = query_obj.read(
                 read_options=read_options, dataframe_type=dataframe_type
             )
-            # if training_dataset_version is None:
-            transformation_function_engine.TransformationFunctionEngine.compute_and_set_feature_statistics(
-                training_dataset_obj, feature_view_obj, df
+            transformation_function_engine.TransformationFunctionEngine.set_feature_statistics(
+                training_dataset_obj, feature_view_obj, df, training_dataset_version
             )
-            # else:
-            #    transformation_function_engine.TransformationFunctionEngine.get_and_set_feature_statistics(
-            #        training_dataset_obj, feature_view_obj, training_dataset_version
-            #    )
             return self._apply_transformation_function(
                 feature_view_obj.transformation_functions,
                 df,
@@ -1025,15 +923,13 @@ class Engine:
                 training_dataset_obj,
             )
 
-        # TODO : Currently statistics always computed since in memory training dataset retrieved is not consistent
-        # if training_dataset_version is None:
-        transformation_function_engine.TransformationFunctionEngine.compute_and_set_feature_statistics(
-            training_dataset_obj, feature_view_obj, result_dfs
+        # statistics are only reused if the splits are reproducible, random splits without a seed are recomputed
+        transformation_function_engine.TransformationFunctionEngine.set_feature_statistics(
+            training_dataset_obj,
+            feature_view_obj,
+            result_dfs,
+            training_dataset_version,
         )
-        # else:
-        #    transformation_function_engine.TransformationFunctionEngine.get_and_set_feature_statistics(
-        #        training_dataset_obj, feature_view_obj, training_dataset_version
-        #    )
         # and the apply them
         for split_name in result_dfs:
             result_dfs[split_name] = self._apply_transformation_function(
@@ -1068,7 +964,7 @@ class Engine:
         for i, split in enumerate(splits):
             groups += [i] * int(df_size * split.percentage)
         groups += [len(splits) - 1] * (df_size - len(groups))
-        random.shuffle(groups)
+        random.Random(training_dataset_obj.seed).shuffle(groups)
         if HAS_POLARS and (
             isinstance(df, pl.DataFrame) or isinstance(df, pl.dataframe.frame.DataFrame)
         ):
@@ -1513,22 +1409,15 @@ class Engine:
             offline_write_options=offline_write_options,
         )
 
-        if isinstance(dataframe, pd.DataFrame):
-            row_iterator = dataframe.itertuples(index=False)
-        else:
-            row_iterator = dataframe.iter_rows(named=True)
-
-        # loop over rows
-        for row in row_iterator:
-            if isinstance(dataframe, pd.DataFrame):
-                # itertuples returns Python NamedTyple, to be able to serialize it using
-                # avro, create copy of row only by converting to dict, which preserves datatypes
-                row = row._asdict()
-            encoded_row = kafka_engine.encode_row(feature_writers, writer, row)
-
-            # assemble key
-            key = "".join([str(row[pk]) for pk in sorted(feature_group.primary_key)])
-
+        # encode rows in chunks, converting types column-wise
+        for key, encoded_row in kafka_engine.encode_dataframe(
+            feature_group,
+            dataframe,
+            feature_writers,
+            writer,
+            chunk_size=offline_write_options.get("kafka_encoding_chunk_size"),
+            num_processes=offline_write_options.get("kafka_encoding_processes"),
+        ):
             kafka_engine.kafka_produce(
                 producer=producer,
                 key=key,
@@ -98,6 +98,7 @@ from hsfs import (
 )
 from hsfs import feature_group as fg_mod
 from hsfs.core import (
+    arrow_statistics_engine,
     dataset_api,
     delta_engine,
     hudi_engine,
@@ -780,14 +781,9 @@ class Engine:
             else:
                 raise ValueError("Dataset should be a query.")
 
-            # if training_dataset_version is None:
-            transformation_function_engine.TransformationFunctionEngine.compute_and_set_feature_statistics(
-                training_dataset, feature_view_obj, dataset
+            transformation_function_engine.TransformationFunctionEngine.set_feature_statistics(
+                training_dataset, feature_view_obj, dataset, training_dataset_version
             )
-            # else:
-            #    transformation_function_engine.TransformationFunctionEngine.get_and_set_feature_statistics(
-            #        training_dataset, feature_view_obj, training_dataset_version
-            #    )
 
             if training_dataset.coalesce:
                 dataset = dataset.coalesce(1)
@@ -1186,6 +1182,56 @@ class Engine:
             exact_uniqueness,
         )
 
+    def profile_sketches(
+        self,
+        dataframe,
+        relevant_columns,
+        correlations,
+        histograms,
+    ):
+        """Profile a dataframe with mergeable sketches, each partition is profiled with Arrow on the executors."""
+        relevant_columns = relevant_columns or dataframe.columns
+
+        def profile_partition(batches):
+            import pyarrow as pa
+
+            statistics = None
+            for batch in batches:
+                if statistics is None:
+                    statistics = arrow_statistics_engine.ArrowStatisticsEngine(
+                        batch.schema,
+                        correlations=correlations,
+                        histograms=histograms,
+                        include_sketches=True,
+                    )
+                statistics.update(batch)
+            if statistics is not None:
+                yield pa.RecordBatch.from_pydict({"statistics": [statistics.to_json()]})
+
+        merged_statistics = None
+        for row in (
+            dataframe.select(*relevant_columns)
+            .mapInArrow(profile_partition, "statistics string")
+            .collect()
+        ):
+            partition_statistics = (
+                arrow_statistics_engine.ArrowStatisticsEngine.from_sketches(
+                    json.loads(row.statistics)["columns"],
+                    correlations=correlations,
+                    histograms=histograms,
+                )
+            )
+            merged_statistics = (
+                partition_statistics
+                if merged_statistics is None
+                else merged_statistics.merge(partition_statistics)
+            )
+        if merged_statistics is None:
+            return json.dumps(
+                {"columns": [{"column": col, "count": 0} for col in relevant_columns]}
+            )
+        return merged_statistics.to_json()
+
     @uses_great_expectations
     def validate_with_great_expectations(
         self,
@@ -24,6 +24,7 @@ from datetime import date, datetime
 from typing import (
     Any,
     Dict,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -38,7 +39,7 @@ import humps
 import pandas as pd
 from hopsworks_common.client.exceptions import FeatureStoreException, RestAPIError
 from hopsworks_common.core import alerts_api
-from hopsworks_common.core.constants import HAS_NUMPY, HAS_POLARS
+from hopsworks_common.core.constants import HAS_NUMPY, HAS_POLARS, HAS_PYARROW
 from hsfs import (
     engine,
     feature,
@@ -108,6 +109,9 @@ if HAS_NUMPY:
 if HAS_POLARS:
     import polars as pl
 
+if HAS_PYARROW:
+    import pyarrow as pa
+
 
 _logger = logging.getLogger(__name__)
 
@@ -1473,6 +1477,9 @@ class FeatureGroupBase:
             validation_options: Additional validation options as key-value pairs, defaults to `{}`.
                 * key `run_validation` boolean value, set to `False` to skip validation temporarily on ingestion.
                 * key `ge_validate_kwargs` a dictionary containing kwargs for the validate method of Great Expectations.
+                * key `native_validation` boolean value, set to `True` to evaluate the not-null, between, in-set, unique, regex,
+                  mean and standard deviation expectations on pandas and polars DataFrames without Great Expectations.
+                  Other expectations are still evaluated with Great Expectations.
             ingestion_result: Specify the fate of the associated data, defaults
                 to "UNKNOWN". Supported options are  "UNKNOWN", "INGESTED", "REJECTED",
                 "EXPERIMENT", "FG_DATA". Use "INGESTED" or "REJECTED" for validation
@@ -2137,6 +2144,41 @@ class FeatureGroupBase:
             severity=severity,
         )
 
+    def read_vector_db_batches(
+        self,
+        batch_size: int = VectorDbClient.DEFAULT_READ_BATCH_SIZE,
+        dataframe_type: str = "pandas",
+        options: Optional[dict] = None,
+    ) -> Iterator[
+        Union[pd.DataFrame, pl.DataFrame, TypeVar("pyarrow.Table")]  # noqa: F821
+    ]:
+        """Read all rows of an embedding feature group from the vector database, one batch at a time.
+
+        Unlike `read(online=True)`, which is limited to the maximum result window of the vector database, all rows
+        are read, and only one batch is held in memory. Rows are paginated over a point in time of the index.
+
+        !!! example
+            ```python
+            for df in fg.read_vector_db_batches(batch_size=50000):
+                process(df)
+            ```
+
+        # Arguments
+            batch_size: Number of rows of each batch. Defaults to 10000.
+            dataframe_type: `"pandas"`, `"polars"` or `"arrow"`. Defaults to `"pandas"`.
+            options: The options used for the requests to the vector database.
+                The keys are attribute values of the `hsfs.core.opensearch.OpensearchRequestOption` class.
+
+        # Returns
+            An iterator of `pd.DataFrame`, `pl.DataFrame` or `pa.Table`.
+
+        # Raises
+            `hopsworks.client.exceptions.FeatureStoreException`: If the feature group does not have an embedding index.
+        """
+        return VectorDbClient.read_feature_group_batches(
+            self, batch_size=batch_size, dataframe_type=dataframe_type, options=options
+        )
+
     @property
     def embedding_index(self) -> Optional["EmbeddingIndex"]:
         if self._embedding_index:
@@ -2814,6 +2856,59 @@ class FeatureGroup(FeatureGroupBase):
             for result in results
         ]
 
+    def find_neighbors_batch(
+        self,
+        embeddings: List[List[Union[int, float]]],
+        col: Optional[str] = None,
+        k: Optional[int] = 10,
+        filter: Optional[Union[Filter, Logic]] = None,
+        options: Optional[dict] = None,
+    ) -> List[List[Tuple[float, List[Any]]]]:
+        """
+        Finds the nearest neighbors for many embeddings in the vector database.
+
+        The embeddings are searched with multi-search requests instead of one request per embedding.
+        The results of each embedding are the same as the results of `find_neighbors`.
+
+        # Arguments
+            embeddings: The target embeddings for which neighbors are to be found,
+                a list of embeddings or a 2D array with one embedding per row.
+            col: The column name used to compute similarity score. Required only if there
+            are multiple embeddings (optional).
+            k: The number of nearest neighbors to retrieve for each embedding (default is 10).
+            filter: A filter expression to restrict the search space (optional).
+            options: The options used for the request to the vector database.
+                The keys are attribute values of the `hsfs.core.opensearch.OpensearchRequestOption` class.
+
+        # Returns
+            A list with the nearest neighbors of each embedding, in the order of the embeddings.
+            The nearest neighbors are a list of tuples `(The similarity score, A list of feature values)`.
+
+        !!! Example
+            ```
+            fg.find_neighbors_batch(
+                [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]],
+                k=5,
+            )
+            ```
+        """
+        if self._vector_db_client is None and self._embedding_index:
+            self._vector_db_client = VectorDbClient(self.select_all())
+        batch_results = self._vector_db_client.find_neighbors_batch(
+            embeddings,
+            feature=(self.__getattr__(col) if col else None),
+            k=k,
+            filter=filter,
+            options=options,
+        )
+        return [
+            [
+                (result[0], [result[1][f.name] for f in self.features])
+                for result in results
+            ]
+            for results in batch_results
+        ]
+
     def show(self, n: int, online: Optional[bool] = False) -> List[List[Any]]:
         """Show the first `n` rows of the feature group.
 
@@ -2898,6 +2993,10 @@ class FeatureGroup(FeatureGroupBase):
                 * key `kafka_producer_config` and value an object of type [properties](https://docs.confluent.io/platform/current/clients/librdkafka/html/md_CONFIGURATION.htmln)
                   used to configure the Kafka client. To optimize for throughput in high latency connection, consider
                   changing the [producer properties](https://docs.confluent.io/cloud/current/client-apps/optimizing/throughput.html#producer).
+                * key `kafka_encoding_chunk_size` and value an integer to configure the number of rows
+                  serialized together before being sent to Kafka. Defaults to 10000.
+                * key `kafka_encoding_processes` and value an integer to serialize chunks of rows
+                  concurrently in a pool of processes. By default rows are serialized in the calling process.
                 * key `internal_kafka` and value `True` or `False` in case you established
                   connectivity from you Python environment to the internal advertised
                   listeners of the Hopsworks Kafka Cluster. Defaults to `False` and
@@ -2906,6 +3005,9 @@ class FeatureGroup(FeatureGroupBase):
                 * key `run_validation` boolean value, set to `False` to skip validation temporarily on ingestion.
                 * key `save_report` boolean value, set to `False` to skip upload of the validation report to Hopsworks.
                 * key `ge_validate_kwargs` a dictionary containing kwargs for the validate method of Great Expectations.
+                * key `native_validation` boolean value, set to `True` to evaluate the not-null, between, in-set, unique, regex,
+                  mean and standard deviation expectations on pandas and polars DataFrames without Great Expectations.
+                  Other expectations are still evaluated with Great Expectations.
                 * key `online_schema_validation` boolean value, set to `True` to validate the schema for online ingestion.
             wait: Wait for job and online ingestion to finish before returning, defaults to `False`.
                 Shortcut for write_options `{"wait_for_job": False, "wait_for_online_ingestion": False}`.
@@ -2987,7 +3089,9 @@ class FeatureGroup(FeatureGroupBase):
             )
         return (
             fg_job,
-            ge_report.to_ge_type() if ge_report is not None else None,
+            ge_report.to_ge_type()
+            if ge_report is not None and HAS_GREAT_EXPECTATIONS
+            else ge_report,
         )
 
     def insert(
@@ -2999,6 +3103,8 @@ class FeatureGroup(FeatureGroupBase):
             TypeVar("pyspark.RDD"),  # noqa: F821
             np.ndarray,
             List[list],
+            Iterator[Union[pd.DataFrame, pl.DataFrame]],
+            TypeVar("pyarrow.RecordBatchReader"),  # noqa: F821
         ],
         overwrite: bool = False,
         operation: Optional[str] = "upsert",
@@ -3074,8 +3180,27 @@ class FeatureGroup(FeatureGroupBase):
             fg.insert(df_for_fg2)
             ```
 
+        !!! example "Streaming insert of a dataset larger than memory"
+            ```python
+            import pyarrow.dataset as ds
+
+            # connect to the Feature Store
+            fs = ...
+
+            fg = fs.get_feature_group(name='transactions', version=1)
+
+            # record batches are read and inserted one at a time
+            fg.insert(ds.dataset("transactions/", format="parquet").scanner(batch_size=100000).to_reader())
+            ```
+
         # Arguments
-            features: Pandas DataFrame, Polars DataFrame, RDD, Ndarray, list. Features to be saved.
+            features: Pandas DataFrame, Polars DataFrame, RDD, Ndarray, list, or an iterator of Pandas or Polars
+                DataFrames or a `pyarrow.RecordBatchReader`. Features to be saved.
+                Chunks of an iterator are inserted one at a time through a multi part insert, so that only one chunk
+                is held in memory. Expectations are fetched and the Kafka producer is initialised once, each chunk is
+                validated separately and the materialization job is started once after the last chunk.
+                `overwrite` only applies to the first chunk and `wait_for_online_ingestion` is not supported.
+                Iterators are only supported with the Python engine.
             overwrite: Drop all data in the feature group before
                 inserting new data. This does not affect metadata, defaults to False.
             operation: Apache Hudi operation type `"insert"` or `"upsert"`.
@@ -3113,6 +3238,9 @@ class FeatureGroup(FeatureGroupBase):
                 * key `run_validation` boolean value, set to `False` to skip validation temporarily on ingestion.
                 * key `save_report` boolean value, set to `False` to skip upload of the validation report to Hopsworks.
                 * key `ge_validate_kwargs` a dictionary containing kwargs for the validate method of Great Expectations.
+                * key `native_validation` boolean value, set to `True` to evaluate the not-null, between, in-set, unique, regex,
+                  mean and standard deviation expectations on pandas and polars DataFrames without Great Expectations.
+                  Other expectations are still evaluated with Great Expectations.
                 * key `fetch_expectation_suite` a boolean value, by default `True`, to control whether the expectation
                    suite of the feature group should be fetched before every insert.
                 * key `online_schema_validation` boolean value, set to `True` to validate the schema for online ingestion.
@@ -3130,6 +3258,7 @@ class FeatureGroup(FeatureGroupBase):
                 existing feature group schema, etc.
             `hsfs.client.exceptions.DataValidationException`: If data validation fails and the expectation
                 suite `validation_ingestion_policy` is set to `STRICT`. Data is NOT ingested.
+            `hopsworks.client.exceptions.FeatureStoreException`: If an iterator is inserted with the Spark engine.
         """
         if storage and self.stream:
             warnings.warn(
@@ -3137,6 +3266,21 @@ class FeatureGroup(FeatureGroupBase):
                 stacklevel=1,
             )
 
+        if isinstance(features, Iterator) or (
+            HAS_PYARROW and isinstance(features, pa.RecordBatchReader)
+        ):
+            return self._insert_chunks(
+                features,
+                overwrite=overwrite,
+                operation=operation,
+                storage=storage,
+                write_options=write_options or {},
+                validation_options=validation_options or {},
+                wait=wait,
+                transformation_context=transformation_context,
+                transform=transform,
+            )
+
         feature_dataframe = engine.get_instance().convert_to_default_dataframe(features)
 
         if validation_options is None:
@@ -3165,13 +3309,77 @@ class FeatureGroup(FeatureGroupBase):
         if engine.get_type().startswith("spark") and not self.stream:
             # Also, only compute statistics if stream is False.
             # if True, the backfill job has not been triggered and the data has not been inserted (it's in Kafka)
+            self._compute_commit_statistics(feature_dataframe)
             self.compute_statistics()
 
         return (
             job,
-            ge_report.to_ge_type() if ge_report is not None else None,
+            # the native expectation engine validates data without Great Expectations installed
+            ge_report.to_ge_type()
+            if ge_report is not None and HAS_GREAT_EXPECTATIONS
+            else ge_report,
         )
 
+    def _insert_chunks(
+        self,
+        chunks: Union[
+            Iterator[Union[pd.DataFrame, pl.DataFrame]],
+            TypeVar("pyarrow.RecordBatchReader"),  # noqa: F821
+        ],
+        overwrite: bool,
+        operation: Optional[str],
+        storage: Optional[str],
+        write_options: Dict[str, Any],
+        validation_options: Dict[str, Any],
+        wait: bool,
+        transformation_context: Optional[Dict[str, Any]],
+        transform: bool,
+    ) -> Tuple[Optional[Job], Optional[ValidationReport]]:
+        if engine.get_type() != "python":
+            # the materialization job and the commit statistics of the chunks are only handled by the Python engine
+            raise FeatureStoreException(
+                "Inserting an iterator of dataframes or a `pyarrow.RecordBatchReader` is only supported "
+                "with the Python engine. Insert a Spark DataFrame instead."
+            )
+        start_offline_materialization = write_options.get(
+            "start_offline_materialization",
+            write_options.get("start_offline_backfill", True),
+        )
+        wait_for_job = write_options.get("wait_for_job", wait)
+        job, ge_report = None, None
+        with self.multi_part_insert() as writer:
+            for i, chunk in enumerate(chunks):
+                if HAS_PYARROW and isinstance(chunk, pa.RecordBatch):
+                    chunk = chunk.to_pandas()
+                job, ge_report = writer.insert(
+                    chunk,
+                    overwrite=overwrite and i == 0,
+                    operation=operation,
+                    storage=storage,
+                    write_options={
+                        **write_options,
+                        "wait_for_job": False,
+                        "wait_for_online_ingestion": False,
+                        "start_offline_materialization": False,
+                    },
+                    validation_options={
+                        **validation_options,
+                        # the expectation suite does not change while inserting the chunks
+                        "fetch_expectation_suite": i == 0
+                        and validation_options.get("fetch_expectation_suite", True),
+                    },
+                    transformation_context=transformation_context,
+                    transform=transform,
+                )
+
+        if job is not None and start_offline_materialization:
+            # the job reads the rows of all chunks from where its last execution left off
+            job.run(
+                args=job.config.get("defaultArgs", ""),
+                await_termination=wait_for_job,
+            )
+        return job, ge_report
+
     def multi_part_insert(
         self,
         features: Optional[
@@ -3287,6 +3495,9 @@ class FeatureGroup(FeatureGroupBase):
                 * key `run_validation` boolean value, set to `False` to skip validation temporarily on ingestion.
                 * key `save_report` boolean value, set to `False` to skip upload of the validation report to Hopsworks.
                 * key `ge_validate_kwargs` a dictionary containing kwargs for the validate method of Great Expectations.
+                * key `native_validation` boolean value, set to `True` to evaluate the not-null, between, in-set, unique, regex,
+                  mean and standard deviation expectations on pandas and polars DataFrames without Great Expectations.
+                  Other expectations are still evaluated with Great Expectations.
                 * key `fetch_expectation_suite` a boolean value, by default `False` for multi part inserts,
                    to control whether the expectation suite of the feature group should be fetched before every insert.
             transformation_context: `Dict[str, Any]` A dictionary mapping variable names to objects that will be provided as contextual information to the transformation function at runtime.
@@ -3663,6 +3874,11 @@ class FeatureGroup(FeatureGroupBase):
             start_commit_time=from_commit_time,
             end_commit_time=to_commit_time,
             feature_names=feature_names,
+        ) or self._statistics_engine.merge_commit_statistics(
+            self,
+            start_commit_time=util.convert_event_time_to_timestamp(from_commit_time),
+            end_commit_time=util.convert_event_time_to_timestamp(to_commit_time),
+            feature_names=feature_names,
         )
 
     def compute_statistics(
@@ -3705,6 +3921,8 @@ class FeatureGroup(FeatureGroupBase):
                     registered_stats
                 ):
                     registered_stats = None
+                if registered_stats is None:
+                    registered_stats = self._merge_commit_statistics(fg_commit_id)
                 # Don't read the dataframe here, to avoid triggering a read operation
                 # for the Python engine. The Python engine is going to setup a Spark Job
                 # to update the statistics.
@@ -3717,6 +3935,31 @@ class FeatureGroup(FeatureGroupBase):
                 )
         return super().compute_statistics()
 
+    def _compute_commit_statistics(self, feature_dataframe) -> None:
+        # statistics of the data written by the last commit, including mergeable sketches
+        if self.statistics_config.enabled and self._is_time_travel_enabled():
+            fg_commit_id = list(
+                self._feature_group_engine.commit_details(self, None, 1).keys()
+            )[0]
+            self._statistics_engine.compute_and_save_commit_statistics(
+                self, feature_dataframe, fg_commit_id
+            )
+
+    def _merge_commit_statistics(self, fg_commit_id: int) -> Optional[Statistics]:
+        # The statistics of the feature group as of a commit can only be merged from the statistics of
+        # each commit if all of them only appended rows, and exact uniqueness cannot be merged.
+        if self.statistics_config.exact_uniqueness:
+            return None
+        commits = self._feature_group_engine.commit_details(self, fg_commit_id, None)
+        if any(
+            commit["rowsUpdated"] or commit["rowsDeleted"]
+            for commit in commits.values()
+        ):
+            return None
+        return self._statistics_engine.merge_and_save_commit_statistics(
+            self, fg_commit_id, list(commits.keys())
+        )
+
     @classmethod
     def from_response_json(
         cls, json_dict: Union[Dict[str, Any], List[Dict[str, Any]]]
@@ -4229,6 +4472,9 @@ class ExternalFeatureGroup(FeatureGroupBase):
                 * key `run_validation` boolean value, set to `False` to skip validation temporarily on ingestion.
                 * key `save_report` boolean value, set to `False` to skip upload of the validation report to Hopsworks.
                 * key `ge_validate_kwargs` a dictionary containing kwargs for the validate method of Great Expectations.
+                * key `native_validation` boolean value, set to `True` to evaluate the not-null, between, in-set, unique, regex,
+                  mean and standard deviation expectations on pandas and polars DataFrames without Great Expectations.
+                  Other expectations are still evaluated with Great Expectations.
                 * key `fetch_expectation_suite` a boolean value, by default `True`, to control whether the expectation
                    suite of the feature group should be fetched before every insert.
             wait: Wait for job and online ingestion to finish before returning, defaults to `False`.
@@ -4274,7 +4520,9 @@ class ExternalFeatureGroup(FeatureGroupBase):
 
         return (
             job,
-            ge_report.to_ge_type() if ge_report is not None else None,
+            ge_report.to_ge_type()
+            if ge_report is not None and HAS_GREAT_EXPECTATIONS
+            else ge_report,
         )
 
     def read(
@@ -4451,6 +4699,59 @@ class ExternalFeatureGroup(FeatureGroupBase):
             for result in results
         ]
 
+    def find_neighbors_batch(
+        self,
+        embeddings: List[List[Union[int, float]]],
+        col: Optional[str] = None,
+        k: Optional[int] = 10,
+        filter: Optional[Union[Filter, Logic]] = None,
+        options: Optional[dict] = None,
+    ) -> List[List[Tuple[float, List[Any]]]]:
+        """
+        Finds the nearest neighbors for many embeddings in the vector database.
+
+        The embeddings are searched with multi-search requests instead of one request per embedding.
+        The results of each embedding are the same as the results of `find_neighbors`.
+
+        # Arguments
+            embeddings: The target embeddings for which neighbors are to be found,
+                a list of embeddings or a 2D array with one embedding per row.
+            col: The column name used to compute similarity score. Required only if there
+            are multiple embeddings (optional).
+            k: The number of nearest neighbors to retrieve for each embedding (default is 10).
+            filter: A filter expression to restrict the search space (optional).
+            options: The options used for the request to the vector database.
+                The keys are attribute values of the `hsfs.core.opensearch.OpensearchRequestOption` class.
+
+        # Returns
+            A list with the nearest neighbors of each embedding, in the order of the embeddings.
+            The nearest neighbors are a list of tuples `(The similarity score, A list of feature values)`.
+
+        !!! Example
+            ```
+            fg.find_neighbors_batch(
+                [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]],
+                k=5,
+            )
+            ```
+        """
+        if self._vector_db_client is None and self._embedding_index:
+            self._vector_db_client = VectorDbClient(self.select_all())
+        batch_results = self._vector_db_client.find_neighbors_batch(
+            embeddings,
+            feature=(self.__getattr__(col) if col else None),
+            k=k,
+            filter=filter,
+            options=options,
+        )
+        return [
+            [
+                (result[0], [result[1][f.name] for f in self.features])
+                for result in results
+            ]
+            for results in batch_results
+        ]
+
     @classmethod
     def from_response_json(
         cls, json_dict: Dict[str, Any]
@@ -15,6 +15,7 @@
 #
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import warnings
@@ -36,7 +37,7 @@ import humps
 import pandas as pd
 from hopsworks_common.client.exceptions import FeatureStoreException
 from hopsworks_common.core import alerts_api
-from hopsworks_common.core.constants import HAS_NUMPY, HAS_POLARS
+from hopsworks_common.core.constants import HAS_NUMPY, HAS_POLARS, HAS_PYARROW
 from hsfs import (
     feature_group,
     storage_connector,
@@ -55,6 +56,7 @@ from hsfs.core import (
     feature_monitoring_result_engine,
     feature_view_engine,
     job,
+    serving_snapshot,
     statistics_engine,
     transformation_function_engine,
     vector_server,
@@ -79,6 +81,9 @@ from hsml.model import Model
 if HAS_NUMPY:
     import numpy as np
 
+if HAS_PYARROW:
+    import pyarrow as pa
+
 
 _logger = logging.getLogger(__name__)
 
@@ -326,6 +331,8 @@ class FeatureView:
         config_rest_client: Optional[Dict[str, Any]] = None,
         default_client: Optional[Literal["sql", "rest"]] = None,
         feature_logger: Optional[FeatureLogger] = None,
+        cache_config: Optional[Dict[str, Any]] = None,
+        snapshot: Optional[str] = None,
         **kwargs,
     ) -> None:
         """Initialise feature view to retrieve feature vector from online and offline feature store.
@@ -362,6 +369,8 @@ class FeatureView:
             options: Additional options as key/value pairs for configuring online serving engine.
                 * key: kwargs of SqlAlchemy engine creation (See: https://docs.sqlalchemy.org/en/20/core/engines.html#sqlalchemy.create_engine).
                   For example: `{"pool_size": 10}`
+                * `max_concurrent_lookups`: maximum number of SQL lookups from different threads executed concurrently, defaults to the connection pool size.
+                * `max_pending_lookups`: maximum number of SQL lookups waiting for execution before callers block, unbounded by default.
             reset_rest_client: boolean, defaults to False. If set to True, the rest client will be reset and reinitialised with provided configuration.
             config_rest_client: dictionary, optional. Additional configuration options for the rest client. If the client is already initialised,
                 this will be ignored. Options include:
@@ -372,14 +381,48 @@ class FeatureView:
                     provided if initialising the rest client in an internal environment.
                 * `timeout`: int, optional. The timeout for the rest client in seconds. Defaults to 2.
                 * `use_ssl`: boolean, optional. Use SSL to connect to the online store. Defaults to True.
+                * `batch_chunk_size`: int, optional. Maximum number of entries sent in a single batch request, larger batches
+                    are split into chunks sent concurrently. Defaults to 256.
+                * `batch_max_parallel_requests`: int, optional. Maximum number of chunks of a batch sent concurrently. Defaults to 4.
+                * `batch_chunk_retries`: int, optional. Number of retries of a chunk on connection errors, timeouts or server errors. Defaults to 2.
+                * `json_decoder`: str, optional. Package used to decode the responses, one of "orjson", "msgspec" or "json".
+                    Defaults to the fastest installed one.
             feature_logger: Custom feature logger which [`feature_view.log()`](#log) uses to log feature vectors. If provided,
                 feature vectors will not be inserted to logging feature group automatically when `feature_view.log()` is called.
+            cache_config: dictionary, optional. If provided, feature vectors read from the online feature store are cached in memory,
+                per serving key values, and only cache misses are read from the online feature store. Passed features, on-demand and
+                model-dependent transformations are still applied on every call. Defaults to `None`, no caching. Options include:
+                * `max_size`: int, optional. Maximum number of cached feature vectors, least recently used ones are evicted first. Defaults to 10000.
+                * `ttl`: float, optional. Time in seconds after which a cached feature vector is read again from the online feature store. Defaults to 60.
+            snapshot: string, optional. Path of a serving snapshot written by [`feature_view.export_serving_snapshot()`](#export_serving_snapshot).
+                If provided, the metadata required for serving is read from the snapshot instead of being fetched from Hopsworks,
+                which speeds up initialising serving, e.g. when starting many inference pods. Defaults to `None`.
 
+        # Raises
+            `hopsworks.client.exceptions.FeatureStoreException`: If the snapshot was exported for another feature view or training dataset version.
         """
+        if snapshot is not None:
+            snapshot = serving_snapshot.ServingSnapshot.load(snapshot)
+            snapshot.check_feature_view(self.name, self.version)
+            if training_dataset_version is None:
+                training_dataset_version = snapshot.training_dataset_version
+            elif training_dataset_version != snapshot.training_dataset_version:
+                raise FeatureStoreException(
+                    f"Serving snapshot was exported for training dataset version {snapshot.training_dataset_version}, "
+                    f"not {training_dataset_version}."
+                )
+
         # initiate batch scoring server
         # `training_dataset_version` should not be set if `None` otherwise backend will look up the td.
         try:
-            self.init_batch_scoring(training_dataset_version)
+            if snapshot is not None:
+                self._batch_scoring_server.init_batch_scoring(
+                    self,
+                    training_dataset_version=training_dataset_version,
+                    snapshot=snapshot,
+                )
+            else:
+                self.init_batch_scoring(training_dataset_version)
         except ValueError as e:
             # In 3.3 or before, td version is set to 1 by default.
             # For backward compatibility, if a td version is required, set it to 1.
@@ -414,6 +457,8 @@ class FeatureView:
             config_rest_client=config_rest_client,
             default_client=default_client,
             training_dataset_version=training_dataset_version,
+            cache_config=cache_config,
+            snapshot=snapshot,
         )
 
         self._prefix_serving_key_map = dict(
@@ -434,6 +479,38 @@ class FeatureView:
             # reset feature logger in case init_serving is called again without feature logger
             self._feature_logger = None
 
+    def export_serving_snapshot(self, path: str) -> None:
+        """Export the metadata fetched from Hopsworks while initialising serving to a local file.
+
+        Passing the file to [`feature_view.init_serving()`](#init_serving) initialises serving without fetching
+        the metadata again, e.g. in inference pods started from the same image.
+
+        !!! example
+            ```python
+            # get feature view instance
+            feature_view = fs.get_feature_view(...)
+
+            # initialise serving and export the snapshot, e.g. when building the inference image
+            feature_view.init_serving(training_dataset_version=1)
+            feature_view.export_serving_snapshot("serving_snapshot.json")
+
+            # initialise serving from the snapshot, e.g. when starting an inference pod
+            feature_view.init_serving(snapshot="serving_snapshot.json")
+            ```
+
+        !!! warning
+            The snapshot contains the credentials of the online feature store, it is written readable only by its owner
+            and must be stored as securely as the credentials.
+            The snapshot must be exported again when the feature view, its feature groups or the online feature store change.
+
+        # Arguments
+            path: Path of the file to write the snapshot to.
+
+        # Raises
+            `hopsworks.client.exceptions.FeatureStoreException`: If serving is not initialized.
+        """
+        self._vector_server.get_serving_snapshot(self).save(path)
+
     @staticmethod
     def _sort_transformation_functions(
         transformation_functions: List[TransformationFunction],
@@ -533,7 +610,7 @@ class FeatureView:
         entry: Optional[Dict[str, Any]] = None,
         passed_features: Optional[Dict[str, Any]] = None,
         external: Optional[bool] = None,
-        return_type: Literal["list", "polars", "numpy", "pandas"] = "list",
+        return_type: Literal["list", "polars", "numpy", "pandas", "arrow"] = "list",
         allow_missing: bool = False,
         force_rest_client: bool = False,
         force_sql_client: bool = False,
@@ -541,7 +618,7 @@ class FeatureView:
         on_demand_features: Optional[bool] = True,
         request_parameters: Optional[Dict[str, Any]] = None,
         transformation_context: Dict[str, Any] = None,
-    ) -> Union[List[Any], pd.DataFrame, np.ndarray, pl.DataFrame]:
+    ) -> Union[List[Any], pd.DataFrame, np.ndarray, pl.DataFrame, pa.Table]:
         """Returns assembled feature vector from online feature store.
             Call [`feature_view.init_serving`](#init_serving) before this method if the following configurations are needed.
               1. The training dataset version of the transformation statistics
@@ -608,7 +685,7 @@ class FeatureView:
                 If set to False, the online feature store storage connector is used
                 which relies on the private IP. Defaults to True if connection to Hopsworks is established from
                 external environment (e.g AWS Sagemaker or Google Colab), otherwise to False.
-            return_type: `"list"`, `"pandas"`, `"polars"` or `"numpy"`. Defaults to `"list"`.
+            return_type: `"list"`, `"pandas"`, `"polars"`, `"numpy"` or `"arrow"`. Defaults to `"list"`.
             force_rest_client: boolean, defaults to False. If set to True, reads from online feature store
                 using the REST client if initialised.
             force_sql_client: boolean, defaults to False. If set to True, reads from online feature store
@@ -622,9 +699,9 @@ class FeatureView:
                 These variables must be explicitly defined as parameters in the transformation function to be accessible during execution. If no context variables are provided, this parameter defaults to `None`.
 
         # Returns
-            `list`, `pd.DataFrame`, `polars.DataFrame` or `np.ndarray` if `return type` is set to `"list"`, `"pandas"`, `"polars"` or `"numpy"`
+            `list`, `pd.DataFrame`, `polars.DataFrame`, `np.ndarray` or `pyarrow.Table` if `return type` is set to `"list"`, `"pandas"`, `"polars"`, `"numpy"` or `"arrow"`
             respectively. Defaults to `list`.
-            Returned `list`, `pd.DataFrame`, `polars.DataFrame` or `np.ndarray` contains feature values related to provided primary keys,
+            Returned `list`, `pd.DataFrame`, `polars.DataFrame`, `np.ndarray` or `pyarrow.Table` contains feature values related to provided primary keys,
             ordered according to positions of this features in the feature view query.
 
         # Raises
@@ -656,7 +733,7 @@ class FeatureView:
         entry: Optional[List[Dict[str, Any]]] = None,
         passed_features: Optional[List[Dict[str, Any]]] = None,
         external: Optional[bool] = None,
-        return_type: Literal["list", "polars", "numpy", "pandas"] = "list",
+        return_type: Literal["list", "polars", "numpy", "pandas", "arrow"] = "list",
         allow_missing: bool = False,
         force_rest_client: bool = False,
         force_sql_client: bool = False,
@@ -664,7 +741,8 @@ class FeatureView:
         on_demand_features: Optional[bool] = True,
         request_parameters: Optional[List[Dict[str, Any]]] = None,
         transformation_context: Dict[str, Any] = None,
-    ) -> Union[List[List[Any]], pd.DataFrame, np.ndarray, pl.DataFrame]:
+        vectorized_transformations: bool = False,
+    ) -> Union[List[List[Any]], pd.DataFrame, np.ndarray, pl.DataFrame, pa.Table]:
         """Returns assembled feature vectors in batches from online feature store.
             Call [`feature_view.init_serving`](#init_serving) before this method if the following configurations are needed.
               1. The training dataset version of the transformation statistics
@@ -729,7 +807,7 @@ class FeatureView:
                 If set to False, the online feature store storage connector is used
                 which relies on the private IP. Defaults to True if connection to Hopsworks is established from
                 external environment (e.g AWS Sagemaker or Google Colab), otherwise to False.
-            return_type: `"list"`, `"pandas"`, `"polars"` or `"numpy"`. Defaults to `"list"`.
+            return_type: `"list"`, `"pandas"`, `"polars"`, `"numpy"` or `"arrow"`. Defaults to `"list"`.
             force_sql_client: boolean, defaults to False. If set to True, reads from online feature store
                 using the SQL client if initialised.
             force_rest_client: boolean, defaults to False. If set to True, reads from online feature store
@@ -741,12 +819,15 @@ class FeatureView:
             request_parameters: Request parameters required by on-demand transformation functions to compute on-demand features present in the feature view.
             transformation_context: `Dict[str, Any]` A dictionary mapping variable names to objects that will be provided as contextual information to the transformation function at runtime.
                 These variables must be explicitly defined as parameters in the transformation function to be accessible during execution. If no context variables are provided, this parameter defaults to `None`.
+            vectorized_transformations: `bool`, defaults to `False`. If set to `True`, the retrieved feature vectors are collected into columns and
+                each transformation function is applied once over the whole batch instead of once per feature vector. Pandas UDFs then receive
+                all values of the batch in a single `pd.Series`, as they do when creating training data.
 
         # Returns
-            `List[list]`, `pd.DataFrame`, `polars.DataFrame` or `np.ndarray` if `return type` is set to `"list", `"pandas"`,`"polars"` or `"numpy"`
+            `List[list]`, `pd.DataFrame`, `polars.DataFrame`, `np.ndarray` or `pyarrow.Table` if `return type` is set to `"list", `"pandas"`,`"polars"`, `"numpy"` or `"arrow"`
             respectively. Defaults to `List[list]`.
 
-            Returned `List[list]`, `pd.DataFrame`, `polars.DataFrame` or `np.ndarray` contains feature values related to provided primary
+            Returned `List[list]`, `pd.DataFrame`, `polars.DataFrame`, `np.ndarray` or `pyarrow.Table` contains feature values related to provided primary
             keys, ordered according to positions of this features in the feature view query.
 
         # Raises
@@ -773,6 +854,204 @@ class FeatureView:
             on_demand_features=on_demand_features,
             request_parameters=request_parameters,
             transformation_context=transformation_context,
+            vectorized_transformations=vectorized_transformations,
+        )
+
+    async def get_feature_vector_async(
+        self,
+        entry: Optional[Dict[str, Any]] = None,
+        passed_features: Optional[Dict[str, Any]] = None,
+        external: Optional[bool] = None,
+        return_type: Literal["list", "polars", "numpy", "pandas", "arrow"] = "list",
+        allow_missing: bool = False,
+        force_rest_client: bool = False,
+        force_sql_client: bool = False,
+        transform: Optional[bool] = True,
+        on_demand_features: Optional[bool] = True,
+        request_parameters: Optional[Dict[str, Any]] = None,
+        transformation_context: Dict[str, Any] = None,
+    ) -> Union[List[Any], pd.DataFrame, np.ndarray, pl.DataFrame, pa.Table]:
+        """Returns assembled feature vector from online feature store, awaitable from a running event loop.
+
+        This is the asyncio counterpart of [`feature_view.get_feature_vector`](#get_feature_vector) for
+        serving applications which already run an event loop (e.g. FastAPI or aiohttp handlers).
+        With the SQL client, the prepared statements are executed on the caller's event loop using a
+        connection pool bound to that loop, so concurrent lookups do not block each other.
+        The REST client is synchronous and is run in the default executor of the event loop.
+
+        !!! example
+            ```python
+            # get feature store instance
+            fs = ...
+
+            # get feature view instance
+            feature_view = fs.get_feature_view(...)
+            feature_view.init_serving()
+
+            async def handler(pk1, pk2):
+                return await feature_view.get_feature_vector_async(
+                    entry = {"pk1": pk1, "pk2": pk2}
+                )
+            ```
+
+        # Arguments
+            entry: dictionary of feature group primary key and values provided by serving application.
+                Set of required primary keys is [`feature_view.primary_keys`](#primary_keys)
+                If the required primary keys is not provided, it will look for name
+                of the primary key in feature group in the entry.
+            passed_features: dictionary of feature values provided by the application at runtime.
+                They can replace features values fetched from the feature store as well as
+                providing feature values which are not available in the feature store.
+            external: boolean, optional. If set to True, the connection to the
+                online feature store is established using the same host as
+                for the `host` parameter in the [`hopsworks.login()`](login.md#login) method.
+                If set to False, the online feature store storage connector is used
+                which relies on the private IP. Defaults to True if connection to Hopsworks is established from
+                external environment (e.g AWS Sagemaker or Google Colab), otherwise to False.
+            return_type: `"list"`, `"pandas"`, `"polars"`, `"numpy"` or `"arrow"`. Defaults to `"list"`.
+            force_rest_client: boolean, defaults to False. If set to True, reads from online feature store
+                using the REST client if initialised.
+            force_sql_client: boolean, defaults to False. If set to True, reads from online feature store
+                using the SQL client if initialised.
+            allow_missing: Setting to `True` returns feature vectors with missing values.
+            transform: `bool`, default=`True`. If set to `True`, model-dependent transformations are applied to the feature vector, and `on_demand_feature` is automatically set to `True`, ensuring the inclusion of on-demand features.
+                If set to `False`, the function returns the feature vector without applying any model-dependent transformations.
+            on_demand_features: `bool`, defaults to `True`. Setting this to `False` returns untransformed feature vectors without any on-demand features.
+            request_parameters: Request parameters required by on-demand transformation functions to compute on-demand features present in the feature view.
+            transformation_context: `Dict[str, Any]` A dictionary mapping variable names to objects that will be provided as contextual information to the transformation function at runtime.
+                These variables must be explicitly defined as parameters in the transformation function to be accessible during execution. If no context variables are provided, this parameter defaults to `None`.
+
+        # Returns
+            `list`, `pd.DataFrame`, `polars.DataFrame`, `np.ndarray` or `pyarrow.Table` if `return type` is set to `"list"`, `"pandas"`, `"polars"`, `"numpy"` or `"arrow"`
+            respectively. Defaults to `list`.
+
+        # Raises
+            `hopsworks.client.exceptions.FeatureStoreException`: When primary key entry cannot be found in one or more of the feature groups used by this
+                feature view.
+        """
+        if not self._vector_server._serving_initialized:
+            self.init_serving(external=external)
+
+        vector_db_features = None
+        if self._vector_db_client:
+            vector_db_features = await asyncio.get_running_loop().run_in_executor(
+                None, self._get_vector_db_result, entry
+            )
+        return await self._vector_server.get_feature_vector_async(
+            entry=entry,
+            return_type=return_type,
+            passed_features=passed_features,
+            allow_missing=allow_missing,
+            vector_db_features=vector_db_features,
+            force_rest_client=force_rest_client,
+            force_sql_client=force_sql_client,
+            transform=transform,
+            on_demand_features=on_demand_features,
+            request_parameters=request_parameters,
+            transformation_context=transformation_context,
+        )
+
+    async def get_feature_vectors_async(
+        self,
+        entry: Optional[List[Dict[str, Any]]] = None,
+        passed_features: Optional[List[Dict[str, Any]]] = None,
+        external: Optional[bool] = None,
+        return_type: Literal["list", "polars", "numpy", "pandas", "arrow"] = "list",
+        allow_missing: bool = False,
+        force_rest_client: bool = False,
+        force_sql_client: bool = False,
+        transform: Optional[bool] = True,
+        on_demand_features: Optional[bool] = True,
+        request_parameters: Optional[List[Dict[str, Any]]] = None,
+        transformation_context: Dict[str, Any] = None,
+        vectorized_transformations: bool = False,
+    ) -> Union[List[List[Any]], pd.DataFrame, np.ndarray, pl.DataFrame, pa.Table]:
+        """Returns assembled feature vectors in batches from online feature store, awaitable from a running event loop.
+
+        This is the asyncio counterpart of [`feature_view.get_feature_vectors`](#get_feature_vectors),
+        see [`feature_view.get_feature_vector_async`](#get_feature_vector_async) for how the lookups are executed.
+
+        !!! example
+            ```python
+            # get feature store instance
+            fs = ...
+
+            # get feature view instance
+            feature_view = fs.get_feature_view(...)
+            feature_view.init_serving()
+
+            async def handler(entries):
+                return await feature_view.get_feature_vectors_async(
+                    entry = entries,
+                    return_type = "pandas"
+                )
+            ```
+
+        # Arguments
+            entry: a list of dictionary of feature group primary key and values provided by serving application.
+                Set of required primary keys is [`feature_view.primary_keys`](#primary_keys)
+                If the required primary keys is not provided, it will look for name
+                of the primary key in feature group in the entry.
+            passed_features: a list of dictionary of feature values provided by the application at runtime.
+                They can replace features values fetched from the feature store as well as
+                providing feature values which are not available in the feature store.
+            external: boolean, optional. If set to True, the connection to the
+                online feature store is established using the same host as
+                for the `host` parameter in the [`hopsworks.login()`](login.md#login) method.
+                If set to False, the online feature store storage connector is used
+                which relies on the private IP. Defaults to True if connection to Hopsworks is established from
+                external environment (e.g AWS Sagemaker or Google Colab), otherwise to False.
+            return_type: `"list"`, `"pandas"`, `"polars"`, `"numpy"` or `"arrow"`. Defaults to `"list"`.
+            force_sql_client: boolean, defaults to False. If set to True, reads from online feature store
+                using the SQL client if initialised.
+            force_rest_client: boolean, defaults to False. If set to True, reads from online feature store
+                using the REST client if initialised.
+            allow_missing: Setting to `True` returns feature vectors with missing values.
+            transform: `bool`, default=`True`. If set to `True`, model-dependent transformations are applied to the feature vector, and `on_demand_feature` is automatically set to `True`, ensuring the inclusion of on-demand features.
+                If set to `False`, the function returns the feature vector without applying any model-dependent transformations.
+            on_demand_features: `bool`, defaults to `True`. Setting this to `False` returns untransformed feature vectors without any on-demand features.
+            request_parameters: Request parameters required by on-demand transformation functions to compute on-demand features present in the feature view.
+            transformation_context: `Dict[str, Any]` A dictionary mapping variable names to objects that will be provided as contextual information to the transformation function at runtime.
+                These variables must be explicitly defined as parameters in the transformation function to be accessible during execution. If no context variables are provided, this parameter defaults to `None`.
+            vectorized_transformations: `bool`, defaults to `False`. If set to `True`, each transformation function is applied once over the whole batch
+                instead of once per feature vector.
+
+        # Returns
+            `List[list]`, `pd.DataFrame`, `polars.DataFrame`, `np.ndarray` or `pyarrow.Table` if `return type` is set to `"list", `"pandas"`,`"polars"`, `"numpy"` or `"arrow"`
+            respectively. Defaults to `List[list]`.
+
+        # Raises
+            `hopsworks.client.exceptions.FeatureStoreException`: When primary key entry cannot be found in one or more of the feature groups used by this
+                feature view.
+        """
+        if not self._vector_server._serving_initialized:
+            self.init_serving(external=external, init_rest_client=force_rest_client)
+
+        vector_db_features = []
+        if self._vector_db_client:
+            loop = asyncio.get_running_loop()
+            vector_db_features = list(
+                await asyncio.gather(
+                    *[
+                        loop.run_in_executor(None, self._get_vector_db_result, _entry)
+                        for _entry in entry
+                    ]
+                )
+            )
+
+        return await self._vector_server.get_feature_vectors_async(
+            entries=entry,
+            return_type=return_type,
+            passed_features=passed_features,
+            allow_missing=allow_missing,
+            vector_db_features=vector_db_features,
+            force_rest_client=force_rest_client,
+            force_sql_client=force_sql_client,
+            transform=transform,
+            on_demand_features=on_demand_features,
+            request_parameters=request_parameters,
+            transformation_context=transformation_context,
+            vectorized_transformations=vectorized_transformations,
         )
 
     def get_inference_helper(
@@ -993,6 +1272,84 @@ class FeatureView:
             allow_missing=True,
         )
 
+    def find_neighbors_batch(
+        self,
+        embeddings: List[List[Union[int, float]]],
+        feature: Optional[Feature] = None,
+        k: Optional[int] = 10,
+        filter: Optional[Union[Filter, Logic]] = None,
+        external: Optional[bool] = None,
+        return_type: Literal["list", "polars", "pandas"] = "list",
+    ) -> List[Any]:
+        """
+        Finds the nearest neighbors for many embeddings in the vector database.
+
+        The embeddings are searched with multi-search requests, and the feature vectors of all neighbors are
+        fetched from the online feature store in a single batch, instead of one round trip per embedding.
+        The results of each embedding are the same as the results of `find_neighbors`.
+
+        # Arguments
+            embeddings: The target embeddings for which neighbors are to be found,
+                a list of embeddings or a 2D array with one embedding per row.
+            feature: The feature used to compute similarity score. Required only if there
+            are multiple embeddings (optional).
+            k: The number of nearest neighbors to retrieve for each embedding (default is 10).
+            filter: A filter expression to restrict the search space (optional).
+            external: boolean, optional. If set to True, the connection to the
+                online feature store is established using the same host as
+                for the `host` parameter in the [`hopsworks.login()`](login.md#login) method.
+                If set to False, the online feature store storage connector is used
+                which relies on the private IP. Defaults to True if connection to Hopsworks is established from
+                external environment (e.g AWS Sagemaker or Google Colab), otherwise to False.
+            return_type: `"list"`, `"pandas"` or `"polars"`. Defaults to `"list"`.
+
+        # Returns
+            A list with the nearest neighbors of each embedding, in the order of the embeddings.
+            The nearest neighbors are a `list`, `pd.DataFrame` or `polars.DataFrame` if `return type` is set to
+            `"list"`, `"pandas"` or `"polars"` respectively.
+
+        !!! Example
+            ```
+            fv.find_neighbors_batch(
+                [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]],
+                k=5,
+            )
+            ```
+        """
+        if self._vector_db_client is None:
+            self.init_serving(external=external)
+        batch_results = self._vector_db_client.find_neighbors_batch(
+            embeddings,
+            feature=(feature if feature else None),
+            k=k,
+            filter=filter,
+        )
+        results = [res for results in batch_results for res in results]
+        if len(results) == 0:
+            return [[] for _ in batch_results]
+
+        # missing feature vectors are allowed, so there is one feature vector per neighbor
+        feature_vectors = self._vector_server.get_feature_vectors(
+            [self._extract_primary_key(res[1]) for res in results],
+            return_type=return_type,
+            vector_db_features=[res[1] for res in results],
+            allow_missing=True,
+        )
+        neighbors = []
+        start = 0
+        for results in batch_results:
+            end = start + len(results)
+            if len(results) == 0:
+                neighbors.append([])
+            elif return_type == "pandas":
+                neighbors.append(feature_vectors.iloc[start:end].reset_index(drop=True))
+            elif return_type == "polars":
+                neighbors.append(feature_vectors.slice(start, end - start))
+            else:
+                neighbors.append(feature_vectors[start:end])
+            start = end
+        return neighbors
+
     def _extract_primary_key(self, result_key: Dict[str, str]) -> Dict[str, str]:
         primary_key_map = {}
         for prefix_sk, sk in self._prefix_serving_key_map.items():
@@ -4234,6 +4591,22 @@ class FeatureView:
     def serving_keys(self, serving_keys: List[skm.ServingKey]) -> None:
         self._serving_keys = serving_keys
 
+    @property
+    def feature_vector_cache_stats(self) -> Optional[Dict[str, int]]:
+        """Number of hits, misses and evictions of the feature vector cache and its current size.
+        `None` if serving was not initialised with a `cache_config`."""
+        if self._vector_server.feature_vector_cache is None:
+            return None
+        return self._vector_server.feature_vector_cache.stats
+
+    @property
+    def init_serving_timings(self) -> Dict[str, float]:
+        """Duration in seconds of each stage of the last [`feature_view.init_serving()`](#init_serving) call.
+
+        Metadata requests are sent concurrently, stages named after them overlap and their sum can exceed `total`.
+        """
+        return self._vector_server.init_serving_timings
+
     @property
     def logging_enabled(self) -> bool:
         return self._logging_enabled
@@ -260,6 +260,13 @@ class HopsworksUdf:
         # Set to `False` if the output column names are saved in the backend and the udf is constructed from it using `from_response_json` function or if user has specified the output feature names using the `alias`` function.
         self._generate_output_col_name: bool = generate_output_col_names
 
+        # Compiled UDFs returned by `get_udf`, keyed by execution mode, online flag, engine type and output renaming.
+        # Each entry also keeps the scope the wrapper was executed in, so that context variables can be refreshed without recompiling.
+        self._udf_cache: Dict[
+            Tuple[UDFExecutionMode, bool, str, bool],
+            Tuple[Callable, Optional[Dict[str, Any]]],
+        ] = {}
+
     @staticmethod
     def _validate_and_convert_drop_features(
         dropped_features: Union[str, List[str]],
@@ -824,34 +831,64 @@ def renaming_wrapper(*args):
             `Callable`: Pandas UDF in the spark engine otherwise returns a python function for the UDF.
         """
 
-        if (
-            self.execution_mode.get_current_execution_mode(online)
-            == UDFExecutionMode.PANDAS
-        ):
-            if engine.get_type() in ["python", "training"] or online:
-                return self.pandas_udf_wrapper()
+        execution_mode = self.execution_mode.get_current_execution_mode(online)
+        engine_type = engine.get_type()
+        python_engine = engine_type in ["python", "training"] or online
+        # Renaming into correct column names done within Python engine since a wrapper does not work for polars dataFrames.
+        rename_outputs = execution_mode == UDFExecutionMode.PYTHON and not python_engine
+
+        cache_key = (execution_mode, online, engine_type, rename_outputs)
+        if cache_key in self._udf_cache:
+            return self._udf_cache[cache_key][0]
+
+        if execution_mode == UDFExecutionMode.PANDAS:
+            wrapper, scope = self._compile_udf_wrapper(self.pandas_udf_wrapper)
+            if python_engine:
+                compiled_udf = wrapper
             else:
                 from pyspark.sql.functions import pandas_udf
 
-                return pandas_udf(
-                    f=self.pandas_udf_wrapper(),
+                compiled_udf = pandas_udf(
+                    f=wrapper,
                     returnType=self._create_pandas_udf_return_schema_from_list(),
                 )
-        elif (
-            self.execution_mode.get_current_execution_mode(online)
-            == UDFExecutionMode.PYTHON
-        ):
-            if engine.get_type() in ["python", "training"] or online:
-                # Renaming into correct column names done within Python engine since a wrapper does not work for polars dataFrames.
-                return self.python_udf_wrapper(rename_outputs=False)
+        else:
+            wrapper, scope = self._compile_udf_wrapper(
+                self.python_udf_wrapper, rename_outputs=rename_outputs
+            )
+            if python_engine:
+                compiled_udf = wrapper
             else:
                 from pyspark.sql.functions import udf as pyspark_udf
 
-                return pyspark_udf(
-                    f=self.python_udf_wrapper(rename_outputs=True),
+                compiled_udf = pyspark_udf(
+                    f=wrapper,
                     returnType=self._create_pandas_udf_return_schema_from_list(),
                 )
 
+        self._udf_cache[cache_key] = (compiled_udf, scope)
+        return compiled_udf
+
+    def _compile_udf_wrapper(
+        self, wrapper_builder: Callable, **kwargs
+    ) -> Tuple[Callable, Optional[Dict[str, Any]]]:
+        """
+        Function that builds the wrapper function of the UDF and returns it along with the scope it was executed in.
+
+        # Arguments
+            wrapper_builder: `Callable`. Function that generates the wrapper, either `python_udf_wrapper` or `pandas_udf_wrapper`.
+        # Returns
+            `Tuple[Callable, Optional[Dict[str, Any]]]`: The wrapper function and its global scope.
+        """
+        wrapper = wrapper_builder(**kwargs)
+        return wrapper, getattr(wrapper, "__globals__", None)
+
+    def _invalidate_udf_cache(self) -> None:
+        """
+        Function that drops all compiled UDFs, so that they are rebuilt on the next call to `get_udf`.
+        """
+        self._udf_cache = {}
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert class into a dictionary.
@@ -1123,11 +1160,19 @@ def renaming_wrapper(*args):
 
     @transformation_context.setter
     def transformation_context(self, context_variables: Dict[str, Any]) -> None:
-        self._transformation_context = (
+        transformation_context = (
             self._validate_transformation_context(context_variables)
             if context_variables
             else {}
         )
+        if transformation_context.keys() != self.transformation_context.keys():
+            self._invalidate_udf_cache()
+        else:
+            # Context values change on every call during online inference, so they are refreshed in the scope of the compiled UDFs instead of recompiling them.
+            for _, scope in self._udf_cache.values():
+                if scope is not None:
+                    scope[UDFKeyWords.CONTEXT.value] = transformation_context
+        self._transformation_context = transformation_context
 
     @dropped_features.setter
     def dropped_features(self, features: List[str]) -> None:
@@ -1139,6 +1184,7 @@ def renaming_wrapper(*args):
     def transformation_statistics(
         self, statistics: List[FeatureDescriptiveStatistics]
     ) -> None:
+        self._invalidate_udf_cache()
         self._statistics = TransformationStatistics(*self._statistics_argument_names)
         for stat in statistics:
             if stat.feature_name in self._statistics_argument_mapping.keys():
@@ -1151,7 +1197,14 @@ def renaming_wrapper(*args):
         if not isinstance(output_col_names, List):
             output_col_names = [output_col_names]
         self._validate_output_col_name(output_col_names)
+        self._invalidate_udf_cache()
         self._output_column_names = output_col_names
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Compiled UDFs hold a copy of the `__main__` scope which cannot be deep copied or pickled, they are rebuilt on demand.
+        state = self.__dict__.copy()
+        state["_udf_cache"] = {}
+        return state
+
     def __repr__(self):
         return f'{self.function_name}({", ".join(self.transformation_features)})'
@@ -102,6 +102,7 @@ class TransformationFunction:
             # Reset output column names so that they would be regenerated.
             # Handles the use case in which the same UDF is used to define both on-demand and model dependent transformations.
             self.__hopsworks_udf._output_column_names = []
+            self.__hopsworks_udf._invalidate_udf_cache()
 
     def save(self) -> None:
         """Save a transformation function into the backend.
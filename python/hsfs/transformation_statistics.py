@@ -18,9 +18,17 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 import humps
+from hopsworks_common.core.constants import HAS_NUMPY, HAS_PANDAS
+
+
+if HAS_NUMPY:
+    import numpy as np
+
+if HAS_PANDAS:
+    import pandas as pd
 
 
 @dataclass
@@ -97,6 +105,10 @@ class FeatureTransformationStatistics:
             self._histogram = extended_statistics.get("histogram", None)
             self._kll = extended_statistics.get("kll", None)
             self._unique_values = extended_statistics.get("unique_values", None)
+        # Lookup structures for categorical encodings, built on first use and reused for every call.
+        self._sorted_unique_values: Optional[List[Any]] = None
+        self._categorical_index: Optional[pd.Index] = None
+        self._one_hot_encoding_table: Optional[np.ndarray] = None
 
     @property
     def feature_name(self) -> str:
@@ -213,6 +225,34 @@ class FeatureTransformationStatistics:
         """Number of Unique Values."""
         return self._unique_values
 
+    @property
+    def sorted_unique_values(self) -> Optional[List[Any]]:
+        """Unique values of the feature in sorted order."""
+        if self._sorted_unique_values is None and self.unique_values is not None:
+            self._sorted_unique_values = sorted(self.unique_values)
+        return self._sorted_unique_values
+
+    @property
+    def categorical_index(self) -> Optional[pd.Index]:
+        """Index of the sorted unique values, the position of a value in the index is its label encoding."""
+        if self._categorical_index is None and self.sorted_unique_values is not None:
+            self._categorical_index = pd.Index(self.sorted_unique_values)
+        return self._categorical_index
+
+    @property
+    def one_hot_encoding_table(self) -> Optional[np.ndarray]:
+        """Boolean matrix whose row `i` is the one hot encoding of the `i`-th sorted unique value.
+
+        The matrix has an additional last row of `False` values, so that indexing it with the code `-1`
+        of values not present in the unique values encodes them with all categories set to `False`.
+        """
+        if self._one_hot_encoding_table is None and self.unique_values is not None:
+            num_categories = len(self.unique_values)
+            self._one_hot_encoding_table = np.eye(
+                num_categories + 1, num_categories, dtype=bool
+            )
+        return self._one_hot_encoding_table
+
     @classmethod
     def from_response_json(
         cls: FeatureTransformationStatistics, json_dict: Dict[str, Any]
@@ -17,10 +17,12 @@
 from hopsworks_common.core.dataset_api import (
     Chunk,
     DatasetApi,
+    UploadBudget,
 )
 
 
 __all__ = [
     "Chunk",
     "DatasetApi",
+    "UploadBudget",
 ]
@@ -0,0 +1,176 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import time
+import uuid
+from typing import Optional
+
+from hopsworks_common.constants import ENV_VARS
+
+
+_logger = logging.getLogger(__name__)
+
+
+class ModelFileCache:
+    """Local cache of model and artifact files, shared by all processes on a host.
+
+    A file is cached under a key derived from its remote path, size and modification time, so a file changed in the
+    Hopsworks filesystem is never served from the cache. The modification time of a cached file is set to the remote
+    modification time, which allows detecting cached files modified locally through a hard link.
+
+    Cached files are materialized in the target folder as hard links, falling back to copies across file systems.
+    The least recently used files are evicted when the cache exceeds its maximum size.
+    """
+
+    DEFAULT_MAX_SIZE = 50 * 1024**3
+    FILES_DIR_NAME = "files"
+
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_MAX_SIZE):
+        self._cache_dir = os.path.abspath(cache_dir)
+        self._files_dir = os.path.join(self._cache_dir, self.FILES_DIR_NAME)
+        self._max_size = max_size
+        os.makedirs(self._files_dir, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> Optional[ModelFileCache]:
+        """Get the cache configured with environment variables, `None` if caching is disabled.
+
+        The cache is enabled by setting `HOPSWORKS_MODEL_CACHE_DIR` to the cache folder.
+        `HOPSWORKS_MODEL_CACHE_MAX_SIZE` sets the maximum size of the cache in bytes, by default 50 GB.
+        """
+        cache_dir = os.environ.get(ENV_VARS.MODEL_CACHE_DIR)
+        if not cache_dir:
+            return None
+        return cls(
+            cache_dir,
+            int(os.environ.get(ENV_VARS.MODEL_CACHE_MAX_SIZE, cls.DEFAULT_MAX_SIZE)),
+        )
+
+    @property
+    def cache_dir(self) -> str:
+        """Folder of the cache."""
+        return self._cache_dir
+
+    @property
+    def max_size(self) -> int:
+        """Maximum size of the cache in bytes."""
+        return self._max_size
+
+    def get_key(self, remote_path: str, size: int, modification_time: int) -> str:
+        """Get the key of a remote file.
+
+        # Arguments
+            remote_path: path of the file in the Hopsworks filesystem.
+            size: size of the file in bytes.
+            modification_time: modification time of the file in milliseconds.
+        # Returns
+            `str`: The cache key.
+        """
+        return hashlib.sha256(
+            "{}\0{}\0{}".format(remote_path, size, modification_time).encode("utf-8")
+        ).hexdigest()
+
+    def materialize(
+        self, key: str, local_path: str, size: int, modification_time: int
+    ) -> bool:
+        """Materialize a cached file at a local path.
+
+        # Arguments
+            key: key of the file.
+            local_path: path where to materialize the file.
+            size: size of the file in bytes.
+            modification_time: modification time of the remote file in milliseconds.
+        # Returns
+            `bool`: Whether the file was found in the cache.
+        """
+        cached_path = self._get_path(key)
+        try:
+            stat = os.stat(cached_path)
+        except FileNotFoundError:
+            return False
+        if stat.st_size != size or int(stat.st_mtime) != modification_time // 1000:
+            # the cached file was modified through a hard link
+            self._remove(cached_path)
+            return False
+
+        try:
+            os.link(cached_path, local_path)
+        except FileNotFoundError:
+            # evicted concurrently
+            return False
+        except OSError:
+            shutil.copyfile(cached_path, local_path)
+        # the access time orders files for eviction
+        os.utime(cached_path, (time.time(), stat.st_mtime))
+        return True
+
+    def store(self, key: str, local_path: str, modification_time: int):
+        """Add a downloaded file to the cache.
+
+        # Arguments
+            key: key of the file.
+            local_path: path of the downloaded file.
+            modification_time: modification time of the remote file in milliseconds.
+        """
+        cached_path = self._get_path(key)
+        os.makedirs(os.path.dirname(cached_path), exist_ok=True)
+        # files are added under a temporary name and renamed, so that concurrent readers never see partial files
+        tmp_path = "{}.{}.tmp".format(cached_path, uuid.uuid4().hex)
+        try:
+            try:
+                os.link(local_path, tmp_path)
+            except OSError:
+                shutil.copyfile(local_path, tmp_path)
+            os.utime(tmp_path, (time.time(), modification_time / 1000))
+            os.replace(tmp_path, cached_path)
+        except OSError:
+            _logger.warning("Failed to add %s to the model cache.", local_path)
+            self._remove(tmp_path)
+
+    def evict(self):
+        """Remove the least recently used files until the cache fits its maximum size."""
+        files = []
+        total_size = 0
+        for root, _, file_names in os.walk(self._files_dir):
+            for file_name in file_names:
+                path = os.path.join(root, file_name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_atime, stat.st_size, path))
+                total_size += stat.st_size
+
+        for _, size, path in sorted(files):
+            if total_size <= self._max_size:
+                break
+            self._remove(path)
+            total_size -= size
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self._files_dir, key[:2], key)
+
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
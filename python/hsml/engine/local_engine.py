@@ -15,15 +15,26 @@
 #
 
 import os
+import tempfile
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
+from hopsworks_common.client.exceptions import ModelRegistryException
 from hsml import client
-from hsml.core import dataset_api, hdfs_api, model_api
+from hsml.core import dataset_api, hdfs_api, model_api, model_file_cache
 
 
 class LocalEngine:
+    DEFAULT_SIMULTANEOUS_FILE_UPLOADS = 8
+    DEFAULT_SIMULTANEOUS_FILE_DOWNLOADS = 8
+    # progress bars are only shown for files larger than this size
+    PROGRESS_BAR_MIN_FILE_SIZE = 10 * 1024 * 1024
+    DEFAULT_BUNDLE_UNZIP_TIMEOUT = 600
+
     def __init__(self):
         self._dataset_api = dataset_api.DatasetApi()
         self._model_api = model_api.ModelApi()
+        self._model_file_cache = model_file_cache.ModelFileCache.from_env()
 
         try:
             self._hdfs_api = hdfs_api.HdfsApi()
@@ -65,12 +76,144 @@ class LocalEngine:
                     "simultaneous_uploads",
                     self._dataset_api.DEFAULT_UPLOAD_SIMULTANEOUS_UPLOADS,
                 ),
+                simultaneous_chunks=upload_configuration.get(
+                    "simultaneous_chunks",
+                    self._dataset_api.DEFAULT_UPLOAD_SIMULTANEOUS_CHUNKS,
+                ),
                 max_chunk_retries=upload_configuration.get(
                     "max_chunk_retries",
                     self._dataset_api.DEFAULT_UPLOAD_MAX_CHUNK_RETRIES,
                 ),
             )
 
+    def upload_many(self, uploads, upload_configuration=None, on_uploaded=None):
+        """Upload files and directories concurrently.
+
+        Each upload is a tuple of the local path and the remote directory to upload it into. Local directories are
+        uploaded as a single bundle, i.e. zipped, uploaded in one flow and extracted in the remote directory.
+        Chunks of all files share a budget of bytes in flight, so that many small files are uploaded in parallel
+        without large files exhausting memory and bandwidth.
+
+        # Arguments
+            uploads: list of tuples (local_path, remote_path).
+            upload_configuration: dictionary with the upload configuration, see `Model.save`.
+            on_uploaded: callback called with the local path of each completed upload.
+        """
+        upload_configuration = upload_configuration if upload_configuration else {}
+        simultaneous_uploads = upload_configuration.get(
+            "simultaneous_uploads", self.DEFAULT_SIMULTANEOUS_FILE_UPLOADS
+        )
+        upload_budget = dataset_api.UploadBudget(
+            upload_configuration.get(
+                "max_bytes_in_flight",
+                self._dataset_api.DEFAULT_UPLOAD_MAX_BYTES_IN_FLIGHT,
+            )
+        )
+
+        with ThreadPoolExecutor(simultaneous_uploads) as executor:
+            futures = {}
+            for local_path, remote_path in uploads:
+                upload_fn = (
+                    self._upload_bundle
+                    if os.path.isdir(local_path)
+                    else self._upload_file
+                )
+                future = executor.submit(
+                    upload_fn,
+                    self._get_abs_path(local_path),
+                    self._prepend_project_path(remote_path),
+                    upload_configuration,
+                    upload_budget,
+                )
+                futures[future] = local_path
+
+            pending = set(futures)
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                        if on_uploaded is not None:
+                            on_uploaded(futures[future])
+            except Exception:
+                for future in pending:
+                    future.cancel()
+                raise
+
+    def _upload_file(
+        self, local_path, remote_path, upload_configuration, upload_budget
+    ):
+        if self._hdfs_api is not None:
+            self._hdfs_api.upload(
+                local_path=local_path,
+                upload_path=remote_path,
+                buffer_size=upload_configuration.get(
+                    "buffer_size", self._hdfs_api.DEFAULT_BUFFER_SIZE
+                ),
+            )
+            return
+
+        chunk_size = upload_configuration.get(
+            "chunk_size", self._dataset_api.DEFAULT_UPLOAD_FLOW_CHUNK_SIZE
+        )
+        # the remote directory is created by the caller, existence checks are skipped
+        self._dataset_api._upload_file(
+            os.path.basename(local_path),
+            local_path,
+            remote_path,
+            chunk_size,
+            upload_configuration.get(
+                "simultaneous_chunks",
+                self._dataset_api.DEFAULT_UPLOAD_SIMULTANEOUS_CHUNKS,
+            ),
+            upload_configuration.get(
+                "max_chunk_retries", self._dataset_api.DEFAULT_UPLOAD_MAX_CHUNK_RETRIES
+            ),
+            1,
+            upload_budget=upload_budget,
+            # progress bars are only shown for files spanning multiple chunks
+            show_progress=os.path.getsize(local_path) > chunk_size,
+        )
+
+    def _upload_bundle(
+        self, local_path, remote_path, upload_configuration, upload_budget
+    ):
+        if self._hdfs_api is not None:
+            # the hdfs client uploads directories recursively
+            self._upload_file(local_path, remote_path, upload_configuration, None)
+            return
+
+        dir_name = os.path.basename(local_path)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            zip_path = os.path.join(tmp_dir, dir_name + ".zip")
+            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                for root, dirs, files in os.walk(local_path):
+                    for name in dirs + files:
+                        path = os.path.join(root, name)
+                        zip_file.write(
+                            path,
+                            os.path.join(dir_name, os.path.relpath(path, local_path)),
+                        )
+            self._upload_file(
+                zip_path, remote_path, upload_configuration, upload_budget
+            )
+
+        remote_zip_path = remote_path + "/" + dir_name + ".zip"
+        extracted = self._dataset_api.unzip(
+            remote_zip_path,
+            block=True,
+            timeout=upload_configuration.get(
+                "bundle_unzip_timeout", self.DEFAULT_BUNDLE_UNZIP_TIMEOUT
+            ),
+        )
+        if not extracted:
+            raise ModelRegistryException(
+                "Timeout while extracting {} in the model registry".format(
+                    remote_zip_path
+                )
+            )
+        self._dataset_api.remove(remote_zip_path)
+
     def download(self, remote_path: str, local_path: str, download_configuration=None):
         local_path = self._get_abs_path(local_path)
         remote_path = self._prepend_project_path(remote_path)
@@ -93,6 +236,109 @@ class LocalEngine:
             # otherwise, use the REST API
             self._dataset_api.download(remote_path, local_path)
 
+    def download_many(self, downloads, download_configuration=None, on_downloaded=None):
+        """Download files concurrently, materializing files from the model file cache when enabled.
+
+        Each download is a tuple of the remote path, the local path, the size and the modification time in
+        milliseconds of the file, as listed in the Hopsworks filesystem.
+
+        # Arguments
+            downloads: list of tuples (remote_path, local_path, size, modification_time).
+            download_configuration: dictionary with the download configuration.
+            on_downloaded: callback called with the local path of each completed download.
+        """
+        download_configuration = (
+            download_configuration if download_configuration else {}
+        )
+        cache = self._model_file_cache
+
+        with ThreadPoolExecutor(
+            download_configuration.get(
+                "simultaneous_downloads", self.DEFAULT_SIMULTANEOUS_FILE_DOWNLOADS
+            )
+        ) as executor:
+            futures = {}
+            for remote_path, local_path, size, modification_time in downloads:
+                local_path = self._get_abs_path(local_path)
+                # files without a modification time are never cached
+                if (
+                    cache is not None
+                    and modification_time
+                    and cache.materialize(
+                        cache.get_key(remote_path, size, modification_time),
+                        local_path,
+                        size,
+                        modification_time,
+                    )
+                ):
+                    if on_downloaded is not None:
+                        on_downloaded(local_path)
+                    continue
+                future = executor.submit(
+                    self._download_file,
+                    remote_path,
+                    local_path,
+                    size,
+                    modification_time,
+                    download_configuration,
+                )
+                futures[future] = local_path
+
+            pending = set(futures)
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                        if on_downloaded is not None:
+                            on_downloaded(futures[future])
+            except Exception:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        if cache is not None and futures:
+            cache.evict()
+
+    def _download_file(
+        self, remote_path, local_path, size, modification_time, download_configuration
+    ):
+        if self._hdfs_api is not None:
+            self._hdfs_api.download(
+                path=self._prepend_project_path(remote_path),
+                local_path=local_path,
+                buffer_size=download_configuration.get(
+                    "buffer_size", self._hdfs_api.DEFAULT_BUFFER_SIZE
+                ),
+            )
+        else:
+            chunk_size = download_configuration.get(
+                "chunk_size", self._dataset_api.DEFAULT_DOWNLOAD_FLOW_CHUNK_SIZE
+            )
+            # the size is known from the listing, so no metadata request is needed
+            self._dataset_api._download_file(
+                self._prepend_project_path(remote_path),
+                local_path,
+                size,
+                chunk_size,
+                show_progress=size > self.PROGRESS_BAR_MIN_FILE_SIZE,
+                simultaneous_ranges=download_configuration.get(
+                    "simultaneous_ranges",
+                    self._dataset_api.DEFAULT_DOWNLOAD_SIMULTANEOUS_RANGES,
+                ),
+                range_size=download_configuration.get(
+                    "range_size", self._dataset_api.DEFAULT_DOWNLOAD_RANGE_SIZE
+                ),
+                modification_time=modification_time,
+            )
+
+        if self._model_file_cache is not None and modification_time:
+            self._model_file_cache.store(
+                self._model_file_cache.get_key(remote_path, size, modification_time),
+                local_path,
+                modification_time,
+            )
+
     def copy(self, source_path, destination_path):
         source_path = self._prepend_project_path(source_path)
         destination_path = self._prepend_project_path(destination_path)
@@ -14,11 +14,13 @@
 #   limitations under the License.
 #
 
+import hashlib
 import json
 import os
 import tempfile
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from hopsworks_common import client, constants, util
 from hopsworks_common.client.exceptions import ModelRegistryException, RestAPIError
@@ -29,6 +31,8 @@ from tqdm.auto import tqdm
 
 
 class ModelEngine:
+    HASH_BLOCK_SIZE = 8 * 1024 * 1024
+
     def __init__(self):
         self._model_api = model_api.ModelApi()
         self._dataset_api = dataset_api.DatasetApi()
@@ -145,8 +149,9 @@ class ModelEngine:
         update_download_progress,
         n_dirs,
         n_files,
+        downloads,
     ):
-        """Download model files from a model path in hdfs, recursively"""
+        """Create the folders of a model path in hdfs locally and collect the files to download, recursively"""
 
         for entry in self._dataset_api.list(from_hdfs_model_path, sort_by="NAME:desc")[
             "items"
@@ -169,15 +174,20 @@ class ModelEngine:
                     update_download_progress=update_download_progress,
                     n_dirs=n_dirs,
                     n_files=n_files,
+                    downloads=downloads,
                 )
                 n_dirs += 1
                 update_download_progress(n_dirs=n_dirs, n_files=n_files)
             else:
-                # if it's a file, download it
-                local_file_path = os.path.join(to_local_path, basename)
-                self._engine.download(path, local_file_path)
-                n_files += 1
-                update_download_progress(n_dirs=n_dirs, n_files=n_files)
+                # if it's a file, collect it to be downloaded concurrently
+                downloads.append(
+                    (
+                        path,
+                        os.path.join(to_local_path, basename),
+                        int(path_attr.get("size", 0)),
+                        int(path_attr.get("modificationTime", 0)),
+                    )
+                )
 
         return n_dirs, n_files
 
@@ -186,13 +196,22 @@ class ModelEngine:
     ):
         """Download model files from a model path in hdfs."""
 
+        downloads = []
         n_dirs, n_files = self._download_model_from_hopsfs_recursive(
             from_hdfs_model_path=from_hdfs_model_path,
             to_local_path=to_local_path,
             update_download_progress=update_download_progress,
             n_dirs=0,
             n_files=0,
+            downloads=downloads,
         )
+
+        def on_downloaded(local_path):
+            nonlocal n_files
+            n_files += 1
+            update_download_progress(n_dirs=n_dirs, n_files=n_files)
+
+        self._engine.download_many(downloads, on_downloaded=on_downloaded)
         update_download_progress(n_dirs=n_dirs, n_files=n_files, done=True)
 
     def _upload_local_model(
@@ -201,11 +220,24 @@ class ModelEngine:
         to_model_files_path,
         update_upload_progress,
         upload_configuration=None,
+        files_manifest=None,
+        previous_model_files_path=None,
+        previous_files_manifest=None,
     ):
-        """Copy or upload model files from a local path to the model files folder in the Models dataset."""
+        """Copy or upload model files from a local path to the model files folder in the Models dataset.
+
+        Folders are created first and files are then uploaded concurrently. Folders containing only many small files,
+        such as tokenizer vocabularies or configuration shards, are uploaded as a single bundle.
+        Files and bundles identical to the previous model version, according to the files manifests, are copied
+        server-side from the previous version instead of being uploaded.
+        """
+        upload_configuration = upload_configuration if upload_configuration else {}
         n_dirs, n_files = 0, 0
         if os.path.isdir(from_local_model_path):
-            # if path is a dir, upload files and folders iteratively
+            uploads = []
+            copies = []
+            bundles = {}
+            # if path is a dir, create folders and collect files and bundles iteratively
             for root, dirs, files in os.walk(from_local_model_path):
                 # os.walk(local_model_path), where local_model_path is expected to be an absolute path
                 # - root is the absolute path of the directory being walked
@@ -215,18 +247,67 @@ class ModelEngine:
                 remote_base_path = root.replace(
                     from_local_model_path, to_model_files_path
                 ).replace(os.sep, "/")
-                for d_name in dirs:
+                for d_name in list(dirs):
+                    local_dir_path = root + "/" + d_name
+                    bundle_content = self._get_bundle_content(
+                        local_dir_path, from_local_model_path, upload_configuration
+                    )
+                    if bundle_content is not None:
+                        # the bundle creates the folder with all its content, do not walk into it
+                        dirs.remove(d_name)
+                        bundles[local_dir_path] = bundle_content
+                        relative_path = self._get_relative_path(
+                            local_dir_path, from_local_model_path
+                        )
+                        if self._is_unchanged_dir(
+                            relative_path, files_manifest, previous_files_manifest
+                        ):
+                            copies.append(
+                                (
+                                    local_dir_path,
+                                    previous_model_files_path + "/" + relative_path,
+                                    remote_base_path,
+                                )
+                            )
+                        else:
+                            uploads.append((local_dir_path, remote_base_path))
+                        continue
                     self._engine.mkdir(remote_base_path + "/" + d_name)
                     n_dirs += 1
                     update_upload_progress(n_dirs, n_files)
                 for f_name in files:
-                    self._engine.upload(
-                        root + "/" + f_name,
-                        remote_base_path,
-                        upload_configuration=upload_configuration,
+                    local_file_path = root + "/" + f_name
+                    relative_path = self._get_relative_path(
+                        local_file_path, from_local_model_path
                     )
-                    n_files += 1
-                    update_upload_progress(n_dirs, n_files)
+                    if self._is_unchanged_file(
+                        relative_path, files_manifest, previous_files_manifest
+                    ):
+                        copies.append(
+                            (
+                                local_file_path,
+                                previous_model_files_path + "/" + relative_path,
+                                remote_base_path,
+                            )
+                        )
+                    else:
+                        uploads.append((local_file_path, remote_base_path))
+
+            def on_uploaded(local_path):
+                nonlocal n_dirs, n_files
+                bundle_dirs, bundle_files = bundles.get(local_path, (0, 1))
+                n_dirs += bundle_dirs
+                n_files += bundle_files
+                update_upload_progress(n_dirs, n_files)
+
+            uploads += self._copy_unchanged_model_items(
+                copies, upload_configuration, on_copied=on_uploaded
+            )
+            self._engine.upload_many(
+                uploads,
+                upload_configuration=upload_configuration,
+                on_uploaded=on_uploaded,
+            )
         else:
             # if path is a file, upload file
             self._engine.upload(
@@ -237,6 +318,173 @@ class ModelEngine:
             n_files += 1
             update_upload_progress(n_dirs, n_files)
 
+    def _copy_unchanged_model_items(self, copies, upload_configuration, on_copied):
+        """Copy files and folders unchanged since the previous model version, concurrently.
+
+        Returns the uploads replacing the copies that failed, e.g. because the previous version was modified.
+        """
+        failed_copies = []
+        if not copies:
+            return failed_copies
+        with ThreadPoolExecutor(
+            upload_configuration.get(
+                "simultaneous_uploads", self._engine.DEFAULT_SIMULTANEOUS_FILE_UPLOADS
+            )
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._copy_or_move_hopsfs_model_item,
+                    {"path": previous_path},
+                    remote_path,
+                    True,
+                ): (local_path, previous_path, remote_path)
+                for local_path, previous_path, remote_path in copies
+            }
+            for future in as_completed(futures):
+                local_path, _, remote_path = futures[future]
+                try:
+                    future.result()
+                except RestAPIError:
+                    failed_copies.append((local_path, remote_path))
+                    continue
+                on_copied(local_path)
+        return failed_copies
+
+    def _get_relative_path(self, local_path, from_local_model_path):
+        return os.path.relpath(local_path, from_local_model_path).replace(os.sep, "/")
+
+    def _is_unchanged_file(
+        self, relative_path, files_manifest, previous_files_manifest
+    ):
+        if files_manifest is None or previous_files_manifest is None:
+            return False
+        previous_file = previous_files_manifest.get(relative_path)
+        return previous_file is not None and previous_file == files_manifest.get(
+            relative_path
+        )
+
+    def _is_unchanged_dir(self, relative_path, files_manifest, previous_files_manifest):
+        if files_manifest is None or previous_files_manifest is None:
+            return False
+
+        def dir_files(manifest):
+            prefix = relative_path + "/"
+            return {
+                path: file for path, file in manifest.items() if path.startswith(prefix)
+            }
+
+        # empty folders are not in the manifests, so they are always uploaded
+        files = dir_files(files_manifest)
+        return len(files) > 0 and files == dir_files(previous_files_manifest)
+
+    def _build_files_manifest(self, local_model_path, upload_configuration):
+        """Hash the files of a local model folder, keyed by their path relative to the folder."""
+        local_file_paths = [
+            root + "/" + f_name
+            for root, _, files in os.walk(local_model_path)
+            for f_name in files
+        ]
+
+        def hash_file(local_file_path):
+            sha256 = hashlib.sha256()
+            with open(local_file_path, "rb") as f:
+                for block in iter(lambda: f.read(self.HASH_BLOCK_SIZE), b""):
+                    sha256.update(block)
+            return {
+                "size": os.path.getsize(local_file_path),
+                "sha256": sha256.hexdigest(),
+            }
+
+        with ThreadPoolExecutor(
+            upload_configuration.get(
+                "simultaneous_uploads", self._engine.DEFAULT_SIMULTANEOUS_FILE_UPLOADS
+            )
+        ) as executor:
+            hashes = list(executor.map(hash_file, local_file_paths))
+        return {
+            self._get_relative_path(local_file_path, local_model_path): file_hash
+            for local_file_path, file_hash in zip(local_file_paths, hashes)
+        }
+
+    def _get_previous_files_manifest(self, model_instance):
+        """Get the model files path and the files manifest of the previous model version, if any."""
+        try:
+            items = self._dataset_api.list(
+                model_instance.model_path, sort_by="NAME:desc"
+            )["items"]
+        except RestAPIError:
+            return None, None
+        versions = []
+        for item in items:
+            _, file_name = os.path.split(item["attributes"]["path"])
+            if file_name.isdigit() and int(file_name) < model_instance.version:
+                versions.append(int(file_name))
+        if not versions:
+            return None, None
+
+        previous_version_path = "{}/{}".format(model_instance.model_path, max(versions))
+        manifest_path = "{}/{}".format(
+            previous_version_path, constants.MODEL_REGISTRY.FILES_MANIFEST_FILE_NAME
+        )
+        if not self._dataset_api.path_exists(manifest_path):
+            return None, None
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            local_manifest_path = os.path.join(
+                tmp_dir, constants.MODEL_REGISTRY.FILES_MANIFEST_FILE_NAME
+            )
+            self._engine.download(manifest_path, local_manifest_path)
+            with open(local_manifest_path, "r") as f:
+                manifest = json.load(f)
+        return (
+            "{}/{}".format(
+                previous_version_path, constants.MODEL_REGISTRY.MODEL_FILES_DIR_NAME
+            ),
+            manifest["files"],
+        )
+
+    def _upload_files_manifest(self, model_instance, files_manifest):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            local_manifest_path = os.path.join(
+                tmp_dir, constants.MODEL_REGISTRY.FILES_MANIFEST_FILE_NAME
+            )
+            with open(local_manifest_path, "w") as f:
+                json.dump({"files": files_manifest}, f)
+            self._engine.upload(local_manifest_path, model_instance.version_path)
+
+    def _get_bundle_content(
+        self, local_dir_path, from_local_model_path, upload_configuration
+    ):
+        """Get the number of folders and files of a folder to be uploaded as a single bundle.
+
+        Returns `None` if the folder should be uploaded file by file.
+        """
+        if not upload_configuration.get("bundle_small_files", True):
+            return None
+        if "." in os.path.relpath(local_dir_path, from_local_model_path):
+            # the bundle is extracted in the folder named as the archive without extension
+            return None
+
+        max_file_size = upload_configuration.get(
+            "bundle_max_file_size", constants.MODEL_REGISTRY.BUNDLE_MAX_FILE_SIZE
+        )
+        max_size = upload_configuration.get(
+            "bundle_max_size", constants.MODEL_REGISTRY.BUNDLE_MAX_SIZE
+        )
+        n_dirs, n_files, size = 1, 0, 0
+        for root, dirs, files in os.walk(local_dir_path):
+            n_dirs += len(dirs)
+            for f_name in files:
+                file_size = os.path.getsize(root + "/" + f_name)
+                size += file_size
+                n_files += 1
+                if file_size > max_file_size or size > max_size:
+                    return None
+        if n_files < upload_configuration.get(
+            "bundle_min_files", constants.MODEL_REGISTRY.BUNDLE_MIN_FILES
+        ):
+            return None
+        return n_dirs, n_files
+
     def _save_model_from_local_or_hopsfs_mount(
         self,
         model_instance,
@@ -257,12 +505,33 @@ class ModelEngine:
                 update_upload_progress=update_upload_progress,
             )
         else:
+            upload_configuration = upload_configuration if upload_configuration else {}
+            files_manifest, previous_model_files_path, previous_files_manifest = (
+                None,
+                None,
+                None,
+            )
+            if os.path.isdir(model_path) and upload_configuration.get(
+                "deduplicate", True
+            ):
+                # files unchanged since the previous version are copied server-side instead of uploaded
+                files_manifest = self._build_files_manifest(
+                    model_path, upload_configuration
+                )
+                previous_model_files_path, previous_files_manifest = (
+                    self._get_previous_files_manifest(model_instance)
+                )
             self._upload_local_model(
                 from_local_model_path=model_path,
                 to_model_files_path=model_instance.model_files_path,
                 update_upload_progress=update_upload_progress,
                 upload_configuration=upload_configuration,
+                files_manifest=files_manifest,
+                previous_model_files_path=previous_model_files_path,
+                previous_files_manifest=previous_files_manifest,
             )
+            if files_manifest is not None:
+                self._upload_files_manifest(model_instance, files_manifest)
 
     def _set_model_version(
         self, model_instance, dataset_models_root_path, dataset_model_path
@@ -314,8 +314,9 @@ class ServingEngine:
         update_download_progress,
         n_dirs,
         n_files,
+        downloads,
     ):
-        """Download model files from a model path in hdfs, recursively"""
+        """Create the folders of a model path in hdfs locally and collect the files to download, recursively"""
 
         for entry in self._dataset_api.list(from_hdfs_path, sort_by="NAME:desc")[
             "items"
@@ -338,15 +339,20 @@ class ServingEngine:
                     update_download_progress=update_download_progress,
                     n_dirs=n_dirs,
                     n_files=n_files,
+                    downloads=downloads,
                 )
                 n_dirs += 1
                 update_download_progress(n_dirs=n_dirs, n_files=n_files)
             else:
-                # if it's a file, download it
-                local_file_path = os.path.join(to_local_path, basename)
-                self._engine.download(path, local_file_path)
-                n_files += 1
-                update_download_progress(n_dirs=n_dirs, n_files=n_files)
+                # if it's a file, collect it to be downloaded concurrently
+                downloads.append(
+                    (
+                        path,
+                        os.path.join(to_local_path, basename),
+                        int(path_attr.get("size", 0)),
+                        int(path_attr.get("modificationTime", 0)),
+                    )
+                )
 
         return n_dirs, n_files
 
@@ -355,13 +361,22 @@ class ServingEngine:
     ):
         """Download files from a model path in hdfs."""
 
+        downloads = []
         n_dirs, n_files = self._download_files_from_hopsfs_recursive(
             from_hdfs_path=from_hdfs_path,
             to_local_path=to_local_path,
             update_download_progress=update_download_progress,
             n_dirs=0,
             n_files=0,
+            downloads=downloads,
         )
+
+        def on_downloaded(local_path):
+            nonlocal n_files
+            n_files += 1
+            update_download_progress(n_dirs=n_dirs, n_files=n_files)
+
+        self._engine.download_many(downloads, on_downloaded=on_downloaded)
         update_download_progress(n_dirs=n_dirs, n_files=n_files, done=True)
 
     def download_artifact_files(self, deployment_instance, local_path=None):
@@ -113,11 +113,20 @@ class Model:
             await_registration: Awaiting time for the model to be registered in Hopsworks.
             keep_original_files: If the model files are located in hopsfs, whether to move or copy those files into the Models dataset. Default is False (i.e., model files will be moved)
             upload_configuration: When saving a model from outside Hopsworks, the model is uploaded to the model registry using the REST APIs. Each model artifact is divided into
-                chunks and each chunk uploaded independently. This parameter can be used to control the upload chunk size, the parallelism and the number of retries.
+                chunks and each chunk uploaded independently. Model files are uploaded concurrently, and folders containing only many small files are uploaded as a single bundle.
+                This parameter can be used to control the upload chunk size, the parallelism, the bundling and the number of retries.
                 `upload_configuration` can contain the following keys:
-                * key `chunk_size`: size of each chunk in megabytes. Default 10.
-                * key `simultaneous_uploads`: number of chunks to upload in parallel. Default 3.
+                * key `chunk_size`: size of each chunk in bytes. Default 10 MB.
+                * key `simultaneous_uploads`: number of files to upload in parallel. Default 8.
+                * key `simultaneous_chunks`: number of chunks of each file to upload in parallel. Default 3.
+                * key `max_bytes_in_flight`: maximum number of bytes uploaded at the same time across all files. Default 160 MB.
                 * key `max_chunk_retries`: number of times to retry the upload of a chunk in case of failure. Default 1.
+                * key `bundle_small_files`: whether to upload folders containing only small files as a single bundle. Default True.
+                * key `bundle_min_files`: minimum number of files in a folder to upload it as a bundle. Default 16.
+                * key `bundle_max_file_size`: maximum size in bytes of the files in a bundle. Default 1 MB.
+                * key `bundle_max_size`: maximum total size in bytes of a bundle. Default 64 MB.
+                * key `deduplicate`: whether to copy files unchanged since the previous model version server-side instead of uploading them.
+                    Files are compared by hash against the manifest saved with the previous version. Default True.
 
         # Returns
             `Model`: The model metadata object.
@@ -169,6 +178,11 @@ class Model:
     def download(self, local_path=None) -> str:
         """Download the model files.
 
+        Files are downloaded concurrently. To reuse files across downloads of the same model version, set the
+        `HOPSWORKS_MODEL_CACHE_DIR` environment variable to a local cache folder, whose size is bounded by
+        `HOPSWORKS_MODEL_CACHE_MAX_SIZE` in bytes (50 GB by default). Cached files are hard linked into `local_path`,
+        so they should not be modified in place.
+
         # Arguments
             local_path: path where to download the model files in the local filesystem
         # Returns
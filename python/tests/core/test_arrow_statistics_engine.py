@@ -0,0 +1,269 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from hsfs.core import arrow_statistics_engine
+from hsfs.core.feature_descriptive_statistics import FeatureDescriptiveStatistics
+
+
+class TestArrowStatisticsEngine:
+    def test_profile_numerical(self):
+        # Arrange
+        df = pd.DataFrame({"fg.col": [1.0, 2.0, 3.0, 4.0, np.nan]})
+
+        # Act
+        result = json.loads(
+            arrow_statistics_engine.ArrowStatisticsEngine.profile(df, histograms=True)
+        )
+
+        # Assert
+        stats = result["columns"][0]
+        assert stats["column"] == "col"
+        assert stats["dataType"] == "Fractional"
+        assert stats["count"] == 5
+        assert stats["numRecordsNull"] == 1
+        assert stats["numRecordsNonNull"] == 4
+        assert stats["completeness"] == 0.8
+        assert stats["approximateNumDistinctValues"] == 4
+        assert stats["sum"] == 10
+        assert stats["stdDev"] == pytest.approx(np.std([1, 2, 3, 4]))
+        assert len(stats["approxPercentiles"]) == 100
+        assert stats["approxPercentiles"][49] == 2.5
+        assert len(stats["histogram"]) == 21
+        assert stats["histogram"][0] == {
+            "value": "1.00 to 1.15",
+            "count": 1,
+            "ratio": 0.2,
+        }
+        assert stats["histogram"][-1] == {
+            "value": "NullValue",
+            "count": 1,
+            "ratio": 0.2,
+        }
+
+    def test_profile_categorical(self):
+        # Arrange
+        df = pd.DataFrame(
+            {
+                "str": pd.Series(["a", "b", "a", None]),
+                "cat": pd.Series(["x", "y", "x", "x"], dtype="category"),
+                "bool": [True, False, True, True],
+            }
+        )
+
+        # Act
+        result = json.loads(
+            arrow_statistics_engine.ArrowStatisticsEngine.profile(
+                df, histograms=True, exact_uniqueness=True
+            )
+        )
+
+        # Assert
+        str_stats, cat_stats, bool_stats = result["columns"]
+        assert str_stats["dataType"] == "String"
+        assert str_stats["numRecordsNull"] == 1
+        assert str_stats["exactNumDistinctValues"] == 2
+        assert str_stats["uniqueness"] == 1 / 3
+        assert str_stats["histogram"] == [
+            {"value": "a", "count": 2, "ratio": 0.5},
+            {"value": "b", "count": 1, "ratio": 0.25},
+            {"value": "NullValue", "count": 1, "ratio": 0.25},
+        ]
+        assert cat_stats["dataType"] == "String"
+        assert cat_stats["approximateNumDistinctValues"] == 2
+        assert bool_stats["dataType"] == "Boolean"
+        assert bool_stats["histogram"][0]["value"] == "true"
+
+    def test_profile_correlations(self):
+        # Arrange
+        df = pd.DataFrame(
+            {"a": [1, 2, 3, 4], "b": [2.0, 4.0, 6.0, 8.0], "c": ["x"] * 4}
+        )
+
+        # Act
+        result = json.loads(
+            arrow_statistics_engine.ArrowStatisticsEngine.profile(df, correlations=True)
+        )
+
+        # Assert
+        a_stats, b_stats, c_stats = result["columns"]
+        assert a_stats["correlations"] == [
+            {"column": "a", "correlation": 1.0},
+            {"column": "b", "correlation": pytest.approx(1.0)},
+        ]
+        assert b_stats["correlations"][0]["column"] == "a"
+        assert "correlations" not in c_stats
+
+    def test_profile_record_batches(self):
+        # Arrange
+        table = pa.table({"a": list(range(10)), "b": [str(i % 3) for i in range(10)]})
+
+        # Act
+        result = json.loads(
+            arrow_statistics_engine.ArrowStatisticsEngine.profile(
+                iter(table.to_batches(max_chunksize=3)), columns=["b"]
+            )
+        )
+
+        # Assert
+        assert [stats["column"] for stats in result["columns"]] == ["b"]
+        assert result["columns"][0]["count"] == 10
+        assert result["columns"][0]["approximateNumDistinctValues"] == 3
+
+    def test_profile_no_record_batches(self):
+        # Act
+        result = json.loads(
+            arrow_statistics_engine.ArrowStatisticsEngine.profile(
+                iter([]), columns=["a"]
+            )
+        )
+
+        # Assert
+        stats = result["columns"][0]
+        assert stats["column"] == "a"
+        assert stats["dataType"] == "String"
+        assert stats["count"] == 0
+
+    def test_profile_integral(self):
+        # Arrange
+        large = 2**62
+        df = pd.DataFrame({"a": pd.array([large, large + 1, None], dtype="Int64")})
+
+        # Act
+        result = json.loads(
+            arrow_statistics_engine.ArrowStatisticsEngine.profile(
+                df, exact_uniqueness=True
+            )
+        )
+
+        # Assert
+        stats = result["columns"][0]
+        assert stats["dataType"] == "Integral"
+        assert stats["numRecordsNull"] == 1
+        assert stats["minimum"] == large
+        assert stats["maximum"] == large + 1
+        assert isinstance(stats["minimum"], int)
+        assert stats["approximateNumDistinctValues"] == 2
+        assert stats["exactNumDistinctValues"] == 2
+
+    def test_profile_infinite_values(self):
+        # Arrange
+        df = pd.DataFrame({"a": [-np.inf, 0.0, 1.0, 2.0, np.inf]})
+
+        # Act
+        result = json.loads(
+            arrow_statistics_engine.ArrowStatisticsEngine.profile(
+                df, histograms=True, num_histogram_bins=2
+            )
+        )
+
+        # Assert
+        stats = result["columns"][0]
+        assert stats["minimum"] == -np.inf
+        assert stats["maximum"] == np.inf
+        assert stats["histogram"] == [
+            {"value": "0.00 to 1.00", "count": 2, "ratio": 0.4},
+            {"value": "1.00 to 2.00", "count": 3, "ratio": 0.6},
+        ]
+
+    def test_merge(self):
+        # Arrange
+        df = pd.DataFrame(
+            {"a": np.arange(100, dtype=np.float64), "b": np.arange(100) % 7}
+        )
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        left = arrow_statistics_engine.ArrowStatisticsEngine(
+            table.schema, correlations=True, exact_uniqueness=True
+        )
+        right = arrow_statistics_engine.ArrowStatisticsEngine(
+            table.schema, correlations=True, exact_uniqueness=True
+        )
+
+        # Act
+        left.update(table.slice(0, 40))
+        right.update(table.slice(40))
+        result = left.merge(right).to_dict()
+
+        # Assert
+        expected = json.loads(
+            arrow_statistics_engine.ArrowStatisticsEngine.profile(
+                df, correlations=True, exact_uniqueness=True
+            )
+        )
+        for stats, expected_stats in zip(result["columns"], expected["columns"]):
+            assert stats.pop("correlations") == [
+                {
+                    "column": correlation["column"],
+                    "correlation": pytest.approx(correlation["correlation"]),
+                }
+                for correlation in expected_stats.pop("correlations")
+            ]
+            assert stats == pytest.approx(expected_stats)
+
+    def test_merge_different_columns(self):
+        # Arrange
+        schema = pa.schema([("a", pa.int64()), ("b", pa.int64())])
+
+        # Act
+        with pytest.raises(ValueError):
+            arrow_statistics_engine.ArrowStatisticsEngine(schema, ["a"]).merge(
+                arrow_statistics_engine.ArrowStatisticsEngine(schema, ["b"])
+            )
+
+    def test_profile_nested(self):
+        # Arrange
+        table = pa.table({"a": [[1, 2], None, [3]]})
+
+        # Act
+        result = json.loads(
+            arrow_statistics_engine.ArrowStatisticsEngine.profile(table)
+        )
+
+        # Assert
+        assert result["columns"][0] == {
+            "column": "a",
+            "dataType": "String",
+            "isDataTypeInferred": "false",
+            "count": 3,
+            "numRecordsNull": 1,
+            "numRecordsNonNull": 2,
+            "completeness": 2 / 3,
+        }
+
+    def test_profile_parsed_as_feature_descriptive_statistics(self):
+        # Arrange
+        df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "y"]})
+
+        # Act
+        result = json.loads(
+            arrow_statistics_engine.ArrowStatisticsEngine.profile(
+                df, correlations=True, histograms=True, exact_uniqueness=True
+            )
+        )
+        desc_stats = [
+            FeatureDescriptiveStatistics.from_deequ_json(stats)
+            for stats in result["columns"]
+        ]
+
+        # Assert
+        assert desc_stats[0].mean == 2
+        assert desc_stats[0].percentiles[49] == 2
+        assert desc_stats[1].exact_num_distinct_values == 2
+        assert "histogram" in desc_stats[1].extended_statistics
@@ -0,0 +1,337 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+import pytest
+from hopsworks_common.client.exceptions import DatasetException, RestAPIError
+from hopsworks_common.core import dataset_api
+
+
+class TestUploadBudget:
+    def test_acquire_waits_for_release(self):
+        # Arrange
+        budget = dataset_api.UploadBudget(10)
+        budget.acquire(8)
+        acquired = threading.Event()
+
+        def acquire():
+            budget.acquire(5)
+            acquired.set()
+
+        # Act
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        waited = not acquired.wait(0.1)
+        budget.release(8)
+        thread.join(1)
+
+        # Assert
+        assert waited
+        assert acquired.is_set()
+
+    def test_acquire_larger_than_budget(self):
+        # Arrange
+        budget = dataset_api.UploadBudget(10)
+
+        # Act
+        budget.acquire(20)
+        budget.release(20)
+        budget.acquire(5)
+
+        # Assert
+        assert budget._bytes_in_flight == 5
+
+
+class TestDatasetApi:
+    def _write_file(self, tmp_path, size):
+        local_path = tmp_path / "model.bin"
+        local_path.write_bytes(bytes(range(256)) * (size // 256) + b"x" * (size % 256))
+        return str(local_path)
+
+    def test_upload_file_chunks(self, mocker, tmp_path):
+        # Arrange
+        mock_upload_request = mocker.patch(
+            "hopsworks_common.core.dataset_api.DatasetApi._upload_request"
+        )
+        local_path = self._write_file(tmp_path, 1000)
+        d_api = dataset_api.DatasetApi()
+
+        # Act
+        d_api._upload_file(
+            "model.bin",
+            local_path,
+            "Models/m/1/Files",
+            300,
+            2,
+            1,
+            0,
+        )
+
+        # Assert
+        calls = sorted(
+            mock_upload_request.call_args_list,
+            key=lambda call: call.args[0]["flowChunkNumber"],
+        )
+        assert [call.args[0]["flowChunkNumber"] for call in calls] == [1, 2, 3, 4]
+        assert [call.args[0]["flowCurrentChunkSize"] for call in calls] == [
+            300,
+            300,
+            300,
+            100,
+        ]
+        assert b"".join(call.args[3] for call in calls) == open(local_path, "rb").read()
+        assert all(call.args[0]["flowTotalChunks"] == 4 for call in calls)
+
+    def test_upload_file_empty(self, mocker, tmp_path):
+        # Arrange
+        mock_upload_request = mocker.patch(
+            "hopsworks_common.core.dataset_api.DatasetApi._upload_request"
+        )
+        local_path = self._write_file(tmp_path, 0)
+        d_api = dataset_api.DatasetApi()
+
+        # Act
+        d_api._upload_file("model.bin", local_path, "Models/m/1/Files", 300, 2, 1, 0)
+
+        # Assert
+        assert mock_upload_request.call_count == 1
+        assert mock_upload_request.call_args.args[3] == b""
+
+    def test_upload_file_sliding_window(self, mocker, tmp_path):
+        # Arrange
+        slow_chunk_started = threading.Event()
+        release_slow_chunk = threading.Event()
+        uploaded = []
+
+        def upload_request(params, path, file_name, chunk):
+            if params["flowChunkNumber"] == 1:
+                slow_chunk_started.set()
+                release_slow_chunk.wait(5)
+            uploaded.append(params["flowChunkNumber"])
+            if len(uploaded) == 4:
+                # all other chunks were uploaded while the first one was in flight
+                release_slow_chunk.set()
+
+        mocker.patch(
+            "hopsworks_common.core.dataset_api.DatasetApi._upload_request",
+            side_effect=upload_request,
+        )
+        local_path = self._write_file(tmp_path, 500)
+        d_api = dataset_api.DatasetApi()
+
+        # Act
+        d_api._upload_file("model.bin", local_path, "Models/m/1/Files", 100, 2, 1, 0)
+
+        # Assert
+        assert slow_chunk_started.is_set()
+        assert uploaded == [2, 3, 4, 5, 1]
+
+    def test_upload_file_budget_released(self, mocker, tmp_path):
+        # Arrange
+        mocker.patch("hopsworks_common.core.dataset_api.DatasetApi._upload_request")
+        local_path = self._write_file(tmp_path, 1000)
+        d_api = dataset_api.DatasetApi()
+        budget = dataset_api.UploadBudget(300)
+        mock_acquire = mocker.spy(budget, "acquire")
+
+        # Act
+        d_api._upload_file(
+            "model.bin",
+            local_path,
+            "Models/m/1/Files",
+            300,
+            3,
+            1,
+            0,
+            upload_budget=budget,
+        )
+
+        # Assert
+        assert mock_acquire.call_count == 4
+        assert budget._bytes_in_flight == 0
+
+    def test_upload_file_failure(self, mocker, tmp_path):
+        # Arrange
+        response = mocker.Mock(status_code=500)
+        response.json.return_value = {}
+
+        def upload_request(params, path, file_name, chunk):
+            if params["flowChunkNumber"] == 2:
+                raise RestAPIError("url", response)
+            time.sleep(0.01)
+
+        mocker.patch(
+            "hopsworks_common.core.dataset_api.DatasetApi._upload_request",
+            side_effect=upload_request,
+        )
+        local_path = self._write_file(tmp_path, 1000)
+        d_api = dataset_api.DatasetApi()
+        budget = dataset_api.UploadBudget(200)
+
+        # Act
+        with pytest.raises(RestAPIError):
+            d_api._upload_file(
+                "model.bin",
+                local_path,
+                "Models/m/1/Files",
+                100,
+                2,
+                1,
+                0,
+                upload_budget=budget,
+            )
+
+        # Assert
+        assert budget._bytes_in_flight == 0
+
+    def _mock_download_requests(self, mocker, content, supports_ranges=True):
+        requested_ranges = []
+
+        def send_download_request(path, headers=None):
+            response = mocker.MagicMock()
+            response.__enter__.return_value = response
+            if headers is not None and supports_ranges:
+                start, end = headers["Range"][len("bytes=") :].split("-")
+                requested_ranges.append((int(start), int(end)))
+                response.status_code = 206
+                body = content[int(start) : int(end) + 1]
+            else:
+                response.status_code = 200
+                body = content
+            response.iter_content.return_value = [
+                body[i : i + 64] for i in range(0, len(body), 64)
+            ]
+            return response
+
+        mocker.patch(
+            "hopsworks_common.core.dataset_api.DatasetApi._send_download_request",
+            side_effect=send_download_request,
+        )
+        return requested_ranges
+
+    def test_download_file_ranges(self, mocker, tmp_path):
+        # Arrange
+        content = bytes(range(256)) * 4
+        requested_ranges = self._mock_download_requests(mocker, content)
+        local_path = str(tmp_path / "model.bin")
+        d_api = dataset_api.DatasetApi()
+
+        # Act
+        d_api._download_file(
+            "Models/m/1/Files/model.bin",
+            local_path,
+            len(content),
+            show_progress=False,
+            simultaneous_ranges=2,
+            range_size=300,
+            sha256=hashlib.sha256(content).hexdigest(),
+        )
+
+        # Assert
+        assert sorted(requested_ranges) == [
+            (0, 299),
+            (300, 599),
+            (600, 899),
+            (900, 1023),
+        ]
+        with open(local_path, "rb") as f:
+            assert f.read() == content
+        assert os.listdir(tmp_path) == ["model.bin"]
+
+    def test_download_file_ranges_resume(self, mocker, tmp_path):
+        # Arrange
+        content = bytes(range(256)) * 4
+        requested_ranges = self._mock_download_requests(mocker, content)
+        local_path = str(tmp_path / "model.bin")
+        with open(local_path + ".part", "wb") as f:
+            f.write(content[:300] + b"\0" * 724)
+        with open(local_path + ".part.json", "w") as f:
+            json.dump(
+                {
+                    "path": "Models/m/1/Files/model.bin",
+                    "size": 1024,
+                    "range_size": 300,
+                    "modification_time": 1000,
+                    "completed": [0],
+                },
+                f,
+            )
+        d_api = dataset_api.DatasetApi()
+
+        # Act
+        d_api._download_file(
+            "Models/m/1/Files/model.bin",
+            local_path,
+            len(content),
+            show_progress=False,
+            simultaneous_ranges=2,
+            range_size=300,
+            modification_time=1000,
+        )
+
+        # Assert
+        assert sorted(requested_ranges) == [(300, 599), (600, 899), (900, 1023)]
+        with open(local_path, "rb") as f:
+            assert f.read() == content
+
+    def test_download_file_ranges_not_supported(self, mocker, tmp_path):
+        # Arrange
+        content = bytes(range(256)) * 4
+        self._mock_download_requests(mocker, content, supports_ranges=False)
+        local_path = str(tmp_path / "model.bin")
+        d_api = dataset_api.DatasetApi()
+
+        # Act
+        d_api._download_file(
+            "Models/m/1/Files/model.bin",
+            local_path,
+            len(content),
+            show_progress=False,
+            simultaneous_ranges=2,
+            range_size=300,
+        )
+
+        # Assert
+        with open(local_path, "rb") as f:
+            assert f.read() == content
+        assert os.listdir(tmp_path) == ["model.bin"]
+
+    def test_download_file_checksum_mismatch(self, mocker, tmp_path):
+        # Arrange
+        content = bytes(range(256)) * 4
+        self._mock_download_requests(mocker, content)
+        local_path = str(tmp_path / "model.bin")
+        d_api = dataset_api.DatasetApi()
+
+        # Act
+        with pytest.raises(DatasetException):
+            d_api._download_file(
+                "Models/m/1/Files/model.bin",
+                local_path,
+                len(content),
+                show_progress=False,
+                simultaneous_ranges=2,
+                range_size=300,
+                sha256=hashlib.sha256(b"other").hexdigest(),
+            )
+
+        # Assert
+        assert os.listdir(tmp_path) == []
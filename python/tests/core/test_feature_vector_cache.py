@@ -0,0 +1,129 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import pytest
+from hsfs.core.feature_vector_cache import FeatureVectorCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestFeatureVectorCache:
+    def test_get_put(self):
+        # Arrange
+        cache = FeatureVectorCache()
+        key = cache.make_key({"id": 1}, "sql", False)
+
+        # Act
+        miss = cache.get(key)
+        cache.put(key, {"id": 1, "amount": 10})
+        hit = cache.get(key)
+
+        # Assert
+        assert miss is None
+        assert hit == {"id": 1, "amount": 10}
+        assert cache.stats == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+    def test_get_returns_copy(self):
+        # Arrange
+        cache = FeatureVectorCache()
+        key = cache.make_key({"id": 1})
+        cache.put(key, {"id": 1, "amount": 10})
+
+        # Act
+        cache.get(key)["amount"] = 20
+
+        # Assert
+        assert cache.get(key) == {"id": 1, "amount": 10}
+
+    def test_make_key(self):
+        # Act
+        key = FeatureVectorCache.make_key({"a": 1, "b": 2}, "sql")
+        same_key = FeatureVectorCache.make_key({"b": 2, "a": 1}, "sql")
+        other_client_key = FeatureVectorCache.make_key({"a": 1, "b": 2}, "rest")
+        unhashable_key = FeatureVectorCache.make_key({"a": [1, 2]}, "sql")
+
+        # Assert
+        assert key == same_key
+        assert key != other_client_key
+        assert unhashable_key is None
+
+    def test_lru_eviction(self):
+        # Arrange
+        cache = FeatureVectorCache(max_size=2)
+        cache.put("a", {"id": "a"})
+        cache.put("b", {"id": "b"})
+        cache.get("a")
+
+        # Act
+        cache.put("c", {"id": "c"})
+
+        # Assert
+        assert cache.get("b") is None
+        assert cache.get("a") == {"id": "a"}
+        assert cache.get("c") == {"id": "c"}
+        assert cache.stats["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        # Arrange
+        clock = FakeClock()
+        cache = FeatureVectorCache(ttl=10, clock=clock)
+        cache.put("a", {"id": "a"})
+
+        # Act
+        clock.now = 9.9
+        before_expiry = cache.get("a")
+        clock.now = 10
+        after_expiry = cache.get("a")
+
+        # Assert
+        assert before_expiry == {"id": "a"}
+        assert after_expiry is None
+        assert cache.stats["size"] == 0
+
+    def test_empty_result_not_cached(self):
+        # Arrange
+        cache = FeatureVectorCache()
+
+        # Act
+        cache.put("a", {})
+
+        # Assert
+        assert cache.stats["size"] == 0
+
+    def test_from_config(self):
+        # Act
+        cache = FeatureVectorCache.from_config({"max_size": 5, "ttl": 30})
+        default_cache = FeatureVectorCache.from_config({})
+
+        # Assert
+        assert cache.max_size == 5
+        assert cache.ttl == 30
+        assert default_cache.max_size == FeatureVectorCache.DEFAULT_MAX_SIZE
+        assert default_cache.ttl == FeatureVectorCache.DEFAULT_TTL
+
+    def test_invalid_config(self):
+        # Act
+        with pytest.raises(ValueError) as exception:
+            FeatureVectorCache(max_size=0)
+
+        # Assert
+        assert "max_size" in str(exception.value)
@@ -618,3 +618,49 @@ class TestGreatExpectationEngine:
                 dataframe=df,
                 expectation_suite=suite,
             )
+
+    def test_validate_native_validation(self, mocker):
+        # Arrange
+        ge_engine = great_expectation_engine.GreatExpectationEngine(feature_store_id=11)
+        mocker.patch("hsfs.engine.get_type")
+        mock_engine_get_instance = mocker.patch("hsfs.engine.get_instance")
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=11,
+            partition_key=[],
+            primary_key=["id"],
+        )
+        df = pd.DataFrame({"id": [1, None], "name": ["Alice", "Bob"]})
+        suite = es.ExpectationSuite(
+            expectation_suite_name="suite_name",
+            expectations=[
+                {
+                    "expectation_type": "expect_column_values_to_not_be_null",
+                    "kwargs": {"column": "id"},
+                    "meta": {},
+                }
+            ],
+            meta={},
+            run_validation=True,
+        )
+
+        # Act
+        report = ge_engine.validate(
+            feature_group=fg,
+            dataframe=df,
+            expectation_suite=suite,
+            validation_options={"native_validation": True},
+            ge_type=False,
+            ingestion_result="INGESTED",
+        )
+
+        # Assert
+        assert (
+            mock_engine_get_instance.return_value.validate_with_great_expectations.call_count
+            == 0
+        )
+        assert isinstance(report, validation_report.ValidationReport)
+        assert report.success is False
+        assert report.ingestion_result == "INGESTED"
+        assert report.results[0].result["unexpected_count"] == 1
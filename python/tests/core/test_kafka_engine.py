@@ -14,7 +14,14 @@
 #   limitations under the License.
 #
 import importlib
-
+import json
+import math
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
 from hopsworks_common.core import constants
 from hsfs import feature_group, storage_connector
 from hsfs.core import kafka_engine, online_ingestion
@@ -83,6 +90,125 @@ class TestKafkaEngine:
         assert len(result) == 2
         assert result == {"one": b"1", "two": b"2"}
 
+    @staticmethod
+    def _encoding_feature_group(mocker):
+        feature_group = mocker.Mock()
+        feature_group.primary_key = ["id", "region"]
+        feature_group._get_encoded_avro_schema.return_value = json.dumps(
+            {
+                "type": "record",
+                "name": "test_fg",
+                "fields": [
+                    {"name": "id", "type": ["null", "long"]},
+                    {"name": "region", "type": ["null", "string"]},
+                    {
+                        "name": "ts",
+                        "type": [
+                            "null",
+                            {"type": "long", "logicalType": "timestamp-micros"},
+                        ],
+                    },
+                    {"name": "values", "type": ["null", "bytes"]},
+                ],
+            }
+        )
+        feature_group._get_feature_avro_schema.return_value = json.dumps(
+            ["null", {"type": "array", "items": ["null", "double"]}]
+        )
+        return feature_group
+
+    def test_normalize_dataframe_columns(self):
+        # Arrange
+        df = pd.DataFrame(
+            {
+                "ts": pd.to_datetime(["2022-07-03 00:00:00", None]),
+                "amount": [1.5, float("nan")],
+                "count": pd.array([1, None], dtype="Int64"),
+                "values": [np.array([1.0, 2.0]), None],
+            }
+        )
+
+        # Act
+        columns = kafka_engine.normalize_dataframe_columns(df)
+
+        # Assert
+        assert columns["ts"] == [datetime(2022, 7, 3, tzinfo=timezone.utc), None]
+        assert columns["amount"][0] == 1.5 and math.isnan(columns["amount"][1])
+        assert columns["count"] == [1, None]
+        assert columns["values"] == [[1.0, 2.0], None]
+
+    def test_build_kafka_keys(self):
+        # Act
+        keys = kafka_engine.build_kafka_keys(
+            {"region": ["eu", "us"], "id": [1, 2]}, ["region", "id"], 2
+        )
+
+        # Assert
+        assert keys == ["1eu", "2us"]
+
+    @pytest.mark.parametrize("num_processes", [None, 2])
+    def test_encode_dataframe(self, mocker, num_processes):
+        # Arrange
+        feature_group = self._encoding_feature_group(mocker)
+        feature_writers = {
+            "values": kafka_engine.get_encoder_func(
+                feature_group._get_feature_avro_schema("values")
+            )
+        }
+        writer = kafka_engine.get_encoder_func(feature_group._get_encoded_avro_schema())
+        df = pd.DataFrame(
+            {
+                "id": list(range(5)),
+                "region": ["eu", "us", None, "eu", "us"],
+                "ts": pd.date_range("2022-07-03", periods=5, freq="h"),
+                "values": [np.array([float(i), 1.0]) for i in range(5)],
+            }
+        )
+        expected = [
+            (
+                f"{i}{row['region']}",
+                kafka_engine.encode_row(dict(feature_writers), writer, dict(row)),
+            )
+            for i, row in enumerate(df.to_dict(orient="records"))
+        ]
+
+        # Act
+        result = list(
+            kafka_engine.encode_dataframe(
+                feature_group,
+                df,
+                feature_writers,
+                writer,
+                chunk_size=2,
+                num_processes=num_processes,
+            )
+        )
+
+        # Assert
+        assert result == expected
+
+    def test_encode_dataframe_polars(self, mocker):
+        # Arrange
+        feature_group = self._encoding_feature_group(mocker)
+        writer = kafka_engine.get_encoder_func(feature_group._get_encoded_avro_schema())
+        df = pl.DataFrame(
+            {
+                "id": [1, 2, 3],
+                "region": ["eu", "us", "eu"],
+                "ts": [datetime(2022, 7, 3), None, datetime(2022, 7, 4)],
+                "values": [None, None, None],
+            }
+        )
+
+        # Act
+        result = list(kafka_engine.encode_dataframe(feature_group, df, {}, writer))
+
+        # Assert
+        assert result == [
+            (f"{row['id']}{row['region']}", kafka_engine.encode_row({}, writer, row))
+            for row in df.iter_rows(named=True)
+        ]
+
     def test_get_encoder_func(self, mocker):
         # Arrange
         mock_json_loads = mocker.patch("json.loads")
@@ -0,0 +1,144 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import os
+
+from hsml.core import model_file_cache
+
+
+MODIFICATION_TIME = 1700000000000
+
+
+class TestModelFileCache:
+    def _store(self, cache, tmp_path, name, content):
+        local_path = tmp_path / name
+        local_path.write_bytes(content)
+        key = cache.get_key(
+            "/Projects/p/Models/m/1/Files/" + name, len(content), MODIFICATION_TIME
+        )
+        cache.store(key, str(local_path), MODIFICATION_TIME)
+        return key
+
+    def test_from_env(self, monkeypatch, tmp_path):
+        # Arrange
+        monkeypatch.setenv("HOPSWORKS_MODEL_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.setenv("HOPSWORKS_MODEL_CACHE_MAX_SIZE", "1024")
+
+        # Act
+        cache = model_file_cache.ModelFileCache.from_env()
+
+        # Assert
+        assert cache.cache_dir == str(tmp_path / "cache")
+        assert cache.max_size == 1024
+
+    def test_from_env_disabled(self, monkeypatch):
+        # Arrange
+        monkeypatch.delenv("HOPSWORKS_MODEL_CACHE_DIR", raising=False)
+
+        # Act
+        cache = model_file_cache.ModelFileCache.from_env()
+
+        # Assert
+        assert cache is None
+
+    def test_get_key(self, tmp_path):
+        # Arrange
+        cache = model_file_cache.ModelFileCache(str(tmp_path / "cache"))
+
+        # Act
+        key = cache.get_key("/Projects/p/Models/m/1/Files/a", 10, MODIFICATION_TIME)
+
+        # Assert
+        assert key == cache.get_key(
+            "/Projects/p/Models/m/1/Files/a", 10, MODIFICATION_TIME
+        )
+        assert key != cache.get_key(
+            "/Projects/p/Models/m/2/Files/a", 10, MODIFICATION_TIME
+        )
+        assert key != cache.get_key(
+            "/Projects/p/Models/m/1/Files/a", 11, MODIFICATION_TIME
+        )
+        assert key != cache.get_key(
+            "/Projects/p/Models/m/1/Files/a", 10, MODIFICATION_TIME + 1000
+        )
+
+    def test_materialize(self, tmp_path):
+        # Arrange
+        cache = model_file_cache.ModelFileCache(str(tmp_path / "cache"))
+        key = self._store(cache, tmp_path, "weights.bin", b"0123456789")
+        target_path = str(tmp_path / "target.bin")
+
+        # Act
+        found = cache.materialize(key, target_path, 10, MODIFICATION_TIME)
+
+        # Assert
+        assert found
+        with open(target_path, "rb") as f:
+            assert f.read() == b"0123456789"
+        assert os.stat(target_path).st_ino == os.stat(tmp_path / "weights.bin").st_ino
+
+    def test_materialize_missing(self, tmp_path):
+        # Arrange
+        cache = model_file_cache.ModelFileCache(str(tmp_path / "cache"))
+
+        # Act
+        found = cache.materialize(
+            cache.get_key("/Projects/p/Models/m/1/Files/a", 10, MODIFICATION_TIME),
+            str(tmp_path / "target.bin"),
+            10,
+            MODIFICATION_TIME,
+        )
+
+        # Assert
+        assert not found
+        assert not os.path.exists(tmp_path / "target.bin")
+
+    def test_materialize_modified_locally(self, tmp_path):
+        # Arrange
+        cache = model_file_cache.ModelFileCache(str(tmp_path / "cache"))
+        key = self._store(cache, tmp_path, "weights.bin", b"0123456789")
+        # the downloaded file is a hard link of the cached file
+        with open(tmp_path / "weights.bin", "r+b") as f:
+            f.write(b"9876543210")
+
+        # Act
+        found = cache.materialize(
+            key, str(tmp_path / "target.bin"), 10, MODIFICATION_TIME
+        )
+
+        # Assert
+        assert not found
+        assert not os.path.exists(tmp_path / "target.bin")
+
+    def test_evict(self, tmp_path):
+        # Arrange
+        cache = model_file_cache.ModelFileCache(str(tmp_path / "cache"), max_size=25)
+        key_1 = self._store(cache, tmp_path, "a.bin", b"0" * 10)
+        key_2 = self._store(cache, tmp_path, "b.bin", b"1" * 10)
+        key_3 = self._store(cache, tmp_path, "c.bin", b"2" * 10)
+        for key, access_time in [(key_1, 300), (key_2, 100), (key_3, 200)]:
+            path = cache._get_path(key)
+            os.utime(path, (access_time, os.stat(path).st_mtime))
+
+        # Act
+        cache.evict()
+
+        # Assert
+        assert os.path.exists(cache._get_path(key_1))
+        assert not os.path.exists(cache._get_path(key_2))
+        assert os.path.exists(cache._get_path(key_3))
+        # evicting cached files does not remove downloaded files
+        assert os.path.exists(tmp_path / "b.bin")
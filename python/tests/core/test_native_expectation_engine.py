@@ -0,0 +1,270 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import datetime
+import decimal
+import json
+
+import hsfs.expectation_suite as es
+import pandas as pd
+import pytest
+from hopsworks_common.core.constants import HAS_POLARS
+from hsfs.core import native_expectation_engine
+from hsfs.core.constants import HAS_GREAT_EXPECTATIONS
+from hsfs.engine import python
+
+
+if HAS_GREAT_EXPECTATIONS:
+    import great_expectations
+
+if HAS_POLARS:
+    import polars as pl
+
+
+EXPECTATIONS = [
+    ("expect_column_values_to_not_be_null", {"column": "amount"}),
+    (
+        "expect_column_values_to_be_between",
+        {"column": "amount", "min_value": 1, "max_value": 10, "mostly": 0.5},
+    ),
+    (
+        "expect_column_values_to_be_between",
+        {"column": "amount", "min_value": 1, "max_value": 4, "strict_min": True},
+    ),
+    (
+        "expect_column_values_to_be_in_set",
+        {"column": "name", "value_set": ["ab", "cd"]},
+    ),
+    ("expect_column_values_to_be_unique", {"column": "name"}),
+    ("expect_column_values_to_match_regex", {"column": "name", "regex": "^[a-z]+$"}),
+    (
+        "expect_column_mean_to_be_between",
+        {"column": "amount", "min_value": 1, "max_value": 10},
+    ),
+    ("expect_column_stdev_to_be_between", {"column": "amount", "min_value": 1}),
+]
+
+
+class TestNativeExpectationEngine:
+    def _build_suite(self, expectations):
+        return es.ExpectationSuite(
+            expectation_suite_name="suite_name",
+            expectations=[
+                {"expectation_type": expectation_type, "kwargs": kwargs, "meta": {}}
+                for expectation_type, kwargs in expectations
+            ],
+            meta={},
+        )
+
+    def _build_dataframe(self):
+        return pd.DataFrame(
+            {
+                "amount": [1, 2, None, 4, 4, 100],
+                "name": ["ab", "cd", None, "x1", "zz", "ab"],
+            }
+        )
+
+    def test_is_supported(self):
+        # Arrange
+        engine = native_expectation_engine.NativeExpectationEngine()
+        suite = self._build_suite(
+            [
+                ("expect_column_values_to_not_be_null", {"column": "amount"}),
+                ("expect_column_max_to_be_between", {"column": "amount"}),
+                (
+                    "expect_column_values_to_not_be_null",
+                    {"column": "amount", "result_format": "COMPLETE"},
+                ),
+                (
+                    "expect_column_values_to_be_between",
+                    {"column": "amount", "min_value": {"$PARAMETER": "min_amount"}},
+                ),
+            ]
+        )
+
+        # Act
+        supported = [
+            engine.is_supported(expectation) for expectation in suite.expectations
+        ]
+
+        # Assert
+        assert supported == [True, False, False, False]
+
+    def test_validate(self):
+        # Arrange
+        engine = native_expectation_engine.NativeExpectationEngine()
+
+        # Act
+        report = engine.validate(
+            self._build_dataframe(), self._build_suite(EXPECTATIONS)
+        )
+
+        # Assert
+        assert report.success is False
+        assert [result.success for result in report.results] == [
+            False,
+            True,
+            False,
+            False,
+            False,
+            False,
+            False,
+            True,
+        ]
+        assert report.results[1].result == pytest.approx(
+            {
+                "element_count": 6,
+                "missing_count": 1,
+                "missing_percent": 100 / 6,
+                "unexpected_count": 1,
+                "unexpected_percent": 20.0,
+                "unexpected_percent_total": 100 / 6,
+                "unexpected_percent_nonmissing": 20.0,
+                "partial_unexpected_list": [100.0],
+            }
+        )
+        assert report.results[4].result["partial_unexpected_list"] == ["ab", "ab"]
+        assert report.results[6].result["observed_value"] == pytest.approx(22.2)
+        assert report.statistics == {
+            "evaluated_expectations": 8,
+            "successful_expectations": 2,
+            "unsuccessful_expectations": 6,
+            "success_percent": 25.0,
+        }
+
+    def test_validate_json_serializable_results(self):
+        # Arrange
+        engine = native_expectation_engine.NativeExpectationEngine()
+        timestamp = datetime.datetime(2024, 1, 1, 12, 30)
+        df = pd.DataFrame(
+            {
+                "event_time": [timestamp, timestamp, datetime.datetime(2024, 1, 2)],
+                "price": [decimal.Decimal("1.50"), decimal.Decimal("1.50"), None],
+            }
+        )
+        suite = self._build_suite(
+            [
+                ("expect_column_values_to_be_unique", {"column": "event_time"}),
+                ("expect_column_values_to_be_unique", {"column": "price"}),
+                (
+                    "expect_column_mean_to_be_between",
+                    {"column": "price", "min_value": 2},
+                ),
+            ]
+        )
+
+        # Act
+        report = engine.validate(df, suite)
+
+        # Assert
+        assert [
+            result.result["partial_unexpected_list"] for result in report.results[:2]
+        ] == [
+            ["2024-01-01T12:30:00", "2024-01-01T12:30:00"],
+            [1.5, 1.5],
+        ]
+        assert report.results[2].result["observed_value"] == 1.5
+        json.loads(report.json())
+
+    @pytest.mark.skipif(
+        not HAS_GREAT_EXPECTATIONS, reason="Great Expectations is not installed"
+    )
+    @pytest.mark.parametrize("dataframe_type", ["pandas", "polars"])
+    def test_validate_same_results_as_great_expectations(self, dataframe_type):
+        # Arrange
+        if dataframe_type == "polars" and not HAS_POLARS:
+            pytest.skip("polars is not installed")
+        engine = native_expectation_engine.NativeExpectationEngine()
+        df = self._build_dataframe()
+        suite = self._build_suite(EXPECTATIONS)
+
+        # Act
+        report = engine.validate(
+            df if dataframe_type == "pandas" else pl.from_pandas(df), suite
+        )
+        ge_report = great_expectations.from_pandas(
+            df, expectation_suite=suite.to_ge_type()
+        ).validate()
+
+        # Assert
+        ge_results = {
+            (
+                result.expectation_config.expectation_type,
+                str(result.expectation_config.kwargs),
+            ): result.to_json_dict()
+            for result in ge_report.results
+        }
+        for result in report.results:
+            ge_result = ge_results[
+                (
+                    result.expectation_config["expectation_type"],
+                    str(result.expectation_config["kwargs"]),
+                )
+            ]
+            assert result.success == ge_result["success"]
+            assert result.result == pytest.approx(ge_result["result"])
+        assert report.statistics == ge_report.statistics
+
+    @pytest.mark.skipif(
+        not HAS_GREAT_EXPECTATIONS, reason="Great Expectations is not installed"
+    )
+    def test_validate_fallback_to_great_expectations(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine.get_instance", return_value=python.Engine())
+        mock_validate_with_great_expectations = mocker.spy(
+            python.Engine, "validate_with_great_expectations"
+        )
+        engine = native_expectation_engine.NativeExpectationEngine()
+        suite = self._build_suite(
+            [
+                ("expect_column_values_to_not_be_null", {"column": "amount"}),
+                (
+                    "expect_column_max_to_be_between",
+                    {"column": "amount", "max_value": 10},
+                ),
+                # regex with a lookahead is not supported by pyarrow
+                (
+                    "expect_column_values_to_match_regex",
+                    {"column": "name", "regex": "^(?!x)"},
+                ),
+                ("expect_column_values_to_be_unique", {"column": "amount"}),
+            ]
+        )
+
+        # Act
+        report = engine.validate(self._build_dataframe(), suite)
+
+        # Assert
+        ge_suite = mock_validate_with_great_expectations.call_args.kwargs[
+            "expectation_suite"
+        ]
+        assert [
+            expectation.expectation_type for expectation in ge_suite.expectations
+        ] == ["expect_column_max_to_be_between", "expect_column_values_to_match_regex"]
+        assert [
+            result.expectation_config["expectation_type"] for result in report.results
+        ] == [
+            "expect_column_values_to_not_be_null",
+            "expect_column_max_to_be_between",
+            "expect_column_values_to_match_regex",
+            "expect_column_values_to_be_unique",
+        ]
+        assert [result.success for result in report.results] == [
+            False,
+            False,
+            False,
+            False,
+        ]
@@ -82,3 +82,39 @@ class TestOnlineStoreRestClientApi:
         # Act
         with pytest.raises(online_store_rest_client_api.exceptions.RestAPIError):
             online_rest_api.handle_rdrs_feature_store_response(response)
+
+    def test_handle_rdrs_feature_store_response_ok(self, mocker):
+        # Arrange
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"features": [["APPL", 21.3]], "status": ["COMPLETE"]}'
+        mock_decoder = mocker.MagicMock(side_effect=json.loads)
+        mocker.patch(
+            "hsfs.core.online_store_rest_client_api.get_json_decoder",
+            return_value=mock_decoder,
+        )
+        online_rest_api = online_store_rest_client_api.OnlineStoreRestClientApi()
+
+        # Act
+        response_json = online_rest_api.handle_rdrs_feature_store_response(response)
+
+        # Assert
+        assert response_json == {"features": [["APPL", 21.3]], "status": ["COMPLETE"]}
+        mock_decoder.assert_called_once_with(response.content)
+
+    def test_get_json_decoder(self):
+        # Act
+        decoder = online_store_rest_client_api.get_json_decoder(
+            online_store_rest_client_api.JSON_DECODER_JSON
+        )
+
+        # Assert
+        assert decoder is json.loads
+        assert online_store_rest_client_api.get_json_decoder()(b'{"a": [1]}') == {
+            "a": [1]
+        }
+
+    def test_get_json_decoder_unknown(self):
+        # Act
+        with pytest.raises(ValueError):
+            online_store_rest_client_api.get_json_decoder("ujson")
@@ -14,8 +14,11 @@
 #   limitations under the License.
 #
 
+from datetime import datetime
+
 import pytest
 from hsfs import training_dataset_feature
+from hsfs.client import exceptions
 from hsfs.core import online_store_rest_client_engine
 
 
@@ -254,6 +257,60 @@ class TestOnlineRestClientEngine:
         # Assert
         assert feature_vector_dict == reference_feature_vector
 
+    def test_convert_rdrs_response_to_feature_vector_row_decode_timestamps(
+        self, training_dataset_features_ticker
+    ):
+        # Arrange
+        rest_client_engine = (
+            online_store_rest_client_engine.OnlineStoreRestClientEngine(
+                feature_store_name="test_store_featurestore",
+                feature_view_name="test_feature_view",
+                feature_view_version=2,
+                features=training_dataset_features_ticker,
+                decode_timestamps=True,
+            )
+        )
+
+        # Act
+        feature_vector_dict = rest_client_engine.convert_rdrs_response_to_feature_value_row(
+            row_feature_values=["APPL", "2022-01-01 00:00:00", 21.3, 10],
+            return_type=online_store_rest_client_engine.OnlineStoreRestClientEngine.RETURN_TYPE_FEATURE_VALUE_DICT,
+            drop_missing=False,
+        )
+        # passed features given as datetime are returned as milliseconds
+        feature_vector_list = rest_client_engine.convert_rdrs_response_to_feature_value_row(
+            row_feature_values=["GOOG", 1640995200000, None, 43],
+            return_type=online_store_rest_client_engine.OnlineStoreRestClientEngine.RETURN_TYPE_FEATURE_VALUE_LIST,
+            drop_missing=False,
+        )
+
+        # Assert
+        assert feature_vector_dict == {
+            "ticker": "APPL",
+            "when": datetime(2022, 1, 1),
+            "price": 21.3,
+            "volume": 10,
+        }
+        assert feature_vector_list == ["GOOG", datetime(2022, 1, 1), None, 43]
+
+    def test_convert_rdrs_response_to_feature_vector_row_drop_failed_feature_group(
+        self,
+        rest_client_engine_ticker: online_store_rest_client_engine.OnlineStoreRestClientEngine,
+    ):
+        # Arrange
+        fg_id = rest_client_engine_ticker.features[0].feature_group.id
+
+        # Act
+        feature_vector_dict = rest_client_engine_ticker.convert_rdrs_response_to_feature_value_row(
+            row_feature_values=["APPL", None, None, None],
+            detailed_status=[{"featureGroupId": fg_id, "httpStatus": 404}],
+            return_type=online_store_rest_client_engine.OnlineStoreRestClientEngine.RETURN_TYPE_FEATURE_VALUE_DICT,
+            drop_missing=True,
+        )
+
+        # Assert
+        assert feature_vector_dict == {}
+
     def test_get_batch_feature_vectors_response_json(
         self,
         mocker,
@@ -407,3 +464,157 @@ class TestOnlineRestClientEngine:
         # Assert
         assert batch_vectors == reference_batch_vectors
         assert mock_online_rest_api.called_once_with(payload=payload)
+
+    @staticmethod
+    def _echo_batch_response(payload):
+        # one feature vector per entry, with the passed price if any
+        return {
+            "features": [
+                [entry["ticker"], "2022-01-01 00:00:00", passed.get("price"), 1]
+                for entry, passed in zip(
+                    payload["entries"],
+                    payload["passedFeatures"] or [{}] * len(payload["entries"]),
+                )
+            ],
+            "metadata": None,
+            "status": ["COMPLETE"] * len(payload["entries"]),
+        }
+
+    def test_get_batch_feature_vectors_in_chunks(
+        self, mocker, training_dataset_features_ticker
+    ):
+        # Arrange
+        rest_client_engine = (
+            online_store_rest_client_engine.OnlineStoreRestClientEngine(
+                feature_store_name="test_store_featurestore",
+                feature_view_name="test_feature_view",
+                feature_view_version=2,
+                features=training_dataset_features_ticker,
+                batch_chunk_size=3,
+                batch_max_parallel_requests=2,
+            )
+        )
+        mock_online_rest_api = mocker.patch(
+            ONLINE_STORE_REST_CLIENT_API_GET_BATCH_RAW_FEATURE_VECTORS,
+            side_effect=self._echo_batch_response,
+        )
+        entries = [{"ticker": f"T{i}"} for i in range(10)]
+        passed_features = [{"price": float(i)} for i in range(10)]
+
+        # Act
+        batch_vectors = rest_client_engine.get_batch_feature_vectors(
+            entries=entries,
+            passed_features=passed_features,
+            return_type=online_store_rest_client_engine.OnlineStoreRestClientEngine.RETURN_TYPE_FEATURE_VALUE_LIST,
+        )
+
+        # Assert
+        assert mock_online_rest_api.call_count == 4
+        assert sorted(
+            len(call.kwargs["payload"]["entries"])
+            for call in mock_online_rest_api.call_args_list
+        ) == [1, 3, 3, 3]
+        assert batch_vectors == [
+            [f"T{i}", "2022-01-01 00:00:00", float(i), 1] for i in range(10)
+        ]
+
+    def test_close_shuts_down_batch_executor(
+        self, mocker, training_dataset_features_ticker
+    ):
+        # Arrange
+        rest_client_engine = (
+            online_store_rest_client_engine.OnlineStoreRestClientEngine(
+                feature_store_name="test_store_featurestore",
+                feature_view_name="test_feature_view",
+                feature_view_version=2,
+                features=training_dataset_features_ticker,
+                batch_chunk_size=2,
+            )
+        )
+        mocker.patch(
+            ONLINE_STORE_REST_CLIENT_API_GET_BATCH_RAW_FEATURE_VECTORS,
+            side_effect=self._echo_batch_response,
+        )
+        rest_client_engine.get_batch_feature_vectors(
+            entries=[{"ticker": f"T{i}"} for i in range(4)]
+        )
+        batch_executor = rest_client_engine._batch_executor
+
+        # Act
+        rest_client_engine.close()
+
+        # Assert
+        assert rest_client_engine._batch_executor is None
+        for thread in batch_executor._threads:
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+
+    def test_get_batch_feature_vectors_chunk_retry(
+        self, mocker, training_dataset_features_ticker
+    ):
+        # Arrange
+        rest_client_engine = (
+            online_store_rest_client_engine.OnlineStoreRestClientEngine(
+                feature_store_name="test_store_featurestore",
+                feature_view_name="test_feature_view",
+                feature_view_version=2,
+                features=training_dataset_features_ticker,
+                batch_chunk_size=2,
+                batch_chunk_retries=1,
+            )
+        )
+        mocker.patch("time.sleep")
+        server_error = mocker.MagicMock()
+        server_error.status_code = 503
+        attempts = []
+
+        def flaky_batch_response(payload):
+            attempts.append(payload["entries"][0]["ticker"])
+            if payload["entries"][0]["ticker"] == "T2" and attempts.count("T2") == 1:
+                raise exceptions.RestAPIError("url", server_error)
+            return self._echo_batch_response(payload)
+
+        mocker.patch(
+            ONLINE_STORE_REST_CLIENT_API_GET_BATCH_RAW_FEATURE_VECTORS,
+            side_effect=flaky_batch_response,
+        )
+
+        # Act
+        response = rest_client_engine.get_batch_feature_vectors(
+            entries=[{"ticker": f"T{i}"} for i in range(4)],
+            return_type=online_store_rest_client_engine.OnlineStoreRestClientEngine.RETURN_TYPE_RESPONSE_JSON,
+        )
+
+        # Assert
+        assert sorted(attempts) == ["T0", "T2", "T2"]
+        assert [row[0] for row in response["features"]] == ["T0", "T1", "T2", "T3"]
+        assert response["status"] == ["COMPLETE"] * 4
+
+    def test_get_batch_feature_vectors_chunk_client_error_not_retried(
+        self, mocker, training_dataset_features_ticker
+    ):
+        # Arrange
+        rest_client_engine = (
+            online_store_rest_client_engine.OnlineStoreRestClientEngine(
+                feature_store_name="test_store_featurestore",
+                feature_view_name="test_feature_view",
+                feature_view_version=2,
+                features=training_dataset_features_ticker,
+                batch_chunk_size=2,
+            )
+        )
+        client_error = mocker.MagicMock()
+        client_error.status_code = 401
+        mock_online_rest_api = mocker.patch(
+            ONLINE_STORE_REST_CLIENT_API_GET_BATCH_RAW_FEATURE_VECTORS,
+            side_effect=exceptions.RestAPIError("url", client_error),
+        )
+
+        # Act
+        with pytest.raises(exceptions.RestAPIError):
+            rest_client_engine.get_batch_feature_vectors(
+                entries=[{"ticker": "T0"}, {"ticker": "T1"}]
+            )
+
+        # Assert
+        assert mock_online_rest_api.call_count == 1
@@ -0,0 +1,295 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import asyncio
+import gc
+import threading
+import time
+
+import pytest
+from hsfs.core import online_store_sql_engine
+from hsfs.serving_key import ServingKey
+
+
+class TestOnlineStoreSqlClient:
+    def _build_sql_client(self, mocker):
+        serving_keys = [
+            ServingKey("id", 0),
+            ServingKey("id", 1, prefix="right_", join_on="id"),
+            ServingKey("region", 1, prefix="right_", join_on="region"),
+        ]
+        sql_client = online_store_sql_engine.OnlineStoreSqlClient(
+            feature_store_id=99,
+            skip_fg_ids=set(),
+            external=False,
+            serving_keys=serving_keys,
+        )
+        sql_client._async_task_thread = mocker.MagicMock()
+        sql_client.prefix_by_serving_index = {0: "", 1: "right_"}
+        # serving keys are stored in a set, keep the statement parameter order deterministic
+        for sk in serving_keys:
+            sql_client.serving_key_by_serving_index[sk.join_index] = (
+                sql_client.serving_key_by_serving_index.get(sk.join_index, []) + [sk]
+            )
+        return sql_client
+
+    @staticmethod
+    def _batch(n):
+        entries = [{"id": i, "region": i % 3} for i in range(n)]
+        parallel_results = {
+            0: [{"id": i, "amount": i * 10} for i in range(n)],
+            # results are not returned in the order of the entries
+            1: [
+                {"right_id": i, "right_region": i % 3, "right_x": -i}
+                for i in reversed(range(n))
+            ],
+        }
+        return entries, parallel_results
+
+    def test_batch_vector_bind_entries(self, mocker):
+        # Arrange
+        sql_client = self._build_sql_client(mocker)
+
+        # Act
+        _, entry_values = sql_client._batch_vector_bind_entries(
+            [{"id": 1, "region": 2}, {"id": 3, "right_region": 4}],
+            {0: "stmt_0", 1: "stmt_1"},
+        )
+
+        # Assert
+        assert entry_values == {
+            0: {"batch_ids": [(1,), (3,)]},
+            1: {"batch_ids": [(1, 2), (3, 4)]},
+        }
+
+    def test_stitch_batch_vector_results(self, mocker):
+        # Arrange
+        sql_client = self._build_sql_client(mocker)
+        entries, parallel_results = self._batch(3)
+        # entry without match in the right feature group
+        entries.append({"id": 5, "region": 0})
+
+        # Act
+        batch_results, serving_keys = sql_client._stitch_batch_vector_results(
+            entries, {0: "stmt_0", 1: "stmt_1"}, parallel_results
+        )
+
+        # Assert
+        assert batch_results == [
+            {"id": 0, "amount": 0, "right_id": 0, "right_region": 0, "right_x": 0},
+            {"id": 1, "amount": 10, "right_id": 1, "right_region": 1, "right_x": -1},
+            {"id": 2, "amount": 20, "right_id": 2, "right_region": 2, "right_x": -2},
+            {},
+        ]
+        assert len(serving_keys) == 3
+
+    def test_stitch_batch_vector_results_scales_linearly(self, mocker):
+        # Arrange
+        sql_client = self._build_sql_client(mocker)
+        timings = {}
+
+        # Act
+        for n in (10000, 100000):
+            entries, parallel_results = self._batch(n)
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                sql_client._stitch_batch_vector_results(
+                    entries, {0: "stmt_0", 1: "stmt_1"}, parallel_results
+                )
+                timings[n] = time.perf_counter() - start
+            finally:
+                gc.enable()
+
+        # Assert
+        # 10 times more entries, a quadratic implementation would take ~100 times longer
+        assert timings[100000] < 15 * timings[10000]
+
+    def test_fetch_prepared_statements(self, mocker):
+        # Arrange
+        sql_client = self._build_sql_client(mocker)
+        sql_client._skip_fg_ids = {2}
+        # every request waits for the others, they only complete if sent concurrently
+        barrier = threading.Barrier(4, timeout=5)
+
+        def get_serving_prepared_statement(
+            name, version, batch, inference_helper_columns
+        ):
+            barrier.wait()
+            return [
+                mocker.Mock(feature_group_id=1, batch=batch),
+                mocker.Mock(feature_group_id=2, batch=batch),
+            ]
+
+        sql_client._feature_view_api = mocker.Mock()
+        sql_client._feature_view_api.get_serving_prepared_statement.side_effect = (
+            get_serving_prepared_statement
+        )
+
+        # Act
+        sql_client.fetch_prepared_statements(mocker.Mock(), True)
+
+        # Assert
+        assert sorted(sql_client.prepared_statements) == sorted(
+            sql_client.get_prepared_statement_labels(True)
+        )
+        for key, prepared_statements in sql_client.prepared_statements.items():
+            assert [ps.feature_group_id for ps in prepared_statements] == [1]
+            assert prepared_statements[0].batch == key.startswith("batch")
+
+    def _build_async_sql_client(self, mocker, pools):
+        sql_client = self._build_sql_client(mocker)
+        # the asyncio API does not go through the async task thread
+        sql_client._async_task_thread = mocker.Mock()
+        sql_client._online_connector = mocker.Mock()
+        sql_client._prepared_statements = {
+            sql_client.SINGLE_VECTOR_KEY: [mocker.Mock()]
+        }
+        sql_client._parametrised_prepared_statements = {
+            sql_client.SINGLE_VECTOR_KEY: {0: "stmt_0"}
+        }
+        mocker.patch.object(
+            sql_client,
+            "_single_vector_bind_entries",
+            side_effect=lambda entry, stmts: (stmts, {0: entry}),
+        )
+
+        async def get_connection_pool(default_min_size):
+            pool = mocker.Mock()
+            pool.loop = asyncio.get_running_loop()
+            pool.wait_closed = mocker.AsyncMock()
+            pools.append(pool)
+            return pool
+
+        sql_client._get_connection_pool = get_connection_pool
+        return sql_client
+
+    def test_get_single_feature_vector_async_running_loop_connection_pool(self, mocker):
+        # Arrange
+        pools = []
+        sql_client = self._build_async_sql_client(mocker, pools)
+        used_pools = []
+
+        async def execute_prep_statements(
+            prepared_statements, entries, connection_pool
+        ):
+            used_pools.append((connection_pool, asyncio.get_running_loop()))
+            await asyncio.sleep(0)
+            return {0: [{"id": entries[0]["id"], "amount": 10}]}
+
+        sql_client._execute_prep_statements = execute_prep_statements
+
+        async def lookup_all():
+            await asyncio.gather(
+                *[
+                    sql_client.get_single_feature_vector_async({"id": i})
+                    for i in range(3)
+                ]
+            )
+            return asyncio.get_running_loop()
+
+        # Act
+        loop = asyncio.run(lookup_all())
+
+        # Assert
+        # concurrent lookups share a single pool created on the caller's event loop
+        assert len(pools) == 1
+        assert pools[0].loop is loop
+        assert used_pools == [(pools[0], loop)] * 3
+
+    def test_get_single_feature_vector_async_closes_connection_pool(self, mocker):
+        # Arrange
+        pools = []
+        sql_client = self._build_async_sql_client(mocker, pools)
+        sql_client._execute_prep_statements = mocker.AsyncMock(
+            return_value={0: [{"id": 1, "amount": 10}]}
+        )
+
+        # Act
+        for _ in range(2):
+            loop = asyncio.new_event_loop()
+            loop.run_until_complete(
+                sql_client.get_single_feature_vector_async({"id": 1})
+            )
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+        # Assert
+        assert len(pools) == 2
+        for pool in pools:
+            pool.close.assert_called_once()
+            pool.wait_closed.assert_awaited_once()
+        assert sql_client._connection_pools_by_loop == {}
+        assert sql_client._pending_connection_pools == {}
+
+    def test_get_single_feature_vector_async_releases_closed_loop_pool(self, mocker):
+        # Arrange
+        pools = []
+        sql_client = self._build_async_sql_client(mocker, pools)
+        sql_client._execute_prep_statements = mocker.AsyncMock(
+            return_value={0: [{"id": 1, "amount": 10}]}
+        )
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(sql_client.get_single_feature_vector_async({"id": 1}))
+        # closed without shutting down its asynchronous generators
+        loop.close()
+
+        # Act
+        asyncio.run(sql_client.get_single_feature_vector_async({"id": 1}))
+
+        # Assert
+        assert len(pools) == 2
+        assert loop not in sql_client._connection_pools_by_loop
+
+    def test_init_async_mysql_connection_query_timeout(self, mocker):
+        # Arrange
+        mock_async_task_thread = mocker.patch(
+            "hsfs.core.online_store_sql_engine.AsyncTaskThread"
+        )
+        sql_client = self._build_sql_client(mocker)
+        sql_client._async_task_thread = None
+        sql_client._prepared_statements = {
+            sql_client.SINGLE_VECTOR_KEY: [mocker.Mock()]
+        }
+
+        # Act
+        sql_client.init_async_mysql_connection(
+            options={"query_timeout": 5}, online_connector=mocker.Mock()
+        )
+
+        # Assert
+        # the timeout is only applied to the prepared statements, not to the whole task
+        assert "task_timeout" not in mock_async_task_thread.call_args.kwargs
+        mock_async_task_thread.return_value.start.assert_called_once()
+
+    def test_execute_prep_statements_query_timeout(self, mocker):
+        # Arrange
+        sql_client = self._build_sql_client(mocker)
+        sql_client._connection_options = {"query_timeout": 0.05}
+
+        async def query_async_sql(stmt, bind_params, connection_pool):
+            await asyncio.sleep(1)
+
+        sql_client._query_async_sql = query_async_sql
+
+        # Act
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(
+                sql_client._execute_prep_statements(
+                    {0: "stmt_0"}, {0: {"id": 1}}, connection_pool=mocker.Mock()
+                )
+            )
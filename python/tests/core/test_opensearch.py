@@ -16,6 +16,7 @@
 import pytest
 from hsfs.client.exceptions import VectorDatabaseException
 from hsfs.core.opensearch import OpenSearchClientSingleton, OpensearchRequestOption
+from opensearchpy.exceptions import NotFoundError
 
 
 class TestOpenSearchClientSingleton:
@@ -67,6 +68,73 @@ class TestOpenSearchClientSingleton:
         assert exception.reason == expected_reason
         assert exception.info == expected_info
 
+    def test_create_pit_not_supported(self, mocker):
+        # Arrange
+        self.target._opensearch_client = mocker.MagicMock()
+        self.target._opensearch_client.create_pit.side_effect = NotFoundError(
+            404, "no handler found", {}
+        )
+
+        # Act
+        pit_id = self.target.create_pit("index", "1m")
+
+        # Assert
+        assert pit_id is None
+
+    def test_create_pit_not_supported_by_client(self, mocker):
+        # Arrange
+        # opensearch-py 1.x clients do not have the point in time api
+        self.target._opensearch_client = mocker.MagicMock(spec=["search", "msearch"])
+
+        # Act
+        pit_id = self.target.create_pit("index", "1m")
+
+        # Assert
+        assert pit_id is None
+
+    def test_msearch(self, mocker):
+        # Arrange
+        self.target._opensearch_client = mocker.MagicMock()
+        self.target._opensearch_client.msearch.return_value = {
+            "responses": [{"hits": {"hits": [1]}}, {"hits": {"hits": [2]}}]
+        }
+
+        # Act
+        responses = self.target.msearch([{"size": 1}, {"size": 2}], index="index")
+
+        # Assert
+        assert responses == [{"hits": {"hits": [1]}}, {"hits": {"hits": [2]}}]
+        assert self.target._opensearch_client.msearch.call_args.kwargs["body"] == [
+            {},
+            {"size": 1},
+            {},
+            {"size": 2},
+        ]
+
+    def test_msearch_error(self, mocker):
+        # Arrange
+        self.target._opensearch_client = mocker.MagicMock()
+        self.target._opensearch_client.msearch.return_value = {
+            "responses": [
+                {"hits": {"hits": []}},
+                {
+                    "error": {
+                        "caused_by": {
+                            "type": "illegal_argument_exception",
+                            "reason": "[knn] requires k <= 5",
+                        }
+                    }
+                },
+            ]
+        }
+
+        # Act
+        with pytest.raises(VectorDatabaseException) as e_info:
+            self.target.msearch([{"size": 1}, {"size": 2}], index="index")
+
+        # Assert
+        assert e_info.value.reason == VectorDatabaseException.REQUESTED_K_TOO_LARGE
+
 
 class TestOpensearchRequestOption:
     def test_version_1_no_options(self):
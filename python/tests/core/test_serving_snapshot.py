@@ -0,0 +1,163 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import json
+import os
+import stat
+
+import pytest
+from hsfs import storage_connector, training_dataset_feature
+from hsfs.client.exceptions import FeatureStoreException
+from hsfs.constructor.serving_prepared_statement import ServingPreparedStatement
+from hsfs.core import serving_snapshot, vector_server
+from hsfs.core.feature_descriptive_statistics import FeatureDescriptiveStatistics
+
+
+class TestServingSnapshot:
+    def _build_snapshot(self):
+        return serving_snapshot.ServingSnapshot(
+            feature_view_name="fv",
+            feature_view_version=2,
+            training_dataset_version=3,
+            parent_feature_groups=[
+                serving_snapshot.SnapshotFeatureGroup(
+                    name="fg", version=1, online_enabled=True
+                )
+            ],
+            transformation_statistics=[
+                FeatureDescriptiveStatistics(
+                    feature_name="amount", feature_type="Fractional", min=1.0, max=9.0
+                )
+            ],
+            prepared_statements={
+                "single_vector": [
+                    ServingPreparedStatement(
+                        feature_group_id=11,
+                        prepared_statement_index=0,
+                        prepared_statement_parameters=[{"name": "id", "index": 1}],
+                        query_online="SELECT * FROM fg_1 WHERE id = ?",
+                        prefix="",
+                    )
+                ]
+            },
+            online_connector=storage_connector.JdbcConnector(
+                id=5,
+                name="online",
+                featurestore_id=99,
+                connection_string="jdbc:mysql://mysqld:3306/test",
+                arguments=[{"name": "user", "value": "test"}],
+            ),
+            hostname="mysqld.example.com",
+        )
+
+    def test_save_load(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "serving_snapshot.json")
+
+        # Act
+        self._build_snapshot().save(path)
+        snapshot = serving_snapshot.ServingSnapshot.load(path)
+
+        # Assert
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert snapshot.feature_view_name == "fv"
+        assert snapshot.feature_view_version == 2
+        assert snapshot.training_dataset_version == 3
+        assert snapshot.parent_feature_groups == [
+            serving_snapshot.SnapshotFeatureGroup(
+                name="fg", version=1, online_enabled=True
+            )
+        ]
+        assert snapshot.transformation_statistics[0].feature_name == "amount"
+        assert snapshot.transformation_statistics[0].max == 9.0
+        prepared_statement = snapshot.prepared_statements["single_vector"][0]
+        assert prepared_statement.feature_group_id == 11
+        assert prepared_statement.prefix == ""
+        assert prepared_statement.query_online == "SELECT * FROM fg_1 WHERE id = ?"
+        assert prepared_statement.prepared_statement_parameters[0].name == "id"
+        assert isinstance(snapshot.online_connector, storage_connector.JdbcConnector)
+        assert snapshot.online_connector.connection_string == (
+            "jdbc:mysql://mysqld:3306/test"
+        )
+        assert snapshot.online_connector.arguments == [
+            {"name": "user", "value": "test"}
+        ]
+        assert snapshot.hostname == "mysqld.example.com"
+
+    def test_load_unsupported_format_version(self, tmp_path):
+        # Arrange
+        path = tmp_path / "serving_snapshot.json"
+        path.write_text(json.dumps({"formatVersion": 0}))
+
+        # Act
+        with pytest.raises(FeatureStoreException):
+            serving_snapshot.ServingSnapshot.load(str(path))
+
+    def test_check_feature_view(self):
+        # Arrange
+        snapshot = self._build_snapshot()
+
+        # Act
+        snapshot.check_feature_view("fv", 2)
+        with pytest.raises(FeatureStoreException):
+            snapshot.check_feature_view("fv", 1)
+
+    def test_vector_server_init_serving_from_snapshot(self, mocker, tmp_path):
+        # Arrange
+        mock_sql_client = mocker.patch(
+            "hsfs.core.online_store_sql_engine.OnlineStoreSqlClient"
+        ).return_value
+        mock_get_statistics = mocker.patch(
+            "hsfs.core.transformation_function_engine.TransformationFunctionEngine.get_transformation_statistics"
+        )
+        path = str(tmp_path / "serving_snapshot.json")
+        self._build_snapshot().save(path)
+        snapshot = serving_snapshot.ServingSnapshot.load(path)
+        entity = mocker.Mock(
+            features=[training_dataset_feature.TrainingDatasetFeature(name="id")],
+            transformation_functions=[],
+            labels=[],
+        )
+        entity.name = "fv"
+        entity.version = 2
+        vs = vector_server.VectorServer(
+            feature_store_id=99, features=entity.features, serving_keys=[]
+        )
+
+        # Act
+        vs.init_serving(
+            entity, training_dataset_version=3, external=True, snapshot=snapshot
+        )
+        mock_sql_client.prepared_statements = snapshot.prepared_statements
+        mock_sql_client.online_connector = snapshot.online_connector
+        mock_sql_client.hostname = snapshot.hostname
+        exported = vs.get_serving_snapshot(entity)
+
+        # Assert
+        entity.get_parent_feature_groups.assert_not_called()
+        mock_get_statistics.assert_not_called()
+        assert (
+            mock_sql_client.init_prepared_statements.call_args.kwargs[
+                "prepared_statements"
+            ]
+            is snapshot.prepared_statements
+        )
+        assert mock_sql_client.init_async_mysql_connection.call_args.kwargs == {
+            "options": None,
+            "online_connector": snapshot.online_connector,
+            "hostname": "mysqld.example.com",
+        }
+        assert exported.to_dict() == snapshot.to_dict()
@@ -17,16 +17,20 @@
 import json
 
 import hopsworks_common
+import pandas as pd
 import pytest
 from hsfs import (
     feature,
     feature_group,
     feature_view,
+    statistics,
     statistics_config,
     training_dataset,
 )
 from hsfs.client import exceptions
 from hsfs.core import statistics_engine
+from hsfs.core.feature_descriptive_statistics import FeatureDescriptiveStatistics
+from hsfs.engine import python
 
 
 hopsworks_common.connection._hsfs_engine_type = "python"
@@ -686,6 +690,133 @@ class TestStatisticsEngine:
         assert mock_statistics_api.return_value.get_all.call_count == 1
         assert mock_statistics_api.return_value.get.call_count == 0
 
+    def test_compute_and_save_commit_statistics(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine.get_instance", return_value=python.Engine())
+        mock_statistics_engine_save_statistics = mocker.patch(
+            "hsfs.core.statistics_engine.StatisticsEngine._save_statistics"
+        )
+
+        s_engine = statistics_engine.StatisticsEngine(feature_store_id, "featuregroup")
+
+        df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "x"]})
+
+        # Act
+        s_engine.compute_and_save_commit_statistics(
+            metadata_instance=fg,
+            feature_dataframe=df,
+            feature_group_commit_id=1000,
+        )
+
+        # Assert
+        assert mock_statistics_engine_save_statistics.call_count == 1
+        stats = mock_statistics_engine_save_statistics.call_args[0][0]
+        assert stats.window_start_commit_time == 1000
+        assert stats.window_end_commit_time == 1000
+        assert [fds.feature_name for fds in stats.feature_descriptive_statistics] == [
+            "a",
+            "b",
+        ]
+        assert all(
+            "sketch" in fds.extended_statistics
+            for fds in stats.feature_descriptive_statistics
+        )
+
+    def _commit_statistics(self, df, commit_id, computation_time=1):
+        stats_str = python.Engine().profile_sketches(df, None, False, False)
+        return statistics.Statistics(
+            computation_time=computation_time,
+            feature_descriptive_statistics=[
+                FeatureDescriptiveStatistics.from_deequ_json(col_stats)
+                for col_stats in json.loads(stats_str)["columns"]
+            ],
+            window_start_commit_time=commit_id,
+            window_end_commit_time=commit_id,
+        )
+
+    def test_merge_commit_statistics(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mock_statistics_api = mocker.patch("hsfs.core.statistics_api.StatisticsApi")
+
+        s_engine = statistics_engine.StatisticsEngine(feature_store_id, "featuregroup")
+
+        df = pd.DataFrame({"a": [1.0, 2.0, 3.0, 4.0, 5.0], "b": list("xyzxy")})
+        mock_statistics_api.return_value.get_all.return_value = [
+            self._commit_statistics(df.iloc[:2], 1000),
+            # statistics computed on the whole feature group, without sketches
+            statistics.Statistics(
+                computation_time=1,
+                feature_descriptive_statistics=[
+                    FeatureDescriptiveStatistics(feature_name="a", count=2)
+                ],
+                window_end_commit_time=1000,
+            ),
+            self._commit_statistics(df.iloc[2:], 2000),
+        ]
+
+        # Act
+        result = s_engine.merge_commit_statistics(
+            metadata_instance=fg, commit_ids=[1000, 2000]
+        )
+
+        # Assert
+        assert (
+            mock_statistics_api.return_value.get_all.call_args[1]["with_content"]
+            is True
+        )
+        assert result.window_start_commit_time is None
+        assert result.window_end_commit_time == 2000
+        a_stats, b_stats = result.feature_descriptive_statistics
+        assert a_stats.count == 5
+        assert a_stats.mean == 3
+        assert a_stats.max == 5
+        assert a_stats.percentiles[49] == 3
+        assert b_stats.approx_num_distinct_values == 3
+
+    def test_merge_commit_statistics_recomputed_commit(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mock_statistics_api = mocker.patch("hsfs.core.statistics_api.StatisticsApi")
+
+        s_engine = statistics_engine.StatisticsEngine(feature_store_id, "featuregroup")
+
+        df = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+        mock_statistics_api.return_value.get_all.return_value = [
+            self._commit_statistics(df, 1000, computation_time=2),
+            self._commit_statistics(df.iloc[:1], 1000, computation_time=1),
+        ]
+
+        # Act
+        result = s_engine.merge_commit_statistics(metadata_instance=fg)
+
+        # Assert
+        assert result.feature_descriptive_statistics[0].count == 3
+
+    def test_merge_commit_statistics_missing_commit(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mock_statistics_api = mocker.patch("hsfs.core.statistics_api.StatisticsApi")
+
+        s_engine = statistics_engine.StatisticsEngine(feature_store_id, "featuregroup")
+
+        mock_statistics_api.return_value.get_all.return_value = [
+            self._commit_statistics(pd.DataFrame({"a": [1.0]}), 1000),
+        ]
+
+        # Act
+        result = s_engine.merge_commit_statistics(
+            metadata_instance=fg, commit_ids=[1000, 2000]
+        )
+
+        # Assert
+        assert result is None
+
     def test_get_by_time_window(self, mocker):
         # Arrange
         feature_store_id = 99
@@ -706,6 +837,43 @@ class TestStatisticsEngine:
         assert mock_statistics_api.return_value.get.call_count == 1
         assert mock_statistics_api.return_value.get_all.call_count == 0
 
+    def test_get_by_time_window_skips_commit_statistics(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mock_statistics_api = mocker.patch("hsfs.core.statistics_api.StatisticsApi")
+
+        s_engine = statistics_engine.StatisticsEngine(feature_store_id, "featuregroup")
+
+        df = pd.DataFrame({"a": [1.0, 2.0]})
+        table_stats = statistics.Statistics(
+            computation_time=1,
+            feature_descriptive_statistics=[
+                FeatureDescriptiveStatistics(feature_name="a", count=4)
+            ],
+            window_end_commit_time=2000,
+        )
+        mock_statistics_api.return_value.get.return_value = self._commit_statistics(
+            df, 2000, computation_time=2
+        )
+        mock_statistics_api.return_value.get_all.return_value = [
+            table_stats,
+            self._commit_statistics(df, 2000, computation_time=2),
+        ]
+
+        # Act
+        result = s_engine.get_by_time_window(
+            metadata_instance=None,
+            end_commit_time=2000,
+        )
+
+        # Assert
+        assert result == table_stats
+        assert (
+            mock_statistics_api.return_value.get_all.call_args[1]["filter_eq_times"]
+            is True
+        )
+
     def test_get_by_time_window_stats_not_found(self, mocker):
         # Arrange
         feature_store_id = 99
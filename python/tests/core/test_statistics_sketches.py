@@ -0,0 +1,202 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import numpy as np
+import pandas as pd
+import pytest
+from hsfs.core import statistics_sketches
+
+
+class TestStatisticsSketches:
+    def test_moments_merge(self):
+        # Arrange
+        values = np.random.default_rng(0).normal(size=1000)
+        left = statistics_sketches.MomentsSketch()
+        right = statistics_sketches.MomentsSketch()
+
+        # Act
+        left.update(values[:300])
+        right.update(values[300:])
+        left.merge(right)
+
+        # Assert
+        assert left.count == 1000
+        assert left.minimum == values.min()
+        assert left.maximum == values.max()
+        assert left.mean == pytest.approx(values.mean())
+        assert left.stddev == pytest.approx(values.std())
+
+    def test_moments_large_integers(self):
+        # Arrange
+        values = np.array([2**62] * 3)
+        sketch = statistics_sketches.MomentsSketch()
+
+        # Act
+        sketch.update(values)
+
+        # Assert
+        assert sketch.minimum == 2**62
+        assert sketch.maximum == 2**62
+        assert isinstance(sketch.minimum, int)
+        assert sketch.sum == pytest.approx(3 * 2.0**62)
+        assert sketch.mean == pytest.approx(4.611686e18)
+        assert sketch.stddev == 0.0
+
+    def test_co_moments_correlation(self):
+        # Arrange
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=1000)
+        y = 2 * x + rng.normal(size=1000)
+        y[0] = np.nan
+        left = statistics_sketches.CoMomentsSketch()
+        right = statistics_sketches.CoMomentsSketch()
+
+        # Act
+        left.update(x[:500], y[:500])
+        right.update(x[500:], y[500:])
+        left.merge(right)
+
+        # Assert
+        assert left.count == 999
+        assert left.correlation == pytest.approx(np.corrcoef(x[1:], y[1:])[0, 1])
+
+    def test_co_moments_correlation_constant(self):
+        # Arrange
+        sketch = statistics_sketches.CoMomentsSketch()
+
+        # Act
+        sketch.update(np.ones(10), np.arange(10, dtype=np.float64))
+
+        # Assert
+        assert sketch.correlation is None
+
+    def test_hyperloglog_estimate(self):
+        # Arrange
+        left = statistics_sketches.HyperLogLog()
+        right = statistics_sketches.HyperLogLog()
+
+        # Act
+        left.update_hashes(pd.util.hash_array(np.arange(60000)))
+        right.update_hashes(pd.util.hash_array(np.arange(40000, 100000)))
+        left.merge(right)
+
+        # Assert
+        assert left.estimate() == pytest.approx(100000, rel=0.03)
+
+    def test_hyperloglog_estimate_small(self):
+        # Arrange
+        sketch = statistics_sketches.HyperLogLog()
+
+        # Act
+        sketch.update_hashes(
+            pd.util.hash_array(np.array(["a", "b", "c", "a"], dtype=object))
+        )
+
+        # Assert
+        assert sketch.estimate() == 3
+
+    def test_hyperloglog_merge_different_precision(self):
+        # Act
+        with pytest.raises(ValueError):
+            statistics_sketches.HyperLogLog(precision=12).merge(
+                statistics_sketches.HyperLogLog(precision=14)
+            )
+
+    def test_quantiles_exact(self):
+        # Arrange
+        values = np.random.default_rng(0).normal(size=100)
+        sketch = statistics_sketches.QuantileSketch()
+
+        # Act
+        sketch.update(values)
+        result = sketch.quantiles([0.25, 0.5, 0.75])
+
+        # Assert
+        assert sketch.is_exact
+        assert result == pytest.approx(
+            pd.Series(values).quantile([0.25, 0.5, 0.75]).tolist()
+        )
+
+    def test_quantiles_approximate(self):
+        # Arrange
+        values = np.random.default_rng(0).uniform(size=200000)
+        left = statistics_sketches.QuantileSketch(k=1024)
+        right = statistics_sketches.QuantileSketch(k=1024)
+
+        # Act
+        for batch in np.array_split(values[:100000], 10):
+            left.update(batch)
+        right.update(values[100000:])
+        left.merge(right)
+        result = left.quantiles([0.1, 0.5, 0.9])
+
+        # Assert
+        assert not left.is_exact
+        assert left.count == 200000
+        assert result == pytest.approx([0.1, 0.5, 0.9], abs=0.02)
+
+    def test_quantiles_histogram(self):
+        # Arrange
+        sketch = statistics_sketches.QuantileSketch()
+        sketch.update(np.array([0.0, 1.0, 1.0, 4.0]))
+
+        # Act
+        counts, edges = sketch.histogram(4)
+
+        # Assert
+        assert counts.tolist() == [1, 2, 0, 1]
+        assert edges.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def test_quantiles_histogram_infinite_values(self):
+        # Arrange
+        sketch = statistics_sketches.QuantileSketch()
+        sketch.update(np.array([-np.inf, 0.0, 1.0, 2.0, np.inf]))
+
+        # Act
+        counts, edges = sketch.histogram(2)
+
+        # Assert
+        assert counts.tolist() == [2, 3]
+        assert edges.tolist() == [0.0, 1.0, 2.0]
+
+    def test_quantiles_histogram_no_finite_values(self):
+        # Arrange
+        sketch = statistics_sketches.QuantileSketch()
+        sketch.update(np.array([np.inf, np.inf]))
+
+        # Act
+        result = sketch.histogram(2)
+
+        # Assert
+        assert result is None
+
+    def test_value_counts_uniqueness_statistics(self):
+        # Arrange
+        left = statistics_sketches.ValueCounts()
+        right = statistics_sketches.ValueCounts()
+
+        # Act
+        left.update(["a", "b"], [2, 1])
+        right.update(["a", "c"], [1, 1])
+        left.merge(right)
+        result = left.uniqueness_statistics()
+
+        # Assert
+        assert result["exactNumDistinctValues"] == 3
+        assert result["distinctness"] == 3 / 5
+        assert result["uniqueness"] == 2 / 5
+        assert result["entropy"] == pytest.approx(
+            -(0.6 * np.log(0.6) + 2 * 0.2 * np.log(0.2))
+        )
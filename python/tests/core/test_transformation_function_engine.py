@@ -24,6 +24,7 @@ from hsfs import (
     transformation_function,
 )
 from hsfs.core import transformation_function_engine
+from hsfs.core.feature_descriptive_statistics import FeatureDescriptiveStatistics
 from hsfs.hopsworks_udf import udf
 from hsfs.transformation_function import TransformationType
 
@@ -486,3 +487,209 @@ class TestTransformationFunctionEngine:
 
         # Assert
         assert mock_s_engine.return_value.get.call_count == 1
+
+    def _prepare_feature_statistics_cache_test(self, mocker, splits, seed=None):
+        feature_store_id = 99
+        mocker.patch("hopsworks_common.client.get_instance")
+        mock_s_engine = mocker.patch("hsfs.core.statistics_engine.StatisticsEngine")
+        mocker.patch.object(
+            transformation_function_engine.TransformationFunctionEngine,
+            "_feature_statistics_cache",
+            {},
+        )
+        from hsfs.transformation_statistics import TransformationStatistics
+
+        stats = TransformationStatistics("col1")
+
+        @udf(int)
+        def testFunction1(col1, statistics=stats):
+            return col1 + statistics.col1.mean
+
+        tf1 = transformation_function.TransformationFunction(
+            feature_store_id,
+            hopsworks_udf=testFunction1,
+            transformation_type=TransformationType.MODEL_DEPENDENT,
+        )
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits=splits,
+            seed=seed,
+            id=10,
+        )
+        if splits:
+            td.train_split = "train"
+
+        fv = feature_view.FeatureView(
+            name="test",
+            featurestore_id=feature_store_id,
+            query=fg1.select_all(),
+            version=1,
+            transformation_functions=[tf1],
+            id=20,
+        )
+
+        feature_statistics = [
+            FeatureDescriptiveStatistics(feature_name="col1", mean=1.0)
+        ]
+        mock_s_engine.return_value.compute_transformation_fn_statistics.return_value.feature_descriptive_statistics = feature_statistics
+        mock_s_engine.return_value.get.return_value.feature_descriptive_statistics = (
+            feature_statistics
+        )
+        return mock_s_engine, td, fv
+
+    def test_set_feature_statistics_reuses_computed_statistics(self, mocker):
+        # Arrange
+        mock_s_engine, td, fv = self._prepare_feature_statistics_cache_test(
+            mocker, splits={}
+        )
+        tf_engine = transformation_function_engine.TransformationFunctionEngine(99)
+
+        # Act
+        tf_engine.set_feature_statistics(td, fv, pd.DataFrame(), None)
+        tf_engine.set_feature_statistics(td, fv, pd.DataFrame(), 1)
+
+        # Assert
+        assert (
+            mock_s_engine.return_value.compute_transformation_fn_statistics.call_count
+            == 1
+        )
+        assert mock_s_engine.return_value.get.call_count == 0
+        assert fv.transformation_functions[0].transformation_statistics.col1.mean == 1.0
+
+    def test_set_feature_statistics_existing_version(self, mocker):
+        # Arrange
+        mock_s_engine, td, fv = self._prepare_feature_statistics_cache_test(
+            mocker, splits={"train": 0.8, "test": 0.2}, seed=42
+        )
+        tf_engine = transformation_function_engine.TransformationFunctionEngine(99)
+
+        # Act
+        tf_engine.set_feature_statistics(td, fv, {"train": pd.DataFrame()}, 1)
+        tf_engine.set_feature_statistics(td, fv, {"train": pd.DataFrame()}, 1)
+
+        # Assert
+        assert (
+            mock_s_engine.return_value.compute_transformation_fn_statistics.call_count
+            == 0
+        )
+        assert mock_s_engine.return_value.get.call_count == 1
+        assert fv.transformation_functions[0].transformation_statistics.col1.mean == 1.0
+
+    def test_set_feature_statistics_existing_version_no_statistics(self, mocker):
+        # Arrange
+        mock_s_engine, td, fv = self._prepare_feature_statistics_cache_test(
+            mocker, splits={}
+        )
+        mock_s_engine.return_value.get.return_value = None
+        tf_engine = transformation_function_engine.TransformationFunctionEngine(99)
+
+        # Act
+        tf_engine.set_feature_statistics(td, fv, pd.DataFrame(), 1)
+        tf_engine.set_feature_statistics(td, fv, pd.DataFrame(), 1)
+
+        # Assert
+        assert (
+            mock_s_engine.return_value.compute_transformation_fn_statistics.call_count
+            == 1
+        )
+        assert mock_s_engine.return_value.get.call_count == 1
+
+    def test_set_feature_statistics_in_memory_open_event_time_range(self, mocker):
+        # Arrange
+        mock_s_engine, td, fv = self._prepare_feature_statistics_cache_test(
+            mocker, splits={}
+        )
+        td.training_dataset_type = td.IN_MEMORY
+        td.event_start_time = 1000
+        tf_engine = transformation_function_engine.TransformationFunctionEngine(99)
+
+        # Act
+        tf_engine.set_feature_statistics(td, fv, pd.DataFrame(), 1)
+
+        # Assert
+        # new feature data may have been written since the statistics were saved
+        assert (
+            mock_s_engine.return_value.compute_transformation_fn_statistics.call_count
+            == 1
+        )
+        assert mock_s_engine.return_value.get.call_count == 0
+
+    def test_set_feature_statistics_in_memory_closed_event_time_range(self, mocker):
+        # Arrange
+        mock_s_engine, td, fv = self._prepare_feature_statistics_cache_test(
+            mocker, splits={}
+        )
+        td.training_dataset_type = td.IN_MEMORY
+        td.event_start_time = 1000
+        td.event_end_time = 2000
+        tf_engine = transformation_function_engine.TransformationFunctionEngine(99)
+
+        # Act
+        tf_engine.set_feature_statistics(td, fv, pd.DataFrame(), 1)
+
+        # Assert
+        assert (
+            mock_s_engine.return_value.compute_transformation_fn_statistics.call_count
+            == 0
+        )
+        assert mock_s_engine.return_value.get.call_count == 1
+
+    def test_set_feature_statistics_random_split_without_seed(self, mocker):
+        # Arrange
+        mock_s_engine, td, fv = self._prepare_feature_statistics_cache_test(
+            mocker, splits={"train": 0.8, "test": 0.2}
+        )
+        tf_engine = transformation_function_engine.TransformationFunctionEngine(99)
+
+        # Act
+        tf_engine.set_feature_statistics(td, fv, {"train": pd.DataFrame()}, 1)
+        tf_engine.set_feature_statistics(td, fv, {"train": pd.DataFrame()}, 1)
+
+        # Assert
+        assert (
+            mock_s_engine.return_value.compute_transformation_fn_statistics.call_count
+            == 2
+        )
+        assert mock_s_engine.return_value.get.call_count == 0
+
+    def test_set_feature_statistics_different_split_definition(self, mocker):
+        # Arrange
+        mock_s_engine, td, fv = self._prepare_feature_statistics_cache_test(
+            mocker, splits={"train": 0.8, "test": 0.2}, seed=42
+        )
+        tf_engine = transformation_function_engine.TransformationFunctionEngine(99)
+
+        # Act
+        tf_engine.set_feature_statistics(td, fv, {"train": pd.DataFrame()}, None)
+        td.seed = 43
+        tf_engine.set_feature_statistics(td, fv, {"train": pd.DataFrame()}, None)
+
+        # Assert
+        assert (
+            mock_s_engine.return_value.compute_transformation_fn_statistics.call_count
+            == 2
+        )
+
+    def test_clear_feature_statistics_cache(self, mocker):
+        # Arrange
+        mock_s_engine, td, fv = self._prepare_feature_statistics_cache_test(
+            mocker, splits={}
+        )
+        tf_engine = transformation_function_engine.TransformationFunctionEngine(99)
+        tf_engine.set_feature_statistics(td, fv, pd.DataFrame(), None)
+
+        # Act
+        tf_engine.clear_feature_statistics_cache(fv, training_dataset_version=2)
+        tf_engine.set_feature_statistics(td, fv, pd.DataFrame(), None)
+        tf_engine.clear_feature_statistics_cache(fv, training_dataset_version=1)
+        tf_engine.set_feature_statistics(td, fv, pd.DataFrame(), None)
+
+        # Assert
+        assert (
+            mock_s_engine.return_value.compute_transformation_fn_statistics.call_count
+            == 2
+        )
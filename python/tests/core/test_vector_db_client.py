@@ -167,7 +167,7 @@ class TestVectorDbClient:
                 ],
             ),
             (
-                lambda f1, f2: ((f1 > 10) & ((f2 < 20) | ((f1 > 30) & (f2 < 40)))),
+                lambda f1, f2: (f1 > 10) & ((f2 < 20) | ((f1 > 30) & (f2 < 40))),
                 [
                     {
                         "bool": {
@@ -253,3 +253,160 @@ class TestVectorDbClient:
     def test_read_without_pk_or_keys(self):
         with pytest.raises(FeatureStoreException):
             self.target.read(self.fg.id, self.fg.features)
+
+    def test_find_neighbors_batch(self):
+        # Arrange
+        self.target._opensearch_client.msearch.return_value = [
+            self.target._opensearch_client.search.return_value,
+            {"hits": {"hits": []}},
+        ]
+
+        # Act
+        actual = self.target.find_neighbors_batch([[1, 2, 3], [4, 5, 6]], k=1)
+
+        # Assert
+        queries = self.target._opensearch_client.msearch.call_args.args[0]
+        assert [
+            query["query"]["bool"]["must"][0]["knn"]["f2"]["vector"]
+            for query in queries
+        ] == [[1, 2, 3], [4, 5, 6]]
+        assert self.target._opensearch_client.search.call_count == 0
+        assert actual == [[(0.0, {"f1": 4, "f2": [9, 4, 4]})], []]
+
+    def test_find_neighbors_batch_project_index(self, mocker):
+        # Arrange
+        mocker.patch.dict(
+            vector_db_client.VectorDbClient._index_result_limit_k,
+            {"2249__embedding_default_embedding": 100},
+        )
+        self.target._fg_embedding_map[self.fg.id]._col_prefix = "test_fg_1_"
+        hit = self.target._opensearch_client.search.return_value
+        self.target._opensearch_client.msearch.side_effect = [
+            [hit, {"hits": {"hits": []}}, hit],
+            [hit],
+        ]
+
+        try:
+            # Act
+            actual = self.target.find_neighbors_batch(
+                [[1, 2, 3], [4, 5, 6], [7, 8, 9]], k=1
+            )
+        finally:
+            self.target._fg_embedding_map[self.fg.id]._col_prefix = ""
+
+        # Assert
+        # only the embedding with less than k results is searched again, with a larger k
+        retried_queries = self.target._opensearch_client.msearch.call_args.args[0]
+        assert len(retried_queries) == 1
+        knn = retried_queries[0]["query"]["bool"]["must"][0]["knn"]["test_fg_1_f2"]
+        assert knn == {"vector": [4, 5, 6], "k": 3}
+        assert [len(results) for results in actual] == [1, 1, 1]
+
+    def _hits(self, *ids):
+        return {
+            "hits": {
+                "hits": [
+                    {"_source": {"f1": i, "f2": [i, i, i]}, "sort": [str(i)]}
+                    for i in ids
+                ]
+            },
+            "pit_id": "pit_2",
+        }
+
+    def test_read_batches(self):
+        # Arrange
+        self.target._opensearch_client.create_pit.return_value = "pit_1"
+        queries = []
+
+        def search(body, index, options):
+            queries.append((dict(body), index))
+            return self._hits(1, 2) if len(queries) == 1 else self._hits(3)
+
+        self.target._opensearch_client.search.side_effect = search
+
+        # Act
+        batches = list(
+            self.target.read_batches(
+                self.fg.id, self.fg.features, pk="f1", batch_size=2
+            )
+        )
+
+        # Assert
+        assert batches == [
+            [{"f1": 1, "f2": [1, 1, 1]}, {"f1": 2, "f2": [2, 2, 2]}],
+            [{"f1": 3, "f2": [3, 3, 3]}],
+        ]
+        assert [index for _, index in queries] == [None, None]
+        assert queries[0][0]["sort"] == [{"_shard_doc": "asc"}]
+        assert "search_after" not in queries[0][0]
+        assert queries[1][0]["search_after"] == ["2"]
+        assert queries[1][0]["pit"] == {"id": "pit_2", "keep_alive": "1m"}
+        self.target._opensearch_client.delete_pit.assert_called_once_with("pit_2")
+
+    def test_read_batches_without_pit(self):
+        # Arrange
+        self.target._opensearch_client.create_pit.return_value = None
+        self.target._opensearch_client.search.side_effect = [
+            self._hits(1, 2),
+            self._hits(),
+        ]
+
+        # Act
+        batches = list(
+            self.target.read_batches(
+                self.fg.id, self.fg.features, pk="f1", batch_size=2
+            )
+        )
+
+        # Assert
+        assert len(batches) == 1
+        for call in self.target._opensearch_client.search.call_args_list:
+            assert call.kwargs["index"] == "2249__embedding_default_embedding"
+            assert "pit" not in call.kwargs["body"]
+            assert call.kwargs["body"]["sort"] == [{"_id": "asc"}]
+        assert self.target._opensearch_client.delete_pit.call_count == 0
+
+    def test_read_batches_closed_early(self):
+        # Arrange
+        self.target._opensearch_client.create_pit.return_value = "pit_1"
+        self.target._opensearch_client.search.return_value = self._hits(1, 2)
+
+        # Act
+        batches = self.target.read_batches(
+            self.fg.id, self.fg.features, pk="f1", batch_size=2
+        )
+        next(batches)
+        batches.close()
+
+        # Assert
+        self.target._opensearch_client.delete_pit.assert_called_once_with("pit_1")
+
+    @pytest.mark.parametrize("dataframe_type", ["pandas", "polars", "arrow"])
+    def test_read_feature_group_batches(self, mocker, dataframe_type):
+        # Arrange
+        mocker.patch.object(
+            FeatureGroup, "primary_key", new_callable=mocker.PropertyMock
+        ).return_value = ["f1"]
+        mocker.patch(
+            "hsfs.core.vector_db_client.VectorDbClient.read_batches",
+            return_value=iter(
+                [[{"f1": 1, "f2": [1, 1, 1], "f3": None}], [{"f1": 2, "f2": None}]]
+            ),
+        )
+
+        # Act
+        batches = list(
+            vector_db_client.VectorDbClient.read_feature_group_batches(
+                self.fg, dataframe_type=dataframe_type
+            )
+        )
+
+        # Assert
+        assert [len(batch) for batch in batches] == [1, 1]
+        assert list(
+            batches[1].columns if dataframe_type != "arrow" else batches[1].column_names
+        ) == [
+            "f1",
+            "f2",
+            "f3",
+        ]
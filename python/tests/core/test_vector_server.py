@@ -0,0 +1,639 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import asyncio
+import gc
+import threading
+import time
+from datetime import datetime
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+from hsfs import engine, training_dataset_feature
+from hsfs.client.exceptions import FeatureStoreException
+from hsfs.core import vector_server
+from hsfs.core.feature_vector_cache import FeatureVectorCache
+from hsfs.hopsworks_udf import udf
+from hsfs.transformation_function import TransformationFunction, TransformationType
+
+
+engine.init("python")
+
+
+@udf(int, mode="pandas")
+def add_one(feature):
+    return feature + 1
+
+
+@udf([int, int], mode="python")
+def add_and_subtract_two(feature):
+    return feature + 2, feature - 2
+
+
+@udf(float)
+def amount_ratio(amount, request_amount):
+    return amount / request_amount
+
+
+class TestVectorServer:
+    def _build_vector_server(self):
+        on_demand_tf = TransformationFunction(
+            featurestore_id=99,
+            hopsworks_udf=amount_ratio("amount", "request_amount"),
+            transformation_type=TransformationType.ON_DEMAND,
+        )
+        features = [
+            training_dataset_feature.TrainingDatasetFeature(name="id"),
+            training_dataset_feature.TrainingDatasetFeature(name="amount"),
+            training_dataset_feature.TrainingDatasetFeature(
+                name="amount_ratio", transformation_function=on_demand_tf
+            ),
+        ]
+        vs = vector_server.VectorServer(feature_store_id=99, features=features)
+        vs._model_dependent_transformation_functions = [
+            TransformationFunction(
+                featurestore_id=99,
+                hopsworks_udf=add_one("amount"),
+                transformation_type=TransformationType.MODEL_DEPENDENT,
+            ),
+            TransformationFunction(
+                featurestore_id=99,
+                hopsworks_udf=add_and_subtract_two("id"),
+                transformation_type=TransformationType.MODEL_DEPENDENT,
+            ),
+        ]
+        vs._on_demand_transformation_functions = [on_demand_tf]
+        vs._on_demand_feature_names = ["amount_ratio"]
+        return vs
+
+    def test_apply_batch_transformation(self):
+        # Arrange
+        vs = self._build_vector_server()
+        rows = [{"id": i, "amount": 10 * i} for i in range(1, 4)]
+        request_parameters = [
+            {"request_amount": 2},
+            {"request_amount": 5},
+            {"request_amount": 10},
+        ]
+
+        # Act
+        feature_columns = vs.apply_batch_transformation(
+            [dict(row) for row in rows], request_parameters
+        )
+
+        # Assert
+        expected = [
+            vs.apply_transformation(dict(row), request_parameter)
+            for row, request_parameter in zip(rows, request_parameters)
+        ]
+        for fname in vs.transformed_feature_vector_col_name:
+            assert feature_columns[fname] == [vector[fname] for vector in expected]
+
+    def test_apply_batch_transformation_on_demand_only(self):
+        # Arrange
+        vs = self._build_vector_server()
+        rows = [{"id": 1, "amount": 10}, {"id": 2, "amount": 20}]
+
+        # Act
+        feature_columns = vs.apply_batch_transformation(
+            rows,
+            [{"request_amount": 10}, {"request_amount": 10}],
+            transform=False,
+            on_demand_features=True,
+        )
+
+        # Assert
+        assert feature_columns == {
+            "id": [1, 2],
+            "amount": [10, 20],
+            "amount_ratio": [1.0, 2.0],
+        }
+
+    def test_apply_batch_transformation_pandas_udf_called_once(self, mocker):
+        # Arrange
+        vs = self._build_vector_server()
+        hopsworks_udf = vs._model_dependent_transformation_functions[0].hopsworks_udf
+        get_udf_spy = mocker.spy(hopsworks_udf, "get_udf")
+        rows = [{"id": i, "amount": i} for i in range(100)]
+
+        # Act
+        feature_columns = vs.apply_batch_transformation(
+            rows, [{"request_amount": 1}] * 100
+        )
+
+        # Assert
+        assert get_udf_spy.call_count == 1
+        assert feature_columns["add_one_amount_"] == list(range(1, 101))
+
+    def test_apply_batch_transformation_missing_request_parameter(self):
+        # Arrange
+        vs = self._build_vector_server()
+
+        # Act
+        with pytest.raises(FeatureStoreException) as exception:
+            vs.apply_batch_transformation(
+                [{"id": 1, "amount": 10}, {"id": 2, "amount": 20}],
+                [{"request_amount": 10}, {}],
+            )
+
+        # Assert
+        assert "requires features 'request_amount'" in str(exception.value)
+
+    def test_handle_feature_columns_return_type(self):
+        # Arrange
+        vs = self._build_vector_server()
+        feature_columns = {"id": [1, 2], "amount": [10, 20]}
+
+        # Act
+        as_list = vs.handle_feature_columns_return_type(
+            feature_columns, 2, ["id", "amount", "amount_ratio"], "list"
+        )
+        as_numpy = vs.handle_feature_columns_return_type(
+            feature_columns, 2, ["id", "amount"], "numpy"
+        )
+        as_pandas = vs.handle_feature_columns_return_type(
+            feature_columns, 2, ["id", "amount"], "pandas"
+        )
+        as_polars = vs.handle_feature_columns_return_type(
+            feature_columns, 2, ["id", "amount"], "polars"
+        )
+        as_arrow = vs.handle_feature_columns_return_type(
+            feature_columns, 2, ["id", "amount"], "arrow"
+        )
+
+        # Assert
+        assert as_list == [[1, 10, None], [2, 20, None]]
+        assert as_numpy.tolist() == [[1, 10], [2, 20]]
+        pd.testing.assert_frame_equal(
+            as_pandas, pd.DataFrame({"id": [1, 2], "amount": [10, 20]})
+        )
+        assert as_polars.equals(pl.DataFrame({"id": [1, 2], "amount": [10, 20]}))
+        assert as_arrow.equals(pa.table({"id": [1, 2], "amount": [10, 20]}))
+
+    def test_handle_feature_columns_return_type_invalid(self):
+        # Arrange
+        vs = self._build_vector_server()
+
+        # Act
+        with pytest.raises(ValueError) as exception:
+            vs.handle_feature_columns_return_type({}, 0, [], "dict")
+
+        # Assert
+        assert "Unknown return type" in str(exception.value)
+
+    def test_get_feature_vectors_vectorized_transformations(self, mocker):
+        # Arrange
+        vs = self._build_vector_server()
+        mocker.patch.object(
+            vs, "which_client_and_ensure_initialised", return_value="sql"
+        )
+        mocker.patch.object(
+            vs, "validate_entry", side_effect=lambda entry, **kwargs: entry
+        )
+        vs._sql_client = mocker.MagicMock()
+        vs._sql_client.get_batch_feature_vectors.side_effect = lambda entries: (
+            [{"id": entry["id"], "amount": entry["id"] * 10} for entry in entries],
+            None,
+        )
+        entries = [{"id": 1}, {"id": 2}, {"id": 3}]
+        request_parameters = [{"request_amount": 10}] * 3
+
+        # Act
+        row_wise = vs.get_feature_vectors(
+            entries=entries,
+            return_type="list",
+            vector_db_features=[],
+            request_parameters=[dict(rp) for rp in request_parameters],
+        )
+        vectorized = vs.get_feature_vectors(
+            entries=entries,
+            return_type="list",
+            vector_db_features=[],
+            request_parameters=[dict(rp) for rp in request_parameters],
+            vectorized_transformations=True,
+        )
+
+        # Assert
+        assert vectorized == row_wise
+        assert vectorized == [
+            [1, 10, 1.0, 11, 3, -1],
+            [2, 20, 2.0, 21, 4, 0],
+            [3, 30, 3.0, 31, 5, 1],
+        ]
+
+    def test_get_feature_vectors_async(self, mocker):
+        # Arrange
+        vs = self._build_vector_server()
+        mocker.patch.object(
+            vs, "which_client_and_ensure_initialised", return_value="sql"
+        )
+        mocker.patch.object(
+            vs, "validate_entry", side_effect=lambda entry, **kwargs: entry
+        )
+
+        async def get_batch_feature_vectors_async(entries):
+            return (
+                [{"id": entry["id"], "amount": entry["id"] * 10} for entry in entries],
+                None,
+            )
+
+        vs._sql_client = mocker.MagicMock()
+        vs._sql_client.get_batch_feature_vectors.side_effect = lambda entries: (
+            [{"id": entry["id"], "amount": entry["id"] * 10} for entry in entries],
+            None,
+        )
+        vs._sql_client.get_batch_feature_vectors_async.side_effect = (
+            get_batch_feature_vectors_async
+        )
+        entries = [{"id": 1}, {"id": 2}]
+
+        # Act
+        sync_result = vs.get_feature_vectors(
+            entries=entries,
+            return_type="list",
+            vector_db_features=[],
+            request_parameters=[{"request_amount": 10}, {"request_amount": 10}],
+        )
+        async_result = asyncio.run(
+            vs.get_feature_vectors_async(
+                entries=entries,
+                return_type="list",
+                vector_db_features=[],
+                request_parameters=[{"request_amount": 10}, {"request_amount": 10}],
+            )
+        )
+
+        # Assert
+        assert async_result == sync_result
+        assert vs._sql_client.get_batch_feature_vectors_async.call_count == 1
+
+    def test_get_feature_vector_async_concurrent(self, mocker):
+        # Arrange
+        vs = self._build_vector_server()
+        mocker.patch.object(
+            vs, "which_client_and_ensure_initialised", return_value="sql"
+        )
+        mocker.patch.object(
+            vs, "validate_entry", side_effect=lambda entry, **kwargs: entry
+        )
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_single_feature_vector_async(entry):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"id": entry["id"], "amount": entry["id"] * 10}
+
+        vs._sql_client = mocker.MagicMock()
+        vs._sql_client.get_single_feature_vector_async.side_effect = (
+            get_single_feature_vector_async
+        )
+
+        async def lookup_all():
+            return await asyncio.gather(
+                *[
+                    vs.get_feature_vector_async(
+                        entry={"id": i},
+                        return_type="list",
+                        request_parameters={"request_amount": 10},
+                    )
+                    for i in range(1, 4)
+                ]
+            )
+
+        # Act
+        result = asyncio.run(lookup_all())
+
+        # Assert
+        assert max_in_flight == 3
+        assert result == [
+            [1, 10, 1.0, 11, 3, -1],
+            [2, 20, 2.0, 21, 4, 0],
+            [3, 30, 3.0, 31, 5, 1],
+        ]
+        vs._sql_client.get_single_feature_vector.assert_not_called()
+
+    def test_get_feature_vectors_cache_fetches_only_misses(self, mocker):
+        # Arrange
+        vs = self._build_vector_server()
+        vs._feature_vector_cache = FeatureVectorCache(max_size=10, ttl=60)
+        mocker.patch.object(
+            vs, "which_client_and_ensure_initialised", return_value="sql"
+        )
+        mocker.patch.object(
+            vs, "validate_entry", side_effect=lambda entry, **kwargs: entry
+        )
+        vs._sql_client = mocker.MagicMock()
+        vs._sql_client.get_batch_feature_vectors.side_effect = lambda entries: (
+            [{"id": entry["id"], "amount": entry["id"] * 10} for entry in entries],
+            None,
+        )
+        vs._sql_client.get_single_feature_vector.side_effect = lambda entry: {
+            "id": entry["id"],
+            "amount": entry["id"] * 10,
+        }
+
+        # Act
+        vs.get_feature_vector(
+            entry={"id": 2},
+            return_type="list",
+            request_parameters={"request_amount": 10},
+        )
+        result = vs.get_feature_vectors(
+            entries=[{"id": 1}, {"id": 2}, {"id": 3}],
+            return_type="list",
+            vector_db_features=[],
+            request_parameters=[{"request_amount": 10} for _ in range(3)],
+        )
+        vs._sql_client.get_batch_feature_vectors.assert_called_once_with(
+            [{"id": 1}, {"id": 3}]
+        )
+        cached_result = vs.get_feature_vectors(
+            entries=[{"id": 1}, {"id": 2}, {"id": 3}],
+            return_type="list",
+            vector_db_features=[],
+            request_parameters=[{"request_amount": 5} for _ in range(3)],
+        )
+
+        # Assert
+        assert vs._sql_client.get_single_feature_vector.call_count == 1
+        assert vs._sql_client.get_batch_feature_vectors.call_count == 1
+        assert result == [
+            [1, 10, 1.0, 11, 3, -1],
+            [2, 20, 2.0, 21, 4, 0],
+            [3, 30, 3.0, 31, 5, 1],
+        ]
+        # transformations are applied on every call with the request parameters of the call
+        assert [vector[2] for vector in cached_result] == [2.0, 4.0, 6.0]
+        assert vs.feature_vector_cache.stats == {
+            "hits": 4,
+            "misses": 3,
+            "evictions": 0,
+            "size": 3,
+        }
+
+    def test_assemble_feature_vectors_scales_linearly(self):
+        # Arrange
+        vs = vector_server.VectorServer(
+            feature_store_id=99,
+            features=[
+                training_dataset_feature.TrainingDatasetFeature(name="id"),
+                training_dataset_feature.TrainingDatasetFeature(name="amount"),
+            ],
+        )
+        vs._on_demand_feature_names = []
+        timings = {}
+
+        # Act
+        for n in (10000, 100000):
+            # every second entry was skipped because only passed features were provided
+            batch_results = [{"id": i, "amount": i} for i in range(0, n, 2)]
+            passed_features = [{"amount": -1} if i % 2 else {} for i in range(n)]
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                vectors = vs._assemble_feature_vectors_and_convert(
+                    entries=[{"id": i} for i in range(n)],
+                    batch_results=batch_results,
+                    skipped_empty_entries=list(range(1, n, 2)),
+                    return_type="list",
+                    passed_features=passed_features,
+                    vector_db_features=[],
+                    request_parameters=None,
+                    allow_missing=True,
+                    client="sql",
+                    transform=False,
+                    on_demand_features=False,
+                    transformation_context=None,
+                    vectorized_transformations=False,
+                )
+                timings[n] = time.perf_counter() - start
+            finally:
+                gc.enable()
+
+        # Assert
+        assert vectors[:3] == [[0, 0], [None, -1], [2, 2]]
+        # 10 times more entries, a quadratic implementation would take ~100 times longer
+        assert timings[100000] < 15 * timings[10000]
+
+    def test_get_feature_vectors_columnar_return_types(self, mocker):
+        # Arrange
+        vs = self._build_vector_server()
+        mocker.patch.object(
+            vs, "which_client_and_ensure_initialised", return_value="sql"
+        )
+        mocker.patch.object(
+            vs, "validate_entry", side_effect=lambda entry, **kwargs: entry
+        )
+        vs._sql_client = mocker.MagicMock()
+        # the second entry is not found in the online store and is skipped
+        vs._sql_client.get_batch_feature_vectors.side_effect = lambda entries: (
+            [
+                {"id": entry["id"], "amount": entry["id"] * 10}
+                if entry["id"] != 2
+                else {}
+                for entry in entries
+            ],
+            None,
+        )
+
+        def get_feature_vectors(return_type):
+            return vs.get_feature_vectors(
+                entries=[{"id": 1}, {"id": 2}, {"id": 3}],
+                return_type=return_type,
+                vector_db_features=[],
+                request_parameters=[{"request_amount": 10} for _ in range(3)],
+            )
+
+        # Act
+        as_list = get_feature_vectors("list")
+        as_numpy = get_feature_vectors("numpy")
+        as_pandas = get_feature_vectors("pandas")
+        as_polars = get_feature_vectors("polars")
+        as_arrow = get_feature_vectors("arrow")
+
+        # Assert
+        column_names = vs.transformed_feature_vector_col_name
+        assert as_list == [[1, 10, 1.0, 11, 3, -1], [3, 30, 3.0, 31, 5, 1]]
+        assert as_numpy.shape == (2, 6)
+        assert as_numpy.tolist() == as_list
+        pd.testing.assert_frame_equal(
+            as_pandas, pd.DataFrame(as_list, columns=column_names)
+        )
+        assert as_polars.equals(
+            pl.DataFrame(as_list, schema=column_names, orient="row")
+        )
+        assert isinstance(as_arrow, pa.Table)
+        assert as_arrow.column_names == column_names
+        assert as_arrow.to_pylist() == [
+            dict(zip(column_names, vector)) for vector in as_list
+        ]
+
+    def test_handle_feature_vector_return_type_arrow(self):
+        # Arrange
+        vs = self._build_vector_server()
+
+        # Act
+        single = vs.handle_feature_vector_return_type(
+            [1, 10, 1.0],
+            batch=False,
+            inference_helper=False,
+            return_type="arrow",
+            on_demand_feature=True,
+        )
+        helpers = vs.handle_feature_vector_return_type(
+            [{"helper": 1}, {"helper": 2}],
+            batch=True,
+            inference_helper=True,
+            return_type="arrow",
+        )
+
+        # Assert
+        assert single.to_pylist() == [{"id": 1, "amount": 10, "amount_ratio": 1.0}]
+        assert helpers.to_pylist() == [{"helper": 1}, {"helper": 2}]
+
+    def test_init_serving_fetches_metadata_concurrently(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.client.get_instance")
+        mocker.patch("hsfs.core.online_store_sql_engine.AsyncTaskThread")
+        # every request waits for all the others, they only complete if sent concurrently
+        barrier = threading.Barrier(6, timeout=5)
+
+        requests = []
+
+        def request(result):
+            def send(*args, **kwargs):
+                # the statistics are requested again while attaching transformations, after the metadata is fetched
+                requests.append(args)
+                if len(requests) <= barrier.parties:
+                    barrier.wait()
+                return result
+
+            return send
+
+        fg = mocker.Mock(online_enabled=True, version=1)
+        fg.name = "fg"
+        entity = mocker.Mock(
+            features=[training_dataset_feature.TrainingDatasetFeature(name="id")],
+            transformation_functions=[],
+            labels=[],
+        )
+        entity.name = "fv"
+        entity.version = 1
+        entity.get_parent_feature_groups.side_effect = request(
+            mocker.Mock(accessible=[fg])
+        )
+        mocker.patch(
+            "hsfs.core.transformation_function_engine.TransformationFunctionEngine.get_transformation_statistics",
+            side_effect=request(None),
+        )
+        mocker.patch(
+            "hsfs.core.feature_view_api.FeatureViewApi.get_serving_prepared_statement",
+            side_effect=request([mocker.Mock(feature_group_id=1)]),
+        )
+        mocker.patch(
+            "hsfs.core.storage_connector_api.StorageConnectorApi.get_online_connector",
+            side_effect=request(mocker.Mock()),
+        )
+        mocker.patch(
+            "hopsworks_common.core.variable_api.VariableApi.get_loadbalancer_external_domain",
+            side_effect=request("mysqld.example.com"),
+        )
+        mocker.patch(
+            "hsfs.core.online_store_sql_engine.OnlineStoreSqlClient.init_parametrize_and_serving_utils"
+        )
+        mocker.patch(
+            "hsfs.core.online_store_sql_engine.OnlineStoreSqlClient._parametrize_prepared_statements"
+        )
+        vs = vector_server.VectorServer(
+            feature_store_id=99, features=entity.features, serving_keys=[]
+        )
+
+        # Act
+        vs.init_serving(entity, training_dataset_version=1, external=True)
+
+        # Assert
+        assert vs.sql_client.hostname == "mysqld.example.com"
+        assert len(vs.sql_client.prepared_statements["single_feature_vector"]) == 1
+        assert set(vs.init_serving_timings) == {
+            "parent_feature_groups",
+            "transformation_statistics",
+            "prepared_statements.single_feature_vector",
+            "prepared_statements.batch_feature_vectors",
+            "online_connector",
+            "hostname",
+            "transformation",
+            "sql_client",
+            "total",
+        }
+
+    def test_setup_rest_client_and_engine_closes_previous_engine(self, mocker):
+        # Arrange
+        mock_rest_client_engine = mocker.patch(
+            "hsfs.core.online_store_rest_client_engine.OnlineStoreRestClientEngine"
+        )
+        mocker.patch(
+            "hopsworks_common.client.online_store_rest_client.init_or_reset_online_store_rest_client"
+        )
+        first_engine, second_engine = mocker.Mock(), mocker.Mock()
+        mock_rest_client_engine.side_effect = [first_engine, second_engine]
+        vs = vector_server.VectorServer(
+            feature_store_id=99,
+            features=[training_dataset_feature.TrainingDatasetFeature(name="id")],
+        )
+        entity = mocker.Mock()
+
+        # Act
+        vs.setup_rest_client_and_engine(entity)
+        vs.setup_rest_client_and_engine(entity, reset_rest_client=True)
+
+        # Assert
+        first_engine.close.assert_called_once()
+        second_engine.close.assert_not_called()
+        assert vs.rest_client_engine is second_engine
+
+    def test_apply_return_value_handlers_rest_passed_timestamp(self, mocker):
+        # Arrange
+        features = [
+            training_dataset_feature.TrainingDatasetFeature(
+                name="id", type="bigint", featuregroup=mocker.Mock(id=1)
+            ),
+            training_dataset_feature.TrainingDatasetFeature(
+                name="event_time", type="timestamp", featuregroup=mocker.Mock(id=1)
+            ),
+        ]
+        vs = vector_server.VectorServer(feature_store_id=99, features=features)
+        vs.set_return_feature_value_handlers(features)
+
+        # Act
+        # timestamps read from RonDB are already converted by the REST client engine
+        read_vector = vs.apply_return_value_handlers(
+            {"id": 1, "event_time": datetime(2024, 1, 1, 12, 0)}, client="rest"
+        )
+        # passed features are merged in the vector as given by the user
+        passed_vector = vs.apply_return_value_handlers(
+            {"id": 1, "event_time": "2024-01-02 08:30:00"}, client="rest"
+        )
+
+        # Assert
+        assert read_vector["event_time"] == datetime(2024, 1, 1, 12, 0)
+        assert passed_vector["event_time"] == datetime(2024, 1, 2, 8, 30)
@@ -0,0 +1,154 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import zipfile
+
+import pytest
+from hopsworks_common.client.exceptions import ModelRegistryException
+from hsml.core import model_file_cache
+from hsml.engine import local_engine
+
+
+class TestLocalEngine:
+    def _local_engine(self, mocker):
+        mocker.patch("hsml.core.hdfs_api.HdfsApi", side_effect=KeyError)
+        mocker.patch("hsml.core.model_api.ModelApi")
+        mock_dataset_api = mocker.patch("hsml.core.dataset_api.DatasetApi")
+        mock_dataset_api.return_value.DEFAULT_UPLOAD_MAX_BYTES_IN_FLIGHT = 1024
+        mock_dataset_api.return_value.DEFAULT_UPLOAD_FLOW_CHUNK_SIZE = 100
+        mock_dataset_api.return_value.DEFAULT_UPLOAD_SIMULTANEOUS_CHUNKS = 2
+        mock_dataset_api.return_value.DEFAULT_UPLOAD_MAX_CHUNK_RETRIES = 1
+        mock_dataset_api.return_value.DEFAULT_DOWNLOAD_FLOW_CHUNK_SIZE = 100
+        mock_dataset_api.return_value.DEFAULT_DOWNLOAD_SIMULTANEOUS_RANGES = 2
+        mock_dataset_api.return_value.DEFAULT_DOWNLOAD_RANGE_SIZE = 1000
+        return local_engine.LocalEngine(), mock_dataset_api.return_value
+
+    def test_upload_many(self, mocker, tmp_path):
+        # Arrange
+        l_engine, mock_dataset_api = self._local_engine(mocker)
+        (tmp_path / "tokenizer").mkdir()
+        (tmp_path / "tokenizer" / "vocab.txt").write_text("a b c")
+        (tmp_path / "config.json").write_text("{}")
+        archives = {}
+
+        def upload_file(file_name, local_path, *args, **kwargs):
+            if file_name.endswith(".zip"):
+                with zipfile.ZipFile(local_path) as zip_file:
+                    archives[file_name] = sorted(zip_file.namelist())
+
+        mock_dataset_api._upload_file.side_effect = upload_file
+        uploaded = []
+
+        # Act
+        l_engine.upload_many(
+            [
+                (str(tmp_path / "tokenizer"), "/Projects/p/Models/m/1/Files"),
+                (str(tmp_path / "config.json"), "/Projects/p/Models/m/1/Files"),
+            ],
+            on_uploaded=uploaded.append,
+        )
+
+        # Assert
+        assert sorted(uploaded) == sorted(
+            [str(tmp_path / "tokenizer"), str(tmp_path / "config.json")]
+        )
+        assert archives == {"tokenizer.zip": ["tokenizer/vocab.txt"]}
+        mock_dataset_api.unzip.assert_called_once_with(
+            "/Projects/p/Models/m/1/Files/tokenizer.zip",
+            block=True,
+            timeout=l_engine.DEFAULT_BUNDLE_UNZIP_TIMEOUT,
+        )
+        mock_dataset_api.remove.assert_called_once_with(
+            "/Projects/p/Models/m/1/Files/tokenizer.zip"
+        )
+
+    def test_upload_many_unzip_timeout(self, mocker, tmp_path):
+        # Arrange
+        l_engine, mock_dataset_api = self._local_engine(mocker)
+        (tmp_path / "tokenizer").mkdir()
+        (tmp_path / "tokenizer" / "vocab.txt").write_text("a b c")
+        mock_dataset_api.unzip.return_value = False
+
+        # Act
+        with pytest.raises(ModelRegistryException):
+            l_engine.upload_many(
+                [(str(tmp_path / "tokenizer"), "/Projects/p/Models/m/1/Files")]
+            )
+
+        # Assert
+        assert mock_dataset_api.remove.call_count == 0
+
+    def test_download_many(self, mocker, tmp_path):
+        # Arrange
+        mocker.patch(
+            "hsml.core.model_file_cache.ModelFileCache.from_env", return_value=None
+        )
+        l_engine, mock_dataset_api = self._local_engine(mocker)
+
+        def download_file(path, local_path, *args, **kwargs):
+            with open(local_path, "w") as f:
+                f.write(path)
+
+        mock_dataset_api._download_file.side_effect = download_file
+        downloaded = []
+
+        # Act
+        l_engine.download_many(
+            [
+                ("/Projects/p/Models/m/1/Files/a", str(tmp_path / "a"), 27, 1000),
+                ("/Projects/p/Models/m/1/Files/b", str(tmp_path / "b"), 27, 1000),
+            ],
+            on_downloaded=downloaded.append,
+        )
+
+        # Assert
+        assert sorted(downloaded) == [str(tmp_path / "a"), str(tmp_path / "b")]
+        assert (tmp_path / "b").read_text() == "/Projects/p/Models/m/1/Files/b"
+
+    def test_download_many_cache(self, mocker, tmp_path):
+        # Arrange
+        cache = model_file_cache.ModelFileCache(str(tmp_path / "cache"))
+        mocker.patch(
+            "hsml.core.model_file_cache.ModelFileCache.from_env", return_value=cache
+        )
+        l_engine, mock_dataset_api = self._local_engine(mocker)
+
+        def download_file(path, local_path, *args, **kwargs):
+            with open(local_path, "w") as f:
+                f.write("content")
+
+        mock_dataset_api._download_file.side_effect = download_file
+        (tmp_path / "first").mkdir()
+        (tmp_path / "second").mkdir()
+        downloads = [
+            ("/Projects/p/Models/m/1/Files/a", "a", 7, 1700000000000),
+            ("/Projects/p/Models/m/1/Files/b", "b", 7, 0),
+        ]
+
+        # Act
+        for folder in ["first", "second"]:
+            l_engine.download_many(
+                [
+                    (remote_path, str(tmp_path / folder / name), size, mtime)
+                    for remote_path, name, size, mtime in downloads
+                ]
+            )
+
+        # Assert
+        # the file without modification time is downloaded twice
+        assert mock_dataset_api._download_file.call_count == 3
+        assert (tmp_path / "second" / "a").read_text() == "content"
+        assert (tmp_path / "second" / "b").read_text() == "content"
@@ -0,0 +1,224 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import json
+
+from hopsworks_common.client.exceptions import RestAPIError
+from hsml.engine import model_engine
+
+
+class TestModelEngine:
+    def _model_engine(self, mocker):
+        mock_local_engine = mocker.patch("hsml.engine.local_engine.LocalEngine")
+        mock_local_engine.return_value.DEFAULT_SIMULTANEOUS_FILE_UPLOADS = 2
+        mocker.patch("hsml.core.model_api.ModelApi")
+        mock_dataset_api = mocker.patch("hopsworks_common.core.dataset_api.DatasetApi")
+        return (
+            model_engine.ModelEngine(),
+            mock_local_engine.return_value,
+            mock_dataset_api.return_value,
+        )
+
+    def _write_model(self, tmp_path, n_vocab_files=20):
+        model_path = tmp_path / "model"
+        (model_path / "tokenizer" / "special").mkdir(parents=True)
+        (model_path / "weights").mkdir()
+        (model_path / "config.json").write_text("{}")
+        for i in range(n_vocab_files):
+            (model_path / "tokenizer" / "vocab_{}.txt".format(i)).write_text("a b c")
+        (model_path / "tokenizer" / "special" / "tokens.txt").write_text("<s>")
+        (model_path / "weights" / "model.bin").write_bytes(b"0" * 2048)
+        return str(model_path)
+
+    def test_upload_local_model(self, mocker, tmp_path):
+        # Arrange
+        m_engine, mock_local_engine, _ = self._model_engine(mocker)
+        model_path = self._write_model(tmp_path)
+        progress = []
+
+        def upload_many(uploads, upload_configuration=None, on_uploaded=None):
+            for local_path, _ in uploads:
+                on_uploaded(local_path)
+
+        mock_local_engine.upload_many.side_effect = upload_many
+
+        # Act
+        m_engine._upload_local_model(
+            model_path,
+            "Models/m/1/Files",
+            lambda n_dirs, n_files: progress.append((n_dirs, n_files)),
+            upload_configuration={"bundle_max_file_size": 1024},
+        )
+
+        # Assert
+        mock_local_engine.mkdir.assert_called_once_with("Models/m/1/Files/weights")
+        uploads = mock_local_engine.upload_many.call_args.args[0]
+        assert sorted(uploads) == sorted(
+            [
+                (model_path + "/tokenizer", "Models/m/1/Files"),
+                (model_path + "/config.json", "Models/m/1/Files"),
+                (model_path + "/weights/model.bin", "Models/m/1/Files/weights"),
+            ]
+        )
+        assert progress[-1] == (3, 23)
+
+    def test_upload_local_model_bundles_disabled(self, mocker, tmp_path):
+        # Arrange
+        m_engine, mock_local_engine, _ = self._model_engine(mocker)
+        model_path = self._write_model(tmp_path)
+
+        # Act
+        m_engine._upload_local_model(
+            model_path,
+            "Models/m/1/Files",
+            lambda n_dirs, n_files: None,
+            upload_configuration={"bundle_small_files": False},
+        )
+
+        # Assert
+        assert mock_local_engine.mkdir.call_count == 3
+        uploads = mock_local_engine.upload_many.call_args.args[0]
+        assert len(uploads) == 23
+        assert all(not local_path.endswith("tokenizer") for local_path, _ in uploads)
+
+    def test_get_bundle_content(self, mocker, tmp_path):
+        # Arrange
+        m_engine, _, _ = self._model_engine(mocker)
+        model_path = self._write_model(tmp_path, n_vocab_files=5)
+
+        # Act
+        few_files = m_engine._get_bundle_content(
+            model_path + "/tokenizer", model_path, {}
+        )
+        bundle = m_engine._get_bundle_content(
+            model_path + "/tokenizer", model_path, {"bundle_min_files": 2}
+        )
+        large_file = m_engine._get_bundle_content(
+            model_path + "/weights",
+            model_path,
+            {"bundle_min_files": 1, "bundle_max_file_size": 1024},
+        )
+
+        # Assert
+        assert few_files is None
+        assert bundle == (2, 6)
+        assert large_file is None
+
+    def test_build_files_manifest(self, mocker, tmp_path):
+        # Arrange
+        m_engine, _, _ = self._model_engine(mocker)
+        model_path = self._write_model(tmp_path, n_vocab_files=1)
+
+        # Act
+        manifest = m_engine._build_files_manifest(model_path, {})
+
+        # Assert
+        assert sorted(manifest) == [
+            "config.json",
+            "tokenizer/special/tokens.txt",
+            "tokenizer/vocab_0.txt",
+            "weights/model.bin",
+        ]
+        assert manifest["config.json"] == {
+            "size": 2,
+            "sha256": "44136fa355b3678a1146ad16f7e8649e94fb4fc21fe77e8310c060f61caaff8a",
+        }
+
+    def test_upload_local_model_deduplicate(self, mocker, tmp_path):
+        # Arrange
+        m_engine, mock_local_engine, _ = self._model_engine(mocker)
+        model_path = self._write_model(tmp_path)
+        files_manifest = m_engine._build_files_manifest(model_path, {})
+        previous_files_manifest = dict(files_manifest)
+        previous_files_manifest["config.json"] = {"size": 2, "sha256": "changed"}
+        progress = []
+
+        # Act
+        m_engine._upload_local_model(
+            model_path,
+            "Models/m/2/Files",
+            lambda n_dirs, n_files: progress.append((n_dirs, n_files)),
+            upload_configuration={"bundle_max_file_size": 1024},
+            files_manifest=files_manifest,
+            previous_model_files_path="Models/m/1/Files",
+            previous_files_manifest=previous_files_manifest,
+        )
+
+        # Assert
+        assert sorted(call.args for call in mock_local_engine.copy.call_args_list) == [
+            ("Models/m/1/Files/tokenizer", "Models/m/2/Files/tokenizer"),
+            (
+                "Models/m/1/Files/weights/model.bin",
+                "Models/m/2/Files/weights/model.bin",
+            ),
+        ]
+        uploads = mock_local_engine.upload_many.call_args.args[0]
+        assert uploads == [(model_path + "/config.json", "Models/m/2/Files")]
+        assert progress[-1] == (3, 22)
+
+    def test_upload_local_model_deduplicate_copy_failure(self, mocker, tmp_path):
+        # Arrange
+        m_engine, mock_local_engine, _ = self._model_engine(mocker)
+        model_path = self._write_model(tmp_path)
+        files_manifest = m_engine._build_files_manifest(model_path, {})
+        response = mocker.Mock(status_code=404)
+        response.json.return_value = {}
+        mock_local_engine.copy.side_effect = RestAPIError("url", response)
+
+        # Act
+        m_engine._upload_local_model(
+            model_path,
+            "Models/m/2/Files",
+            lambda n_dirs, n_files: None,
+            upload_configuration={"bundle_small_files": False},
+            files_manifest=files_manifest,
+            previous_model_files_path="Models/m/1/Files",
+            previous_files_manifest=files_manifest,
+        )
+
+        # Assert
+        assert mock_local_engine.copy.call_count == 23
+        uploads = mock_local_engine.upload_many.call_args.args[0]
+        assert len(uploads) == 23
+
+    def test_get_previous_files_manifest(self, mocker, tmp_path):
+        # Arrange
+        m_engine, mock_local_engine, mock_dataset_api = self._model_engine(mocker)
+        model_instance = mocker.Mock(model_path="/Projects/p/Models/m", version=3)
+        mock_dataset_api.list.return_value = {
+            "items": [
+                {"attributes": {"path": "/Projects/p/Models/m/" + name}}
+                for name in ["3", "2", "10", "1", "notes"]
+            ]
+        }
+
+        def download(remote_path, local_path):
+            with open(local_path, "w") as f:
+                json.dump({"files": {"a": {"size": 1, "sha256": "x"}}}, f)
+
+        mock_local_engine.download.side_effect = download
+
+        # Act
+        previous_model_files_path, previous_files_manifest = (
+            m_engine._get_previous_files_manifest(model_instance)
+        )
+
+        # Assert
+        assert previous_model_files_path == "/Projects/p/Models/m/2/Files"
+        assert previous_files_manifest == {"a": {"size": 1, "sha256": "x"}}
+        mock_dataset_api.path_exists.assert_called_once_with(
+            "/Projects/p/Models/m/2/files_manifest.json"
+        )
@@ -14,6 +14,7 @@
 #   limitations under the License.
 #
 import decimal
+import json
 from datetime import date, datetime
 
 import hopsworks_common
@@ -833,364 +834,204 @@ class TestPython:
             + "environment with Spark Engine."
         )
 
-    def test_profile_pandas(self, mocker):
+    def test_profile_pandas(self):
         # Arrange
-        mock_python_engine_convert_pandas_statistics = mocker.patch(
-            "hsfs.engine.python.Engine._convert_pandas_statistics"
-        )
-
         python_engine = python.Engine()
 
-        mock_python_engine_convert_pandas_statistics.side_effect = [
-            {"dataType": "Integral", "test_key": "test_value"},
-            {"dataType": "Fractional", "test_key": "test_value"},
-            {"dataType": "String", "test_key": "test_value"},
-        ]
-
         d = {"col1": [1, 2], "col2": [0.1, 0.2], "col3": ["a", "b"]}
         df = pd.DataFrame(data=d)
 
         # Act
-        result = python_engine.profile(
-            df=df,
-            relevant_columns=None,
-            correlations=None,
-            histograms=None,
-            exact_uniqueness=True,
+        result = json.loads(
+            python_engine.profile(
+                df=df,
+                relevant_columns=None,
+                correlations=None,
+                histograms=None,
+                exact_uniqueness=True,
+            )
         )
 
         # Assert
-        assert (
-            result
-            == '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
-            '"column": "col1", "completeness": 1}, '
-            '{"dataType": "Fractional", "test_key": "test_value", "isDataTypeInferred": "false", '
-            '"column": "col2", "completeness": 1}, '
-            '{"dataType": "String", "test_key": "test_value", "isDataTypeInferred": "false", '
-            '"column": "col3", "completeness": 1}]}'
-        )
-        assert mock_python_engine_convert_pandas_statistics.call_count == 3
-
-    def test_profile_pandas_with_null_column(self, mocker):
+        col1, col2, col3 = result["columns"]
+        assert [col["column"] for col in result["columns"]] == ["col1", "col2", "col3"]
+        assert [col["dataType"] for col in result["columns"]] == [
+            "Integral",
+            "Fractional",
+            "String",
+        ]
+        assert col1["count"] == 2
+        assert col1["completeness"] == 1
+        assert col1["minimum"] == 1
+        assert col1["maximum"] == 2
+        assert col1["sum"] == 3
+        assert col1["mean"] == 1.5
+        assert col1["stdDev"] == 0.5
+        assert col1["approxPercentiles"][24] == 1.25
+        assert col1["approxPercentiles"][49] == 1.5
+        assert col1["approxPercentiles"][74] == 1.75
+        assert col1["exactNumDistinctValues"] == 2
+        assert col2["mean"] == pytest.approx(0.15)
+        assert col3["approximateNumDistinctValues"] == 2
+        assert col3["uniqueness"] == 1
+        assert "approxPercentiles" not in col3
+
+    def test_profile_pandas_with_null_column(self):
         # Arrange
-        mock_python_engine_convert_pandas_statistics = mocker.patch(
-            "hsfs.engine.python.Engine._convert_pandas_statistics"
-        )
-
         python_engine = python.Engine()
 
-        mock_python_engine_convert_pandas_statistics.side_effect = [
-            {"dataType": "Integral", "test_key": "test_value"},
-            {"dataType": "Fractional", "test_key": "test_value"},
-            {"dataType": "String", "test_key": "test_value"},
-        ]
-
         d = {"col1": [1, 2], "col2": [0.1, None], "col3": [None, None]}
         df = pd.DataFrame(data=d)
 
         # Act
-        result = python_engine.profile(
-            df=df,
-            relevant_columns=None,
-            correlations=None,
-            histograms=None,
-            exact_uniqueness=True,
+        result = json.loads(
+            python_engine.profile(
+                df=df,
+                relevant_columns=None,
+                correlations=None,
+                histograms=None,
+                exact_uniqueness=True,
+            )
         )
 
         # Assert
-        assert (
-            result
-            == '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
-            '"column": "col1", "completeness": 1}, '
-            '{"dataType": "Fractional", "test_key": "test_value", "isDataTypeInferred": "false", '
-            '"column": "col2", "completeness": 1}, '
-            '{"dataType": "String", "test_key": "test_value", "isDataTypeInferred": "false", '
-            '"column": "col3", "completeness": 1}]}'
-        )
-        assert mock_python_engine_convert_pandas_statistics.call_count == 3
+        col1, col2, col3 = result["columns"]
+        assert col1["completeness"] == 1
+        assert col2["dataType"] == "Fractional"
+        assert col2["numRecordsNull"] == 1
+        assert col2["completeness"] == 0.5
+        assert col2["mean"] == 0.1
+        assert col3["dataType"] == "String"
+        assert col3["count"] == 2
+        assert col3["numRecordsNull"] == 2
+        assert col3["completeness"] == 0
 
     @pytest.mark.skipif(
         not HAS_POLARS,
         reason="Polars is not installed.",
     )
-    def test_profile_polars(self, mocker):
+    def test_profile_polars(self):
         # Arrange
-        mock_python_engine_convert_pandas_statistics = mocker.patch(
-            "hsfs.engine.python.Engine._convert_pandas_statistics"
-        )
-
         python_engine = python.Engine()
 
-        mock_python_engine_convert_pandas_statistics.side_effect = [
-            {"dataType": "Integral", "test_key": "test_value"},
-            {"dataType": "Fractional", "test_key": "test_value"},
-            {"dataType": "String", "test_key": "test_value"},
-        ]
-
         d = {"col1": [1, 2], "col2": [0.1, 0.2], "col3": ["a", "b"]}
         df = pl.DataFrame(data=d)
 
         # Act
-        result = python_engine.profile(
-            df=df,
-            relevant_columns=None,
-            correlations=None,
-            histograms=None,
-            exact_uniqueness=True,
+        result = json.loads(
+            python_engine.profile(
+                df=df,
+                relevant_columns=None,
+                correlations=None,
+                histograms=None,
+                exact_uniqueness=True,
+            )
         )
 
         # Assert
-        assert (
-            result
-            == '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
-            '"column": "col1", "completeness": 1}, '
-            '{"dataType": "Fractional", "test_key": "test_value", "isDataTypeInferred": "false", '
-            '"column": "col2", "completeness": 1}, '
-            '{"dataType": "String", "test_key": "test_value", "isDataTypeInferred": "false", '
-            '"column": "col3", "completeness": 1}]}'
-        )
-        assert mock_python_engine_convert_pandas_statistics.call_count == 3
+        assert [col["dataType"] for col in result["columns"]] == [
+            "Integral",
+            "Fractional",
+            "String",
+        ]
+        assert result["columns"][0]["mean"] == 1.5
+        assert result["columns"][2]["exactNumDistinctValues"] == 2
 
     @pytest.mark.skipif(
         not HAS_POLARS,
         reason="Polars is not installed.",
     )
-    def test_profile_polars_with_null_column(self, mocker):
+    def test_profile_polars_with_null_column(self):
         # Arrange
-        mock_python_engine_convert_pandas_statistics = mocker.patch(
-            "hsfs.engine.python.Engine._convert_pandas_statistics"
-        )
-
         python_engine = python.Engine()
 
-        mock_python_engine_convert_pandas_statistics.side_effect = [
-            {"dataType": "Integral", "test_key": "test_value"},
-            {"dataType": "Fractional", "test_key": "test_value"},
-            {"dataType": "String", "test_key": "test_value"},
-        ]
-
         d = {"col1": [1, 2], "col2": [0.1, None], "col3": [None, None]}
         df = pl.DataFrame(data=d)
 
         # Act
-        result = python_engine.profile(
-            df=df,
-            relevant_columns=None,
-            correlations=None,
-            histograms=None,
-            exact_uniqueness=True,
+        result = json.loads(
+            python_engine.profile(
+                df=df,
+                relevant_columns=None,
+                correlations=None,
+                histograms=None,
+                exact_uniqueness=True,
+            )
         )
 
         # Assert
-        assert (
-            result
-            == '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
-            '"column": "col1", "completeness": 1}, '
-            '{"dataType": "Fractional", "test_key": "test_value", "isDataTypeInferred": "false", '
-            '"column": "col2", "completeness": 1}, '
-            '{"dataType": "String", "test_key": "test_value", "isDataTypeInferred": "false", '
-            '"column": "col3", "completeness": 1}]}'
-        )
-        assert mock_python_engine_convert_pandas_statistics.call_count == 3
+        col1, col2, col3 = result["columns"]
+        assert col1["completeness"] == 1
+        assert col2["completeness"] == 0.5
+        assert col3["dataType"] == "String"
+        assert col3["numRecordsNull"] == 2
 
-    def test_profile_relevant_columns(self, mocker):
+    def test_profile_relevant_columns(self):
         # Arrange
-        mock_python_engine_convert_pandas_statistics = mocker.patch(
-            "hsfs.engine.python.Engine._convert_pandas_statistics"
-        )
-
         python_engine = python.Engine()
 
-        mock_python_engine_convert_pandas_statistics.return_value = {
-            "dataType": "Integral",
-            "test_key": "test_value",
-        }
-
         d = {"col1": [1, 2], "col2": [0.1, 0.2], "col3": ["a", "b"]}
         df = pd.DataFrame(data=d)
 
         # Act
-        result = python_engine.profile(
-            df=df,
-            relevant_columns=["col1"],
-            correlations=None,
-            histograms=None,
-            exact_uniqueness=True,
+        result = json.loads(
+            python_engine.profile(
+                df=df,
+                relevant_columns=["col1"],
+                correlations=None,
+                histograms=None,
+                exact_uniqueness=True,
+            )
         )
 
         # Assert
-        assert (
-            result
-            == '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
-            '"column": "col1", "completeness": 1}]}'
-        )
-        assert mock_python_engine_convert_pandas_statistics.call_count == 1
+        assert [col["column"] for col in result["columns"]] == ["col1"]
 
-    def test_profile_relevant_columns_diff_dtypes(self, mocker):
+    def test_profile_relevant_columns_diff_dtypes(self):
         # Arrange
-        mock_python_engine_convert_pandas_statistics = mocker.patch(
-            "hsfs.engine.python.Engine._convert_pandas_statistics"
-        )
-
         python_engine = python.Engine()
 
-        mock_python_engine_convert_pandas_statistics.side_effect = [
-            {"dataType": "Integral", "test_key": "test_value"},
-            {"dataType": "String", "test_key": "test_value"},
-        ]
-
         d = {"col1": [1, 2], "col2": [0.1, 0.2], "col3": ["a", "b"]}
         df = pd.DataFrame(data=d)
 
         # Act
-        result = python_engine.profile(
-            df=df,
-            relevant_columns=["col1", "col3"],
-            correlations=None,
-            histograms=None,
-            exact_uniqueness=True,
+        result = json.loads(
+            python_engine.profile(
+                df=df,
+                relevant_columns=["col1", "col3"],
+                correlations=None,
+                histograms=None,
+                exact_uniqueness=True,
+            )
         )
 
         # Assert
-        assert (
-            result
-            == '{"columns": [{"dataType": "Integral", "test_key": "test_value", "isDataTypeInferred": "false", '
-            '"column": "col1", "completeness": 1}, '
-            '{"dataType": "String", "test_key": "test_value", "isDataTypeInferred": "false", '
-            '"column": "col3", "completeness": 1}]}'
-        )
-        assert mock_python_engine_convert_pandas_statistics.call_count == 2
+        assert [col["column"] for col in result["columns"]] == ["col1", "col3"]
+        assert [col["dataType"] for col in result["columns"]] == ["Integral", "String"]
 
-    def test_convert_pandas_statistics(self):
+    def test_profile_timestamp_column(self):
         # Arrange
         python_engine = python.Engine()
 
-        stat = {
-            "25%": 25,
-            "50%": 50,
-            "75%": 75,
-            "mean": 50,
-            "count": 100,
-            "max": 10,
-            "std": 33,
-            "min": 1,
-        }
+        df = pd.DataFrame(
+            data={"ts": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-01"])}
+        )
 
         # Act
-        result = python_engine._convert_pandas_statistics(stat=stat, dataType="Integer")
-
-        # Assert
-        assert result == {
-            "dataType": "Integer",
-            "approxPercentiles": [
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                25,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                50,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                75,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-            ],
-            "maximum": 10,
-            "mean": 50,
-            "minimum": 1,
-            "stdDev": 33,
-            "sum": 5000,
-            "count": 100,
-        }
+        result = json.loads(
+            python_engine.profile(
+                df=df,
+                relevant_columns=None,
+                correlations=None,
+                histograms=None,
+                exact_uniqueness=False,
+            )
+        )
+
+        # Assert
+        assert result["columns"][0]["dataType"] == "String"
+        assert result["columns"][0]["approximateNumDistinctValues"] == 2
+        assert df["ts"].dtype == "datetime64[ns]"
 
     def test_validate(self):
         # Arrange
@@ -2083,6 +1924,33 @@ class TestPython:
         for column in list(result):
             assert not result[column].empty
 
+    def test_random_split_seed(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+
+        python_engine = python.Engine()
+
+        d = {"col1": list(range(100)), "col2": list(range(100))}
+        df = pd.DataFrame(data=d)
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={"test_split1": 0.5, "test_split2": 0.5},
+            seed=42,
+            id=10,
+        )
+
+        # Act
+        result1 = python_engine._random_split(df=df.copy(), training_dataset_obj=td)
+        result2 = python_engine._random_split(df=df.copy(), training_dataset_obj=td)
+
+        # Assert
+        for split_name in ["test_split1", "test_split2"]:
+            assert result1[split_name].equals(result2[split_name])
+
     def test_random_split_size_precision_1(self, mocker):
         # In python sum([0.6, 0.3, 0.1]) != 1.0 due to floating point precision.
         # This test checks if different split ratios can be handled.
@@ -0,0 +1,130 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import numpy as np
+import pandas as pd
+from hsfs import transformation_function
+from hsfs.builtin_transformations import label_encoder, one_hot_encoder
+from hsfs.core.feature_descriptive_statistics import FeatureDescriptiveStatistics
+from hsfs.transformation_function import TransformationType
+from hsfs.transformation_statistics import FeatureTransformationStatistics
+
+
+class TestBuiltinTransformations:
+    @staticmethod
+    def _with_statistics(builtin_udf, unique_values):
+        tf = transformation_function.TransformationFunction(
+            hopsworks_udf=builtin_udf("col_0"),
+            featurestore_id=99,
+            transformation_type=TransformationType.MODEL_DEPENDENT,
+        )
+        tf.transformation_statistics = [
+            FeatureDescriptiveStatistics(
+                feature_name="col_0",
+                extended_statistics={"unique_values": unique_values},
+            )
+        ]
+        return tf.hopsworks_udf
+
+    def test_label_encoder(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        hopsworks_udf = self._with_statistics(label_encoder, ["c", "a", "b"])
+        udf = hopsworks_udf.get_udf(online=True)
+
+        # Act
+        result = udf(pd.Series(["b", "a", "unknown", "c"]))
+
+        # Assert
+        assert result.tolist() == [1, 0, -1, 2]
+        assert result.name == "label_encoder_col_0_"
+
+    def test_label_encoder_missing_values(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        hopsworks_udf = self._with_statistics(label_encoder, ["c", "a", "b"])
+        udf = hopsworks_udf.get_udf(online=True)
+
+        # Act
+        result = udf(pd.Series(["c", None]))
+
+        # Assert
+        assert result.iloc[0] == 2
+        assert np.isnan(result.iloc[1])
+
+    def test_one_hot_encoder(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        hopsworks_udf = self._with_statistics(one_hot_encoder, ["c", "a", "b"])
+        udf = hopsworks_udf.get_udf(online=True)
+
+        # Act
+        result = udf(pd.Series(["b", "unknown", None, "a"], index=[3, 4, 5, 6]))
+
+        # Assert
+        assert list(result.columns) == hopsworks_udf.output_column_names
+        assert list(result.index) == [3, 4, 5, 6]
+        assert result.values.tolist() == [
+            [False, True, False],
+            [False, False, False],
+            [False, False, False],
+            [True, False, False],
+        ]
+
+    def test_lookup_structures_built_once(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        hopsworks_udf = self._with_statistics(label_encoder, ["c", "a", "b"])
+        udf = hopsworks_udf.get_udf(online=True)
+        udf(pd.Series(["a"]))
+        categorical_index = (
+            hopsworks_udf.transformation_statistics.feature.categorical_index
+        )
+
+        # Act
+        udf(pd.Series(["b"]))
+
+        # Assert
+        assert (
+            hopsworks_udf.transformation_statistics.feature.categorical_index
+            is categorical_index
+        )
+        assert list(categorical_index) == ["a", "b", "c"]
+
+    def test_encoders_without_precomputed_lookup(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        # Clients released before the lookup structures were added only expose `unique_values`.
+        mocker.patch.object(FeatureTransformationStatistics, "categorical_index", None)
+        label_udf = self._with_statistics(label_encoder, ["c", "a", "b"]).get_udf(
+            online=True
+        )
+        one_hot_udf = self._with_statistics(one_hot_encoder, ["c", "a", "b"]).get_udf(
+            online=True
+        )
+
+        # Act
+        label_result = label_udf(pd.Series(["b", "unknown", None]))
+        one_hot_result = one_hot_udf(pd.Series(["b", "unknown", None]))
+
+        # Assert
+        assert label_result.tolist()[:2] == [1, -1]
+        assert np.isnan(label_result.iloc[2])
+        assert one_hot_result.values.tolist() == [
+            [False, True, False],
+            [False, False, False],
+            [False, False, False],
+        ]
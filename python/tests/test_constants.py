@@ -56,6 +56,10 @@ class TestConstants:
         model_registry = {
             "HOPSFS_MOUNT_PREFIX": "/hopsfs/",
             "MODEL_FILES_DIR_NAME": "Files",
+            "FILES_MANIFEST_FILE_NAME": "files_manifest.json",
+            "BUNDLE_MIN_FILES": 16,
+            "BUNDLE_MAX_FILE_SIZE": 1024 * 1024,
+            "BUNDLE_MAX_SIZE": 64 * 1024 * 1024,
         }
 
         # Assert
@@ -17,6 +17,8 @@ import warnings
 from unittest import mock
 
 import hsfs
+import pandas as pd
+import pyarrow as pa
 import pytest
 from hsfs import (
     engine,
@@ -484,6 +486,175 @@ class TestFeatureGroup:
         assert mock_job_api.call_count == 6
         assert str(e_info.value) == "No materialization job was found"
 
+    def test_compute_statistics_merge_commit_statistics(self, mocker):
+        # Arrange
+        fg = feature_group.FeatureGroup(
+            name="test_fg",
+            version=2,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            time_travel_format="HUDI",
+            id=10,
+        )
+        mocker.patch.object(
+            fg._feature_group_engine,
+            "commit_details",
+            side_effect=[
+                {2000: {}},
+                {
+                    1000: {"rowsUpdated": 0, "rowsDeleted": 0},
+                    2000: {"rowsUpdated": 0, "rowsDeleted": 0},
+                },
+            ],
+        )
+        mocker.patch.object(
+            fg._statistics_engine, "get_by_time_window", return_value=None
+        )
+        mocker.patch.object(
+            fg._statistics_engine, "merge_commit_statistics", return_value=None
+        )
+        mock_merge_and_save = mocker.patch.object(
+            fg._statistics_engine, "merge_and_save_commit_statistics"
+        )
+        mock_compute_and_save = mocker.patch.object(
+            fg._statistics_engine, "compute_and_save_statistics"
+        )
+
+        # Act
+        result = fg.compute_statistics()
+
+        # Assert
+        mock_merge_and_save.assert_called_once_with(fg, 2000, [1000, 2000])
+        assert result == mock_merge_and_save.return_value
+        assert mock_compute_and_save.call_count == 0
+
+    def test_insert_twice_statistics_cover_all_commits(self, mocker):
+        # Arrange
+        mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine.insert",
+            return_value=(None, None),
+        )
+        mocker.patch("hsfs.engine.get_type", return_value="spark")
+        mocker.patch("hsfs.engine.get_instance", return_value=python.Engine())
+        fg = feature_group.FeatureGroup(
+            name="test_fg",
+            version=2,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            time_travel_format="HUDI",
+            id=10,
+        )
+        commits = {}
+        mocker.patch.object(
+            fg._feature_group_engine,
+            "commit_details",
+            side_effect=lambda fg, wallclock_time, limit: dict(
+                sorted(commits.items(), reverse=True)[:limit]
+            ),
+        )
+        # statistics saved in the backend, which returns the most recently saved ones matching the window
+        saved_statistics = []
+
+        def get(
+            metadata_instance, start_commit_time=None, end_commit_time=None, **kwargs
+        ):
+            return next(
+                (
+                    stats
+                    for stats in reversed(saved_statistics)
+                    if stats.window_end_commit_time == end_commit_time
+                    and start_commit_time in [None, stats.window_start_commit_time]
+                ),
+                None,
+            )
+
+        def get_all(
+            metadata_instance,
+            end_commit_time=None,
+            filter_eq_times=False,
+            **kwargs,
+        ):
+            return [
+                stats
+                for stats in saved_statistics
+                if stats.window_end_commit_time == end_commit_time
+                or (
+                    not filter_eq_times
+                    and stats.window_end_commit_time < end_commit_time
+                )
+            ]
+
+        def post(metadata_instance, stats, training_dataset_version):
+            saved_statistics.append(stats)
+            return stats
+
+        mocker.patch.object(
+            fg._statistics_engine._statistics_api, "get", side_effect=get
+        )
+        mocker.patch.object(
+            fg._statistics_engine._statistics_api, "get_all", side_effect=get_all
+        )
+        mocker.patch.object(
+            fg._statistics_engine._statistics_api, "post", side_effect=post
+        )
+
+        # Act
+        commits[1700000000000] = {"rowsUpdated": 0, "rowsDeleted": 0}
+        fg.insert(pd.DataFrame({"col": [1.0, 2.0, 3.0]}))
+        commits[1700000001000] = {"rowsUpdated": 0, "rowsDeleted": 0}
+        fg.insert(pd.DataFrame({"col": [4.0, 5.0]}))
+        result = fg.get_statistics_by_commit_window(to_commit_time=1700000001000)
+
+        # Assert
+        assert result.window_start_commit_time is None
+        assert result.window_end_commit_time == 1700000001000
+        assert result.feature_descriptive_statistics[0].count == 5
+        assert result.feature_descriptive_statistics[0].max == 5
+
+    def test_compute_statistics_updated_rows(self, mocker):
+        # Arrange
+        fg = feature_group.FeatureGroup(
+            name="test_fg",
+            version=2,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            time_travel_format="HUDI",
+            id=10,
+        )
+        mocker.patch.object(
+            fg._feature_group_engine,
+            "commit_details",
+            side_effect=[
+                {2000: {}},
+                {
+                    1000: {"rowsUpdated": 0, "rowsDeleted": 0},
+                    2000: {"rowsUpdated": 5, "rowsDeleted": 0},
+                },
+            ],
+        )
+        mocker.patch.object(
+            fg._statistics_engine, "get_by_time_window", return_value=None
+        )
+        mocker.patch.object(
+            fg._statistics_engine, "merge_commit_statistics", return_value=None
+        )
+        mock_merge_and_save = mocker.patch.object(
+            fg._statistics_engine, "merge_and_save_commit_statistics"
+        )
+        mock_compute_and_save = mocker.patch.object(
+            fg._statistics_engine, "compute_and_save_statistics"
+        )
+
+        # Act
+        fg.compute_statistics()
+
+        # Assert
+        assert mock_merge_and_save.call_count == 0
+        mock_compute_and_save.assert_called_once_with(fg, feature_group_commit_id=2000)
+
     def test_multi_part_insert_return_writer(self, mocker):
         fg = feature_group.FeatureGroup(
             name="test_fg",
@@ -519,6 +690,149 @@ class TestFeatureGroup:
         mock_writer.insert.assert_called_once()
         assert fg._multi_part_insert is True
 
+    def test_insert_iterator(self, mocker):
+        mock_insert = mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine.insert",
+            return_value=(mocker.Mock(), None),
+        )
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        mocker.patch("hsfs.engine.get_instance", return_value=python.Engine())
+        fg = feature_group.FeatureGroup(
+            name="test_fg",
+            version=2,
+            featurestore_id=99,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+        chunks = (pd.DataFrame({"id": [i, i + 1]}) for i in range(0, 6, 2))
+
+        job, _ = fg.insert(chunks, overwrite=True, wait=True)
+
+        assert mock_insert.call_count == 3
+        assert [call.kwargs["overwrite"] for call in mock_insert.call_args_list] == [
+            True,
+            False,
+            False,
+        ]
+        assert [
+            call.kwargs["validation_options"]["fetch_expectation_suite"]
+            for call in mock_insert.call_args_list
+        ] == [True, False, False]
+        assert all(
+            call.kwargs["write_options"]["start_offline_materialization"] is False
+            for call in mock_insert.call_args_list
+        )
+        # the materialization job is started once, after the last chunk
+        job.run.assert_called_once_with(args=mocker.ANY, await_termination=True)
+        assert fg._multi_part_insert is False
+
+    def test_insert_record_batch_reader(self, mocker):
+        mock_insert = mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine.insert",
+            return_value=(mocker.Mock(), None),
+        )
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        mocker.patch("hsfs.engine.get_instance", return_value=python.Engine())
+        fg = feature_group.FeatureGroup(
+            name="test_fg",
+            version=2,
+            featurestore_id=99,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+        table = pa.table({"id": list(range(5))})
+        reader = pa.RecordBatchReader.from_batches(
+            table.schema, table.to_batches(max_chunksize=2)
+        )
+
+        job, _ = fg.insert(
+            reader, write_options={"start_offline_materialization": False}
+        )
+
+        assert [
+            call.kwargs["feature_dataframe"]["id"].tolist()
+            for call in mock_insert.call_args_list
+        ] == [[0, 1], [2, 3], [4]]
+        job.run.assert_not_called()
+
+    def test_insert_validation_report_without_great_expectations(self, mocker):
+        ge_report = mocker.Mock()
+        ge_report.to_ge_type.side_effect = ModuleNotFoundError(
+            "No module named 'great_expectations'"
+        )
+        mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine.insert",
+            return_value=(None, ge_report),
+        )
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        mocker.patch("hsfs.engine.get_instance", return_value=python.Engine())
+        mocker.patch("hsfs.feature_group.HAS_GREAT_EXPECTATIONS", False)
+        fg = feature_group.FeatureGroup(
+            name="test_fg",
+            version=2,
+            featurestore_id=99,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+
+        _, result = fg.insert(
+            pd.DataFrame({"id": [1]}),
+            validation_options={"native_validation": True},
+        )
+
+        assert result is ge_report
+        ge_report.to_ge_type.assert_not_called()
+
+    def test_insert_empty_iterator(self, mocker):
+        mock_insert = mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine.insert"
+        )
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        fg = feature_group.FeatureGroup(
+            name="test_fg",
+            version=2,
+            featurestore_id=99,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+
+        job, ge_report = fg.insert(iter([]))
+
+        assert mock_insert.call_count == 0
+        assert job is None
+        assert ge_report is None
+        assert fg._multi_part_insert is False
+
+    def test_insert_iterator_spark(self, mocker):
+        mock_insert = mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine.insert"
+        )
+        mocker.patch("hsfs.engine.get_type", return_value="spark")
+        fg = feature_group.FeatureGroup(
+            name="test_fg",
+            version=2,
+            featurestore_id=99,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+        chunks = (pd.DataFrame({"id": [i]}) for i in range(2))
+
+        with pytest.raises(FeatureStoreException) as e_info:
+            fg.insert(chunks)
+
+        assert mock_insert.call_count == 0
+        assert "only supported with the Python engine" in str(e_info.value)
+
     def test_save_feature_list(self, mocker):
         mock_save_metadata = mocker.patch(
             "hsfs.core.feature_group_engine.FeatureGroupEngine.save_feature_group_metadata",
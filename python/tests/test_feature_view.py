@@ -176,3 +176,35 @@ class TestFeatureView:
         transformation_functions = fv.transformation_functions
 
         assert transformation_functions[0] != transformation_functions[1]
+
+    def test_find_neighbors_batch(self, mocker, backend_fixtures):
+        # Arrange
+        mocker.patch("hopsworks_common.client.get_instance")
+        mocker.patch("hsfs.engine.get_type")
+        mocker.patch("hsfs.core.feature_store_api.FeatureStoreApi.get")
+        fv = feature_view.FeatureView.from_response_json(
+            backend_fixtures["feature_view"]["get"]["response"]
+        )
+        fv._vector_db_client = mocker.MagicMock()
+        fv._vector_db_client.find_neighbors_batch.return_value = [
+            [(0.1, {"id": 1}), (0.2, {"id": 2})],
+            [],
+            [(0.3, {"id": 3})],
+        ]
+        fv._FeatureView__vector_server = mocker.MagicMock()
+        fv._vector_server.get_feature_vectors.return_value = [[1], [2], [3]]
+        mocker.patch.object(
+            fv, "_extract_primary_key", side_effect=lambda result: result
+        )
+
+        # Act
+        neighbors = fv.find_neighbors_batch([[0.1], [0.2], [0.3]])
+
+        # Assert
+        fv._vector_server.get_feature_vectors.assert_called_once()
+        assert fv._vector_server.get_feature_vectors.call_args.args[0] == [
+            {"id": 1},
+            {"id": 2},
+            {"id": 3},
+        ]
+        assert neighbors == [[[1], [2]], [], [[3]]]
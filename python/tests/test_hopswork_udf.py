@@ -1159,6 +1159,119 @@ def test_function():
         assert pandas_wrapper_mocker.call_count == 1
         assert python_wrapper_mocker.call_count == 0
 
+    def test_get_udf_cached(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+
+        @udf(return_type=int, mode="python")
+        def test(feature):
+            return feature + 1
+
+        test.output_column_names = ["test_feature_"]
+        python_wrapper_spy = mocker.spy(test, "python_udf_wrapper")
+
+        udf_online = test.get_udf(online=True)
+
+        assert test.get_udf(online=True) is udf_online
+        assert udf_online(1) == 2
+        assert python_wrapper_spy.call_count == 1
+
+    def test_get_udf_cached_per_execution_mode(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+
+        @udf(return_type=int)
+        def test(feature):
+            return feature + 1
+
+        test.output_column_names = ["test_feature_"]
+        pandas_wrapper_spy = mocker.spy(test, "pandas_udf_wrapper")
+        python_wrapper_spy = mocker.spy(test, "python_udf_wrapper")
+
+        udf_online = test.get_udf(online=True)
+        udf_offline = test.get_udf(online=False)
+
+        assert udf_online is not udf_offline
+        assert test.get_udf(online=True) is udf_online
+        assert test.get_udf(online=False) is udf_offline
+        assert pandas_wrapper_spy.call_count == 1
+        assert python_wrapper_spy.call_count == 1
+
+    def test_get_udf_cache_invalidated_output_column_names(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+
+        @udf(return_type=int, mode="pandas")
+        def test(feature):
+            return feature + 1
+
+        test.output_column_names = ["test_feature_"]
+        udf_before = test.get_udf(online=True)
+
+        test.alias("renamed_feature")
+        udf_after = test.get_udf(online=True)
+
+        assert udf_before is not udf_after
+        assert udf_after(pd.Series([1])).name == "renamed_feature"
+
+    def test_get_udf_cache_invalidated_statistics(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+        from hsfs.core.feature_descriptive_statistics import (
+            FeatureDescriptiveStatistics,
+        )
+        from hsfs.transformation_statistics import TransformationStatistics
+
+        stats = TransformationStatistics("feature")
+
+        @udf(return_type=float, mode="python")
+        def test(feature, statistics=stats):
+            return feature - statistics.feature.mean
+
+        test.output_column_names = ["test_feature_"]
+        test.transformation_statistics = [
+            FeatureDescriptiveStatistics(feature_name="feature", mean=1.0)
+        ]
+        assert test.get_udf(online=True)(10) == 9.0
+
+        test.transformation_statistics = [
+            FeatureDescriptiveStatistics(feature_name="feature", mean=5.0)
+        ]
+        assert test.get_udf(online=True)(10) == 5.0
+
+    def test_get_udf_cache_refresh_transformation_context(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+
+        @udf(return_type=int, mode="python")
+        def test(feature, context):
+            return feature + context["value"]
+
+        test.output_column_names = ["test_feature_"]
+        python_wrapper_spy = mocker.spy(test, "python_udf_wrapper")
+
+        test.transformation_context = {"value": 10}
+        assert test.get_udf(online=True)(1) == 11
+
+        test.transformation_context = {"value": 100}
+        assert test.get_udf(online=True)(1) == 101
+        assert python_wrapper_spy.call_count == 1
+
+        # Changing the context schema recompiles the UDF.
+        test.transformation_context = {"value": 1000, "other_value": 1}
+        assert test.get_udf(online=True)(1) == 1001
+        assert python_wrapper_spy.call_count == 2
+
+    def test_get_udf_cache_not_copied(self, mocker):
+        mocker.patch("hsfs.engine.get_type", return_value="python")
+
+        @udf(return_type=int, mode="python")
+        def test(feature):
+            return feature + 1
+
+        test.output_column_names = ["test_feature_"]
+        test.get_udf(online=True)
+
+        new_udf = test("new_feature")
+
+        assert test._udf_cache
+        assert new_udf._udf_cache == {}
+
     def test_HopsworkUDf_call_one_argument(self):
         @udf(int)
         def test_func(col1):
@@ -278,6 +278,22 @@ class TestPandasDataframe(BaseDataFrameTest):
         # validate that only 'val' is detected as a string column
         assert ["string1", "string2"] == string_cols
 
+    def test_string_length_counts_characters(self, df, feature_group_created):
+        # 100 multi-byte characters fit in the default varchar(100) column
+        modified_df = self._modify_row(df, 0, string_col="é" * 100)
+        DataFrameValidator().validate_schema(
+            feature_group_created, modified_df, feature_group_created.features
+        )
+
+    def test_primary_key_null_mixed_types(self, df, feature_group_data):
+        df["primary_key"] = pd.Series([1, "b", None], dtype="object", index=df.index)
+        with pytest.raises(
+            ValueError, match="Primary key column primary_key contains null values"
+        ):
+            DataFrameValidator().validate_schema(
+                feature_group_data, df, feature_group_data.features
+            )
+
 
 @pytest.mark.skipif(not HAS_POLARS, reason="polars not installed")
 class TestPolarsDataframe(BaseDataFrameTest):
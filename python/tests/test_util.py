@@ -16,6 +16,7 @@
 
 import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from urllib.parse import ParseResult
 
@@ -945,3 +946,66 @@ class TestUtil:
                 match="Event loop is not running. Please invoke this co-routine from a running loop or provide an event loop.",
             ):
                 asyncio.run(util_sql.create_async_engine(online_connector, True, 1))
+
+    def test_async_task_thread_runs_tasks_concurrently(self):
+        # Arrange
+        in_flight = 0
+        max_in_flight = 0
+
+        async def task_function(value):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return value * 2
+
+        task_thread = util.AsyncTaskThread(max_concurrent_tasks=2)
+        task_thread.start()
+        tasks = [util.AsyncTask(task_function, task_args=(i,)) for i in range(6)]
+
+        # Act
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            results = list(executor.map(task_thread.submit, tasks))
+
+        # Assert
+        assert results == [0, 2, 4, 6, 8, 10]
+        assert max_in_flight == 2
+
+    def test_async_task_thread_task_timeout(self):
+        # Arrange
+        async def slow_task():
+            await asyncio.sleep(1)
+
+        async def fast_task():
+            return "done"
+
+        task_thread = util.AsyncTaskThread(task_timeout=0.05)
+        task_thread.start()
+
+        # Act
+        with pytest.raises(asyncio.TimeoutError):
+            task_thread.submit(util.AsyncTask(slow_task))
+        result = task_thread.submit(util.AsyncTask(fast_task))
+
+        # Assert
+        assert result == "done"
+
+    def test_async_task_thread_exception_does_not_stop_thread(self):
+        # Arrange
+        async def failing_task():
+            raise ValueError("failed")
+
+        async def fast_task():
+            return "done"
+
+        task_thread = util.AsyncTaskThread()
+        task_thread.start()
+
+        # Act
+        with pytest.raises(ValueError, match="failed"):
+            task_thread.submit(util.AsyncTask(failing_task))
+        result = task_thread.submit(util.AsyncTask(fast_task))
+
+        # Assert
+        assert result == "done"